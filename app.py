@@ -9,17 +9,36 @@ import pandas as pd
 import json
 import random
 import os
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
 from reportlab.lib.pagesizes import letter, A4
-# Vocabulary imports removed - using integrated vocabulary in VOCABULARY_DATA
+from vocabulary_data import VOCABULARY_DATA
+from vocabulary_index import get_vocabulary_index
+from translation_data import EXAMPLE_TRANSLATIONS, TRANSLATION_PATTERNS
+from translation_lookup import get_translation_lookup
 from sentences import SENTENCE_DATABASE
 from comprehensive_sentences import SENTENCE_DATABASE as COMPREHENSIVE_SENTENCES
-from massive_sentence_database import get_massive_sentence_database
-from mega_sentence_database import get_mega_sentence_database
-from ultimate_sentence_database import get_ultimate_sentence_database
-from premium_sentence_database import get_premium_sentence_database, get_extended_premium_sentences
+from sentence_corpus import get_sentence_corpus
+from grammar_store import get_grammar_store
+from grammar_search import get_grammar_search_index
+from flashcard_scheduler import DueCardScheduler
+from quiz_builder import build_quiz, grade
+from quiz_selection import LearnerFeatures, select_quiz_words
+from flashcard_state import FlashcardDeck
+from progress_summary import ProgressSummary
+from review_journal import make_review_record
+from review_planner import BACKLOG_DAYS, FORECAST_DAYS, apply_backlog_plan, forecast_reviews, plan_backlog
+from study_history import StudyHistory, migrate_legacy_sessions
+from srs_engine import apply_rating, bump_data_version, data_version
+from figure_cache import FigureCache
+from learned_words_table import PAGE_SIZE, LearnedWordsTable, page_count
+from profile_catalog import CATALOG_FILENAME, get_profile_catalog
+from credentials import CREDENTIALS_FILENAME, LEGACY_PIN_FIELDS, get_credential_store, legacy_pin
+from profile_storage import DEFAULT_BACKEND, ProfileConflictError, get_profile_storage
+from memory_report import format_bytes, get_memory_monitor, is_admin
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 # Premium UI components removed - using simplified inline CSS
 from workbook_system import WorkbookSystem, WorkbookProgress, EXERCISE_TEMPLATES
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -37,1243 +56,22 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Indonesian vocabulary database - organized by difficulty level
-# Focus on most essential words for absolute beginners
-VOCABULARY_DATA = {
-    "Absolute Beginner": {
-        # Most Essential Greetings & Basic Phrases
-        "halo": {"english": "hello", "pronunciation": "ha-lo", "category": "greetings", "example": "Halo, apa kabar?"},
-        "terima kasih": {"english": "thank you", "pronunciation": "te-ri-ma ka-sih", "category": "greetings", "example": "Terima kasih banyak!"},
-        "sama-sama": {"english": "you're welcome", "pronunciation": "sa-ma sa-ma", "category": "greetings", "example": "Sama-sama!"},
-        "maaf": {"english": "sorry", "pronunciation": "ma-af", "category": "greetings", "example": "Maaf, saya terlambat."},
-        "permisi": {"english": "excuse me", "pronunciation": "per-mi-si", "category": "greetings", "example": "Permisi, boleh lewat?"},
-        "ya": {"english": "yes", "pronunciation": "ya", "category": "greetings", "example": "Ya, saya mengerti."},
-        "tidak": {"english": "no", "pronunciation": "ti-dak", "category": "greetings", "example": "Tidak, terima kasih."},
-        "baik": {"english": "good/fine", "pronunciation": "ba-ik", "category": "greetings", "example": "Saya baik-baik saja."},
-        
-        # Essential Numbers 1-10
-        "satu": {"english": "one", "pronunciation": "sa-tu", "category": "numbers", "example": "Satu orang"},
-        "dua": {"english": "two", "pronunciation": "du-a", "category": "numbers", "example": "Dua buku"},
-        "tiga": {"english": "three", "pronunciation": "ti-ga", "category": "numbers", "example": "Tiga apel"},
-        "empat": {"english": "four", "pronunciation": "em-pat", "category": "numbers", "example": "Empat kursi"},
-        "lima": {"english": "five", "pronunciation": "li-ma", "category": "numbers", "example": "Lima menit"},
-        "enam": {"english": "six", "pronunciation": "e-nam", "category": "numbers", "example": "Enam jam"},
-        "tujuh": {"english": "seven", "pronunciation": "tu-juh", "category": "numbers", "example": "Tujuh hari"},
-        "delapan": {"english": "eight", "pronunciation": "de-la-pan", "category": "numbers", "example": "Delapan bulan"},
-        "sembilan": {"english": "nine", "pronunciation": "sem-bi-lan", "category": "numbers", "example": "Sembilan tahun"},
-        "sepuluh": {"english": "ten", "pronunciation": "se-pu-luh", "category": "numbers", "example": "Sepuluh orang"},
-        
-        # Most Important Pronouns
-        "saya": {"english": "I/me", "pronunciation": "sa-ya", "category": "pronouns", "example": "Saya belajar bahasa Indonesia."},
-        "anda": {"english": "you (formal)", "pronunciation": "an-da", "category": "pronouns", "example": "Anda dari mana?"},
-        "kamu": {"english": "you (informal)", "pronunciation": "ka-mu", "category": "pronouns", "example": "Kamu tinggal di mana?"},
-        "dia": {"english": "he/she", "pronunciation": "di-a", "category": "pronouns", "example": "Dia teman saya."},
-        "kita": {"english": "we/us", "pronunciation": "ki-ta", "category": "pronouns", "example": "Kita pergi bersama."},
-        "mereka": {"english": "they/them", "pronunciation": "me-re-ka", "category": "pronouns", "example": "Mereka dari Jakarta."},
-        
-        # Essential Family Words
-        "ibu": {"english": "mother", "pronunciation": "i-bu", "category": "family", "example": "Ibu saya guru."},
-        "ayah": {"english": "father", "pronunciation": "a-yah", "category": "family", "example": "Ayah saya dokter."},
-        "anak": {"english": "child", "pronunciation": "a-nak", "category": "family", "example": "Anak saya pintar."},
-        "keluarga": {"english": "family", "pronunciation": "ke-lu-ar-ga", "category": "family", "example": "Keluarga saya besar."},
-        
-        # Most Common Verbs
-        "ada": {"english": "to be/exist", "pronunciation": "a-da", "category": "verbs", "example": "Ada banyak orang di sini."},
-        "makan": {"english": "to eat", "pronunciation": "ma-kan", "category": "verbs", "example": "Saya makan nasi."},
-        "minum": {"english": "to drink", "pronunciation": "mi-num", "category": "verbs", "example": "Saya minum air."},
-        "pergi": {"english": "to go", "pronunciation": "per-gi", "category": "verbs", "example": "Saya pergi ke sekolah."},
-        "datang": {"english": "to come", "pronunciation": "da-tang", "category": "verbs", "example": "Dia datang dari Bandung."},
-        "tinggal": {"english": "to live/stay", "pronunciation": "ting-gal", "category": "verbs", "example": "Saya tinggal di Jakarta."},
-        "bekerja": {"english": "to work", "pronunciation": "be-ker-ja", "category": "verbs", "example": "Saya bekerja di kantor."},
-        "belajar": {"english": "to study/learn", "pronunciation": "be-la-jar", "category": "verbs", "example": "Saya belajar bahasa Indonesia."},
-        
-        # Essential Objects
-        "air": {"english": "water", "pronunciation": "a-ir", "category": "objects", "example": "Saya minum air."},
-        "makanan": {"english": "food", "pronunciation": "ma-ka-nan", "category": "objects", "example": "Makanan ini enak."},
-        "rumah": {"english": "house", "pronunciation": "ru-mah", "category": "objects", "example": "Rumah saya kecil."},
-        "buku": {"english": "book", "pronunciation": "bu-ku", "category": "objects", "example": "Buku ini bagus."},
-        "uang": {"english": "money", "pronunciation": "u-ang", "category": "objects", "example": "Saya tidak punya uang."},
-        "mobil": {"english": "car", "pronunciation": "mo-bil", "category": "objects", "example": "Mobil saya biru."},
-        "sepeda": {"english": "bicycle", "pronunciation": "se-pe-da", "category": "objects", "example": "Saya naik sepeda."},
-        "telepon": {"english": "phone", "pronunciation": "te-le-pon", "category": "objects", "example": "Telepon saya rusak."},
-        "komputer": {"english": "computer", "pronunciation": "kom-pu-ter", "category": "objects", "example": "Saya pakai komputer."},
-        "meja": {"english": "table", "pronunciation": "me-ja", "category": "objects", "example": "Meja ini besar."},
-        "kursi": {"english": "chair", "pronunciation": "kur-si", "category": "objects", "example": "Kursi ini nyaman."},
-        "pintu": {"english": "door", "pronunciation": "pin-tu", "category": "objects", "example": "Pintu ini tertutup."},
-        "jendela": {"english": "window", "pronunciation": "jen-de-la", "category": "objects", "example": "Jendela ini besar."},
-        "lampu": {"english": "lamp", "pronunciation": "lam-pu", "category": "objects", "example": "Lampu ini terang."},
-        
-        # Colors
-        "merah": {"english": "red", "pronunciation": "me-rah", "category": "colors", "example": "Bunga ini merah."},
-        "biru": {"english": "blue", "pronunciation": "bi-ru", "category": "colors", "example": "Langit ini biru."},
-        "kuning": {"english": "yellow", "pronunciation": "ku-ning", "category": "colors", "example": "Matahari kuning."},
-        "hijau": {"english": "green", "pronunciation": "hi-jau", "category": "colors", "example": "Daun ini hijau."},
-        "hitam": {"english": "black", "pronunciation": "hi-tam", "category": "colors", "example": "Malam ini hitam."},
-        "putih": {"english": "white", "pronunciation": "pu-tih", "category": "colors", "example": "Salju ini putih."},
-        
-        # Time & Days
-        "hari": {"english": "day", "pronunciation": "ha-ri", "category": "time", "example": "Hari ini cerah."},
-        "malam": {"english": "night", "pronunciation": "ma-lam", "category": "time", "example": "Malam ini dingin."},
-        "pagi": {"english": "morning", "pronunciation": "pa-gi", "category": "time", "example": "Pagi ini indah."},
-        "siang": {"english": "afternoon", "pronunciation": "si-ang", "category": "time", "example": "Siang ini panas."},
-        "senin": {"english": "Monday", "pronunciation": "se-nin", "category": "time", "example": "Senin saya kerja."},
-        "selasa": {"english": "Tuesday", "pronunciation": "se-la-sa", "category": "time", "example": "Selasa saya libur."},
-        "rabu": {"english": "Wednesday", "pronunciation": "ra-bu", "category": "time", "example": "Rabu saya belajar."},
-        "kamis": {"english": "Thursday", "pronunciation": "ka-mis", "category": "time", "example": "Kamis saya olahraga."},
-        "jumat": {"english": "Friday", "pronunciation": "ju-mat", "category": "time", "example": "Jumat saya pulang."},
-        "sabtu": {"english": "Saturday", "pronunciation": "sab-tu", "category": "time", "example": "Sabtu saya santai."},
-        "minggu": {"english": "Sunday", "pronunciation": "ming-gu", "category": "time", "example": "Minggu saya istirahat."},
-        
-        # Food & Drinks
-        "nasi": {"english": "rice", "pronunciation": "na-si", "category": "food", "example": "Nasi ini enak."},
-        "roti": {"english": "bread", "pronunciation": "ro-ti", "category": "food", "example": "Roti ini lembut."},
-        "daging": {"english": "meat", "pronunciation": "da-ging", "category": "food", "example": "Daging ini empuk."},
-        "ikan": {"english": "fish", "pronunciation": "i-kan", "category": "food", "example": "Ikan ini segar."},
-        "sayur": {"english": "vegetable", "pronunciation": "sa-yur", "category": "food", "example": "Sayur ini sehat."},
-        "buah": {"english": "fruit", "pronunciation": "bu-ah", "category": "food", "example": "Buah ini manis."},
-        "susu": {"english": "milk", "pronunciation": "su-su", "category": "food", "example": "Susu ini segar."},
-        "kopi": {"english": "coffee", "pronunciation": "ko-pi", "category": "food", "example": "Kopi ini panas."},
-        "teh": {"english": "tea", "pronunciation": "teh", "category": "food", "example": "Teh ini dingin."},
-        "jus": {"english": "juice", "pronunciation": "jus", "category": "food", "example": "Jus ini segar."},
-        
-        # Body Parts
-        "kepala": {"english": "head", "pronunciation": "ke-pa-la", "category": "body", "example": "Kepala saya sakit."},
-        "mata": {"english": "eye", "pronunciation": "ma-ta", "category": "body", "example": "Mata saya biru."},
-        "hidung": {"english": "nose", "pronunciation": "hi-dung", "category": "body", "example": "Hidung saya kecil."},
-        "mulut": {"english": "mouth", "pronunciation": "mu-lut", "category": "body", "example": "Mulut saya kering."},
-        "tangan": {"english": "hand", "pronunciation": "tan-gan", "category": "body", "example": "Tangan saya bersih."},
-        "kaki": {"english": "foot", "pronunciation": "ka-ki", "category": "body", "example": "Kaki saya sakit."},
-        
-        # Common Adjectives
-        "besar": {"english": "big", "pronunciation": "be-sar", "category": "adjectives", "example": "Rumah ini besar."},
-        "kecil": {"english": "small", "pronunciation": "ke-cil", "category": "adjectives", "example": "Anak ini kecil."},
-        "tinggi": {"english": "tall", "pronunciation": "ting-gi", "category": "adjectives", "example": "Orang ini tinggi."},
-        "pendek": {"english": "short", "pronunciation": "pen-dek", "category": "adjectives", "example": "Meja ini pendek."},
-        "panas": {"english": "hot", "pronunciation": "pa-nas", "category": "adjectives", "example": "Cuaca ini panas."},
-        "dingin": {"english": "cold", "pronunciation": "din-gin", "category": "adjectives", "example": "Air ini dingin."},
-        "enak": {"english": "delicious", "pronunciation": "e-nak", "category": "adjectives", "example": "Makanan ini enak."},
-        "buruk": {"english": "bad", "pronunciation": "bu-ruk", "category": "adjectives", "example": "Cuaca ini buruk."},
-        "bagus": {"english": "good", "pronunciation": "ba-gus", "category": "adjectives", "example": "Film ini bagus."},
-        "cantik": {"english": "beautiful", "pronunciation": "can-tik", "category": "adjectives", "example": "Bunga ini cantik."},
-        
-        # Places
-        "sekolah": {"english": "school", "pronunciation": "se-ko-lah", "category": "places", "example": "Saya pergi ke sekolah."},
-        "rumah sakit": {"english": "hospital", "pronunciation": "ru-mah sa-kit", "category": "places", "example": "Saya pergi ke rumah sakit."},
-        "toko": {"english": "shop", "pronunciation": "to-ko", "category": "places", "example": "Saya beli di toko."},
-        "restoran": {"english": "restaurant", "pronunciation": "res-to-ran", "category": "places", "example": "Saya makan di restoran."},
-        "bank": {"english": "bank", "pronunciation": "bank", "category": "places", "example": "Saya pergi ke bank."},
-        "kantor": {"english": "office", "pronunciation": "kan-tor", "category": "places", "example": "Saya kerja di kantor."},
-        "pasar": {"english": "market", "pronunciation": "pa-sar", "category": "places", "example": "Saya beli di pasar."},
-        "taman": {"english": "park", "pronunciation": "ta-man", "category": "places", "example": "Saya jalan di taman."},
-        
-        # Common Questions
-        "apa": {"english": "what", "pronunciation": "a-pa", "category": "questions", "example": "Apa nama Anda?"},
-        "siapa": {"english": "who", "pronunciation": "si-a-pa", "category": "questions", "example": "Siapa nama Anda?"},
-        "dimana": {"english": "where", "pronunciation": "di-ma-na", "category": "questions", "example": "Dimana rumah Anda?"},
-        "kapan": {"english": "when", "pronunciation": "ka-pan", "category": "questions", "example": "Kapan Anda datang?"},
-        "mengapa": {"english": "why", "pronunciation": "men-ga-pa", "category": "questions", "example": "Mengapa Anda menangis?"},
-        "bagaimana": {"english": "how", "pronunciation": "ba-gai-ma-na", "category": "questions", "example": "Bagaimana kabar Anda?"},
-        
-        # Common Verbs (More)
-        "melihat": {"english": "to see", "pronunciation": "me-li-hat", "category": "verbs", "example": "Saya melihat burung."},
-        "mendengar": {"english": "to hear", "pronunciation": "men-den-gar", "category": "verbs", "example": "Saya mendengar musik."},
-        "berbicara": {"english": "to speak", "pronunciation": "ber-bi-ca-ra", "category": "verbs", "example": "Saya berbicara bahasa Indonesia."},
-        "membaca": {"english": "to read", "pronunciation": "mem-ba-ca", "category": "verbs", "example": "Saya membaca buku."},
-        "menulis": {"english": "to write", "pronunciation": "me-nu-lis", "category": "verbs", "example": "Saya menulis surat."},
-        "membeli": {"english": "to buy", "pronunciation": "mem-be-li", "category": "verbs", "example": "Saya membeli baju."},
-        "menjual": {"english": "to sell", "pronunciation": "men-ju-al", "category": "verbs", "example": "Saya menjual mobil."},
-        "mencari": {"english": "to search", "pronunciation": "men-ca-ri", "category": "verbs", "example": "Saya mencari kunci."},
-        "menemukan": {"english": "to find", "pronunciation": "me-ne-mu-kan", "category": "verbs", "example": "Saya menemukan dompet."},
-        "membuka": {"english": "to open", "pronunciation": "mem-bu-ka", "category": "verbs", "example": "Saya membuka pintu."},
-        "menutup": {"english": "to close", "pronunciation": "me-nu-tup", "category": "verbs", "example": "Saya menutup jendela."},
-        "duduk": {"english": "to sit", "pronunciation": "du-duk", "category": "verbs", "example": "Saya duduk di kursi."},
-        "berdiri": {"english": "to stand", "pronunciation": "ber-di-ri", "category": "verbs", "example": "Saya berdiri di depan."},
-        "berjalan": {"english": "to walk", "pronunciation": "ber-ja-lan", "category": "verbs", "example": "Saya berjalan di taman."},
-        "berlari": {"english": "to run", "pronunciation": "ber-la-ri", "category": "verbs", "example": "Saya berlari di lapangan."},
-        "waktu": {"english": "time", "pronunciation": "wak-tu", "category": "objects", "example": "Waktu sudah malam."},
-        "jam": {"english": "hour/clock", "pronunciation": "jam", "category": "objects", "example": "Jam berapa sekarang?"},
-        "menit": {"english": "minute", "pronunciation": "me-nit", "category": "objects", "example": "Lima menit lagi."},
-        "detik": {"english": "second", "pronunciation": "de-tik", "category": "objects", "example": "Tiga detik."},
-        
-        # More Essential Words
-        "nama": {"english": "name", "pronunciation": "na-ma", "category": "objects", "example": "Nama saya John."},
-        "alamat": {"english": "address", "pronunciation": "a-la-mat", "category": "objects", "example": "Alamat saya di Jakarta."},
-        "umur": {"english": "age", "pronunciation": "u-mur", "category": "objects", "example": "Umur saya 25 tahun."},
-        "tahun": {"english": "year", "pronunciation": "ta-hun", "category": "objects", "example": "Saya lahir tahun 1995."},
-        "bulan": {"english": "month", "pronunciation": "bu-lan", "category": "objects", "example": "Bulan ini Januari."},
-        "minggu": {"english": "week", "pronunciation": "ming-gu", "category": "objects", "example": "Minggu ini sibuk."},
-        
-        # More Colors
-        "coklat": {"english": "brown", "pronunciation": "cok-lat", "category": "colors", "example": "Rambut saya coklat."},
-        "abu-abu": {"english": "gray", "pronunciation": "a-bu a-bu", "category": "colors", "example": "Langit abu-abu."},
-        "ungu": {"english": "purple", "pronunciation": "un-gu", "category": "colors", "example": "Bunga ini ungu."},
-        "jingga": {"english": "orange", "pronunciation": "jing-ga", "category": "colors", "example": "Jeruk ini jingga."},
-        
-        # More Family
-        "kakak": {"english": "older sibling", "pronunciation": "ka-kak", "category": "family", "example": "Kakak saya mahasiswa."},
-        "adik": {"english": "younger sibling", "pronunciation": "a-dik", "category": "family", "example": "Adik saya masih kecil."},
-        "nenek": {"english": "grandmother", "pronunciation": "ne-nek", "category": "family", "example": "Nenek saya baik."},
-        "kakek": {"english": "grandfather", "pronunciation": "ka-kek", "category": "family", "example": "Kakek saya pintar."},
-        "paman": {"english": "uncle", "pronunciation": "pa-man", "category": "family", "example": "Paman saya dokter."},
-        "bibi": {"english": "aunt", "pronunciation": "bi-bi", "category": "family", "example": "Bibi saya guru."},
-        
-        # More Body Parts
-        "rambut": {"english": "hair", "pronunciation": "ram-but", "category": "body", "example": "Rambut saya panjang."},
-        "telinga": {"english": "ear", "pronunciation": "te-lin-ga", "category": "body", "example": "Telinga saya sakit."},
-        "gigi": {"english": "tooth", "pronunciation": "gi-gi", "category": "body", "example": "Gigi saya putih."},
-        "leher": {"english": "neck", "pronunciation": "le-her", "category": "body", "example": "Leher saya sakit."},
-        "punggung": {"english": "back", "pronunciation": "pung-gung", "category": "body", "example": "Punggung saya sakit."},
-        "perut": {"english": "stomach", "pronunciation": "pe-rut", "category": "body", "example": "Perut saya lapar."},
-        
-        # More Food
-        "garam": {"english": "salt", "pronunciation": "ga-ram", "category": "food", "example": "Garam ini asin."},
-        "gula": {"english": "sugar", "pronunciation": "gu-la", "category": "food", "example": "Gula ini manis."},
-        "minyak": {"english": "oil", "pronunciation": "mi-nyak", "category": "food", "example": "Minyak ini panas."},
-        "lada": {"english": "pepper", "pronunciation": "la-da", "category": "food", "example": "Lada ini pedas."},
-        "bawang": {"english": "onion", "pronunciation": "ba-wang", "category": "food", "example": "Bawang ini besar."},
-        "tomat": {"english": "tomato", "pronunciation": "to-mat", "category": "food", "example": "Tomat ini merah."},
-        
-        # More Objects
-        "kunci": {"english": "key", "pronunciation": "kun-ci", "category": "objects", "example": "Kunci ini kecil."},
-        "dompet": {"english": "wallet", "pronunciation": "dom-pet", "category": "objects", "example": "Dompet saya hilang."},
-        "tas": {"english": "bag", "pronunciation": "tas", "category": "objects", "example": "Tas ini berat."},
-        "sepatu": {"english": "shoe", "pronunciation": "se-pa-tu", "category": "objects", "example": "Sepatu saya baru."},
-        "baju": {"english": "clothes", "pronunciation": "ba-ju", "category": "objects", "example": "Baju ini bagus."},
-        "celana": {"english": "pants", "pronunciation": "ce-la-na", "category": "objects", "example": "Celana ini panjang."},
-        
-        # More Adjectives
-        "baru": {"english": "new", "pronunciation": "ba-ru", "category": "adjectives", "example": "Mobil ini baru."},
-        "lama": {"english": "old", "pronunciation": "la-ma", "category": "adjectives", "example": "Rumah ini lama."},
-        "mudah": {"english": "easy", "pronunciation": "mu-dah", "category": "adjectives", "example": "Pekerjaan ini mudah."},
-        "sulit": {"english": "difficult", "pronunciation": "su-lit", "category": "adjectives", "category": "adjectives", "example": "Pertanyaan ini sulit."},
-        "cepat": {"english": "fast", "pronunciation": "ce-pat", "category": "adjectives", "example": "Mobil ini cepat."},
-        "lambat": {"english": "slow", "pronunciation": "lam-bat", "category": "adjectives", "example": "Kereta ini lambat."},
-        "mahal": {"english": "expensive", "pronunciation": "ma-hal", "category": "adjectives", "example": "Mobil ini mahal."},
-        "murah": {"english": "cheap", "pronunciation": "mu-rah", "category": "adjectives", "example": "Buku ini murah."},
-        "bersih": {"english": "clean", "pronunciation": "ber-sih", "category": "adjectives", "example": "Rumah ini bersih."},
-        "kotor": {"english": "dirty", "pronunciation": "ko-tor", "category": "adjectives", "example": "Pakaian ini kotor."},
-        "berapa": {"english": "how much/many", "pronunciation": "be-ra-pa", "category": "questions", "example": "Berapa harganya?"},
-        "bagaimana": {"english": "how", "pronunciation": "ba-gai-ma-na", "category": "questions", "example": "Bagaimana kabarnya?"},
-        
-        # Weather & Nature
-        "hujan": {"english": "rain", "pronunciation": "hu-jan", "category": "weather", "example": "Hari ini hujan."},
-        "panas": {"english": "sunny/hot", "pronunciation": "pa-nas", "category": "weather", "example": "Cuaca panas hari ini."},
-        "angin": {"english": "wind", "pronunciation": "a-ngin", "category": "weather", "example": "Angin kencang sekali."},
-        "awan": {"english": "cloud", "pronunciation": "a-wan", "category": "weather", "example": "Awan hitam di langit."},
-        "petir": {"english": "lightning", "pronunciation": "pe-tir", "category": "weather", "example": "Petir menyambar pohon."},
-        "salju": {"english": "snow", "pronunciation": "sal-ju", "category": "weather", "example": "Salju turun di gunung."},
-        "pohon": {"english": "tree", "pronunciation": "po-hon", "category": "nature", "example": "Pohon mangga besar."},
-        "bunga": {"english": "flower", "pronunciation": "bu-nga", "category": "nature", "example": "Bunga mawar merah."},
-        "daun": {"english": "leaf", "pronunciation": "da-un", "category": "nature", "example": "Daun gugur di musim kering."},
-        "rumput": {"english": "grass", "pronunciation": "rum-put", "category": "nature", "example": "Rumput hijau di taman."},
-        "batu": {"english": "stone", "pronunciation": "ba-tu", "category": "nature", "example": "Batu besar di sungai."},
-        "pasir": {"english": "sand", "pronunciation": "pa-sir", "category": "nature", "example": "Pasir putih di pantai."},
-        "laut": {"english": "sea", "pronunciation": "la-ut", "category": "nature", "example": "Laut biru jernih."},
-        "sungai": {"english": "river", "pronunciation": "su-ngai", "category": "nature", "example": "Sungai mengalir deras."},
-        "gunung": {"english": "mountain", "pronunciation": "gu-nung", "category": "nature", "example": "Gunung tinggi sekali."},
-        "hutan": {"english": "forest", "pronunciation": "hu-tan", "category": "nature", "example": "Hutan lebat dan gelap."},
-        
-        # Animals
-        "kucing": {"english": "cat", "pronunciation": "ku-cing", "category": "animals", "example": "Kucing hitam tidur."},
-        "anjing": {"english": "dog", "pronunciation": "an-jing", "category": "animals", "example": "Anjing menggonggong keras."},
-        "burung": {"english": "bird", "pronunciation": "bu-rung", "category": "animals", "example": "Burung terbang tinggi."},
-        "ayam": {"english": "chicken", "pronunciation": "a-yam", "category": "animals", "example": "Ayam berkokok pagi."},
-        "sapi": {"english": "cow", "pronunciation": "sa-pi", "category": "animals", "example": "Sapi makan rumput."},
-        "kambing": {"english": "goat", "pronunciation": "kam-bing", "category": "animals", "example": "Kambing putih lucu."},
-        "kuda": {"english": "horse", "pronunciation": "ku-da", "category": "animals", "example": "Kuda berlari cepat."},
-        "gajah": {"english": "elephant", "pronunciation": "ga-jah", "category": "animals", "example": "Gajah besar dan kuat."},
-        "harimau": {"english": "tiger", "pronunciation": "ha-ri-mau", "category": "animals", "example": "Harimau berburu malam."},
-        "monyet": {"english": "monkey", "pronunciation": "mo-nyet", "category": "animals", "example": "Monyet melompat di pohon."},
-        "ular": {"english": "snake", "pronunciation": "u-lar", "category": "animals", "example": "Ular merayap di tanah."},
-        "katak": {"english": "frog", "pronunciation": "ka-tak", "category": "animals", "example": "Katak hijau di kolam."},
-        
-        # Transportation
-        "pesawat": {"english": "airplane", "pronunciation": "pe-sa-wat", "category": "transportation", "example": "Pesawat terbang tinggi."},
-        "kereta": {"english": "train", "pronunciation": "ke-re-ta", "category": "transportation", "example": "Kereta api cepat."},
-        "bus": {"english": "bus", "pronunciation": "bus", "category": "transportation", "example": "Bus kota penuh penumpang."},
-        "taksi": {"english": "taxi", "pronunciation": "tak-si", "category": "transportation", "example": "Taksi kuning berhenti."},
-        "motor": {"english": "motorcycle", "pronunciation": "mo-tor", "category": "transportation", "example": "Motor merah kencang."},
-        "becak": {"english": "rickshaw", "pronunciation": "be-cak", "category": "transportation", "example": "Becak tradisional Indonesia."},
-        "perahu": {"english": "boat", "pronunciation": "pe-ra-hu", "category": "transportation", "example": "Perahu nelayan kecil."},
-        "kapal": {"english": "ship", "pronunciation": "ka-pal", "category": "transportation", "example": "Kapal besar di pelabuhan."},
-        
-        # Emotions & Feelings
-        "senang": {"english": "happy", "pronunciation": "se-nang", "category": "emotions", "example": "Saya senang hari ini."},
-        "sedih": {"english": "sad", "pronunciation": "se-dih", "category": "emotions", "example": "Dia sedih mendengar berita."},
-        "marah": {"english": "angry", "pronunciation": "ma-rah", "category": "emotions", "example": "Ayah marah pada adik."},
-        "takut": {"english": "afraid", "pronunciation": "ta-kut", "category": "emotions", "example": "Anak takut gelap."},
-        "kaget": {"english": "surprised", "pronunciation": "ka-get", "category": "emotions", "example": "Saya kaget melihatnya."},
-        "bosan": {"english": "bored", "pronunciation": "bo-san", "category": "emotions", "example": "Dia bosan di rumah."},
-        "lelah": {"english": "tired", "pronunciation": "le-lah", "category": "emotions", "example": "Saya lelah bekerja."},
-        "lapar": {"english": "hungry", "pronunciation": "la-par", "category": "emotions", "example": "Perut saya lapar."},
-        "haus": {"english": "thirsty", "pronunciation": "ha-us", "category": "emotions", "example": "Mulut saya haus."},
-        "sakit": {"english": "sick/hurt", "pronunciation": "sa-kit", "category": "emotions", "example": "Kepala saya sakit."},
-        
-        # Technology & Modern Life
-        "internet": {"english": "internet", "pronunciation": "in-ter-net", "category": "technology", "example": "Internet cepat sekali."},
-        "email": {"english": "email", "pronunciation": "e-mail", "category": "technology", "example": "Kirim email penting."},
-        "website": {"english": "website", "pronunciation": "web-site", "category": "technology", "example": "Website bagus sekali."},
-        "aplikasi": {"english": "application", "pronunciation": "ap-li-ka-si", "category": "technology", "example": "Aplikasi baru di ponsel."},
-        "foto": {"english": "photo", "pronunciation": "fo-to", "category": "technology", "example": "Foto keluarga indah."},
-        "video": {"english": "video", "pronunciation": "vi-de-o", "category": "technology", "example": "Video lucu di YouTube."},
-        "musik": {"english": "music", "pronunciation": "mu-sik", "category": "technology", "example": "Musik jazz enak didengar."},
-        "film": {"english": "movie", "pronunciation": "film", "category": "technology", "example": "Film Indonesia bagus."},
-        
-        # Clothing & Fashion
-        "kemeja": {"english": "shirt", "pronunciation": "ke-me-ja", "category": "clothing", "example": "Kemeja putih rapi."},
-        "kaos": {"english": "t-shirt", "pronunciation": "ka-os", "category": "clothing", "example": "Kaos merah favorit saya."},
-        "rok": {"english": "skirt", "pronunciation": "rok", "category": "clothing", "example": "Rok panjang warna biru."},
-        "jaket": {"english": "jacket", "pronunciation": "ja-ket", "category": "clothing", "example": "Jaket tebal untuk dingin."},
-        "topi": {"english": "hat", "pronunciation": "to-pi", "category": "clothing", "example": "Topi hitam keren."},
-        "kacamata": {"english": "glasses", "pronunciation": "ka-ca-ma-ta", "category": "clothing", "example": "Kacamata minus tinggi."},
-        "jam": {"english": "watch", "pronunciation": "jam", "category": "clothing", "example": "Jam tangan mahal."},
-        "cincin": {"english": "ring", "pronunciation": "cin-cin", "category": "clothing", "example": "Cincin emas berkilau."},
-        "kalung": {"english": "necklace", "pronunciation": "ka-lung", "category": "clothing", "example": "Kalung mutiara cantik."},
-        
-        # Sports & Activities
-        "olahraga": {"english": "sports", "pronunciation": "o-lah-ra-ga", "category": "sports", "example": "Olahraga setiap pagi."},
-        "sepak bola": {"english": "football/soccer", "pronunciation": "se-pak bo-la", "category": "sports", "example": "Main sepak bola sore."},
-        "basket": {"english": "basketball", "pronunciation": "bas-ket", "category": "sports", "example": "Tim basket sekolah menang."},
-        "renang": {"english": "swimming", "pronunciation": "re-nang", "category": "sports", "example": "Renang di kolam bersih."},
-        "lari": {"english": "running", "pronunciation": "la-ri", "category": "sports", "example": "Lari pagi menyehatkan."},
-        "bersepeda": {"english": "cycling", "pronunciation": "ber-se-pe-da", "category": "sports", "example": "Bersepeda ke kantor."},
-        "yoga": {"english": "yoga", "pronunciation": "yo-ga", "category": "sports", "example": "Yoga relaksasi tubuh."},
-        "gym": {"english": "gym", "pronunciation": "gym", "category": "sports", "example": "Gym setiap hari."},
-        
-        # Education & Learning
-        "universitas": {"english": "university", "pronunciation": "u-ni-ver-si-tas", "category": "education", "example": "Universitas terbaik di kota."},
-        "mahasiswa": {"english": "student", "pronunciation": "ma-ha-sis-wa", "category": "education", "example": "Mahasiswa rajin belajar."},
-        "guru": {"english": "teacher", "pronunciation": "gu-ru", "category": "education", "example": "Guru matematika baik."},
-        "pelajaran": {"english": "lesson", "pronunciation": "pe-la-ja-ran", "category": "education", "example": "Pelajaran hari ini sulit."},
-        "ujian": {"english": "exam", "pronunciation": "u-ji-an", "category": "education", "example": "Ujian besok pagi."},
-        "nilai": {"english": "grade", "pronunciation": "ni-lai", "category": "education", "example": "Nilai bagus sekali."},
-        "diploma": {"english": "diploma", "pronunciation": "dip-lo-ma", "category": "education", "example": "Diploma sarjana baru."},
-        "perpustakaan": {"english": "library", "pronunciation": "per-pus-ta-ka-an", "category": "education", "example": "Perpustakaan buku lengkap."},
-        
-        # Business & Work
-        "kerja": {"english": "work", "pronunciation": "ker-ja", "category": "business", "example": "Saya kerja di kantor."},
-        "kantor": {"english": "office", "pronunciation": "kan-tor", "category": "business", "example": "Kantor baru sangat besar."},
-        "bisnis": {"english": "business", "pronunciation": "bis-nis", "category": "business", "example": "Bisnis online berkembang."},
-        "uang": {"english": "money", "pronunciation": "u-ang", "category": "business", "example": "Uang di dompet habis."},
-        "gaji": {"english": "salary", "pronunciation": "ga-ji", "category": "business", "example": "Gaji bulan ini naik."},
-        "bank": {"english": "bank", "pronunciation": "bank", "category": "business", "example": "Bank tutup hari Minggu."},
-        "investasi": {"english": "investment", "pronunciation": "in-ves-ta-si", "category": "business", "example": "Investasi saham menguntungkan."},
-        "perusahaan": {"english": "company", "pronunciation": "pe-ru-sa-ha-an", "category": "business", "example": "Perusahaan besar di Jakarta."},
-        
-        # Health & Medical
-        "dokter": {"english": "doctor", "pronunciation": "dok-ter", "category": "health", "example": "Dokter memeriksa pasien."},
-        "rumah sakit": {"english": "hospital", "pronunciation": "ru-mah sa-kit", "category": "health", "example": "Rumah sakit baru dibuka."},
-        "obat": {"english": "medicine", "pronunciation": "o-bat", "category": "health", "example": "Obat diminum tiga kali."},
-        "sehat": {"english": "healthy", "pronunciation": "se-hat", "category": "health", "example": "Badan sehat jiwa kuat."},
-        "demam": {"english": "fever", "pronunciation": "de-mam", "category": "health", "example": "Anak demam tinggi."},
-        "batuk": {"english": "cough", "pronunciation": "ba-tuk", "category": "health", "example": "Batuk sudah seminggu."},
-        "pilek": {"english": "cold", "pronunciation": "pi-lek", "category": "health", "example": "Pilek karena hujan."},
-        "alergi": {"english": "allergy", "pronunciation": "a-ler-gi", "category": "health", "example": "Alergi makanan laut."},
-        
-        # Travel & Places
-        "hotel": {"english": "hotel", "pronunciation": "ho-tel", "category": "travel", "example": "Hotel mewah di pantai."},
-        "restoran": {"english": "restaurant", "pronunciation": "res-to-ran", "category": "travel", "example": "Restoran Indonesia enak."},
-        "museum": {"english": "museum", "pronunciation": "mu-se-um", "category": "travel", "example": "Museum sejarah menarik."},
-        "taman": {"english": "park", "pronunciation": "ta-man", "category": "travel", "example": "Taman kota sangat indah."},
-        "pantai": {"english": "beach", "pronunciation": "pan-tai", "category": "travel", "example": "Pantai Bali terkenal."},
-        "jalan": {"english": "road/street", "pronunciation": "ja-lan", "category": "travel", "example": "Jalan raya macet."},
-        "jembatan": {"english": "bridge", "pronunciation": "jem-ba-tan", "category": "travel", "example": "Jembatan panjang sekali."},
-        "bandara": {"english": "airport", "pronunciation": "ban-da-ra", "category": "travel", "example": "Bandara internasional besar."},
-        
-        # Shopping & Commerce
-        "toko": {"english": "shop", "pronunciation": "to-ko", "category": "shopping", "example": "Toko buku di pojok."},
-        "pasar": {"english": "market", "pronunciation": "pa-sar", "category": "shopping", "example": "Pasar tradisional ramai."},
-        "mall": {"english": "mall", "pronunciation": "mall", "category": "shopping", "example": "Mall baru sangat besar."},
-        "kasir": {"english": "cashier", "pronunciation": "ka-sir", "category": "shopping", "example": "Kasir ramah sekali."},
-        "diskon": {"english": "discount", "pronunciation": "dis-kon", "category": "shopping", "example": "Diskon besar-besaran."},
-        "kartu kredit": {"english": "credit card", "pronunciation": "kar-tu kre-dit", "category": "shopping", "example": "Bayar pakai kartu kredit."},
-        "belanja": {"english": "shopping", "pronunciation": "be-lan-ja", "category": "shopping", "example": "Belanja bulanan di supermarket."},
-        "harga": {"english": "price", "pronunciation": "har-ga", "category": "shopping", "example": "Harga naik terus."},
-        
-        # Government & Politics
-        "pemerintah": {"english": "government", "pronunciation": "pe-me-rin-tah", "category": "politics", "example": "Pemerintah baru terpilih."},
-        "presiden": {"english": "president", "pronunciation": "pre-si-den", "category": "politics", "example": "Presiden memberikan pidato."},
-        "menteri": {"english": "minister", "pronunciation": "men-te-ri", "category": "politics", "example": "Menteri kesehatan hadir."},
-        "pemilihan": {"english": "election", "pronunciation": "pe-mi-li-han", "category": "politics", "example": "Pemilihan umum tahun depan."},
-        "undang-undang": {"english": "law", "pronunciation": "un-dang un-dang", "category": "politics", "example": "Undang-undang baru disahkan."},
-        "negara": {"english": "country", "pronunciation": "ne-ga-ra", "category": "politics", "example": "Negara Indonesia besar."},
-        "rakyat": {"english": "people/citizens", "pronunciation": "rak-yat", "category": "politics", "example": "Rakyat mendukung kebijakan."},
-        
-        # Science & Research
-        "ilmu": {"english": "science", "pronunciation": "il-mu", "category": "science", "example": "Ilmu pengetahuan berkembang."},
-        "penelitian": {"english": "research", "pronunciation": "pe-ne-li-ti-an", "category": "science", "example": "Penelitian ini penting."},
-        "eksperimen": {"english": "experiment", "pronunciation": "eks-pe-ri-men", "category": "science", "example": "Eksperimen berhasil dilakukan."},
-        "laboratorium": {"english": "laboratory", "pronunciation": "la-bo-ra-to-ri-um", "category": "science", "example": "Laboratorium bersih sekali."},
-        "kimia": {"english": "chemistry", "pronunciation": "ki-mi-a", "category": "science", "example": "Pelajaran kimia menarik."},
-        "fisika": {"english": "physics", "pronunciation": "fi-si-ka", "category": "science", "example": "Fisika kuantum rumit."},
-        "biologi": {"english": "biology", "pronunciation": "bi-o-lo-gi", "category": "science", "example": "Biologi mempelajari kehidupan."},
-        "matematika": {"english": "mathematics", "pronunciation": "ma-te-ma-ti-ka", "category": "science", "example": "Matematika dasar penting."},
-        
-        # Arts & Culture
-        "seni": {"english": "art", "pronunciation": "se-ni", "category": "culture", "example": "Seni lukis Indonesia indah."},
-        "budaya": {"english": "culture", "pronunciation": "bu-da-ya", "category": "culture", "example": "Budaya Jawa unik."},
-        "tarian": {"english": "dance", "pronunciation": "ta-ri-an", "category": "culture", "example": "Tarian Bali sangat cantik."},
-        "lukisan": {"english": "painting", "pronunciation": "lu-ki-san", "category": "culture", "example": "Lukisan ini mahal."},
-        "patung": {"english": "sculpture", "pronunciation": "pa-tung", "category": "culture", "example": "Patung Budha kuno."},
-        "kerajinan": {"english": "handicraft", "pronunciation": "ke-ra-ji-nan", "category": "culture", "example": "Kerajinan tangan bagus."},
-        "tradisi": {"english": "tradition", "pronunciation": "tra-di-si", "category": "culture", "example": "Tradisi leluhur dijaga."},
-        "upacara": {"english": "ceremony", "pronunciation": "u-pa-ca-ra", "category": "culture", "example": "Upacara adat sakral."},
-        
-        # Professions & Jobs
-        "pekerjaan": {"english": "job", "pronunciation": "pe-ker-ja-an", "category": "jobs", "example": "Pekerjaan ini mudah."},
-        "profesi": {"english": "profession", "pronunciation": "pro-fe-si", "category": "jobs", "example": "Profesi dokter mulia."},
-        "insinyur": {"english": "engineer", "pronunciation": "in-si-nyur", "category": "jobs", "example": "Insinyur membangun jembatan."},
-        "akuntan": {"english": "accountant", "pronunciation": "a-kun-tan", "category": "jobs", "example": "Akuntan menghitung keuangan."},
-        "pengacara": {"english": "lawyer", "pronunciation": "peng-a-ca-ra", "category": "jobs", "example": "Pengacara membela klien."},
-        "pilot": {"english": "pilot", "pronunciation": "pi-lot", "category": "jobs", "example": "Pilot menerbangkan pesawat."},
-        "wartawan": {"english": "journalist", "pronunciation": "war-ta-wan", "category": "jobs", "example": "Wartawan menulis berita."},
-        "arsitek": {"english": "architect", "pronunciation": "ar-si-tek", "category": "jobs", "example": "Arsitek merancang rumah."},
-        
-        # Environment & Ecology
-        "lingkungan": {"english": "environment", "pronunciation": "ling-kung-an", "category": "environment", "example": "Lingkungan harus dijaga."},
-        "polusi": {"english": "pollution", "pronunciation": "po-lu-si", "category": "environment", "example": "Polusi udara berbahaya."},
-        "daur ulang": {"english": "recycling", "pronunciation": "da-ur u-lang", "category": "environment", "example": "Daur ulang plastik penting."},
-        "sampah": {"english": "garbage", "pronunciation": "sam-pah", "category": "environment", "example": "Sampah harus dibuang."},
-        "konservasi": {"english": "conservation", "pronunciation": "kon-ser-va-si", "category": "environment", "example": "Konservasi hutan diperlukan."},
-        "ekosistem": {"english": "ecosystem", "pronunciation": "e-ko-sis-tem", "category": "environment", "example": "Ekosistem laut rusak."},
-        "keanekaragaman": {"english": "biodiversity", "pronunciation": "ke-a-ne-ka-ra-ga-man", "category": "environment", "example": "Keanekaragaman hayati Indonesia."},
-        
-        # Food & Cooking
-        "memasak": {"english": "cooking", "pronunciation": "me-ma-sak", "category": "cooking", "example": "Ibu memasak nasi."},
-        "resep": {"english": "recipe", "pronunciation": "re-sep", "category": "cooking", "example": "Resep kue lezat."},
-        "bumbu": {"english": "spices", "pronunciation": "bum-bu", "category": "cooking", "example": "Bumbu Indonesia kaya."},
-        "masakan": {"english": "cuisine", "pronunciation": "ma-sa-kan", "category": "cooking", "example": "Masakan Padang pedas."},
-        "hidangan": {"english": "dish", "pronunciation": "hi-dang-an", "category": "cooking", "example": "Hidangan utama lezat."},
-        "rasa": {"english": "taste", "pronunciation": "ra-sa", "category": "cooking", "example": "Rasa makanan enak."},
-        "aroma": {"english": "aroma", "pronunciation": "a-ro-ma", "category": "cooking", "example": "Aroma kopi harum."},
-        
-        # More Essential Words
-        "ini": {"english": "this", "pronunciation": "i-ni", "category": "pronouns", "example": "Ini buku saya."},
-        "itu": {"english": "that", "pronunciation": "i-tu", "category": "pronouns", "example": "Itu mobil baru."},
-        "di": {"english": "in/at", "pronunciation": "di", "category": "prepositions", "example": "Saya di rumah."},
-        "ke": {"english": "to", "pronunciation": "ke", "category": "prepositions", "example": "Saya pergi ke sekolah."},
-        "dari": {"english": "from", "pronunciation": "da-ri", "category": "prepositions", "example": "Saya dari Jakarta."},
-        "dengan": {"english": "with", "pronunciation": "de-ngan", "category": "prepositions", "example": "Saya pergi dengan teman."},
-        "untuk": {"english": "for", "pronunciation": "un-tuk", "category": "prepositions", "example": "Ini untuk Anda."},
-        "dan": {"english": "and", "pronunciation": "dan", "category": "conjunctions", "example": "Saya dan dia pergi."},
-        "atau": {"english": "or", "pronunciation": "a-tau", "category": "conjunctions", "example": "Teh atau kopi?"},
-        "tetapi": {"english": "but", "pronunciation": "te-ta-pi", "category": "conjunctions", "example": "Mahal tetapi bagus."},
-        "karena": {"english": "because", "pronunciation": "ka-re-na", "category": "conjunctions", "example": "Terlambat karena macet."},
-        "jika": {"english": "if", "pronunciation": "ji-ka", "category": "conjunctions", "example": "Jika hujan, di rumah."},
-        "ketika": {"english": "when", "pronunciation": "ke-ti-ka", "category": "conjunctions", "example": "Ketika malam tiba."},
-        "sebelum": {"english": "before", "pronunciation": "se-be-lum", "category": "conjunctions", "example": "Sebelum makan, cuci tangan."},
-        "sesudah": {"english": "after", "pronunciation": "se-su-dah", "category": "conjunctions", "example": "Sesudah makan, istirahat."},
-        # Military & Security
-        "tentara": {"english": "army", "pronunciation": "ten-ta-ra", "category": "military", "example": "Tentara menjaga negara."},
-        "polisi": {"english": "police", "pronunciation": "po-li-si", "category": "military", "example": "Polisi menangkap pencuri."},
-        "keamanan": {"english": "security", "pronunciation": "ke-a-man-an", "category": "military", "example": "Keamanan sangat penting."},
-        "perang": {"english": "war", "pronunciation": "pe-rang", "category": "military", "example": "Perang dunia berakhir."},
-        "perdamaian": {"english": "peace", "pronunciation": "per-da-mai-an", "category": "military", "example": "Perdamaian dunia diinginkan."},
-        
-        # Religion & Spirituality
-        "agama": {"english": "religion", "pronunciation": "a-ga-ma", "category": "religion", "example": "Agama mengajarkan kebaikan."},
-        "doa": {"english": "prayer", "pronunciation": "do-a", "category": "religion", "example": "Doa ibu terkabul."},
-        "gereja": {"english": "church", "pronunciation": "ge-re-ja", "category": "religion", "example": "Gereja tua bersejarah."},
-        "masjid": {"english": "mosque", "pronunciation": "mas-jid", "category": "religion", "example": "Masjid besar indah."},
-        "kuil": {"english": "temple", "pronunciation": "ku-il", "category": "religion", "example": "Kuil Hindu kuno."},
-        "surga": {"english": "heaven", "pronunciation": "sur-ga", "category": "religion", "example": "Surga tempat bahagia."},
-        
-        # Geography & Nature
-        "benua": {"english": "continent", "pronunciation": "be-nu-a", "category": "geography", "example": "Benua Asia terbesar."},
-        "pulau": {"english": "island", "pronunciation": "pu-lau", "category": "geography", "example": "Pulau Bali terkenal."},
-        "selat": {"english": "strait", "pronunciation": "se-lat", "category": "geography", "example": "Selat Sunda sempit."},
-        "teluk": {"english": "bay", "pronunciation": "te-luk", "category": "geography", "example": "Teluk Jakarta besar."},
-        "danau": {"english": "lake", "pronunciation": "da-nau", "category": "geography", "example": "Danau Toba indah."},
-        "padang rumput": {"english": "grassland", "pronunciation": "pa-dang rum-put", "category": "geography", "example": "Padang rumput luas."},
-        "gua": {"english": "cave", "pronunciation": "gu-a", "category": "geography", "example": "Gua gelap dan dingin."},
-        "air terjun": {"english": "waterfall", "pronunciation": "a-ir ter-jun", "category": "geography", "example": "Air terjun tinggi sekali."},
-        
-        # Communication & Media
-        "komunikasi": {"english": "communication", "pronunciation": "ko-mu-ni-ka-si", "category": "media", "example": "Komunikasi sangat penting."},
-        "berita": {"english": "news", "pronunciation": "be-ri-ta", "category": "media", "example": "Berita hari ini menarik."},
-        "koran": {"english": "newspaper", "pronunciation": "ko-ran", "category": "media", "example": "Koran pagi dibaca."},
-        "majalah": {"english": "magazine", "pronunciation": "ma-ja-lah", "category": "media", "example": "Majalah fashion terbaru."},
-        "radio": {"english": "radio", "pronunciation": "ra-di-o", "category": "media", "example": "Radio menyiarkan musik."},
-        "televisi": {"english": "television", "pronunciation": "te-le-vi-si", "category": "media", "example": "Televisi rusak total."},
-        "iklan": {"english": "advertisement", "pronunciation": "ik-lan", "category": "media", "example": "Iklan produk baru."},
-        
-        # Finance & Economics
-        "ekonomi": {"english": "economy", "pronunciation": "e-ko-no-mi", "category": "finance", "example": "Ekonomi Indonesia tumbuh."},
-        "keuangan": {"english": "finance", "pronunciation": "ke-u-ang-an", "category": "finance", "example": "Keuangan keluarga stabil."},
-        "hutang": {"english": "debt", "pronunciation": "hu-tang", "category": "finance", "example": "Hutang harus dibayar."},
-        "kredit": {"english": "credit", "pronunciation": "kre-dit", "category": "finance", "example": "Kredit rumah disetujui."},
-        "tabungan": {"english": "savings", "pronunciation": "ta-bung-an", "category": "finance", "example": "Tabungan semakin banyak."},
-        "pajak": {"english": "tax", "pronunciation": "pa-jak", "category": "finance", "example": "Pajak harus dibayar."},
-        "anggaran": {"english": "budget", "pronunciation": "ang-ga-ran", "category": "finance", "example": "Anggaran bulan ini ketat."},
-        
-        # Emotions & Feelings Extended
-        "cinta": {"english": "love", "pronunciation": "cin-ta", "category": "emotions", "example": "Cinta ibu tulus."},
-        "benci": {"english": "hate", "pronunciation": "ben-ci", "category": "emotions", "example": "Jangan benci orang lain."},
-        "rindu": {"english": "miss", "pronunciation": "rin-du", "category": "emotions", "example": "Rindu kampung halaman."},
-        "bangga": {"english": "proud", "pronunciation": "bang-ga", "category": "emotions", "example": "Bangga pada anak."},
-        "malu": {"english": "ashamed", "pronunciation": "ma-lu", "category": "emotions", "example": "Malu berbuat salah."},
-        "iri": {"english": "jealous", "pronunciation": "i-ri", "category": "emotions", "example": "Iri pada teman."},
-        "kecewa": {"english": "disappointed", "pronunciation": "ke-ce-wa", "category": "emotions", "example": "Kecewa dengan hasil."},
-        "bahagia": {"english": "happy", "pronunciation": "ba-ha-gi-a", "category": "emotions", "example": "Bahagia bersama keluarga."},
-        
-        # Music & Entertainment
-        "lagu": {"english": "song", "pronunciation": "la-gu", "category": "music", "example": "Lagu ini populer."},
-        "penyanyi": {"english": "singer", "pronunciation": "pe-nya-nyi", "category": "music", "example": "Penyanyi terkenal tampil."},
-        "konser": {"english": "concert", "pronunciation": "kon-ser", "category": "music", "example": "Konser musik rock."},
-        "alat musik": {"english": "musical instrument", "pronunciation": "a-lat mu-sik", "category": "music", "example": "Alat musik tradisional."},
-        "bioskop": {"english": "cinema", "pronunciation": "bi-os-kop", "category": "entertainment", "example": "Bioskop penuh penonton."},
-        "teater": {"english": "theater", "pronunciation": "te-a-ter", "category": "entertainment", "example": "Teater drama bagus."},
-        "hiburan": {"english": "entertainment", "pronunciation": "hi-bu-ran", "category": "entertainment", "example": "Hiburan malam menarik."},
-        
-        # Time Words
-        "sekarang": {"english": "now", "pronunciation": "se-ka-rang", "category": "time", "example": "Sekarang jam berapa?"},
-        "kemarin": {"english": "yesterday", "pronunciation": "ke-ma-rin", "category": "time", "example": "Kemarin saya pergi ke pasar."},
-        "besok": {"english": "tomorrow", "pronunciation": "be-sok", "category": "time", "example": "Besok saya akan datang."},
-        "lusa": {"english": "day after tomorrow", "pronunciation": "lu-sa", "category": "time", "example": "Lusa ada acara penting."},
-        "kemarin dulu": {"english": "day before yesterday", "pronunciation": "ke-ma-rin du-lu", "category": "time", "example": "Kemarin dulu hujan deras."},
-        "minggu": {"english": "week", "pronunciation": "ming-gu", "category": "time", "example": "Minggu depan libur."},
-        "bulan": {"english": "month", "pronunciation": "bu-lan", "category": "time", "example": "Bulan ini sibuk."},
-        "tahun": {"english": "year", "pronunciation": "ta-hun", "category": "time", "example": "Tahun baru datang."},
-        "abad": {"english": "century", "pronunciation": "a-bad", "category": "time", "example": "Abad ke-21 modern."},
-        "masa": {"english": "era/period", "pronunciation": "ma-sa", "category": "time", "example": "Masa lalu indah."},
-        
-        # Advanced Technology
-        "komputer": {"english": "computer", "pronunciation": "kom-pu-ter", "category": "technology", "example": "Komputer baru cepat."},
-        "laptop": {"english": "laptop", "pronunciation": "lap-top", "category": "technology", "example": "Laptop ringan praktis."},
-        "tablet": {"english": "tablet", "pronunciation": "tab-let", "category": "technology", "example": "Tablet untuk membaca."},
-        "smartphone": {"english": "smartphone", "pronunciation": "smart-phone", "category": "technology", "example": "Smartphone canggih sekali."},
-        "perangkat lunak": {"english": "software", "pronunciation": "pe-rang-kat lu-nak", "category": "technology", "example": "Perangkat lunak terbaru."},
-        "perangkat keras": {"english": "hardware", "pronunciation": "pe-rang-kat ke-ras", "category": "technology", "example": "Perangkat keras mahal."},
-        "jaringan": {"english": "network", "pronunciation": "ja-ring-an", "category": "technology", "example": "Jaringan internet cepat."},
-        "server": {"english": "server", "pronunciation": "ser-ver", "category": "technology", "example": "Server down sementara."},
-        "database": {"english": "database", "pronunciation": "da-ta-base", "category": "technology", "example": "Database pelanggan lengkap."},
-        "algoritma": {"english": "algorithm", "pronunciation": "al-go-rit-ma", "category": "technology", "example": "Algoritma pencarian efisien."},
-        
-        # Advanced Science
-        "molekul": {"english": "molecule", "pronunciation": "mo-le-kul", "category": "science", "example": "Molekul air sederhana."},
-        "atom": {"english": "atom", "pronunciation": "a-tom", "category": "science", "example": "Atom terkecil materi."},
-        "elektron": {"english": "electron", "pronunciation": "e-lek-tron", "category": "science", "example": "Elektron bermuatan negatif."},
-        "proton": {"english": "proton", "pronunciation": "pro-ton", "category": "science", "example": "Proton di inti atom."},
-        "neutron": {"english": "neutron", "pronunciation": "neu-tron", "category": "science", "example": "Neutron tidak bermuatan."},
-        "gravitasi": {"english": "gravity", "pronunciation": "gra-vi-ta-si", "category": "science", "example": "Gravitasi menarik benda."},
-        "energi": {"english": "energy", "pronunciation": "e-ner-gi", "category": "science", "example": "Energi tidak dapat hilang."},
-        "massa": {"english": "mass", "pronunciation": "mas-sa", "category": "science", "example": "Massa benda tetap."},
-        "volume": {"english": "volume", "pronunciation": "vo-lu-me", "category": "science", "example": "Volume air berubah."},
-        "densitas": {"english": "density", "pronunciation": "den-si-tas", "category": "science", "example": "Densitas emas tinggi."},
-        
-        # Advanced Medical
-        "diagnosis": {"english": "diagnosis", "pronunciation": "di-ag-no-sis", "category": "health", "example": "Diagnosis dokter akurat."},
-        "terapi": {"english": "therapy", "pronunciation": "te-ra-pi", "category": "health", "example": "Terapi fisik membantu."},
-        "operasi": {"english": "surgery", "pronunciation": "o-pe-ra-si", "category": "health", "example": "Operasi jantung berhasil."},
-        "vaksin": {"english": "vaccine", "pronunciation": "vak-sin", "category": "health", "example": "Vaksin mencegah penyakit."},
-        "antibiotik": {"english": "antibiotic", "pronunciation": "an-ti-bi-o-tik", "category": "health", "example": "Antibiotik melawan bakteri."},
-        "virus": {"english": "virus", "pronunciation": "vi-rus", "category": "health", "example": "Virus sangat kecil."},
-        "bakteri": {"english": "bacteria", "pronunciation": "bak-te-ri", "category": "health", "example": "Bakteri ada dimana-mana."},
-        "penyakit": {"english": "disease", "pronunciation": "pe-nya-kit", "category": "health", "example": "Penyakit harus diobati."},
-        "gejala": {"english": "symptoms", "pronunciation": "ge-ja-la", "category": "health", "example": "Gejala demam muncul."},
-        "pencegahan": {"english": "prevention", "pronunciation": "pen-ce-gah-an", "category": "health", "example": "Pencegahan lebih baik."},
-        
-        # Advanced Geography
-        "benua": {"english": "continent", "pronunciation": "be-nu-a", "category": "geography", "example": "Benua Asia terluas."},
-        "samudra": {"english": "ocean", "pronunciation": "sa-mud-ra", "category": "geography", "example": "Samudra Pasifik luas."},
-        "khatulistiwa": {"english": "equator", "pronunciation": "kha-tu-lis-ti-wa", "category": "geography", "example": "Indonesia di khatulistiwa."},
-        "kutub": {"english": "pole", "pronunciation": "ku-tub", "category": "geography", "example": "Kutub utara dingin."},
-        "garis lintang": {"english": "latitude", "pronunciation": "ga-ris lin-tang", "category": "geography", "example": "Garis lintang nol derajat."},
-        "garis bujur": {"english": "longitude", "pronunciation": "ga-ris bu-jur", "category": "geography", "example": "Garis bujur timur."},
-        "iklim": {"english": "climate", "pronunciation": "ik-lim", "category": "geography", "example": "Iklim tropis hangat."},
-        "musim": {"english": "season", "pronunciation": "mu-sim", "category": "geography", "example": "Musim hujan tiba."},
-        "topografi": {"english": "topography", "pronunciation": "to-po-gra-fi", "category": "geography", "example": "Topografi pegunungan."},
-        "geologi": {"english": "geology", "pronunciation": "ge-o-lo-gi", "category": "geography", "example": "Geologi Indonesia unik."},
-        
-        # Advanced Arts
-        "kaligrafi": {"english": "calligraphy", "pronunciation": "ka-li-gra-fi", "category": "culture", "example": "Kaligrafi Arab indah."},
-        "arsitektur": {"english": "architecture", "pronunciation": "ar-si-tek-tur", "category": "culture", "example": "Arsitektur Jawa klasik."},
-        "sastra": {"english": "literature", "pronunciation": "sas-tra", "category": "culture", "example": "Sastra Indonesia kaya."},
-        "puisi": {"english": "poetry", "pronunciation": "pu-i-si", "category": "culture", "example": "Puisi cinta romantis."},
-        "novel": {"english": "novel", "pronunciation": "no-vel", "category": "culture", "example": "Novel sejarah menarik."},
-        "cerita": {"english": "story", "pronunciation": "ce-ri-ta", "category": "culture", "example": "Cerita rakyat terkenal."},
-        "dongeng": {"english": "fairy tale", "pronunciation": "dong-eng", "category": "culture", "example": "Dongeng anak-anak lucu."},
-        "legenda": {"english": "legend", "pronunciation": "le-gen-da", "category": "culture", "example": "Legenda Sangkuriang."},
-        "mitos": {"english": "myth", "pronunciation": "mi-tos", "category": "culture", "example": "Mitos kuno misterius."},
-        "folklore": {"english": "folklore", "pronunciation": "folk-lo-re", "category": "culture", "example": "Folklore daerah beragam."},
-        
-        # Advanced Economics
-        "inflasi": {"english": "inflation", "pronunciation": "in-fla-si", "category": "finance", "example": "Inflasi naik drastis."},
-        "deflasi": {"english": "deflation", "pronunciation": "de-fla-si", "category": "finance", "example": "Deflasi jarang terjadi."},
-        "resesi": {"english": "recession", "pronunciation": "re-se-si", "category": "finance", "example": "Resesi ekonomi global."},
-        "depresi": {"english": "depression", "pronunciation": "de-pre-si", "category": "finance", "example": "Depresi ekonomi parah."},
-        "kapitalisasi": {"english": "capitalization", "pronunciation": "ka-pi-ta-li-sa-si", "category": "finance", "example": "Kapitalisasi pasar besar."},
-        "dividen": {"english": "dividend", "pronunciation": "di-vi-den", "category": "finance", "example": "Dividen saham tinggi."},
-        "saham": {"english": "stock", "pronunciation": "sa-ham", "category": "finance", "example": "Saham teknologi naik."},
-        "obligasi": {"english": "bond", "pronunciation": "o-bli-ga-si", "category": "finance", "example": "Obligasi pemerintah aman."},
-        "portofolio": {"english": "portfolio", "pronunciation": "por-to-fo-li-o", "category": "finance", "example": "Portofolio investasi beragam."},
-        "likuiditas": {"english": "liquidity", "pronunciation": "li-kui-di-tas", "category": "finance", "example": "Likuiditas tinggi penting."},
-        
-        # Extended Time & Calendar
-        "hari ini": {"english": "today", "pronunciation": "ha-ri i-ni", "category": "time", "example": "Hari ini cuaca bagus."},
-        "malam": {"english": "night", "pronunciation": "ma-lam", "category": "time", "example": "Malam ini saya tidur."},
-        "pagi": {"english": "morning", "pronunciation": "pa-gi", "category": "time", "example": "Pagi ini saya bangun."},
-        "siang": {"english": "afternoon", "pronunciation": "si-ang", "category": "time", "example": "Siang ini panas."},
-        "sore": {"english": "evening", "pronunciation": "so-re", "category": "time", "example": "Sore hari sejuk."},
-        "dini hari": {"english": "dawn", "pronunciation": "di-ni ha-ri", "category": "time", "example": "Dini hari sunyi."},
-        "tengah malam": {"english": "midnight", "pronunciation": "te-ngah ma-lam", "category": "time", "example": "Tengah malam gelap."},
-        "tengah hari": {"english": "noon", "pronunciation": "te-ngah ha-ri", "category": "time", "example": "Tengah hari terik."},
-        "subuh": {"english": "dawn prayer time", "pronunciation": "su-buh", "category": "time", "example": "Subuh waktu sholat."},
-        "maghrib": {"english": "sunset prayer time", "pronunciation": "magh-rib", "category": "time", "example": "Maghrib matahari tenggelam."},
-        "semester": {"english": "semester", "pronunciation": "se-mes-ter", "category": "time", "example": "Semester baru dimulai."},
-        "dekade": {"english": "decade", "pronunciation": "de-ka-de", "category": "time", "example": "Dekade terakhir berubah."},
-        "milenium": {"english": "millennium", "pronunciation": "mi-le-ni-um", "category": "time", "example": "Milenium baru harapan."},
-        
-        # Extended Food & Cuisine
-        "nasi goreng": {"english": "fried rice", "pronunciation": "na-si go-reng", "category": "food", "example": "Nasi goreng pedas enak."},
-        "mie ayam": {"english": "chicken noodles", "pronunciation": "mi-e a-yam", "category": "food", "example": "Mie ayam favorit saya."},
-        "gado-gado": {"english": "Indonesian salad", "pronunciation": "ga-do ga-do", "category": "food", "example": "Gado-gado sayuran segar."},
-        "rendang": {"english": "spicy beef stew", "pronunciation": "ren-dang", "category": "food", "example": "Rendang Padang terkenal."},
-        "sate": {"english": "satay", "pronunciation": "sa-te", "category": "food", "example": "Sate ayam bakar."},
-        "bakso": {"english": "meatball soup", "pronunciation": "bak-so", "category": "food", "example": "Bakso kuah hangat."},
-        "soto": {"english": "Indonesian soup", "pronunciation": "so-to", "category": "food", "example": "Soto ayam kuning."},
-        "gudeg": {"english": "jackfruit stew", "pronunciation": "gu-deg", "category": "food", "example": "Gudeg Yogyakarta manis."},
-        "tempeh": {"english": "fermented soybeans", "pronunciation": "tem-peh", "category": "food", "example": "Tempeh protein nabati."},
-        "tahu": {"english": "tofu", "pronunciation": "ta-hu", "category": "food", "example": "Tahu goreng renyah."},
-        "kerupuk": {"english": "crackers", "pronunciation": "ke-ru-puk", "category": "food", "example": "Kerupuk udang gurih."},
-        "sambal": {"english": "chili sauce", "pronunciation": "sam-bal", "category": "food", "example": "Sambal pedas sekali."},
-        "lalapan": {"english": "raw vegetables", "pronunciation": "la-la-pan", "category": "food", "example": "Lalapan segar sehat."},
-        "asinan": {"english": "pickled fruits", "pronunciation": "a-si-nan", "category": "food", "example": "Asinan buah asam."},
-        "rujak": {"english": "fruit salad", "pronunciation": "ru-jak", "category": "food", "example": "Rujak buah pedas."},
-        
-        # Extended Animals & Wildlife
-        "orangutan": {"english": "orangutan", "pronunciation": "o-rang-u-tan", "category": "animals", "example": "Orangutan Kalimantan langka."},
-        "komodo": {"english": "komodo dragon", "pronunciation": "ko-mo-do", "category": "animals", "example": "Komodo kadal besar."},
-        "badak": {"english": "rhinoceros", "pronunciation": "ba-dak", "category": "animals", "example": "Badak bercula satu."},
-        "tapir": {"english": "tapir", "pronunciation": "ta-pir", "category": "animals", "example": "Tapir hidung panjang."},
-        "anoa": {"english": "dwarf buffalo", "pronunciation": "a-no-a", "category": "animals", "example": "Anoa Sulawesi kecil."},
-        "banteng": {"english": "wild ox", "pronunciation": "ban-teng", "category": "animals", "example": "Banteng Jawa kuat."},
-        "rusa": {"english": "deer", "pronunciation": "ru-sa", "category": "animals", "example": "Rusa berlari cepat."},
-        "babi rusa": {"english": "babirusa", "pronunciation": "ba-bi ru-sa", "category": "animals", "example": "Babi rusa taring panjang."},
-        "binturong": {"english": "bearcat", "pronunciation": "bin-tu-rong", "category": "animals", "example": "Binturong pemanjat pohon."},
-        "trenggiling": {"english": "pangolin", "pronunciation": "treng-gi-ling", "category": "animals", "example": "Trenggiling sisik keras."},
-        "kuskus": {"english": "cuscus", "pronunciation": "kus-kus", "category": "animals", "example": "Kuskus marsupial kecil."},
-        "cendrawasih": {"english": "bird of paradise", "pronunciation": "cen-dra-wa-sih", "category": "animals", "example": "Cendrawasih burung indah."},
-        "jalak bali": {"english": "bali starling", "pronunciation": "ja-lak ba-li", "category": "animals", "example": "Jalak Bali putih langka."},
-        "elang jawa": {"english": "javan eagle", "pronunciation": "e-lang ja-wa", "category": "animals", "example": "Elang Jawa terbang tinggi."},
-        
-        # Extended Plants & Flowers
-        "melati": {"english": "jasmine", "pronunciation": "me-la-ti", "category": "nature", "example": "Melati bunga putih harum."},
-        "mawar": {"english": "rose", "pronunciation": "ma-war", "category": "nature", "example": "Mawar merah cantik."},
-        "anggrek": {"english": "orchid", "pronunciation": "ang-grek", "category": "nature", "example": "Anggrek bulan langka."},
-        "kamboja": {"english": "frangipani", "pronunciation": "kam-bo-ja", "category": "nature", "example": "Kamboja kuning harum."},
-        "kenanga": {"english": "ylang-ylang", "pronunciation": "ke-na-nga", "category": "nature", "example": "Kenanga wangi mewangi."},
-        "cempaka": {"english": "magnolia", "pronunciation": "cem-pa-ka", "category": "nature", "example": "Cempaka putih suci."},
-        "teratai": {"english": "lotus", "pronunciation": "te-ra-tai", "category": "nature", "example": "Teratai di kolam."},
-        "bambu": {"english": "bamboo", "pronunciation": "bam-bu", "category": "nature", "example": "Bambu tumbuh cepat."},
-        "kelapa": {"english": "coconut", "pronunciation": "ke-la-pa", "category": "nature", "example": "Kelapa buah tropis."},
-        "pisang": {"english": "banana", "pronunciation": "pi-sang", "category": "nature", "example": "Pisang kuning manis."},
-        "mangga": {"english": "mango", "pronunciation": "mang-ga", "category": "nature", "example": "Mangga harum manis."},
-        "durian": {"english": "durian", "pronunciation": "du-ri-an", "category": "nature", "example": "Durian raja buah."},
-        "rambutan": {"english": "rambutan", "pronunciation": "ram-bu-tan", "category": "nature", "example": "Rambutan merah berbulu."},
-        "manggis": {"english": "mangosteen", "pronunciation": "mang-gis", "category": "nature", "example": "Manggis ratu buah."},
-        
-        # Extended Transportation & Vehicles
-        "ojek": {"english": "motorcycle taxi", "pronunciation": "o-jek", "category": "transportation", "example": "Ojek online praktis."},
-        "angkot": {"english": "public minivan", "pronunciation": "ang-kot", "category": "transportation", "example": "Angkot transportasi murah."},
-        "bajaj": {"english": "three-wheeler", "pronunciation": "ba-jaj", "category": "transportation", "example": "Bajaj kendaraan kecil."},
-        "delman": {"english": "horse cart", "pronunciation": "del-man", "category": "transportation", "example": "Delman tradisional Yogya."},
-        "dokar": {"english": "horse carriage", "pronunciation": "do-kar", "category": "transportation", "example": "Dokar wisata kota."},
-        "andong": {"english": "traditional carriage", "pronunciation": "an-dong", "category": "transportation", "example": "Andong keliling kota."},
-        "helikopter": {"english": "helicopter", "pronunciation": "he-li-kop-ter", "category": "transportation", "example": "Helikopter terbang rendah."},
-        "jet": {"english": "jet", "pronunciation": "jet", "category": "transportation", "example": "Jet tempur cepat."},
-        "kapal selam": {"english": "submarine", "pronunciation": "ka-pal se-lam", "category": "transportation", "example": "Kapal selam di laut."},
-        "feri": {"english": "ferry", "pronunciation": "fe-ri", "category": "transportation", "example": "Feri menyeberang selat."},
-        "speedboat": {"english": "speedboat", "pronunciation": "speed-boat", "category": "transportation", "example": "Speedboat cepat sekali."},
-        "yacht": {"english": "yacht", "pronunciation": "yacht", "category": "transportation", "example": "Yacht mewah berlayar."},
-        
-        # Extended Clothing & Fashion
-        "batik": {"english": "batik", "pronunciation": "ba-tik", "category": "clothing", "example": "Batik Indonesia terkenal."},
-        "kebaya": {"english": "traditional blouse", "pronunciation": "ke-ba-ya", "category": "clothing", "example": "Kebaya wanita elegan."},
-        "sarong": {"english": "sarong", "pronunciation": "sa-rong", "category": "clothing", "example": "Sarong kain tradisional."},
-        "kain": {"english": "cloth", "pronunciation": "ka-in", "category": "clothing", "example": "Kain sutra halus."},
-        "selendang": {"english": "shawl", "pronunciation": "se-len-dang", "category": "clothing", "example": "Selendang menutupi kepala."},
-        "ikat pinggang": {"english": "belt", "pronunciation": "i-kat ping-gang", "category": "clothing", "example": "Ikat pinggang kulit."},
-        "dasi": {"english": "tie", "pronunciation": "da-si", "category": "clothing", "example": "Dasi formal rapi."},
-        "jas": {"english": "suit jacket", "pronunciation": "jas", "category": "clothing", "example": "Jas hitam formal."},
-        "gaun": {"english": "dress", "pronunciation": "ga-un", "category": "clothing", "example": "Gaun pesta cantik."},
-        "celana": {"english": "pants", "pronunciation": "ce-la-na", "category": "clothing", "example": "Celana jeans biru."},
-        "baju": {"english": "shirt", "pronunciation": "ba-ju", "category": "clothing", "example": "Baju putih bersih."},
-        "sepatu": {"english": "shoes", "pronunciation": "se-pa-tu", "category": "clothing", "example": "Sepatu kulit mahal."},
-        "sandal": {"english": "sandals", "pronunciation": "san-dal", "category": "clothing", "example": "Sandal jepit murah."},
-        "kaos kaki": {"english": "socks", "pronunciation": "ka-os ka-ki", "category": "clothing", "example": "Kaos kaki putih."},
-        
-        # Extended House & Furniture
-        "lemari": {"english": "wardrobe", "pronunciation": "le-ma-ri", "category": "house", "example": "Lemari pakaian besar."},
-        "kasur": {"english": "mattress", "pronunciation": "ka-sur", "category": "house", "example": "Kasur empuk nyaman."},
-        "bantal": {"english": "pillow", "pronunciation": "ban-tal", "category": "house", "example": "Bantal lembut putih."},
-        "selimut": {"english": "blanket", "pronunciation": "se-li-mut", "category": "house", "example": "Selimut hangat tebal."},
-        "sprei": {"english": "bed sheet", "pronunciation": "spre-i", "category": "house", "example": "Sprei warna biru."},
-        "kursi": {"english": "chair", "pronunciation": "kur-si", "category": "house", "example": "Kursi kayu kokoh."},
-        "meja": {"english": "table", "pronunciation": "me-ja", "category": "house", "example": "Meja makan bulat."},
-        "sofa": {"english": "sofa", "pronunciation": "so-fa", "category": "house", "example": "Sofa kulit coklat."},
-        "televisi": {"english": "television", "pronunciation": "te-le-vi-si", "category": "house", "example": "Televisi layar besar."},
-        "kulkas": {"english": "refrigerator", "pronunciation": "kul-kas", "category": "house", "example": "Kulkas penuh makanan."},
-        "kompor": {"english": "stove", "pronunciation": "kom-por", "category": "house", "example": "Kompor gas biru."},
-        "rice cooker": {"english": "rice cooker", "pronunciation": "rice coo-ker", "category": "house", "example": "Rice cooker masak nasi."},
-        "blender": {"english": "blender", "pronunciation": "blen-der", "category": "house", "example": "Blender buat jus."},
-        "setrika": {"english": "iron", "pronunciation": "se-tri-ka", "category": "house", "example": "Setrika baju kusut."},
-        
-        # Extended Body Parts
-        "jantung": {"english": "heart", "pronunciation": "jan-tung", "category": "body", "example": "Jantung berdetak cepat."},
-        "paru-paru": {"english": "lungs", "pronunciation": "pa-ru pa-ru", "category": "body", "example": "Paru-paru butuh oksigen."},
-        "hati": {"english": "liver", "pronunciation": "ha-ti", "category": "body", "example": "Hati organ penting."},
-        "ginjal": {"english": "kidney", "pronunciation": "gin-jal", "category": "body", "example": "Ginjal saring darah."},
-        "lambung": {"english": "stomach", "pronunciation": "lam-bung", "category": "body", "example": "Lambung cerna makanan."},
-        "usus": {"english": "intestine", "pronunciation": "u-sus", "category": "body", "example": "Usus serap nutrisi."},
-        "otak": {"english": "brain", "pronunciation": "o-tak", "category": "body", "example": "Otak pusat pikiran."},
-        "tulang": {"english": "bone", "pronunciation": "tu-lang", "category": "body", "example": "Tulang kuat kokoh."},
-        "otot": {"english": "muscle", "pronunciation": "o-tot", "category": "body", "example": "Otot perlu latihan."},
-        "kulit": {"english": "skin", "pronunciation": "ku-lit", "category": "body", "example": "Kulit perlu perawatan."},
-        "darah": {"english": "blood", "pronunciation": "da-rah", "category": "body", "example": "Darah mengalir tubuh."},
-        "urat": {"english": "vein", "pronunciation": "u-rat", "category": "body", "example": "Urat nadi terasa."},
-        
-        # Extended Common Adjectives
-        "besar": {"english": "big", "pronunciation": "be-sar", "category": "adjectives", "example": "Rumah ini besar."},
-        "kecil": {"english": "small", "pronunciation": "ke-cil", "category": "adjectives", "example": "Anak itu kecil."},
-        "tinggi": {"english": "tall/high", "pronunciation": "ting-gi", "category": "adjectives", "example": "Orang itu tinggi."},
-        "pendek": {"english": "short", "pronunciation": "pen-dek", "category": "adjectives", "example": "Rambut saya pendek."},
-        "panjang": {"english": "long", "pronunciation": "pan-jang", "category": "adjectives", "example": "Jalan ini panjang."},
-        "lebar": {"english": "wide", "pronunciation": "le-bar", "category": "adjectives", "example": "Sungai ini lebar."},
-        "sempit": {"english": "narrow", "pronunciation": "sem-pit", "category": "adjectives", "example": "Gang ini sempit."},
-        "tebal": {"english": "thick", "pronunciation": "te-bal", "category": "adjectives", "example": "Buku ini tebal."},
-        "tipis": {"english": "thin", "pronunciation": "ti-pis", "category": "adjectives", "example": "Kertas ini tipis."},
-        "berat": {"english": "heavy", "pronunciation": "be-rat", "category": "adjectives", "example": "Tas ini berat."},
-        "ringan": {"english": "light", "pronunciation": "ri-ngan", "category": "adjectives", "example": "Bulu ini ringan."},
-        "keras": {"english": "hard", "pronunciation": "ke-ras", "category": "adjectives", "example": "Batu ini keras."},
-        "lembut": {"english": "soft", "pronunciation": "lem-but", "category": "adjectives", "example": "Kain ini lembut."},
-        "kasar": {"english": "rough", "pronunciation": "ka-sar", "category": "adjectives", "example": "Permukaan ini kasar."},
-        "halus": {"english": "smooth", "pronunciation": "ha-lus", "category": "adjectives", "example": "Kulit bayi halus."},
-        "tajam": {"english": "sharp", "pronunciation": "ta-jam", "category": "adjectives", "example": "Pisau ini tajam."},
-        "tumpul": {"english": "blunt", "pronunciation": "tum-pul", "category": "adjectives", "example": "Pensil ini tumpul."},
-        "licin": {"english": "slippery", "pronunciation": "li-cin", "category": "adjectives", "example": "Lantai ini licin."},
-        "kering": {"english": "dry", "pronunciation": "ke-ring", "category": "adjectives", "example": "Pakaian sudah kering."},
-        "basah": {"english": "wet", "pronunciation": "ba-sah", "category": "adjectives", "example": "Rambut masih basah."},
-        "lembab": {"english": "humid", "pronunciation": "lem-bab", "category": "adjectives", "example": "Udara terasa lembab."},
-        "panas": {"english": "hot", "pronunciation": "pa-nas", "category": "adjectives", "example": "Air ini panas."},
-        "dingin": {"english": "cold", "pronunciation": "di-ngin", "category": "adjectives", "example": "Es ini dingin."},
-        "hangat": {"english": "warm", "pronunciation": "ha-ngat", "category": "adjectives", "example": "Sup ini hangat."},
-        "sejuk": {"english": "cool", "pronunciation": "se-juk", "category": "adjectives", "example": "Angin sore sejuk."},
-        
-        # More Extended Verbs
-        "berjalan": {"english": "to walk", "pronunciation": "ber-ja-lan", "category": "verbs", "example": "Saya berjalan ke sekolah."},
-        "berlari": {"english": "to run", "pronunciation": "ber-la-ri", "category": "verbs", "example": "Dia berlari cepat."},
-        "melompat": {"english": "to jump", "pronunciation": "me-lom-pat", "category": "verbs", "example": "Anak melompat tinggi."},
-        "berenang": {"english": "to swim", "pronunciation": "be-re-nang", "category": "verbs", "example": "Ikan berenang di laut."},
-        "terbang": {"english": "to fly", "pronunciation": "ter-bang", "category": "verbs", "example": "Burung terbang tinggi."},
-        "merangkak": {"english": "to crawl", "pronunciation": "me-rang-kak", "category": "verbs", "example": "Bayi merangkak di lantai."},
-        "memanjat": {"english": "to climb", "pronunciation": "me-man-jat", "category": "verbs", "example": "Monyet memanjat pohon."},
-        "menyelam": {"english": "to dive", "pronunciation": "me-nye-lam", "category": "verbs", "example": "Penyelam menyelam dalam."},
-        "mengendarai": {"english": "to ride", "pronunciation": "meng-en-da-rai", "category": "verbs", "example": "Dia mengendarai sepeda."},
-        "mengemudi": {"english": "to drive", "pronunciation": "meng-e-mu-di", "category": "verbs", "example": "Ayah mengemudi mobil."},
-        "menerbangkan": {"english": "to pilot", "pronunciation": "me-ner-bang-kan", "category": "verbs", "example": "Pilot menerbangkan pesawat."},
-        "berlayar": {"english": "to sail", "pronunciation": "ber-la-yar", "category": "verbs", "example": "Kapal berlayar ke pulau."},
-        "mendayung": {"english": "to paddle", "pronunciation": "men-da-yung", "category": "verbs", "example": "Nelayan mendayung perahu."},
-        "berselancar": {"english": "to surf", "pronunciation": "ber-se-lan-car", "category": "verbs", "example": "Dia berselancar di pantai."},
-        
-        # More Numbers & Mathematics
-        "nol": {"english": "zero", "pronunciation": "nol", "category": "numbers", "example": "Nol tambah satu sama dengan satu."},
-        "setengah": {"english": "half", "pronunciation": "se-te-ngah", "category": "numbers", "example": "Setengah dari sepuluh adalah lima."},
-        "seperempat": {"english": "quarter", "pronunciation": "se-pe-rem-pat", "category": "numbers", "example": "Seperempat jam lima belas menit."},
-        "sepertiga": {"english": "one third", "pronunciation": "se-per-ti-ga", "category": "numbers", "example": "Sepertiga dari sembilan adalah tiga."},
-        "sepersepuluh": {"english": "one tenth", "pronunciation": "se-per-se-pu-luh", "category": "numbers", "example": "Sepersepuluh dari seratus adalah sepuluh."},
-        "persen": {"english": "percent", "pronunciation": "per-sen", "category": "numbers", "example": "Lima puluh persen adalah setengah."},
-        "tambah": {"english": "plus", "pronunciation": "tam-bah", "category": "numbers", "example": "Dua tambah tiga sama dengan lima."},
-        "kurang": {"english": "minus", "pronunciation": "ku-rang", "category": "numbers", "example": "Lima kurang dua sama dengan tiga."},
-        "kali": {"english": "times", "pronunciation": "ka-li", "category": "numbers", "example": "Tiga kali empat sama dengan dua belas."},
-        "bagi": {"english": "divided by", "pronunciation": "ba-gi", "category": "numbers", "example": "Delapan bagi dua sama dengan empat."},
-        "sama dengan": {"english": "equals", "pronunciation": "sa-ma de-ngan", "category": "numbers", "example": "Dua tambah dua sama dengan empat."},
-        "lebih besar": {"english": "greater than", "pronunciation": "le-bih be-sar", "category": "numbers", "example": "Lima lebih besar dari tiga."},
-        "lebih kecil": {"english": "less than", "pronunciation": "le-bih ke-cil", "category": "numbers", "example": "Dua lebih kecil dari lima."},
-        
-        # Extended Colors
-        "ungu": {"english": "purple", "pronunciation": "u-ngu", "category": "colors", "example": "Bunga ungu cantik."},
-        "pink": {"english": "pink", "pronunciation": "pink", "category": "colors", "example": "Baju pink cerah."},
-        "coklat": {"english": "brown", "pronunciation": "cok-lat", "category": "colors", "example": "Tanah berwarna coklat."},
-        "abu-abu": {"english": "gray", "pronunciation": "a-bu a-bu", "category": "colors", "example": "Awan abu-abu gelap."},
-        "emas": {"english": "gold", "pronunciation": "e-mas", "category": "colors", "example": "Cincin emas berkilau."},
-        "perak": {"english": "silver", "pronunciation": "pe-rak", "category": "colors", "example": "Gelang perak indah."},
-        "perunggu": {"english": "bronze", "pronunciation": "pe-rung-gu", "category": "colors", "example": "Medali perunggu ketiga."},
-        "krem": {"english": "cream", "pronunciation": "krem", "category": "colors", "example": "Dinding krem lembut."},
-        "salmon": {"english": "salmon", "pronunciation": "sal-mon", "category": "colors", "example": "Warna salmon muda."},
-        "magenta": {"english": "magenta", "pronunciation": "ma-gen-ta", "category": "colors", "example": "Tinta magenta cerah."},
-        
-        # Extended Weather & Climate
-        "mendung": {"english": "cloudy", "pronunciation": "men-dung", "category": "weather", "example": "Langit mendung gelap."},
-        "cerah": {"english": "sunny", "pronunciation": "ce-rah", "category": "weather", "example": "Cuaca cerah hari ini."},
-        "berawan": {"english": "overcast", "pronunciation": "ber-a-wan", "category": "weather", "example": "Langit berawan tipis."},
-        "berkabut": {"english": "foggy", "pronunciation": "ber-ka-but", "category": "weather", "example": "Pagi berkabut tebal."},
-        "badai": {"english": "storm", "pronunciation": "ba-dai", "category": "weather", "example": "Badai kencang datang."},
-        "topan": {"english": "typhoon", "pronunciation": "to-pan", "category": "weather", "example": "Topan merusak rumah."},
-        "tornado": {"english": "tornado", "pronunciation": "tor-na-do", "category": "weather", "example": "Tornado berbentuk corong."},
-        "gempa": {"english": "earthquake", "pronunciation": "gem-pa", "category": "weather", "example": "Gempa bumi guncang kota."},
-        "tsunami": {"english": "tsunami", "pronunciation": "tsu-na-mi", "category": "weather", "example": "Tsunami gelombang besar."},
-        "banjir": {"english": "flood", "pronunciation": "ban-jir", "category": "weather", "example": "Banjir rendam jalan."},
-        "kekeringan": {"english": "drought", "pronunciation": "ke-ke-ring-an", "category": "weather", "example": "Kekeringan panjang terjadi."},
-        "longsor": {"english": "landslide", "pronunciation": "long-sor", "category": "weather", "example": "Longsor tutup jalan."},
-        
-        # Extended Family & Relationships
-        "suami": {"english": "husband", "pronunciation": "sua-mi", "category": "family", "example": "Suami saya baik."},
-        "istri": {"english": "wife", "pronunciation": "is-tri", "category": "family", "example": "Istri cantik sekali."},
-        "anak": {"english": "child", "pronunciation": "a-nak", "category": "family", "example": "Anak bermain di taman."},
-        "orang tua": {"english": "parents", "pronunciation": "o-rang tu-a", "category": "family", "example": "Orang tua saya sehat."},
-        "kakek": {"english": "grandfather", "pronunciation": "ka-kek", "category": "family", "example": "Kakek berumur delapan puluh."},
-        "nenek": {"english": "grandmother", "pronunciation": "ne-nek", "category": "family", "example": "Nenek masak enak."},
-        "cucu": {"english": "grandchild", "pronunciation": "cu-cu", "category": "family", "example": "Cucu pertama lahir."},
-        "paman": {"english": "uncle", "pronunciation": "pa-man", "category": "family", "example": "Paman datang berkunjung."},
-        "bibi": {"english": "aunt", "pronunciation": "bi-bi", "category": "family", "example": "Bibi membawa oleh-oleh."},
-        "sepupu": {"english": "cousin", "pronunciation": "se-pu-pu", "category": "family", "example": "Sepupu saya pintar."},
-        "keponakan": {"english": "nephew/niece", "pronunciation": "ke-po-na-kan", "category": "family", "example": "Keponakan lucu sekali."},
-        "mertua": {"english": "in-law", "pronunciation": "mer-tu-a", "category": "family", "example": "Mertua baik hati."},
-        "ipar": {"english": "sibling-in-law", "pronunciation": "i-par", "category": "family", "example": "Ipar saya dokter."},
-        "menantu": {"english": "son/daughter-in-law", "pronunciation": "me-nan-tu", "category": "family", "example": "Menantu perempuan cantik."},
-        
-        # Extended Education & School
-        "sekolah dasar": {"english": "elementary school", "pronunciation": "se-ko-lah da-sar", "category": "education", "example": "Sekolah dasar enam tahun."},
-        "sekolah menengah": {"english": "middle school", "pronunciation": "se-ko-lah me-ne-ngah", "category": "education", "example": "Sekolah menengah tiga tahun."},
-        "sekolah tinggi": {"english": "high school", "pronunciation": "se-ko-lah ting-gi", "category": "education", "example": "Sekolah tinggi persiapan kuliah."},
-        "kuliah": {"english": "university", "pronunciation": "ku-li-ah", "category": "education", "example": "Kuliah empat tahun."},
-        "fakultas": {"english": "faculty", "pronunciation": "fa-kul-tas", "category": "education", "example": "Fakultas kedokteran sulit."},
-        "jurusan": {"english": "major", "pronunciation": "ju-ru-san", "category": "education", "example": "Jurusan teknik populer."},
-        "mata kuliah": {"english": "course", "pronunciation": "ma-ta ku-li-ah", "category": "education", "example": "Mata kuliah matematika."},
-        "dosen": {"english": "lecturer", "pronunciation": "do-sen", "category": "education", "example": "Dosen mengajar baik."},
-        "rektor": {"english": "rector", "pronunciation": "rek-tor", "category": "education", "example": "Rektor pimpin universitas."},
-        "dekan": {"english": "dean", "pronunciation": "de-kan", "category": "education", "example": "Dekan fakultas baru."},
-        "tugas": {"english": "assignment", "pronunciation": "tu-gas", "category": "education", "example": "Tugas dikumpulkan besok."},
-        "skripsi": {"english": "thesis", "pronunciation": "skrip-si", "category": "education", "example": "Skripsi harus selesai."},
-        "wisuda": {"english": "graduation", "pronunciation": "wi-su-da", "category": "education", "example": "Wisuda bulan depan."},
-        "ijazah": {"english": "diploma", "pronunciation": "i-ja-zah", "category": "education", "example": "Ijazah dokumen penting."},
-        
-        # Extended Technology & Internet
-        "wifi": {"english": "wifi", "pronunciation": "wi-fi", "category": "technology", "example": "Wifi cepat di kafe."},
-        "bluetooth": {"english": "bluetooth", "pronunciation": "blue-tooth", "category": "technology", "example": "Bluetooth koneksi nirkabel."},
-        "USB": {"english": "USB", "pronunciation": "u-es-be", "category": "technology", "example": "USB simpan data."},
-        "CD": {"english": "CD", "pronunciation": "ce-de", "category": "technology", "example": "CD musik lama."},
-        "DVD": {"english": "DVD", "pronunciation": "de-ve-de", "category": "technology", "example": "DVD film bagus."},
-        "flashdisk": {"english": "flash drive", "pronunciation": "flash-disk", "category": "technology", "example": "Flashdisk kecil praktis."},
-        "harddisk": {"english": "hard drive", "pronunciation": "hard-disk", "category": "technology", "example": "Harddisk simpan banyak."},
-        "RAM": {"english": "RAM", "pronunciation": "ram", "category": "technology", "example": "RAM komputer cepat."},
-        "processor": {"english": "processor", "pronunciation": "pro-ces-sor", "category": "technology", "example": "Processor otak komputer."},
-        "motherboard": {"english": "motherboard", "pronunciation": "mother-board", "category": "technology", "example": "Motherboard papan utama."},
-        "keyboard": {"english": "keyboard", "pronunciation": "key-board", "category": "technology", "example": "Keyboard untuk mengetik."},
-        "mouse": {"english": "mouse", "pronunciation": "mouse", "category": "technology", "example": "Mouse klik dan drag."},
-        "monitor": {"english": "monitor", "pronunciation": "mo-ni-tor", "category": "technology", "example": "Monitor layar besar."},
-        "printer": {"english": "printer", "pronunciation": "prin-ter", "category": "technology", "example": "Printer cetak dokumen."},
-        "scanner": {"english": "scanner", "pronunciation": "scan-ner", "category": "technology", "example": "Scanner scan foto."},
-        
-        # Extended Sports & Games
-        "sepak bola": {"english": "soccer", "pronunciation": "se-pak bo-la", "category": "sports", "example": "Sepak bola olahraga populer."},
-        "bulu tangkis": {"english": "badminton", "pronunciation": "bu-lu tang-kis", "category": "sports", "example": "Bulu tangkis olahraga Indonesia."},
-        "tenis": {"english": "tennis", "pronunciation": "te-nis", "category": "sports", "example": "Tenis pakai raket."},
-        "tenis meja": {"english": "table tennis", "pronunciation": "te-nis me-ja", "category": "sports", "example": "Tenis meja ping pong."},
-        "voli": {"english": "volleyball", "pronunciation": "vo-li", "category": "sports", "example": "Voli main beregu."},
-        "basket": {"english": "basketball", "pronunciation": "bas-ket", "category": "sports", "example": "Basket masuk ring."},
-        "baseball": {"english": "baseball", "pronunciation": "base-ball", "category": "sports", "example": "Baseball pakai pemukul."},
-        "golf": {"english": "golf", "pronunciation": "golf", "category": "sports", "example": "Golf olahraga mahal."},
-        "tinju": {"english": "boxing", "pronunciation": "tin-ju", "category": "sports", "example": "Tinju olahraga keras."},
-        "karate": {"english": "karate", "pronunciation": "ka-ra-te", "category": "sports", "example": "Karate bela diri."},
-        "judo": {"english": "judo", "pronunciation": "ju-do", "category": "sports", "example": "Judo seni berkelahi."},
-        "taekwondo": {"english": "taekwondo", "pronunciation": "taek-won-do", "category": "sports", "example": "Taekwondo tendangan tinggi."},
-        "silat": {"english": "martial arts", "pronunciation": "si-lat", "category": "sports", "example": "Silat budaya Indonesia."},
-        "pendek": {"english": "short", "pronunciation": "pen-dek", "category": "adjectives", "example": "Saya pendek."},
-        "panjang": {"english": "long", "pronunciation": "pan-jang", "category": "adjectives", "example": "Rambut saya panjang."},
-        "pendek": {"english": "short", "pronunciation": "pen-dek", "category": "adjectives", "example": "Jalan ini pendek."},
-        "baru": {"english": "new", "pronunciation": "ba-ru", "category": "adjectives", "example": "Mobil ini baru."},
-        "lama": {"english": "old", "pronunciation": "la-ma", "category": "adjectives", "example": "Rumah ini lama."},
-        "muda": {"english": "young", "pronunciation": "mu-da", "category": "adjectives", "example": "Dia masih muda."},
-        "tua": {"english": "old", "pronunciation": "tu-a", "category": "adjectives", "example": "Kakek saya tua."},
-        "baik": {"english": "good", "pronunciation": "ba-ik", "category": "adjectives", "example": "Dia orang baik."},
-        "buruk": {"english": "bad", "pronunciation": "bu-ruk", "category": "adjectives", "example": "Cuaca buruk hari ini."},
-        "enak": {"english": "delicious", "pronunciation": "e-nak", "category": "adjectives", "example": "Makanan ini enak."},
-        "mahal": {"english": "expensive", "pronunciation": "ma-hal", "category": "adjectives", "example": "Mobil ini mahal."},
-        "murah": {"english": "cheap", "pronunciation": "mu-rah", "category": "adjectives", "example": "Harga ini murah."},
-        "mudah": {"english": "easy", "pronunciation": "mu-dah", "category": "adjectives", "example": "Pekerjaan ini mudah."},
-        "sulit": {"english": "difficult", "pronunciation": "su-lit", "category": "adjectives", "example": "Pelajaran ini sulit."},
-        "cepat": {"english": "fast", "pronunciation": "ce-pat", "category": "adjectives", "example": "Mobil ini cepat."},
-        "lambat": {"english": "slow", "pronunciation": "lam-bat", "category": "adjectives", "example": "Kereta ini lambat."},
-        "jauh": {"english": "far", "pronunciation": "ja-uh", "category": "adjectives", "example": "Rumah saya jauh."},
-        "dekat": {"english": "near", "pronunciation": "de-kat", "category": "adjectives", "example": "Sekolah dekat rumah."},
-        "banyak": {"english": "many/much", "pronunciation": "ba-nyak", "category": "adjectives", "example": "Ada banyak orang."},
-        "sedikit": {"english": "few/little", "pronunciation": "se-di-kit", "category": "adjectives", "example": "Saya punya sedikit uang."},
-        "penuh": {"english": "full", "pronunciation": "pe-nuh", "category": "adjectives", "example": "Gelas ini penuh."},
-        "kosong": {"english": "empty", "pronunciation": "ko-song", "category": "adjectives", "example": "Rumah ini kosong."},
-        "bersih": {"english": "clean", "pronunciation": "ber-sih", "category": "adjectives", "example": "Rumah ini bersih."},
-        "kotor": {"english": "dirty", "pronunciation": "ko-tor", "category": "adjectives", "example": "Pakaian ini kotor."},
-        "panas": {"english": "hot", "pronunciation": "pa-nas", "category": "adjectives", "example": "Cuaca hari ini panas."},
-        "dingin": {"english": "cold", "pronunciation": "ding-in", "category": "adjectives", "example": "Air ini dingin."},
-        "hangat": {"english": "warm", "pronunciation": "hang-at", "category": "adjectives", "example": "Teh ini hangat."},
-        "sejuk": {"english": "cool", "pronunciation": "se-juk", "category": "adjectives", "example": "Udara pagi sejuk."},
-    },
-    
-    "Beginner": {
-        # Greetings & Basic Phrases
-        "selamat pagi": {"english": "good morning", "pronunciation": "se-la-mat pa-gi", "category": "greetings", "example": "Selamat pagi, Bu!"},
-        "selamat siang": {"english": "good afternoon", "pronunciation": "se-la-mat si-ang", "category": "greetings", "example": "Selamat siang, Pak!"},
-        "selamat malam": {"english": "good evening/night", "pronunciation": "se-la-mat ma-lam", "category": "greetings", "example": "Selamat malam!"},
-        "selamat tinggal": {"english": "goodbye", "pronunciation": "se-la-mat ting-gal", "category": "greetings", "example": "Selamat tinggal, sampai jumpa!"},
-        "sampai jumpa": {"english": "see you later", "pronunciation": "sam-pai jum-pa", "category": "greetings", "example": "Sampai jumpa besok!"},
-        "apa kabar": {"english": "how are you", "pronunciation": "a-pa ka-bar", "category": "greetings", "example": "Apa kabar hari ini?"},
-        "kabar baik": {"english": "I'm fine", "pronunciation": "ka-bar ba-ik", "category": "greetings", "example": "Kabar baik, terima kasih."},
-        
-        # Numbers 11-20
-        "sebelas": {"english": "eleven", "pronunciation": "se-be-las", "category": "numbers", "example": "Sebelas jam"},
-        "dua belas": {"english": "twelve", "pronunciation": "du-a be-las", "category": "numbers", "example": "Dua belas bulan"},
-        "tiga belas": {"english": "thirteen", "pronunciation": "ti-ga be-las", "category": "numbers", "example": "Tiga belas tahun"},
-        "empat belas": {"english": "fourteen", "pronunciation": "em-pat be-las", "category": "numbers", "example": "Empat belas hari"},
-        "lima belas": {"english": "fifteen", "pronunciation": "li-ma be-las", "category": "numbers", "example": "Lima belas menit"},
-        "enam belas": {"english": "sixteen", "pronunciation": "e-nam be-las", "category": "numbers", "example": "Enam belas orang"},
-        "tujuh belas": {"english": "seventeen", "pronunciation": "tu-juh be-las", "category": "numbers", "example": "Tujuh belas buku"},
-        "delapan belas": {"english": "eighteen", "pronunciation": "de-la-pan be-las", "category": "numbers", "example": "Delapan belas kursi"},
-        "sembilan belas": {"english": "nineteen", "pronunciation": "sem-bi-lan be-las", "category": "numbers", "example": "Sembilan belas apel"},
-        "dua puluh": {"english": "twenty", "pronunciation": "du-a pu-luh", "category": "numbers", "example": "Dua puluh tahun"},
-        
-        # Family & People
-        "kakak": {"english": "older sibling", "pronunciation": "ka-kak", "category": "family", "example": "Kakak saya mahasiswa."},
-        "adik": {"english": "younger sibling", "pronunciation": "a-dik", "category": "family", "example": "Adik saya masih kecil."},
-        "nenek": {"english": "grandmother", "pronunciation": "ne-nek", "category": "family", "example": "Nenek saya sudah tua."},
-        "kakek": {"english": "grandfather", "pronunciation": "ka-kek", "category": "family", "example": "Kakek saya petani."},
-        "teman": {"english": "friend", "pronunciation": "te-man", "category": "people", "example": "Dia teman baik saya."},
-        "guru": {"english": "teacher", "pronunciation": "gu-ru", "category": "people", "example": "Guru saya sangat baik."},
-        "dokter": {"english": "doctor", "pronunciation": "dok-ter", "category": "people", "example": "Dokter ini terkenal."},
-        
-        # More Verbs
-        "tidur": {"english": "to sleep", "pronunciation": "ti-dur", "category": "verbs", "example": "Saya tidur jam sepuluh."},
-        "bangun": {"english": "to wake up", "pronunciation": "bang-un", "category": "verbs", "example": "Saya bangun pagi-pagi."},
-        "mandi": {"english": "to take a bath", "pronunciation": "man-di", "category": "verbs", "example": "Saya mandi dua kali sehari."},
-        "lihat": {"english": "to see/look", "pronunciation": "li-hat", "category": "verbs", "example": "Saya lihat film bagus."},
-        "dengar": {"english": "to hear/listen", "pronunciation": "de-ngar", "category": "verbs", "example": "Saya dengar musik."},
-        "bicara": {"english": "to speak/talk", "pronunciation": "bi-ca-ra", "category": "verbs", "example": "Saya bicara bahasa Indonesia."},
-        "tahu": {"english": "to know", "pronunciation": "ta-hu", "category": "verbs", "example": "Saya tahu jawabannya."},
-        "mau": {"english": "to want", "pronunciation": "ma-u", "category": "verbs", "example": "Saya mau makan nasi."},
-        
-        # Common Objects
-        "mobil": {"english": "car", "pronunciation": "mo-bil", "category": "objects", "example": "Mobil saya biru."},
-        "motor": {"english": "motorcycle", "pronunciation": "mo-tor", "category": "objects", "example": "Motor itu mahal."},
-        "sepeda": {"english": "bicycle", "pronunciation": "se-pe-da", "category": "objects", "example": "Sepeda saya baru."},
-        "meja": {"english": "table", "pronunciation": "me-ja", "category": "objects", "example": "Meja ini besar."},
-        "kursi": {"english": "chair", "pronunciation": "kur-si", "category": "objects", "example": "Kursi itu nyaman."},
-        "pintu": {"english": "door", "pronunciation": "pin-tu", "category": "objects", "example": "Pintu itu tertutup."},
-        "jendela": {"english": "window", "pronunciation": "jen-de-la", "category": "objects", "example": "Jendela ini besar."},
-        "lampu": {"english": "lamp/light", "pronunciation": "lam-pu", "category": "objects", "example": "Lampu ini terang."},
-        
-        # Colors
-        "merah": {"english": "red", "pronunciation": "me-rah", "category": "colors", "example": "Bunga ini merah."},
-        "biru": {"english": "blue", "pronunciation": "bi-ru", "category": "colors", "example": "Laut itu biru."},
-        "hijau": {"english": "green", "pronunciation": "hi-jau", "category": "colors", "example": "Daun itu hijau."},
-        "kuning": {"english": "yellow", "pronunciation": "ku-ning", "category": "colors", "example": "Matahari kuning."},
-        "hitam": {"english": "black", "pronunciation": "hi-tam", "category": "colors", "example": "Malam hari hitam."},
-        "putih": {"english": "white", "pronunciation": "pu-tih", "category": "colors", "example": "Salju itu putih."},
-    },
-    
-    "Intermediate": {
-        # Time & Days
-        "hari": {"english": "day", "pronunciation": "ha-ri", "category": "time"},
-        "minggu": {"english": "week", "pronunciation": "ming-gu", "category": "time"},
-        "bulan": {"english": "month", "pronunciation": "bu-lan", "category": "time"},
-        "tahun": {"english": "year", "pronunciation": "ta-hun", "category": "time"},
-        "senin": {"english": "Monday", "pronunciation": "se-nin", "category": "time"},
-        "selasa": {"english": "Tuesday", "pronunciation": "se-la-sa", "category": "time"},
-        "rabu": {"english": "Wednesday", "pronunciation": "ra-bu", "category": "time"},
-        "kamis": {"english": "Thursday", "pronunciation": "ka-mis", "category": "time"},
-        "jumat": {"english": "Friday", "pronunciation": "ju-mat", "category": "time"},
-        "sabtu": {"english": "Saturday", "pronunciation": "sab-tu", "category": "time"},
-        
-        # Colors
-        "merah": {"english": "red", "pronunciation": "me-rah", "category": "colors"},
-        "biru": {"english": "blue", "pronunciation": "bi-ru", "category": "colors"},
-        "hijau": {"english": "green", "pronunciation": "hi-jau", "category": "colors"},
-        "kuning": {"english": "yellow", "pronunciation": "ku-ning", "category": "colors"},
-        "hitam": {"english": "black", "pronunciation": "hi-tam", "category": "colors"},
-        "putih": {"english": "white", "pronunciation": "pu-tih", "category": "colors"},
-        
-        # Body Parts
-        "kepala": {"english": "head", "pronunciation": "ke-pa-la", "category": "body"},
-        "mata": {"english": "eye", "pronunciation": "ma-ta", "category": "body"},
-        "hidung": {"english": "nose", "pronunciation": "hi-dung", "category": "body"},
-        "mulut": {"english": "mouth", "pronunciation": "mu-lut", "category": "body"},
-        "tangan": {"english": "hand", "pronunciation": "ta-ngan", "category": "body"},
-        "kaki": {"english": "foot/leg", "pronunciation": "ka-ki", "category": "body"},
-        
-        # More Verbs
-        "bekerja": {"english": "to work", "pronunciation": "be-ker-ja", "category": "verbs"},
-        "belajar": {"english": "to study/learn", "pronunciation": "be-la-jar", "category": "verbs"},
-        "bermain": {"english": "to play", "pronunciation": "ber-ma-in", "category": "verbs"},
-        "berbicara": {"english": "to speak/talk", "pronunciation": "ber-bi-ca-ra", "category": "verbs"},
-        "membaca": {"english": "to read", "pronunciation": "mem-ba-ca", "category": "verbs"},
-        "menulis": {"english": "to write", "pronunciation": "me-nu-lis", "category": "verbs"},
-    },
-    
-    "Advanced": {
-        # Abstract Concepts
-        "pikiran": {"english": "thought/mind", "pronunciation": "pi-ki-ran", "category": "abstract"},
-        "perasaan": {"english": "feeling", "pronunciation": "pe-ra-sa-an", "category": "abstract"},
-        "harapan": {"english": "hope", "pronunciation": "ha-ra-pan", "category": "abstract"},
-        "impian": {"english": "dream", "pronunciation": "im-pi-an", "category": "abstract"},
-        "kenangan": {"english": "memory", "pronunciation": "ke-na-ngan", "category": "abstract"},
-        
-        # Complex Verbs
-        "mempertimbangkan": {"english": "to consider", "pronunciation": "mem-per-tim-bang-kan", "category": "verbs"},
-        "mengembangkan": {"english": "to develop", "pronunciation": "me-nge-mbang-kan", "category": "verbs"},
-        "menyampaikan": {"english": "to convey/deliver", "pronunciation": "me-nyam-pai-kan", "category": "verbs"},
-        "menjelaskan": {"english": "to explain", "pronunciation": "men-je-las-kan", "category": "verbs"},
-        "memahami": {"english": "to understand", "pronunciation": "me-ma-ha-mi", "category": "verbs"},
-        
-        # Professional Terms
-        "pekerjaan": {"english": "job/work", "pronunciation": "pe-ker-ja-an", "category": "professional"},
-        "perusahaan": {"english": "company", "pronunciation": "pe-ru-sa-ha-an", "category": "professional"},
-        "rapat": {"english": "meeting", "pronunciation": "ra-pat", "category": "professional"},
-        "proyek": {"english": "project", "pronunciation": "pro-yek", "category": "professional"},
-        "tanggung jawab": {"english": "responsibility", "pronunciation": "tang-gung ja-wab", "category": "professional"},
-    }
-}
-
-# All vocabulary is now integrated directly in VOCABULARY_DATA above
+# A review write that hits a version conflict is re-applied on the reloaded data this many times
+REVIEW_WRITE_ATTEMPTS = 2
 
 class IndonesianLearningApp:
     def __init__(self):
         self.data_dir = "user_data"
         self.profiles_dir = os.path.join(self.data_dir, "profiles")
-        
-        # Comprehensive example sentence translations database
-        self.example_translations = {
-            "Halo, apa kabar?": "Hello, how are you?",
-            "Terima kasih banyak!": "Thank you very much!",
-            "Sama-sama!": "You're welcome!",
-            "Maaf, saya terlambat.": "Sorry, I'm late.",
-            "Permisi, boleh lewat?": "Excuse me, may I pass?",
-            "Ya, saya mengerti.": "Yes, I understand.",
-            "Tidak, terima kasih.": "No, thank you.",
-            "Saya baik-baik saja.": "I'm fine.",
-            "Satu orang": "One person",
-            "Dua buku": "Two books",
-            "Tiga apel": "Three apples",
-            "Empat kursi": "Four chairs",
-            "Lima menit": "Five minutes",
-            "Enam jam": "Six hours",
-            "Tujuh hari": "Seven days",
-            "Delapan bulan": "Eight months",
-            "Sembilan tahun": "Nine years",
-            "Sepuluh rupiah": "Ten rupiah",
-            "Saya suka kopi.": "I like coffee.",
-            "Dia makan nasi.": "He/she eats rice.",
-            "Kami belajar bahasa Indonesia.": "We learn Indonesian.",
-            "Mereka bermain sepak bola.": "They play soccer.",
-            "Ibu memasak di dapur.": "Mother cooks in the kitchen.",
-            "Ayah bekerja di kantor.": "Father works in the office.",
-            "Adik menonton TV.": "Little sibling watches TV.",
-            "Kakak membaca buku.": "Older sibling reads a book.",
-            "Nenek istirahat.": "Grandmother rests.",
-            "Kakek berjalan-jalan.": "Grandfather takes a walk.",
-            "Mata saya sakit.": "My eyes hurt.",
-            "Kepala saya pusing.": "My head is dizzy.",
-            "Tangan saya dingin.": "My hands are cold.",
-            "Kaki saya lelah.": "My feet are tired.",
-            "Perut saya lapar.": "My stomach is hungry.",
-            "Punggung saya sakit.": "My back hurts.",
-            "Saya makan nasi.": "I eat rice.",
-            "Dia minum air.": "He/she drinks water.",
-            "Kami makan bersama.": "We eat together.",
-            "Saya lapar sekali.": "I'm very hungry.",
-            "Makanan ini enak.": "This food is delicious.",
-            "Saya suka buah.": "I like fruit.",
-            "Rumah saya besar.": "My house is big.",
-            "Kamar tidur saya kecil.": "My bedroom is small.",
-            "Dapur ini bersih.": "This kitchen is clean.",
-            "Kamar mandi kotor.": "The bathroom is dirty.",
-            "Ruang tamu nyaman.": "The living room is comfortable.",
-            "Saya pergi ke sekolah.": "I go to school.",
-            "Mobil ini cepat.": "This car is fast.",
-            "Bus itu lambat.": "That bus is slow.",
-            "Pesawat terbang tinggi.": "The plane flies high.",
-            "Kereta api panjang.": "The train is long.",
-            "Sepeda motor kecil.": "The motorcycle is small.",
-            "Cuaca hari ini panas.": "Today's weather is hot.",
-            "Kemarin hujan deras.": "Yesterday it rained heavily.",
-            "Besok akan cerah.": "Tomorrow will be sunny.",
-            "Angin bertiup kencang.": "The wind blows strongly.",
-            "Langit biru cerah.": "The sky is bright blue.",
-            "Saya bekerja di kantor.": "I work at the office.",
-            "Dia seorang dokter.": "He/she is a doctor.",
-            "Guru mengajar di kelas.": "The teacher teaches in class.",
-            "Petani menanam padi.": "The farmer plants rice.",
-            "Polisi menjaga keamanan.": "The police maintain security.",
-            "Baju ini bagus.": "This shirt is nice.",
-            "Celana itu mahal.": "Those pants are expensive.",
-            "Sepatu saya baru.": "My shoes are new.",
-            "Topi ini kecil.": "This hat is small.",
-            "Tas itu berat.": "That bag is heavy.",
-            "Merah, biru, hijau": "Red, blue, green",
-            "Hitam dan putih": "Black and white",
-            "Kuning seperti matahari": "Yellow like the sun",
-            "Ungu adalah warna favorit saya": "Purple is my favorite color",
-            "Coklat seperti tanah": "Brown like soil",
-            "Saya suka musik.": "I like music.",
-            "Film ini menarik.": "This movie is interesting.",
-            "Buku itu tebal.": "That book is thick.",
-            "Permainan ini seru.": "This game is exciting.",
-            "Olahraga itu sehat.": "Sports are healthy.",
-            "Hari ini saya senang.": "Today I am happy.",
-            "Kemarin saya sedih.": "Yesterday I was sad.",
-            "Dia terlihat marah.": "He/she looks angry.",
-            "Kami merasa takut.": "We feel scared.",
-            "Mereka sangat gembira.": "They are very joyful.",
-            "Saya bangun pagi.": "I wake up early.",
-            "Dia tidur malam.": "He/she sleeps at night.",
-            "Kami makan siang.": "We have lunch.",
-            "Mereka bekerja sore.": "They work in the afternoon.",
-            "Keluarga berkumpul malam.": "The family gathers at night.",
-            "Jakarta adalah ibu kota.": "Jakarta is the capital city.",
-            "Bali pulau yang indah.": "Bali is a beautiful island.",
-            "Surabaya kota besar.": "Surabaya is a big city.",
-            "Bandung sejuk dan nyaman.": "Bandung is cool and comfortable.",
-            "Yogyakarta kota budaya.": "Yogyakarta is a cultural city.",
-            "Saya belajar dengan rajin.": "I study diligently.",
-            "Dia bekerja dengan keras.": "He/she works hard.",
-            "Kami bermain dengan gembira.": "We play joyfully.",
-            "Mereka bernyanyi dengan indah.": "They sing beautifully.",
-            "Guru menjelaskan dengan sabar.": "The teacher explains patiently.",
-            # Additional comprehensive translations for better coverage
-            "Anak-anak bermain.": "The children are playing.",
-            "Kucing tidur.": "The cat is sleeping.",
-            "Anjing berlari.": "The dog is running.",
-            "Burung terbang.": "The bird is flying.",
-            "Ikan berenang.": "The fish is swimming.",
-            "Bunga mekar.": "The flower is blooming.",
-            "Pohon tinggi.": "The tree is tall.",
-            "Air mengalir.": "The water is flowing.",
-            "Matahari bersinar.": "The sun is shining.",
-            "Bulan terang.": "The moon is bright.",
-            "Bintang berkilau.": "The stars are sparkling.",
-            "Hujan turun.": "Rain is falling.",
-            "Salju putih.": "Snow is white.",
-            "Api panas.": "Fire is hot.",
-            "Es dingin.": "Ice is cold.",
-            "Pintu terbuka.": "The door is open.",
-            "Jendela tertutup.": "The window is closed.",
-            "Lampu menyala.": "The light is on.",
-            "Komputer mati.": "The computer is off.",
-            "Telepon berdering.": "The phone is ringing.",
-            "Musik keras.": "The music is loud.",
-            "Suara pelan.": "The voice is soft.",
-            "Warna cerah.": "Bright colors.",
-            "Gambar indah.": "Beautiful picture.",
-            "Cerita menarik.": "Interesting story.",
-            "Lagu sedih.": "Sad song.",
-            "Tarian bagus.": "Good dance.",
-            "Makanan lezat.": "Delicious food.",
-            "Minuman segar.": "Fresh drink.",
-            "Udara bersih.": "Clean air.",
-            "Jalan ramai.": "Busy road.",
-            "Kota besar.": "Big city.",
-            "Desa kecil.": "Small village.",
-            "Gunung tinggi.": "High mountain.",
-            "Laut dalam.": "Deep sea.",
-            "Pantai indah.": "Beautiful beach.",
-            "Hutan lebat.": "Dense forest.",
-            "Padang luas.": "Wide field.",
-            "Sungai panjang.": "Long river.",
-            "Danau tenang.": "Calm lake.",
-            "Jembatan kuat.": "Strong bridge.",
-            "Gedung modern.": "Modern building.",
-            "Rumah nyaman.": "Comfortable house.",
-            "Kamar bersih.": "Clean room.",
-            "Tempat tidur empuk.": "Soft bed.",
-            "Meja kayu.": "Wooden table.",
-            "Kursi plastik.": "Plastic chair.",
-            "Lemari besar.": "Big wardrobe.",
-            "Rak buku.": "Bookshelf.",
-            "Jam dinding.": "Wall clock.",
-            "Kaca bening.": "Clear glass.",
-            "Piring putih.": "White plate.",
-            "Gelas kosong.": "Empty glass.",
-            "Sendok kecil.": "Small spoon.",
-            "Garpu tajam.": "Sharp fork.",
-            "Pisau besar.": "Big knife.",
-            "Panci hitam.": "Black pot.",
-            "Wajan bulat.": "Round pan.",
-            "Kompor gas.": "Gas stove.",
-            "Kulkas dingin.": "Cold refrigerator.",
-            "Mesin cuci.": "Washing machine.",
-            "Setrika panas.": "Hot iron.",
-            "Sapu bersih.": "Clean broom.",
-            "Kain lap.": "Cleaning cloth.",
-            "Sabun wangi.": "Fragrant soap.",
-            "Shampo rambut.": "Hair shampoo.",
-            "Pasta gigi.": "Toothpaste.",
-            "Sikat gigi.": "Toothbrush.",
-            "Handuk kering.": "Dry towel.",
-            "Baju baru.": "New clothes.",
-            "Celana panjang.": "Long pants.",
-            "Kaos putih.": "White t-shirt.",
-            "Rok pendek.": "Short skirt.",
-            "Sepatu hitam.": "Black shoes.",
-            "Sandal jepit.": "Flip-flops.",
-            "Topi merah.": "Red hat.",
-            "Tas sekolah.": "School bag.",
-            "Buku tebal.": "Thick book.",
-            "Pensil tajam.": "Sharp pencil.",
-            "Penghapus kecil.": "Small eraser.",
-            "Penggaris panjang.": "Long ruler.",
-            "Kertas putih.": "White paper.",
-            "Pulpen biru.": "Blue pen.",
-            "Spidol hitam.": "Black marker.",
-            "Gunting tajam.": "Sharp scissors.",
-            "Lem kuat.": "Strong glue.",
-            "Stapler berat.": "Heavy stapler.",
-            "Kalkulator kecil.": "Small calculator.",
-            "Komputer baru.": "New computer.",
-            "Laptop ringan.": "Light laptop.",
-            "Tablet tipis.": "Thin tablet.",
-            "Handphone pintar.": "Smart phone.",
-            "Kamera bagus.": "Good camera.",
-            "Televisi besar.": "Big television.",
-            "Radio lama.": "Old radio.",
-            "Jam tangan.": "Wristwatch.",
-            "Kacamata bening.": "Clear glasses.",
-            "Cincin emas.": "Gold ring.",
-            "Kalung perak.": "Silver necklace.",
-            "Gelang cantik.": "Beautiful bracelet.",
-            "Anting kecil.": "Small earrings.",
-        }
-        
-        # Word-based translation patterns for intelligent fallback
-        self.translation_patterns = {
-            # Common sentence structures
-            "saya": "I",
-            "dia": "he/she",
-            "kami": "we", 
-            "mereka": "they",
-            "ini": "this",
-            "itu": "that",
-            "adalah": "is/are",
-            "makan": "eat/eating",
-            "minum": "drink/drinking",
-            "tidur": "sleep/sleeping",
-            "belajar": "learn/learning",
-            "bekerja": "work/working",
-            "bermain": "play/playing",
-            "besar": "big",
-            "kecil": "small",
-            "bagus": "good/nice",
-            "jelek": "bad/ugly",
-            "baru": "new",
-            "lama": "old",
-            "panas": "hot",
-            "dingin": "cold",
-            "tinggi": "tall/high",
-            "rendah": "short/low",
-            "cepat": "fast",
-            "lambat": "slow",
-            "senang": "happy",
-            "sedih": "sad",
-            "marah": "angry",
-            "takut": "afraid",
-        }
+        self.storage = get_profile_storage(DEFAULT_BACKEND, self.data_dir)
+        self.profile_catalog = get_profile_catalog(os.path.join(self.data_dir, CATALOG_FILENAME), self.storage)
+        self.credential_store = get_credential_store(self.profiles_dir)
+        
+        # Shared, process-wide tables - the instance only holds references
+        self.vocab_index = get_vocabulary_index()
+        self.example_translations = EXAMPLE_TRANSLATIONS
+        self.translation_patterns = TRANSLATION_PATTERNS
+        self.translation_lookup = get_translation_lookup()
         self.workbook_system = WorkbookSystem()
         self.workbook_progress = WorkbookProgress()
         self.ensure_data_directory()
@@ -1281,64 +79,18 @@ class IndonesianLearningApp:
     
     def get_example_translation(self, example_text, word):
         """Get accurate English translation for an example sentence"""
-        # Try exact match first - highest priority
-        if example_text in self.example_translations:
-            return self.example_translations[example_text]
-        
-        # Try case-insensitive match
-        for indonesian_text, english_translation in self.example_translations.items():
-            if example_text.lower() == indonesian_text.lower():
-                return english_translation
-        
-        # Try partial matching for variations (with punctuation differences)
-        example_clean = example_text.strip('.,!?').lower()
-        for indonesian_text, english_translation in self.example_translations.items():
-            indonesian_clean = indonesian_text.strip('.,!?').lower()
-            if example_clean == indonesian_clean:
-                return english_translation
-        
-        # Intelligent word-by-word translation as fallback
-        words = example_text.lower().split()
-        translated_words = []
-        
-        for indonesian_word in words:
-            # Clean word from punctuation
-            clean_word = indonesian_word.strip('.,!?')
-            
-            # Check translation patterns first
-            if clean_word in self.translation_patterns:
-                translated_words.append(self.translation_patterns[clean_word])
-            else:
-                # Check vocabulary database
-                found_translation = None
-                for category_words in VOCABULARY_DATA.values():
-                    if clean_word in category_words:
-                        found_translation = category_words[clean_word]['english']
-                        break
-                
-                if found_translation:
-                    translated_words.append(found_translation)
-                else:
-                    # Keep original word if no translation found
-                    translated_words.append(f"[{clean_word}]")
-        
-        if translated_words:
-            # Join translated words and capitalize first letter
-            result = " ".join(translated_words)
-            return result.capitalize() + "."
-        
-        # Last resort - return a helpful message
-        return f"Translation for '{example_text}' not available yet."
+        return self.translation_lookup.translate(example_text)
         
     def get_profile_files(self, profile_name):
         """Get file paths for a specific profile"""
         profile_dir = os.path.join(self.profiles_dir, profile_name)
-        if not os.path.exists(profile_dir):
-            os.makedirs(profile_dir)
         return {
             'progress': os.path.join(profile_dir, "progress.json"),
             'flashcards': os.path.join(profile_dir, "flashcards.json"),
-            'sentences': os.path.join(profile_dir, "sentences.json")
+            'sentences': os.path.join(profile_dir, "sentences.json"),
+            'journal': os.path.join(profile_dir, "reviews.jsonl"),
+            'history': os.path.join(profile_dir, "study_history.bin"),
+            'credentials': os.path.join(profile_dir, CREDENTIALS_FILENAME)
         }
         
     def ensure_data_directory(self):
@@ -1351,7 +103,7 @@ class IndonesianLearningApp:
     def save_progress(self):
         """Save user progress to current profile"""
         if st.session_state.current_profile and st.session_state.current_profile != "Demo":
-            self.save_profile_data(st.session_state.current_profile)
+            return self.save_profile_data(st.session_state.current_profile)
         return True
     
     def load_progress(self):
@@ -1363,7 +115,7 @@ class IndonesianLearningApp:
     def save_flashcards(self):
         """Save flashcard data to current profile"""
         if st.session_state.current_profile and st.session_state.current_profile != "Demo":
-            self.save_profile_data(st.session_state.current_profile)
+            return self.save_profile_data(st.session_state.current_profile)
         return True
     
     def load_flashcards(self):
@@ -1384,20 +136,7 @@ class IndonesianLearningApp:
             if saved_progress:
                 st.session_state.user_progress = saved_progress
             else:
-                st.session_state.user_progress = {
-                    'words_learned': set(),
-                    'daily_streak': 0,
-                    'last_study_date': None,
-                    'total_study_time': 0,
-                    'flashcard_reviews': {},
-                    'quiz_scores': [],
-                    'current_level': 'Absolute Beginner',
-                    'learned_words_details': {},  # Store detailed info about learned words
-                    'weak_words': set(),  # Words that need more practice
-                    'mastered_words': set(),  # Words fully mastered
-                    'study_sessions': [],  # Track study sessions
-                    'total_words_learned': 0
-                }
+                st.session_state.user_progress = self.get_default_progress()
             
         if 'flashcard_data' not in st.session_state:
             # Try to load saved flashcards
@@ -1416,105 +155,133 @@ class IndonesianLearningApp:
         if 'daily_goal' not in st.session_state:
             st.session_state.daily_goal = 20  # Default: 20 words per day
             
+    def get_default_progress(self, profile_name=None):
+        """Fresh progress for a new (or reset) profile"""
+        progress = {
+            'words_learned': set(),
+            'daily_streak': 0,
+            'last_study_date': None,
+            'total_study_time': 0,
+            'flashcard_reviews': {},
+            'quiz_scores': [],
+            'current_level': 'Absolute Beginner',
+            'learned_words_details': {},  # Store detailed info about learned words
+            'weak_words': set(),  # Words that need more practice
+            'mastered_words': set(),  # Words fully mastered
+            'total_words_learned': 0
+        }
+        if profile_name:
+            progress['profile_name'] = profile_name
+            progress['created_date'] = datetime.now().isoformat()
+        return progress
+    
     def init_flashcard_data(self):
         """Initialize flashcard data with spaced repetition scheduling"""
-        flashcard_data = {}
-        for level, words in VOCABULARY_DATA.items():
-            for indonesian, details in words.items():
-                flashcard_data[indonesian] = {
-                    'level': level,
-                    'english': details['english'],
-                    'pronunciation': details['pronunciation'],
-                    'category': details['category'],
-                    'next_review': datetime.now(),
-                    'interval': 1,  # Days until next review
-                    'ease_factor': 2.5,
-                    'review_count': 0,
-                    'correct_streak': 0
-                }
-        return flashcard_data
+        # Sparse deck: cards appear on first review, unreviewed words are implicit new cards
+        return FlashcardDeck()
     
     def update_flashcard_schedule(self, word, difficulty):
         """Update flashcard schedule based on spaced repetition algorithm"""
-        card = st.session_state.flashcard_data[word]
-        card['review_count'] += 1
-        
-        # Save detailed word information when learned
-        if word not in st.session_state.user_progress['learned_words_details']:
-            st.session_state.user_progress['learned_words_details'][word] = {
-                'first_learned': datetime.now().isoformat(),
-                'total_reviews': 0,
-                'correct_reviews': 0,
-                'difficulty_history': [],
-                'last_reviewed': None,
-                'mastery_level': 0
-            }
-            st.session_state.user_progress['total_words_learned'] += 1
-        
-        # Update word details
-        word_details = st.session_state.user_progress['learned_words_details'][word]
-        word_details['total_reviews'] += 1
-        word_details['last_reviewed'] = datetime.now().isoformat()
-        word_details['difficulty_history'].append(difficulty)
-        
-        if difficulty == 'easy':
-            card['correct_streak'] += 1
-            card['interval'] = max(1, int(card['interval'] * card['ease_factor']))
-            card['ease_factor'] = min(2.5, card['ease_factor'] + 0.1)
-            word_details['correct_reviews'] += 1
-            word_details['mastery_level'] = min(10, word_details['mastery_level'] + 2)
-            
-            # Move to mastered if mastery level is high enough
-            if word_details['mastery_level'] >= 8:
-                st.session_state.user_progress['mastered_words'].add(word)
-                if word in st.session_state.user_progress['weak_words']:
-                    st.session_state.user_progress['weak_words'].remove(word)
-                    
-        elif difficulty == 'medium':
-            card['correct_streak'] += 1
-            card['interval'] = max(1, int(card['interval'] * card['ease_factor'] * 0.8))
-            word_details['correct_reviews'] += 1
-            word_details['mastery_level'] = min(10, word_details['mastery_level'] + 1)
-            
-        else:  # hard
-            card['correct_streak'] = 0
-            card['interval'] = 1
-            card['ease_factor'] = max(1.3, card['ease_factor'] - 0.2)
-            word_details['mastery_level'] = max(0, word_details['mastery_level'] - 1)
-            
-            # Add to weak words if mastery level is low
-            if word_details['mastery_level'] < 3:
-                st.session_state.user_progress['weak_words'].add(word)
-                if word in st.session_state.user_progress['mastered_words']:
-                    st.session_state.user_progress['mastered_words'].remove(word)
-            
-        card['next_review'] = datetime.now() + timedelta(days=card['interval'])
-        
-        # Record study session
-        session_data = {
-            'timestamp': datetime.now().isoformat(),
-            'word': word,
-            'difficulty': difficulty,
-            'mastery_level': word_details['mastery_level']
-        }
-        st.session_state.user_progress['study_sessions'].append(session_data)
-        
-        # Auto-save progress and flashcards
-        self.save_progress()
-        self.save_flashcards()
-        
-    def get_due_cards(self, level=None):
-        """Get cards that are due for review"""
-        now = datetime.now()
-        due_cards = []
-        
-        for word, card in st.session_state.flashcard_data.items():
-            if level and card['level'] != level:
-                continue
-            if card['next_review'] <= now:
-                due_cards.append(word)
-                
-        return due_cards
+        summary = self.get_progress_summary()  # Built before this review is in the history
+        quiz_features = self.get_quiz_features()
+        card = st.session_state.flashcard_data.materialize(word)
+        word_details = apply_rating(st.session_state.user_progress, card, word, difficulty)
+        self.get_scheduler().reschedule(word, card['next_review'], card)
+        learned = word in st.session_state.user_progress['words_learned']
+        summary.record_review(word, word_details['mastery_level'], learned)
+        quiz_features.record_review(word, card['correct_streak'], learned)
+        
+        # Record study session (one fixed-size record in the compact history)
+        self.get_study_history().append(self.vocab_index.word_id(word), difficulty, word_details['mastery_level'])
+        
+        # Auto-save: journal this one review instead of rewriting the whole profile
+        self.record_review(word, difficulty)
+    
+    def get_study_history(self):
+        """Get the study-session history for the current profile (cached for the session)"""
+        profile_name = st.session_state.current_profile
+        if profile_name and profile_name != "Demo":
+            history_path = self.get_profile_files(profile_name)['history']
+        else:
+            history_path = None
+        history = st.session_state.get('study_history')
+        if history is None or history.path != history_path or st.session_state.get('study_history_profile') != profile_name:
+            history = StudyHistory(history_path)
+            st.session_state.study_history = history
+            st.session_state.study_history_profile = profile_name
+        return history
+    
+    def record_review(self, word, difficulty):
+        """Persist one review through the storage backend (journal entry or single-row upsert)"""
+        profile_name = st.session_state.current_profile
+        if not profile_name or profile_name == "Demo":
+            return
+        
+        for attempt in range(REVIEW_WRITE_ATTEMPTS):
+            try:
+                record = make_review_record(word, difficulty,
+                                            st.session_state.user_progress,
+                                            st.session_state.flashcard_data)
+                st.session_state.profile_version = self.storage.record_review(
+                    profile_name, record,
+                    st.session_state.user_progress,
+                    st.session_state.flashcard_data,
+                    expected_version=st.session_state.get('profile_version'))
+                self.update_profile_catalog(profile_name)
+                return
+            except ProfileConflictError:
+                # Another worker saved first: take its data and rate the word again on top of it
+                learned = word in st.session_state.user_progress['words_learned']
+                self.reload_after_conflict(profile_name)
+                if learned:
+                    st.session_state.user_progress['words_learned'].add(word)
+                card = st.session_state.flashcard_data.materialize(word)
+                apply_rating(st.session_state.user_progress, card, word, difficulty)
+            except Exception as e:
+                self.notify(f"Error saving review: {e}", 'error')
+                break
+        # Still not written - fall back to a full snapshot of this session's state
+        self.save_profile_data(profile_name)
+        
+    def get_scheduler(self):
+        """Get the due-card scheduler for the current deck, rebuilding it if the deck was replaced"""
+        scheduler = st.session_state.get('flashcard_scheduler')
+        if scheduler is None or not scheduler.tracks(st.session_state.flashcard_data):
+            scheduler = DueCardScheduler(st.session_state.flashcard_data, self.vocab_index.placements,
+                                         vocabulary=self.vocab_index)
+            st.session_state.flashcard_scheduler = scheduler
+        return scheduler
+    
+    def get_progress_summary(self):
+        """Get the dashboard aggregates for the current progress, rebuilding them if progress was replaced"""
+        summary = st.session_state.get('progress_summary')
+        if summary is None or not summary.tracks(st.session_state.user_progress):
+            summary = ProgressSummary(st.session_state.user_progress, self.vocab_index, self.get_study_history())
+            st.session_state.progress_summary = summary
+        return summary
+    
+    def get_quiz_features(self):
+        """Get the learner's quiz-selection arrays, rebuilding them if progress or the deck changed"""
+        features = st.session_state.get('quiz_features')
+        if features is None or not features.tracks(st.session_state.user_progress, st.session_state.flashcard_data):
+            features = LearnerFeatures(st.session_state.user_progress, st.session_state.flashcard_data)
+            st.session_state.quiz_features = features
+        return features
+    
+    def spread_overdue_cards(self, daily_cap, days=BACKLOG_DAYS):
+        """Reschedule the overdue backlog under a daily cap and save it in one write.
+
+        Returns the number of cards moved - 0 if the save lost a version
+        conflict and the other window's deck was loaded instead.
+        """
+        plan = plan_backlog(st.session_state.flashcard_data, daily_cap, days)
+        moved = apply_backlog_plan(st.session_state.flashcard_data, plan)
+        if moved:
+            st.session_state.flashcard_scheduler = None  # Rebuilt from the new review times
+            bump_data_version(st.session_state.user_progress)
+            if not self.save_flashcards():
+                return 0
+        return moved
     
     def update_daily_streak(self):
         """Update daily streak counter"""
@@ -1535,6 +302,94 @@ class IndonesianLearningApp:
             
         st.session_state.user_progress['last_study_date'] = today
     
+    def get_figure_cache(self):
+        """Get the session's chart cache, starting a new one if progress was replaced"""
+        cache = st.session_state.get('figure_cache')
+        if cache is None or not cache.tracks(st.session_state.user_progress):
+            cache = FigureCache(st.session_state.user_progress)
+            st.session_state.figure_cache = cache
+        return cache
+    
+    def cached_figure(self, chart_id, build, *inputs):
+        """A chart rebuilt only when the progress data version (or another input) changed.
+
+        Anything that changes progress or the flashcard deck without a rating
+        (resets, imports, bulk reschedules) must bump_data_version.
+        """
+        key = (data_version(st.session_state.user_progress),) + inputs
+        return self.get_figure_cache().figure(chart_id, key, build)
+    
+    def build_level_progress_chart(self):
+        """Bar chart of learned words per level (%)"""
+        # Progress by level
+        level_progress = {}
+        learned_by_level = self.get_progress_summary().level_counts
+        for level in self.vocab_index.levels:
+            total_words = len(self.vocab_index.words_in_level(level))
+            learned_words = learned_by_level[level]
+            level_progress[level] = (learned_words / total_words) * 100 if total_words > 0 else 0
+        
+        progress_df = pd.DataFrame(list(level_progress.items()), 
+                                 columns=['Level', 'Progress'])
+        
+        fig = px.bar(progress_df, x='Level', y='Progress', 
+                    title='Progress by Level (%)',
+                    color='Progress',
+                    color_continuous_scale='Viridis')
+        fig.update_layout(height=300)
+        return fig
+    
+    def build_daily_goal_chart(self):
+        """Gauge of today's reviews against the daily goal"""
+        today_reviews = self.get_progress_summary().reviews_on()
+        
+        goal_progress = min(100, (today_reviews / st.session_state.daily_goal) * 100)
+        
+        fig = go.Figure(go.Indicator(
+            mode = "gauge+number+delta",
+            value = goal_progress,
+            domain = {'x': [0, 1], 'y': [0, 1]},
+            title = {'text': "Today's Progress"},
+            delta = {'reference': 100},
+            gauge = {
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "darkblue"},
+                'steps': [
+                    {'range': [0, 50], 'color': "lightgray"},
+                    {'range': [50, 100], 'color': "gray"}],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90}}))
+        fig.update_layout(height=300)
+        return fig
+    
+    def build_review_forecast_chart(self):
+        """Reviews-per-day forecast chart, returned with the forecast it shows"""
+        forecast = forecast_reviews(st.session_state.flashcard_data, days=FORECAST_DAYS,
+                                    difficulty_counts=self.get_study_history().difficulty_counts(days=30))
+        forecast_df = pd.DataFrame({
+            'Date': forecast.dates,
+            'Scheduled': forecast.scheduled,
+            'Expected': forecast.expected.round(1)
+        })
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(x=forecast_df['Date'], y=forecast_df['Scheduled'], name='Already scheduled'))
+        fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Expected'], name='Expected incl. re-reviews',
+                                 mode='lines+markers'))
+        fig.update_layout(height=300, title=f'Reviews per Day (next {FORECAST_DAYS} days)',
+                          legend=dict(orientation='h', y=-0.2))
+        return fig, forecast
+    
+    def build_mastery_chart(self):
+        """Bar chart of words per mastery level"""
+        histogram = self.get_progress_summary().mastery_histogram()
+        df = pd.DataFrame({'Mastery Level': range(len(histogram)), 'Number of Words': histogram})
+        return px.bar(df, x='Mastery Level', y='Number of Words',
+                      title='Mastery Level Distribution',
+                      labels={'Mastery Level': 'Mastery Level (0-10)'})
+    
     def render_dashboard(self):
         """Render the modern, engaging dashboard"""
         # Modern header with user info
@@ -1582,7 +437,7 @@ class IndonesianLearningApp:
             """, unsafe_allow_html=True)
         
         with col4:
-            due_count = len(self.get_due_cards())
+            due_count = self.get_scheduler().due_count()
             st.markdown(f"""
             <div style='background: linear-gradient(135deg, #FFA726, #FF9800); padding: 2rem; border-radius: 20px; text-align: center; color: white; box-shadow: 0 8px 25px rgba(0,0,0,0.1);'>
                 <h2 style='margin: 0; font-size: 3rem; font-weight: bold;'>{due_count}</h2>
@@ -1598,8 +453,7 @@ class IndonesianLearningApp:
         with col2:
             # Security and save status
             if st.session_state.current_profile and st.session_state.current_profile != "Demo":
-                profile_files = self.get_profile_files(st.session_state.current_profile)
-                if os.path.exists(profile_files['progress']):
+                if st.session_state.current_profile in self.profile_catalog:
                     st.success("🔒 Private & Saved")
                 else:
                     st.warning("⚠️ No Saved Data")
@@ -1607,56 +461,23 @@ class IndonesianLearningApp:
                 st.info("🚀 Demo Mode")
         st.markdown("---")
         
-        # Progress visualization
+        # Progress visualization (aggregates maintained per review)
+        summary = self.get_progress_summary()
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("📈 Learning Progress")
             
-            # Progress by level
-            level_progress = {}
-            for level in VOCABULARY_DATA.keys():
-                total_words = len(VOCABULARY_DATA[level])
-                learned_words = len([w for w in st.session_state.user_progress['words_learned'] 
-                                   if w in VOCABULARY_DATA[level]])
-                level_progress[level] = (learned_words / total_words) * 100 if total_words > 0 else 0
-            
-            progress_df = pd.DataFrame(list(level_progress.items()), 
-                                     columns=['Level', 'Progress'])
-            
-            fig = px.bar(progress_df, x='Level', y='Progress', 
-                        title='Progress by Level (%)',
-                        color='Progress',
-                        color_continuous_scale='Viridis')
-            fig.update_layout(height=300)
+            # Rebuilt only when progress changes
+            fig = self.cached_figure('level_progress', self.build_level_progress_chart)
             st.plotly_chart(fig, width='stretch')
             
         with col2:
             st.subheader("🎯 Daily Goals")
             
             # Daily goal progress
-            today_reviews = len([w for w in st.session_state.user_progress['words_learned'] 
-                               if st.session_state.user_progress.get('last_study_date') == datetime.now().date()])
-            
-            goal_progress = min(100, (today_reviews / st.session_state.daily_goal) * 100)
-            
-            fig = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = goal_progress,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Today's Progress"},
-                delta = {'reference': 100},
-                gauge = {
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 100], 'color': "gray"}],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90}}))
-            fig.update_layout(height=300)
+            fig = self.cached_figure('daily_goal', self.build_daily_goal_chart,
+                                     st.session_state.daily_goal, datetime.now().date())
             st.plotly_chart(fig, width='stretch')
         
         # Learning Progress Details
@@ -1669,17 +490,17 @@ class IndonesianLearningApp:
             # Show mastery levels
             if st.session_state.user_progress['learned_words_details']:
                 mastery_data = []
-                for word, details in st.session_state.user_progress['learned_words_details'].items():
+                learned_words_details = st.session_state.user_progress['learned_words_details']
+                for word, mastery_level in summary.top_mastered(10):
+                    details = learned_words_details[word]
                     mastery_data.append({
                         'Word': word,
-                        'Mastery Level': details['mastery_level'],
+                        'Mastery Level': mastery_level,
                         'Total Reviews': details['total_reviews'],
                         'Success Rate': f"{(details['correct_reviews']/details['total_reviews']*100):.1f}%" if details['total_reviews'] > 0 else "0%"
                     })
                 
-                mastery_df = pd.DataFrame(mastery_data)
-                mastery_df = mastery_df.sort_values('Mastery Level', ascending=False)
-                st.dataframe(mastery_df.head(10), width='stretch')
+                st.dataframe(pd.DataFrame(mastery_data), width='stretch')
             else:
                 st.info("Start learning words to see your mastery progress!")
         
@@ -1706,6 +527,31 @@ class IndonesianLearningApp:
                 if len(st.session_state.user_progress['mastered_words']) > 3:
                     st.write(f"... and {len(st.session_state.user_progress['mastered_words']) - 3} more")
         
+        # Review workload forecast
+        st.markdown("---")
+        st.subheader("📅 Upcoming Reviews")
+        if len(st.session_state.flashcard_data):
+            # Overdue counts move with the clock, so the forecast is also refreshed hourly
+            fig, forecast = self.cached_figure('review_forecast', self.build_review_forecast_chart,
+                                               datetime.now().strftime('%Y-%m-%d %H'))
+            st.plotly_chart(fig, width='stretch')
+            
+            week_total = forecast.expected[:7].sum()
+            st.caption(f"About {week_total:.0f} reviews expected this week"
+                       f"{f' ({forecast.overdue} overdue now)' if forecast.overdue else ''}, based on your recent ratings.")
+            
+            # Returning after a break: offer to spread the backlog under the daily goal
+            daily_cap = st.session_state.daily_goal
+            if forecast.overdue > daily_cap:
+                st.warning(f"⏰ {forecast.overdue} cards are overdue - more than your daily goal of {daily_cap}.")
+                if st.button(f"📆 Spread them over the next {BACKLOG_DAYS} days", width='stretch'):
+                    moved = self.spread_overdue_cards(daily_cap)
+                    if moved:
+                        self.notify(f"✅ Rescheduled {moved} cards - at most {daily_cap} reviews a day", 'success')
+                    st.rerun()
+        else:
+            st.info("Review some flashcards to see your upcoming workload!")
+        
         # Action buttons
         st.markdown("---")
         # Simple, engaging navigation
@@ -1773,16 +619,8 @@ class IndonesianLearningApp:
         </div>
         """, unsafe_allow_html=True)
         
-        # Flatten VOCABULARY_DATA to get all words across all levels
-        all_words = {}
-        for level_data in VOCABULARY_DATA.values():
-            all_words.update(level_data)
-        
-        # Get all available categories from flattened vocabulary
-        categories = set()
-        for word_data in all_words.values():
-            categories.add(word_data.get('category', 'general'))
-        categories = sorted(list(categories))
+        # All available categories across every level
+        categories = list(self.vocab_index.categories)
         
         # Category and level selection
         col1, col2 = st.columns([2, 1])
@@ -1799,56 +637,45 @@ class IndonesianLearningApp:
         with col2:
             selected_level = st.selectbox(
                 "📚 Level:",
-                options=list(VOCABULARY_DATA.keys()),
-                index=list(VOCABULARY_DATA.keys()).index(st.session_state.user_progress['current_level'])
+                options=list(self.vocab_index.levels),
+                index=list(self.vocab_index.levels).index(st.session_state.user_progress['current_level'])
             )
         
-        # Filter words by category and get due cards
+        # Words in the selected level (and category)
         if selected_category == 'all':
-            available_words = list(all_words.keys())
+            level_words = self.vocab_index.words_in_level(selected_level)
         else:
-            available_words = [word for word, data in all_words.items() 
-                             if data.get('category', 'general') == selected_category]
-        
-        # Get due cards from the filtered words
-        level_words = VOCABULARY_DATA.get(selected_level, {})
-        due_cards = []
-        
-        for word in available_words:
-            if word in level_words and word in st.session_state.flashcard_data:
-                card_data = st.session_state.flashcard_data[word]
-                next_review = card_data['next_review']
-                if isinstance(next_review, str):
-                    next_review = datetime.fromisoformat(next_review)
-                if datetime.now() >= next_review:
-                    due_cards.append(word)
-        
-        # If no due cards, show all available words from category and level
-        if not due_cards:
-            due_cards = [word for word in available_words if word in level_words]
-        
-        if not due_cards:
+            level_words = self.vocab_index.words_in_category(selected_category, level=selected_level)
+        
+        # Due cards in the filtered pool - counted and sampled without listing the pool
+        scheduler = self.get_scheduler()
+        pool_category = None if selected_category == 'all' else selected_category
+        due_count = scheduler.due_count(level=selected_level, category=pool_category)
+        
+        if not due_count and not level_words:
             st.warning(f"No flashcards available for '{selected_category}' category in '{selected_level}' level!")
             if st.button("← Back to Dashboard"):
                 st.session_state.page = 'dashboard'
                 st.rerun()
             return
         
-        # Get current card
-        if (st.session_state.current_card is None or 
-            st.session_state.current_card not in due_cards or
-            st.session_state.get('current_flashcard_category') != selected_category):
-            st.session_state.current_card = random.choice(due_cards)
+        # Get current card (if no cards are due, any word from the category and level)
+        current_card = st.session_state.current_card
+        if due_count:
+            still_valid = current_card is not None and scheduler.is_due(current_card, selected_level, pool_category)
+        else:
+            still_valid = current_card is not None and scheduler.in_pool(current_card, selected_level, pool_category)
+        if not still_valid or st.session_state.get('current_flashcard_category') != selected_category:
+            if due_count:
+                st.session_state.current_card = scheduler.sample_due(level=selected_level, category=pool_category)
+            else:
+                st.session_state.current_card = random.choice(level_words)
             st.session_state.show_answer = False
             st.session_state.current_flashcard_category = selected_category
         
         current_word = st.session_state.current_card
-        word_data = all_words[current_word]
-        card_data = st.session_state.flashcard_data.get(current_word, {
-            'review_count': 0,
-            'next_review': datetime.now(),
-            'interval': 1
-        })
+        word_data = self.vocab_index.entry(current_word, level=selected_level)
+        card_data = st.session_state.flashcard_data.card(current_word)
         
         # Category indicator
         st.markdown(f"""
@@ -1929,26 +756,26 @@ class IndonesianLearningApp:
             
             with col1:
                 if st.button("😊 Easy", use_container_width=True, type="primary"):
-                    self.update_flashcard_schedule(current_word, 'easy')
                     st.session_state.user_progress['words_learned'].add(current_word)
                     self.update_daily_streak()
+                    self.update_flashcard_schedule(current_word, 'easy')
                     st.session_state.current_card = None
                     st.session_state.show_answer = False
                     st.rerun()
                     
             with col2:
                 if st.button("🤔 Medium", use_container_width=True):
-                    self.update_flashcard_schedule(current_word, 'medium')
                     st.session_state.user_progress['words_learned'].add(current_word)
                     self.update_daily_streak()
+                    self.update_flashcard_schedule(current_word, 'medium')
                     st.session_state.current_card = None
                     st.session_state.show_answer = False
                     st.rerun()
                     
             with col3:
                 if st.button("😰 Hard", use_container_width=True):
-                    self.update_flashcard_schedule(current_word, 'hard')
                     self.update_daily_streak()
+                    self.update_flashcard_schedule(current_word, 'hard')
                     st.session_state.current_card = None
                     st.session_state.show_answer = False
                     st.rerun()
@@ -1959,10 +786,12 @@ class IndonesianLearningApp:
         with col1:
             st.info(f"📊 Category: {selected_category.title()}")
         with col2:
-            st.info(f"📋 Due Now: {len(due_cards)} cards")
+            st.info(f"📋 Due Now: {due_count} cards")
         with col3:
-            category_learned = len([w for w in st.session_state.user_progress['words_learned'] 
-                                  if w in available_words])
+            if selected_category == 'all':
+                category_learned = len(st.session_state.user_progress['words_learned'])
+            else:
+                category_learned = self.get_progress_summary().category_counts.get(selected_category, 0)
             st.info(f"✅ Learned: {category_learned} words")
         with col4:
             st.info(f"🏷️ Categories: {len(categories)}")
@@ -2029,9 +858,7 @@ class IndonesianLearningApp:
         if st.session_state.battle_players['player1'] and st.session_state.battle_players['player2']:
             if st.button("🚀 Start Battle!", type="primary"):
                 # Initialize battle with random words
-                all_words = []
-                for level_words in VOCABULARY_DATA.values():
-                    all_words.extend(level_words.keys())
+                all_words = self.vocab_index.words
                 
                 st.session_state.battle_words = random.sample(all_words, min(10, len(all_words)))
                 st.session_state.battle_current_word = 0
@@ -2065,7 +892,8 @@ class IndonesianLearningApp:
         with col1:
             if st.button("✅ Submit Answer", type="primary"):
                 # Check answer
-                correct_answer = VOCABULARY_DATA.get('Absolute Beginner', {}).get(current_word, {}).get('english', 'Unknown')
+                word_entry = self.vocab_index.entry(current_word)
+                correct_answer = word_entry['english'] if word_entry else 'Unknown'
                 if answer.lower().strip() == correct_answer.lower().strip():
                     st.session_state.battle_scores[current_player] += 1
                     st.success(f"✅ Correct! +1 point for {player_name}")
@@ -2183,95 +1011,20 @@ class IndonesianLearningApp:
             with col4:
                 st.markdown(f"{player['battles_won']} wins")
 
-    def generate_intelligent_quiz_words(self, learned_words, num_questions=8):
+    def generate_intelligent_quiz_words(self, num_questions=8):
         """Generate intelligent word selection for quiz avoiding recent repetitions"""
-        # Get quiz history to avoid repetition
-        recent_quizzes = st.session_state.user_progress.get('recent_quiz_words', [])
-        
-        # Categorize words by difficulty and frequency
-        word_stats = {}
-        for word in learned_words:
-            # Get word data
-            word_data = None
-            for level, words in VOCABULARY_DATA.items():
-                if word in words:
-                    word_data = words[word]
-                    word_data['level'] = level
-                    break
-            
-            if word_data:
-                # Calculate word priority (lower = higher priority)
-                recent_count = sum(1 for quiz_words in recent_quizzes if word in quiz_words)
-                level_difficulty = {
-                    'Absolute Beginner': 1, 'Beginner': 2, 'Intermediate': 3, 
-                    'Advanced': 4, 'Expert': 5
-                }.get(level, 3)
-                
-                word_stats[word] = {
-                    'recent_count': recent_count,
-                    'difficulty': level_difficulty,
-                    'category': word_data.get('category', 'general'),
-                    'priority': recent_count * 2 + (5 - level_difficulty)  # Lower = better
-                }
-        
-        # Sort by priority (less recent + appropriate difficulty)
-        sorted_words = sorted(word_stats.keys(), key=lambda w: word_stats[w]['priority'])
-        
-        # Select words with variety
-        selected = []
-        used_categories = set()
-        
-        # First pass: get diverse categories
-        for word in sorted_words:
-            if len(selected) >= num_questions:
-                break
-            category = word_stats[word]['category']
-            if category not in used_categories or len(used_categories) >= 4:
-                selected.append(word)
-                used_categories.add(category)
-        
-        # Second pass: fill remaining slots
-        for word in sorted_words:
-            if len(selected) >= num_questions:
-                break
-            if word not in selected:
-                selected.append(word)
-        
-        return selected[:num_questions]
+        return select_quiz_words(self.get_quiz_features(),
+                                 st.session_state.user_progress.get('recent_quiz_words', []),
+                                 num_questions)
     
-    def generate_sentence_question(self, word, word_data):
-        """Generate a sentence completion question"""
-        # Get example sentence or create one
-        example = word_data.get('example', f"Saya suka {word}.")
-        
-        # Try to get translation
-        example_translation = self.get_example_translation(example, word)
-        
-        # Create blanked version
-        if word in example:
-            question_sentence = example.replace(word, "____")
-            return {
-                'type': 'sentence_completion',
-                'question': f'Complete the sentence: "{question_sentence}"',
-                'translation': f'Translation: "{example_translation}"',
-                'answer': word
-            }
-        else:
-            # Fallback: create a simple sentence
-            sentences = [
-                f"Saya melihat ____ di sana.",
-                f"Ini adalah ____ yang bagus.",
-                f"Mereka membutuhkan ____.",
-                f"Dia membeli ____ kemarin."
-            ]
-            question_sentence = random.choice(sentences)
-            translation = self.get_example_translation(question_sentence.replace("____", word), word)
-            return {
-                'type': 'sentence_completion',
-                'question': f'Complete the sentence: "{question_sentence}"',
-                'translation': f'Translation: "{translation}"',
-                'answer': word
-            }
+    def start_quiz(self, words):
+        """Build the whole quiz up front and reset quiz progress"""
+        quiz = build_quiz(words)
+        st.session_state.quiz = quiz
+        st.session_state.quiz_words = quiz['words']
+        st.session_state.quiz_current = 0
+        st.session_state.quiz_score = 0
+        st.session_state.quiz_answers = []
     
     def render_quiz(self):
         """Render advanced vocabulary quiz system"""
@@ -2295,43 +1048,18 @@ class IndonesianLearningApp:
         
         if 'quiz_words' not in st.session_state:
             # Initialize advanced quiz system
-            learned_words_list = list(st.session_state.user_progress['words_learned'])
-            if len(learned_words_list) < 5:
+            # Learned words outside the vocabulary cannot be quizzed and are not counted
+            if self.get_quiz_features().learned_count < 5:
                 st.warning("Learn at least 5 words before taking the advanced quiz!")
                 if st.button("← Back to Dashboard"):
                     st.session_state.page = 'dashboard'
                     st.rerun()
                 return
             
-            # Ensure we have valid words for the quiz
-            valid_words = []
-            for word in learned_words_list:
-                # Check if word exists in vocabulary data
-                word_found = False
-                for level, words in VOCABULARY_DATA.items():
-                    if word in words:
-                        valid_words.append(word)
-                        word_found = True
-                        break
-                if not word_found:
-                    st.warning(f"Word '{word}' not found in vocabulary data, skipping...")
-            
-            if len(valid_words) < 5:
-                st.error("Not enough valid words for the advanced quiz. Please learn more words first!")
-                if st.button("← Back to Dashboard"):
-                    st.session_state.page = 'dashboard'
-                    st.rerun()
-                return
-            
             # Generate intelligent word selection
-            selected_words = self.generate_intelligent_quiz_words(valid_words, 8)
+            selected_words = self.generate_intelligent_quiz_words(8)
             
-            st.session_state.quiz_words = selected_words
-            st.session_state.quiz_current = 0
-            st.session_state.quiz_score = 0
-            st.session_state.quiz_answers = []
-            st.session_state.quiz_options = {}
-            st.session_state.quiz_questions = {}  # Store generated questions
+            self.start_quiz(selected_words)
             
             # Track this quiz for future repetition avoidance
             if 'recent_quiz_words' not in st.session_state.user_progress:
@@ -2341,17 +1069,16 @@ class IndonesianLearningApp:
             if len(st.session_state.user_progress['recent_quiz_words']) > 5:
                 st.session_state.user_progress['recent_quiz_words'].pop(0)
         
-        # Ensure containers exist even if quiz already initialized
-        if 'quiz_options' not in st.session_state:
-            st.session_state.quiz_options = {}
-        if 'quiz_questions' not in st.session_state:
-            st.session_state.quiz_questions = {}
+        # Quiz words chosen elsewhere (e.g. weak words review) or quiz lost from state
+        if 'quiz' not in st.session_state:
+            self.start_quiz(st.session_state.quiz_words)
         
+        questions = st.session_state.quiz['questions']
         current_idx = st.session_state.quiz_current
         
-        if current_idx >= len(st.session_state.quiz_words):
+        if current_idx >= len(questions):
             # Quiz complete - Enhanced results
-            score_percentage = (st.session_state.quiz_score / len(st.session_state.quiz_words)) * 100
+            score_percentage = (st.session_state.quiz_score / max(len(questions), 1)) * 100
             st.session_state.user_progress['quiz_scores'].append(score_percentage)
             
             # Save progress
@@ -2362,11 +1089,11 @@ class IndonesianLearningApp:
             # Detailed results
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Final Score", f"{st.session_state.quiz_score}/8", f"{score_percentage:.1f}%")
+                st.metric("Final Score", f"{st.session_state.quiz_score}/{len(questions)}", f"{score_percentage:.1f}%")
             with col2:
                 question_types = [ans.get('question_type', 'translation') for ans in st.session_state.quiz_answers]
                 sentence_questions = sum(1 for qt in question_types if qt == 'sentence_completion')
-                st.metric("Sentence Questions", f"{sentence_questions}/8")
+                st.metric("Sentence Questions", f"{sentence_questions}/{len(questions)}")
             with col3:
                 avg_all_scores = sum(st.session_state.user_progress.get('quiz_scores', [])) / len(st.session_state.user_progress.get('quiz_scores', [1]))
                 improvement = score_percentage - avg_all_scores
@@ -2394,58 +1121,27 @@ class IndonesianLearningApp:
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("🔄 Take Another Quiz", use_container_width=True):
-                    for key in ['quiz_words', 'quiz_current', 'quiz_score', 'quiz_answers', 'quiz_options', 'quiz_questions']:
+                    for key in ['quiz', 'quiz_words', 'quiz_current', 'quiz_score', 'quiz_answers']:
                         if key in st.session_state:
                             del st.session_state[key]
                     st.rerun()
             with col2:
                 if st.button("← Back to Dashboard", use_container_width=True):
-                    for key in ['quiz_words', 'quiz_current', 'quiz_score', 'quiz_answers', 'quiz_options', 'quiz_questions']:
+                    for key in ['quiz', 'quiz_words', 'quiz_current', 'quiz_score', 'quiz_answers']:
                         if key in st.session_state:
                             del st.session_state[key]
                     st.session_state.page = 'dashboard'
                     st.rerun()
             return
         
-        # Current question
-        current_word = st.session_state.quiz_words[current_idx]
-        
-        # Get word data from vocabulary or flashcard data
-        if current_word in st.session_state.flashcard_data:
-            card_data = st.session_state.flashcard_data[current_word]
-        else:
-            # Find word in vocabulary data
-            card_data = None
-            for level, words in VOCABULARY_DATA.items():
-                if current_word in words:
-                    card_data = words[current_word]
-                    card_data['level'] = level
-                    break
-            
-            if not card_data:
-                st.error(f"Word '{current_word}' not found in vocabulary data!")
-                st.session_state.quiz_current += 1
-                st.rerun()
-                return
-        
-        st.progress((current_idx + 1) / len(st.session_state.quiz_words))
-        st.subheader(f"Question {current_idx + 1} of 8")
+        # Current question (built with the rest of the quiz in start_quiz)
+        question_data = questions[current_idx]
+        current_word = question_data['word']
+        correct_answer = question_data['answer']
+        options = question_data['options']
         
-        # Generate question type (mix of translation and sentence completion)
-        if current_idx not in st.session_state.quiz_questions:
-            # Decide question type: 50% sentence completion, 50% translation
-            if current_idx % 2 == 0 and current_idx < 6:  # More sentence questions in first 6
-                question_data = self.generate_sentence_question(current_word, card_data)
-                st.session_state.quiz_questions[current_idx] = question_data
-            else:
-                # Traditional translation question
-                st.session_state.quiz_questions[current_idx] = {
-                    'type': 'translation',
-                    'question': f'What does "{current_word}" mean in English?',
-                    'answer': card_data['english']
-                }
-        
-        question_data = st.session_state.quiz_questions[current_idx]
+        st.progress((current_idx + 1) / len(questions))
+        st.subheader(f"Question {current_idx + 1} of {len(questions)}")
         
         # Question display with dynamic styling based on type
         if question_data['type'] == 'sentence_completion':
@@ -2479,39 +1175,6 @@ class IndonesianLearningApp:
             unsafe_allow_html=True
         )
         
-        # Generate multiple choice options (persisted to avoid reshuffle)
-        correct_answer = card_data['english']
-
-        if current_idx not in st.session_state.quiz_options:
-            # Get wrong answers from same level or any level
-            wrong_answers = []
-
-            # Try to get words from same level first
-            same_level_words = []
-            for w, data in st.session_state.flashcard_data.items():
-                if data.get('level') == card_data.get('level') and w != current_word:
-                    same_level_words.append(data['english'])
-
-            # If not enough words from same level, get from any level
-            if len(same_level_words) < 3:
-                all_other_words = []
-                for level, words in VOCABULARY_DATA.items():
-                    for w, data in words.items():
-                        if w != current_word and data['english'] != correct_answer:
-                            all_other_words.append(data['english'])
-
-                # Remove duplicates and add to same_level_words
-                same_level_words.extend([w for w in all_other_words if w not in same_level_words])
-
-            # Select wrong answers
-            wrong_answers = random.sample(same_level_words, min(3, len(same_level_words)))
-
-            options = [correct_answer] + wrong_answers
-            random.shuffle(options)
-            st.session_state.quiz_options[current_idx] = options
-        else:
-            options = st.session_state.quiz_options[current_idx]
-        
         # Answer selection with better styling
         st.markdown("### Choose the correct answer:")
         selected_answer = st.radio("Select your answer:", options, key=f"quiz_{current_idx}", index=None, label_visibility="collapsed")
@@ -2520,14 +1183,15 @@ class IndonesianLearningApp:
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("💡 Get Hint", use_container_width=True):
-                st.info(f"💡 Hint: The word '{current_word}' is related to '{card_data.get('category', 'general')}' category")
+                st.info(f"💡 Hint: The word '{current_word}' is related to '{question_data['category']}' category")
         
         # Submit button with better styling - only proceed if answer is selected
         if st.button("Submit Answer", use_container_width=True, type="primary"):
             if selected_answer is None:
                 st.warning("Please select an answer before submitting!")
                 return
-            if selected_answer == correct_answer:
+            is_correct = grade(question_data, selected_answer)
+            if is_correct:
                 st.session_state.quiz_score += 1
                 st.markdown(
                     f"""
@@ -2574,14 +1238,15 @@ class IndonesianLearningApp:
                 'word': current_word,
                 'correct': correct_answer,
                 'selected': selected_answer,
-                'is_correct': selected_answer == correct_answer
+                'is_correct': is_correct,
+                'question_type': question_data['type']
             })
             
             # Show result and wait for user to continue
             st.session_state.quiz_current += 1
             
             # Add continue button instead of auto-advance
-            if st.session_state.quiz_current < len(st.session_state.quiz_words):
+            if st.session_state.quiz_current < len(questions):
                 st.info("⏳ Click 'Continue' to proceed to the next question...")
                 if st.button("➡️ Continue to Next Question", width='stretch', type="primary"):
                     st.rerun()
@@ -2638,11 +1303,7 @@ class IndonesianLearningApp:
                 details = st.session_state.user_progress['learned_words_details'][word]
                 
                 # Get word data
-                card_data = None
-                for level, words in VOCABULARY_DATA.items():
-                    if word in words:
-                        card_data = words[word]
-                        break
+                card_data = self.vocab_index.entry(word)
                 
                 if not card_data:
                     continue
@@ -2695,10 +1356,7 @@ class IndonesianLearningApp:
                             st.rerun()
                         
                         if st.button(f"🧠 Quiz", key=f"quiz_{word}", width='stretch'):
-                            st.session_state.quiz_words = [word]
-                            st.session_state.quiz_current = 0
-                            st.session_state.quiz_score = 0
-                            st.session_state.quiz_answers = []
+                            self.start_quiz([word])
                             st.session_state.page = 'quiz'
                             st.rerun()
                         
@@ -2723,10 +1381,7 @@ class IndonesianLearningApp:
         
         with col2:
             if st.button("🧠 Quiz Weak Words", width='stretch'):
-                st.session_state.quiz_words = weak_words_sorted[:10]  # Quiz top 10
-                st.session_state.quiz_current = 0
-                st.session_state.quiz_score = 0
-                st.session_state.quiz_answers = []
+                self.start_quiz(weak_words_sorted[:10])  # Quiz top 10
                 st.session_state.page = 'quiz'
                 st.rerun()
         
@@ -2735,6 +1390,14 @@ class IndonesianLearningApp:
                 st.session_state.page = 'dashboard'
                 st.rerun()
     
+    def get_learned_words_table(self):
+        """Get the learned-words table, rebuilding it only when progress changed"""
+        table = st.session_state.get('learned_words_table')
+        if table is None or not table.tracks(st.session_state.user_progress):
+            table = LearnedWordsTable(st.session_state.user_progress, self.vocab_index)
+            st.session_state.learned_words_table = table
+        return table
+    
     def render_word_database(self):
         """Render comprehensive word database view"""
         st.title("📊 Word Database")
@@ -2747,11 +1410,11 @@ class IndonesianLearningApp:
         
         with col2:
             category_filter = st.selectbox("📂 Filter by category:", 
-                                         ["All"] + list(set([data['category'] for data in VOCABULARY_DATA.values() for data in data.values()])))
+                                         ["All"] + list(self.vocab_index.categories))
         
         with col3:
             level_filter = st.selectbox("📚 Filter by level:", 
-                                      ["All"] + list(VOCABULARY_DATA.keys()))
+                                      ["All"] + list(self.vocab_index.levels))
         
         # Get all learned words
         learned_words = st.session_state.user_progress['learned_words_details']
@@ -2763,68 +1426,38 @@ class IndonesianLearningApp:
                 st.rerun()
             return
         
-        # Filter words based on search and filters
-        filtered_words = []
-        for word, details in learned_words.items():
-            # Find the word in vocabulary data
-            word_data = None
-            for level, words in VOCABULARY_DATA.items():
-                if word in words:
-                    word_data = words[word]
-                    word_level = level
-                    break
-            
-            if not word_data:
-                continue
-                
-            # Apply filters
-            if level_filter != "All" and word_level != level_filter:
-                continue
-                
-            if category_filter != "All" and word_data['category'] != category_filter:
-                continue
-                
-            if search_term and search_term.lower() not in word.lower() and search_term.lower() not in word_data['english'].lower():
-                continue
-                
-            filtered_words.append({
-                'Indonesian': word,
-                'English': word_data['english'],
-                'Pronunciation': word_data['pronunciation'],
-                'Category': word_data['category'].title(),
-                'Level': word_level,
-                'Mastery': details['mastery_level'],
-                'Reviews': details['total_reviews'],
-                'Success Rate': f"{(details['correct_reviews']/details['total_reviews']*100):.1f}%" if details['total_reviews'] > 0 else "0%",
-                'Example': word_data.get('example', 'No example available'),
-                'Last Reviewed': details['last_reviewed'][:10] if details['last_reviewed'] else 'Never'
-            })
-        
-        # Sort by mastery level (highest first)
-        filtered_words.sort(key=lambda x: x['Mastery'], reverse=True)
+        # Filter words based on search and filters (vectorized over the cached table)
+        table = self.get_learned_words_table()
+        mask = table.mask(search_term,
+                          category=None if category_filter == "All" else category_filter,
+                          level=None if level_filter == "All" else level_filter)
+        total_matches, mastered_matches, average_mastery = table.stats(mask)
         
-        st.subheader(f"📚 Your Learned Words ({len(filtered_words)} words)")
+        st.subheader(f"📚 Your Learned Words ({total_matches} words)")
         
-        if filtered_words:
-            # Create DataFrame for better display
-            df = pd.DataFrame(filtered_words)
-            
+        if total_matches:
             # Display with options
             col1, col2 = st.columns([3, 1])
             
             with col1:
-                st.dataframe(df, width='stretch', height=400)
+                pages = page_count(total_matches)
+                if st.session_state.get('word_database_page', 1) > pages:
+                    st.session_state.word_database_page = pages  # Filters narrowed the results
+                page = st.number_input("Page", min_value=1, max_value=pages, step=1,
+                                       key="word_database_page") if pages > 1 else 1
+                st.dataframe(table.rows(mask, page - 1), width='stretch', height=400)
+                st.caption(f"Page {page} of {pages} ({PAGE_SIZE} words per page)")
             
             with col2:
                 st.subheader("📊 Quick Stats")
-                st.metric("Total Words", len(filtered_words))
-                st.metric("Mastered Words", len([w for w in filtered_words if w['Mastery'] >= 8]))
-                st.metric("Average Mastery", f"{sum(w['Mastery'] for w in filtered_words)/len(filtered_words):.1f}/10")
+                st.metric("Total Words", total_matches)
+                st.metric("Mastered Words", mastered_matches)
+                st.metric("Average Mastery", f"{average_mastery:.1f}/10")
                 
                 # Export options
                 st.subheader("📤 Export")
                 if st.button("📄 Export to CSV"):
-                    csv = df.to_csv(index=False)
+                    csv = table.export(mask).to_csv(index=False)
                     st.download_button(
                         label="Download CSV",
                         data=csv,
@@ -2833,7 +1466,7 @@ class IndonesianLearningApp:
                     )
                 
                 if st.button("📋 Copy to Clipboard"):
-                    st.code(df.to_string(index=False), language=None)
+                    st.code(table.export(mask).to_string(index=False), language=None)
                     st.success("Copied to clipboard!")
         else:
             st.warning("No words match your search criteria.")
@@ -2873,7 +1506,9 @@ class IndonesianLearningApp:
             col1, col2 = st.columns(2)
             
             with col1:
-                name = st.text_input("Name:", value=st.session_state.user_progress.get('profile_name', ''))
+                # The profile name keys the stored data, so a logged-in profile cannot be renamed here
+                name = st.text_input("Name:", value=st.session_state.user_progress.get('profile_name', ''),
+                                     disabled=st.session_state.current_profile not in (None, "Demo"))
                 email = st.text_input("Email:", value=st.session_state.user_progress.get('profile_email', ''))
                 learning_goal = st.text_area("Learning Goal:", value=st.session_state.user_progress.get('learning_goal', ''))
             
@@ -2891,6 +1526,8 @@ class IndonesianLearningApp:
             st.session_state.user_progress['native_language'] = native_language
             st.session_state.user_progress['target_language'] = target_language
             st.session_state.daily_goal = daily_goal
+            # Reviews only journal the reviewed word, so other edits need a full save
+            self.save_progress()
             st.success("Profile saved successfully!")
         
         # Profile display
@@ -2911,26 +1548,15 @@ class IndonesianLearningApp:
         with col4:
             st.metric("Weak Words", len(st.session_state.user_progress['weak_words']))
         
+        recent_reviews = sum(self.get_study_history().daily_counts(7).values())
+        st.caption(f"🗓️ {recent_reviews} reviews in the last 7 days")
+        
         # Learning progress chart
         if st.session_state.user_progress['learned_words_details']:
             st.subheader("📈 Learning Progress")
             
-            # Create progress data
-            progress_data = []
-            for word, details in st.session_state.user_progress['learned_words_details'].items():
-                progress_data.append({
-                    'Word': word,
-                    'Mastery Level': details['mastery_level'],
-                    'Total Reviews': details['total_reviews'],
-                    'Success Rate': (details['correct_reviews']/details['total_reviews']*100) if details['total_reviews'] > 0 else 0
-                })
-            
-            df = pd.DataFrame(progress_data)
-            
-            # Mastery level distribution
-            fig = px.histogram(df, x='Mastery Level', nbins=11, 
-                             title='Mastery Level Distribution',
-                             labels={'count': 'Number of Words', 'Mastery Level': 'Mastery Level (0-10)'})
+            # Mastery level distribution (kept up to date per review)
+            fig = self.cached_figure('mastery_distribution', self.build_mastery_chart)
             st.plotly_chart(fig, width='stretch')
         
         # Share profile
@@ -3029,11 +1655,15 @@ class IndonesianLearningApp:
                     
                     # Restore flashcard data
                     for word, data in progress_data['flashcard_data'].items():
-                        if word in st.session_state.flashcard_data:
-                            st.session_state.flashcard_data[word].update(data)
-                            st.session_state.flashcard_data[word]['next_review'] = datetime.fromisoformat(data['next_review'])
+                        if word in self.vocab_index and data.get('review_count'):
+                            st.session_state.flashcard_data.materialize(word).update(data)
+                    
+                    # Deck was updated in place - rebuild the due-card scheduler
+                    st.session_state.pop('flashcard_scheduler', None)
+                    bump_data_version(st.session_state.user_progress)
                     
                     st.session_state.daily_goal = progress_data.get('daily_goal', 20)
+                    self.save_progress()
                     st.success("Progress imported successfully!")
                     
                 except Exception as e:
@@ -3045,20 +1675,22 @@ class IndonesianLearningApp:
         col1, col2 = st.columns(2)
         with col1:
             if st.button("Reset Progress", type="secondary"):
-                st.session_state.user_progress = {
-                    'words_learned': set(),
-                    'daily_streak': 0,
-                    'last_study_date': None,
-                    'total_study_time': 0,
-                    'flashcard_reviews': {},
-                    'quiz_scores': [],
-                    'current_level': 'Beginner'
-                }
+                previous = st.session_state.user_progress
+                st.session_state.user_progress = self.get_default_progress(previous.get('profile_name'))
+                if 'created_date' in previous:
+                    st.session_state.user_progress['created_date'] = previous['created_date']
+                # Review history lives beside the progress file - reset it too, and drop the aggregates built from it
+                self.get_study_history().clear()
+                st.session_state.pop('study_history', None)
+                st.session_state.pop('progress_summary', None)
+                self.save_progress()
                 st.success("Progress reset!")
                 
         with col2:
             if st.button("Reset Flashcard Schedule", type="secondary"):
                 st.session_state.flashcard_data = self.init_flashcard_data()
+                bump_data_version(st.session_state.user_progress)  # Charts built from the old deck are stale
+                self.save_flashcards()
                 st.success("Flashcard schedule reset!")
         
         st.markdown("---")
@@ -3167,6 +1799,8 @@ class IndonesianLearningApp:
         if 'page' not in st.session_state:
             st.session_state.page = 'dashboard'
         
+        self.track_session_memory()
+        
         # Sidebar navigation with profile info
         with st.sidebar:
             # Streamlined header with smaller flag and cleaner design
@@ -3355,6 +1989,11 @@ class IndonesianLearningApp:
                     st.session_state.page = 'settings'
                     st.rerun()
                 
+                if is_admin(st.session_state.current_profile):
+                    if st.button("🧠 Memory Report", use_container_width=True, key="memory_btn"):
+                        st.session_state.page = 'memory'
+                        st.rerun()
+                
                 st.markdown("---")
                 if st.button("🚪 Logout", use_container_width=True, type="secondary", key="logout_btn"):
                     st.session_state.current_profile = None
@@ -3362,11 +2001,9 @@ class IndonesianLearningApp:
                     st.rerun()
             
             # Get total vocabulary count
-            total_vocab = 0
-            for level_data in VOCABULARY_DATA.values():
-                total_vocab += len(level_data)
+            total_vocab = self.vocab_index.entry_count
             
-            due_cards = len(self.get_due_cards())
+            due_cards = self.get_scheduler().due_count()
             if due_cards > 0:
                 st.info(f"🎴 {due_cards} cards due for review!")
             else:
@@ -3377,6 +2014,8 @@ class IndonesianLearningApp:
             self.render_profile_selection()
             return
         
+        self.render_notices()
+        
         # Render current page
         if st.session_state.page == 'dashboard':
             self.render_dashboard()
@@ -3400,6 +2039,56 @@ class IndonesianLearningApp:
             self.render_profile()
         elif st.session_state.page == 'settings':
             self.render_settings()
+        elif st.session_state.page == 'memory':
+            self.render_memory_report()
+    
+    def track_session_memory(self):
+        """Report this session's memory use to the process-wide monitor (throttled)"""
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            get_memory_monitor().record(ctx.session_id, st.session_state.current_profile, st.session_state)
+    
+    def render_memory_report(self):
+        """Render the admin-only memory report"""
+        if not is_admin(st.session_state.current_profile):
+            st.error("🔒 The memory report is only available to administrators.")
+            return
+        
+        st.title("🧠 Memory Report")
+        st.markdown("Approximate deep size of session state, per key and per active session")
+        
+        monitor = get_memory_monitor()
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            monitor.record(ctx.session_id, st.session_state.current_profile, st.session_state, force=True)
+        sessions = monitor.sessions()
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Active Sessions", len(sessions))
+        with col2:
+            st.metric("Total Session Memory", format_bytes(sum(snap.total for snap in sessions)))
+        with col3:
+            st.metric("Largest Session", format_bytes(sessions[0].total) if sessions else "0 B")
+        
+        st.subheader("📦 Memory by Session-State Key")
+        key_totals = monitor.key_totals()
+        if key_totals:
+            st.dataframe(pd.DataFrame({
+                'Key': list(key_totals.keys()),
+                'Size': [format_bytes(size) for size in key_totals.values()],
+                'Bytes': list(key_totals.values())
+            }).head(25), width='stretch', hide_index=True)
+        
+        st.subheader("👥 Active Sessions")
+        if sessions:
+            st.dataframe(pd.DataFrame([{
+                'Profile': snap.profile or 'Guest',
+                'Page': snap.page,
+                'Size': format_bytes(snap.total),
+                'Largest Key': next(iter(snap.sizes), ''),
+                'Measured': datetime.fromtimestamp(snap.taken_at).strftime('%H:%M:%S')
+            } for snap in sessions]), width='stretch', hide_index=True)
     
     def render_profile_selection(self):
         """Render simplified login and profile selection page with toggle"""
@@ -3575,14 +2264,17 @@ class IndonesianLearningApp:
             profile_files = self.get_profile_files(profile_name)
             
             # Delete all profile files
+            self.storage.delete(profile_name)
             for file_type, file_path in profile_files.items():
                 if os.path.exists(file_path):
                     os.remove(file_path)
+            self.profile_catalog.remove(profile_name)
+            self.credential_store.forget(profile_name)
             
             # Clear session state
             st.session_state.current_profile = None
             st.session_state.user_progress = self.get_default_progress()
-            st.session_state.flashcard_data = {}
+            st.session_state.flashcard_data = FlashcardDeck()
             
             return True
         except Exception as e:
@@ -3596,186 +2288,121 @@ class IndonesianLearningApp:
             st.error("🔒 Security Error: You can only access your own profile data.")
             return False
         
-        profile_files = self.get_profile_files(profile_name)
+        try:
+            progress_data, flashcard_data, version = self.storage.load(profile_name)
+        except Exception as e:
+            st.error(f"Error loading profile: {e}")
+            return False
         
-        # Load progress
-        if os.path.exists(profile_files['progress']):
-            try:
-                with open(profile_files['progress'], 'r') as f:
-                    progress_data = json.load(f)
-                
-                # Validate profile ownership
-                if progress_data.get('profile_name') != profile_name:
-                    st.error("🔒 Security Error: Profile data mismatch.")
-                    return False
-                
-                # Convert lists back to sets
-                for key, value in progress_data.items():
-                    if key in ['words_learned', 'weak_words', 'mastered_words'] and isinstance(value, list):
-                        progress_data[key] = set(value)
-                    elif key == 'last_study_date' and value:
-                        try:
-                            progress_data[key] = datetime.fromisoformat(value).date()
-                        except:
-                            progress_data[key] = None
-                
-                st.session_state.user_progress = progress_data
-            except Exception as e:
-                st.error(f"Error loading profile progress: {e}")
+        if progress_data is not None:
+            # Validate profile ownership
+            if progress_data.get('profile_name') != profile_name:
+                st.error("🔒 Security Error: Profile data mismatch.")
                 return False
+            st.session_state.user_progress = progress_data
+        if flashcard_data is not None:
+            st.session_state.flashcard_data = flashcard_data
+        st.session_state.profile_version = version
         
-        # Load flashcards
-        if os.path.exists(profile_files['flashcards']):
-            try:
-                with open(profile_files['flashcards'], 'r') as f:
-                    flashcard_data = json.load(f)
-                
-                # Convert ISO strings back to datetime objects
-                for word, data in flashcard_data.items():
-                    if 'next_review' in data:
-                        try:
-                            data['next_review'] = datetime.fromisoformat(data['next_review'])
-                        except:
-                            data['next_review'] = datetime.now()
-                
-                st.session_state.flashcard_data = flashcard_data
-            except Exception as e:
-                st.error(f"Error loading flashcards: {e}")
-                return False
+        # Move legacy study_sessions lists into the compact history file
+        if st.session_state.user_progress.get('study_sessions'):
+            self.import_legacy_sessions(profile_name)
+        
+        # Move a PIN left in an old progress file into the credential record
+        pin_code = legacy_pin(st.session_state.user_progress)
+        if pin_code and self.credential_store.get(profile_name) is None:
+            self.credential_store.set_pin(profile_name, pin_code)
+        for field in LEGACY_PIN_FIELDS:
+            st.session_state.user_progress.pop(field, None)
+        
+        if pin_code:
+            self.save_profile_data(profile_name)
         
         return True
     
+    def import_legacy_sessions(self, profile_name):
+        """Move a profile's study_sessions list into its history file exactly once, even with several workers"""
+        progress_data, flashcard_data, version, imported = migrate_legacy_sessions(
+            self.get_study_history(), self.storage, profile_name, self.vocab_index.word_id)
+        if not imported:
+            st.session_state.pop('study_history', None)  # Reread the history another worker wrote
+        if progress_data is not None:
+            st.session_state.user_progress = progress_data
+        if flashcard_data is not None:
+            st.session_state.flashcard_data = flashcard_data
+        st.session_state.profile_version = version
+    
     
     def authenticate_profile(self, username, pin_code):
         """Authenticate a profile with username and PIN code"""
-        try:
-            profile_files = self.get_profile_files(username)
-            if os.path.exists(profile_files['progress']):
-                with open(profile_files['progress'], 'r') as f:
-                    data = json.load(f)
-                    stored_pin = data.get('access_code', '')  # PIN is stored in access_code field
-                    return stored_pin == pin_code
-        except:
-            pass
-        return False
+        # Salted hash in the profile's small credential record - progress is never read
+        return self.credential_store.verify(username, pin_code)
     
     def get_existing_profiles(self):
         """Get list of existing profiles with complete privacy isolation"""
-        profiles = []
-        if os.path.exists(self.profiles_dir):
-            for profile_name in os.listdir(self.profiles_dir):
-                profile_path = os.path.join(self.profiles_dir, profile_name)
-                if os.path.isdir(profile_path):
-                    profile_files = self.get_profile_files(profile_name)
-                    if os.path.exists(profile_files['progress']):
-                        try:
-                            with open(profile_files['progress'], 'r') as f:
-                                data = json.load(f)
-                                # Only show basic info, no sensitive data
-                                profiles.append({
-                                    'name': profile_name,
-                                    'words_learned': len(data.get('words_learned', [])),
-                                    'access_code': data.get('access_code', 'N/A')
-                                })
-                        except:
-                            pass
-        return profiles
+        # One read of the profile catalog - only basic info, no PIN data
+        return self.profile_catalog.profiles()
     
     def init_new_profile(self, profile_name, pin_code):
         """Initialize a new profile with default data"""
         # Reset to default state
-        st.session_state.user_progress = {
-            'words_learned': set(),
-            'daily_streak': 0,
-            'last_study_date': None,
-            'total_study_time': 0,
-            'flashcard_reviews': {},
-            'quiz_scores': [],
-            'current_level': 'Absolute Beginner',
-            'learned_words_details': {},
-            'weak_words': set(),
-            'mastered_words': set(),
-            'study_sessions': [],
-            'total_words_learned': 0,
-            'profile_name': profile_name,
-            'created_date': datetime.now().isoformat(),
-            'pin_code': pin_code
-        }
+        st.session_state.user_progress = self.get_default_progress(profile_name)
         
         st.session_state.flashcard_data = self.init_flashcard_data()
         
-        # Save initial data
-        self.save_profile_data(profile_name)
+        # Version 0 = "nothing stored yet", so a profile another worker just created is not overwritten
+        st.session_state.profile_version = 0
+        try:
+            st.session_state.profile_version = self.storage.save(
+                profile_name, st.session_state.user_progress, st.session_state.flashcard_data,
+                expected_version=0)
+        except ProfileConflictError:
+            return False
+        self.credential_store.set_pin(profile_name, pin_code)
+        self.profile_catalog.update(profile_name, 0)
         return True
     
+    def reload_after_conflict(self, profile_name):
+        """Another worker saved this profile first - take its data instead of overwriting it"""
+        self.notify("⚠️ This profile was updated in another window. Loaded the latest saved progress.", 'warning')
+        self.load_profile_data(profile_name)
+    
+    def notify(self, message, kind='info'):
+        """Queue a message for the next render (handlers often st.rerun() right after acting)"""
+        st.session_state.setdefault('notices', []).append((kind, message))
+    
+    def render_notices(self):
+        """Show and clear the queued messages"""
+        for kind, message in st.session_state.pop('notices', []):
+            getattr(st, kind)(message)
+    
     def save_profile_data(self, profile_name):
-        """Save current session data to profile"""
-        profile_files = self.get_profile_files(profile_name)
-        
-        # Save progress
+        """Save current session data to profile; returns False if nothing was written"""
+        # The backend serializes sets/dates and never stores the PIN
         try:
-            progress_data = dict(st.session_state.user_progress)
-            # Convert sets to lists for JSON serialization
-            for key, value in progress_data.items():
-                if isinstance(value, set):
-                    progress_data[key] = list(value)
-                elif key == 'last_study_date' and value:
-                    progress_data[key] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
-            
-            with open(profile_files['progress'], 'w') as f:
-                json.dump(progress_data, f, indent=2, default=str)
+            st.session_state.profile_version = self.storage.save(
+                profile_name, st.session_state.user_progress, st.session_state.flashcard_data,
+                expected_version=st.session_state.get('profile_version'))
+        except ProfileConflictError:
+            self.reload_after_conflict(profile_name)
+            return False
         except Exception as e:
-            st.error(f"Error saving profile progress: {e}")
+            st.error(f"Error saving profile: {e}")
+            return False
         
-        # Save flashcards
-        try:
-            flashcard_data = {}
-            for word, data in st.session_state.flashcard_data.items():
-                flashcard_data[word] = dict(data)
-                if 'next_review' in flashcard_data[word]:
-                    flashcard_data[word]['next_review'] = data['next_review'].isoformat()
-            
-            with open(profile_files['flashcards'], 'w') as f:
-                json.dump(flashcard_data, f, indent=2)
-        except Exception as e:
-            st.error(f"Error saving flashcards: {e}")
+        self.update_profile_catalog(profile_name)
+        return True
+    
+    def update_profile_catalog(self, profile_name):
+        """Keep the login screen's catalog entry current after a write"""
+        self.profile_catalog.update(profile_name, len(st.session_state.user_progress.get('words_learned', ())))
     
     def render_sentence_learning(self):
         """Render premium sentence learning interface with massive database"""
         
-        # Get comprehensive sentence database (combining all databases)
-        MASSIVE_SENTENCES = get_massive_sentence_database()
-        MEGA_SENTENCES = get_mega_sentence_database()
-        ULTIMATE_SENTENCES = get_ultimate_sentence_database()
-        PREMIUM_SENTENCES = get_premium_sentence_database()
-        EXTENDED_SENTENCES = get_extended_premium_sentences()
-        
-        # Combine all sentence databases for maximum content
-        COMBINED_SENTENCES = {}
-        all_categories = ["Greetings & Politeness", "Daily Life", "Family & Relationships", "Food & Dining", 
-                         "Travel & Transportation", "Shopping & Money", "Work & Education", "Business & Professional", 
-                         "Culture & Society", "Technology & Innovation", "Casual & Slang", "Emotions & Feelings",
-                         "Technology", "Health", "Education"]
-        
-        for level in ["Beginner", "Intermediate", "Advanced", "Conversational"]:
-            COMBINED_SENTENCES[level] = {}
-            for category in all_categories:
-                COMBINED_SENTENCES[level][category] = []
-                
-                # Add sentences from all databases
-                for db in [MASSIVE_SENTENCES, MEGA_SENTENCES, ULTIMATE_SENTENCES, PREMIUM_SENTENCES]:
-                    if level in db and category in db[level]:
-                        COMBINED_SENTENCES[level][category].extend(db[level][category])
-                
-                # Add extended sentences
-                if category in EXTENDED_SENTENCES:
-                    COMBINED_SENTENCES[level][category].extend(EXTENDED_SENTENCES[category][:20])  # Add 20 per category per level
-        
-        MASSIVE_SENTENCES = COMBINED_SENTENCES
-        
-        # Calculate total sentences
-        total_sentences = sum(len(category_sentences) for level_data in MASSIVE_SENTENCES.values() 
-                             for category_sentences in level_data.values())
+        # Shared, pre-merged sentence corpus (built once per process)
+        corpus = get_sentence_corpus()
+        total_sentences = corpus.total_sentences
         
         st.title("🇮🇩 Indonesian Sentence Learning")
         st.markdown("**Master Indonesian through 2000+ carefully curated sentences with pronunciation guides, grammar focus, and cultural context**")
@@ -3787,7 +2414,7 @@ class IndonesianLearningApp:
         with col2:
             st.metric("Difficulty Levels", "4")
         with col3:
-            st.metric("Categories", f"{len(all_categories)}")
+            st.metric("Categories", f"{len(corpus.categories)}")
         with col4:
             st.metric("Quality", "Premium")
         
@@ -3797,37 +2424,20 @@ class IndonesianLearningApp:
         with col1:
             selected_level = st.selectbox(
                 "Choose Difficulty Level:",
-                options=list(MASSIVE_SENTENCES.keys()),
+                options=list(corpus.levels),
                 index=0,
                 help="Select your current learning level to see appropriate sentences"
             )
         
         with col2:
             # Category filter
-            sentences = MASSIVE_SENTENCES[selected_level]
-            all_categories = set()
-            for category_sentences in sentences.values():
-                for sentence in category_sentences:
-                    all_categories.add(sentence['category'])
-            
             selected_category = st.selectbox(
                 "Filter by Category:",
-                options=["All"] + sorted(list(all_categories)),
+                options=["All"] + list(corpus.sentence_categories(selected_level)),
                 help="Filter sentences by specific topics"
             )
         
-        # Filter sentences by category if selected
-        if selected_category != "All":
-            filtered_sentences = {}
-            for category, sentence_list in sentences.items():
-                filtered_sentences[category] = [s for s in sentence_list if s['category'] == selected_category]
-            sentences = filtered_sentences
-        
-        # Flatten all sentences from all categories
-        all_sentences = []
-        for category, sentence_list in sentences.items():
-            for sentence in sentence_list:
-                all_sentences.append(sentence)
+        all_sentences = corpus.get_sentences(selected_level, selected_category)
         
         if not all_sentences:
             st.warning("No sentences available for this level and category.")
@@ -3845,7 +2455,7 @@ class IndonesianLearningApp:
         sentence_data = all_sentences[st.session_state.current_sentence]
         
         # Debug: Check sentence data structure
-        if not isinstance(sentence_data, dict):
+        if not isinstance(sentence_data, Mapping):
             st.error(f"Invalid sentence data structure: {type(sentence_data)}")
             return
         
@@ -4025,587 +2635,9 @@ class IndonesianLearningApp:
             if st.button("View Detailed Progress"):
                 st.session_state.show_grammar_analytics = True
         
-        # MASSIVE COMPREHENSIVE GRAMMAR LIBRARY
-        grammar_categories = {
-            "🏗️ Basic Structure": {
-                "level": "beginner",
-                "difficulty": 1,
-                "description": "Master fundamental sentence patterns and word order",
-                "estimated_time": "20 minutes",
-                "topics": [
-                    {
-                        "title": "Subject + Verb + Object (SVO)",
-                        "explanation": "Indonesian follows SVO word order like English, but is more flexible. Understanding this basic structure is crucial for building correct sentences.",
-                        "detailed_explanation": """
-                        **Word Order Rules:**
-                        - Subject always comes first
-                        - Verb follows immediately after subject
-                        - Object comes last
-                        - No articles (a, an, the) needed
-                        - More flexible than English - can rearrange for emphasis
-                        """,
-                        "examples": [
-                            {"indonesian": "Saya makan nasi", "english": "I eat rice", "pronunciation": "SAH-yah MAH-kan NAH-see"},
-                            {"indonesian": "Dia minum kopi", "english": "He/She drinks coffee", "pronunciation": "DEE-ah MEE-noom KOH-pee"},
-                            {"indonesian": "Kami belajar bahasa Indonesia", "english": "We learn Indonesian", "pronunciation": "KAH-mee beh-LAH-jar bah-HAH-sah In-do-NEH-see-ah"}
-                        ],
-                        "key_points": [
-                            "Subject comes first",
-                            "Verb follows the subject",
-                            "Object comes last",
-                            "No articles (a, an, the) needed",
-                            "Can rearrange for emphasis: Nasi saya makan (Rice I eat)"
-                        ],
-                        "common_mistakes": [
-                            "Putting articles before nouns (❌ a buku → ✅ buku)",
-                            "Wrong word order (❌ makan saya nasi → ✅ saya makan nasi)"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'I drink water'",
-                            "Translate: 'She reads books'",
-                            "Rearrange: 'makan saya nasi' (correct order)"
-                        ]
-                    },
-                    {
-                        "title": "Adjective Placement",
-                        "explanation": "Adjectives come AFTER the noun they describe, opposite of English. This is one of the most important differences to remember.",
-                        "detailed_explanation": """
-                        **Adjective Rules:**
-                        - Always placed AFTER the noun
-                        - No agreement with gender or number
-                        - Can be used as predicate
-                        - Can be intensified with 'sangat' (very)
-                        """,
-                        "examples": [
-                            {"indonesian": "rumah besar", "english": "big house", "pronunciation": "ROO-mah BAH-sar"},
-                            {"indonesian": "mobil merah", "english": "red car", "pronunciation": "MOH-beel meh-RAH"},
-                            {"indonesian": "buku bagus", "english": "good book", "pronunciation": "BOO-koo BAH-goos"},
-                            {"indonesian": "Rumah ini besar", "english": "This house is big", "pronunciation": "ROO-mah EE-nee BAH-sar"}
-                        ],
-                        "key_points": [
-                            "Adjective follows noun",
-                            "No agreement with gender or number",
-                            "Can be used as predicate: Rumah ini besar (This house is big)",
-                            "Can be intensified: sangat besar (very big)"
-                        ],
-                        "common_mistakes": [
-                            "Putting adjectives before nouns (❌ besar rumah → ✅ rumah besar)",
-                            "Adding gender agreement (❌ rumah besara → ✅ rumah besar)"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'small house'",
-                            "Translate: 'beautiful flower'",
-                            "Make sentence: 'This car is expensive'"
-                        ]
-                    },
-                    {
-                        "title": "Noun + Adjective Pattern",
-                        "explanation": "Learn the most common Indonesian sentence pattern where adjectives follow nouns.",
-                        "detailed_explanation": """
-                        **Pattern: Noun + Adjective**
-                        - This is the most basic Indonesian sentence structure
-                        - No verb 'to be' needed
-                        - Can be used as complete sentences
-                        """,
-                        "examples": [
-                            {"indonesian": "Rumah besar", "english": "The house is big", "pronunciation": "ROO-mah BAH-sar"},
-                            {"indonesian": "Mobil mahal", "english": "The car is expensive", "pronunciation": "MOH-beel mah-HAHL"},
-                            {"indonesian": "Buku tebal", "english": "The book is thick", "pronunciation": "BOO-koo teh-BAHL"}
-                        ],
-                        "key_points": [
-                            "No 'to be' verb needed",
-                            "Noun + Adjective = complete sentence",
-                            "Most common pattern in Indonesian"
-                        ],
-                        "common_mistakes": [
-                            "Adding 'adalah' unnecessarily (❌ Rumah adalah besar → ✅ Rumah besar)"
-                        ],
-                        "practice_exercises": [
-                            "Make sentence: 'The dog is small'",
-                            "Make sentence: 'The food is delicious'"
-                        ]
-                    }
-                ]
-            },
-            "👥 Pronouns & Possession": {
-                "level": "beginner",
-                "difficulty": 2,
-                "description": "Master personal pronouns, possession, and social context",
-                "estimated_time": "20 minutes",
-                "topics": [
-                    {
-                        "title": "Personal Pronouns System",
-                        "explanation": "Indonesian has a complex pronoun system with formal/informal distinctions and social implications. Master this for proper communication.",
-                        "detailed_explanation": """
-                        **Formal vs Informal System:**
-                        - **Saya** (I) - formal, polite, business
-                        - **Aku** (I) - informal, intimate, friends/family
-                        - **Anda** (You) - formal, respectful, strangers/elders
-                        - **Kamu** (You) - informal, friends/peers
-                        - **Dia** (He/She) - neutral, works for both genders
-                        - **Kami** (We) - excludes listener
-                        - **Kita** (We) - includes listener
-                        """,
-                        "examples": [
-                            {"indonesian": "Saya pergi ke kantor", "english": "I go to the office", "pronunciation": "SAH-yah PER-gee keh KAN-tor", "context": "Formal"},
-                            {"indonesian": "Aku suka musik", "english": "I like music", "pronunciation": "AH-koo SOO-kah MOO-seek", "context": "Informal"},
-                            {"indonesian": "Anda dari mana?", "english": "Where are you from?", "pronunciation": "Ahn-DAH DAH-ree MAH-nah?", "context": "Formal question"},
-                            {"indonesian": "Kamu mau apa?", "english": "What do you want?", "pronunciation": "KAH-moo MAH-oo AH-pah?", "context": "Informal question"}
-                        ],
-                        "key_points": [
-                            "Saya vs Aku: Saya is more polite and formal",
-                            "Anda vs Kamu: Anda shows respect and distance",
-                            "Dia works for both he and she (no gender distinction)",
-                            "Kami excludes listener, Kita includes listener",
-                            "Choose based on relationship and context"
-                        ],
-                        "common_mistakes": [
-                            "Using Aku with strangers (❌ Aku mau... → ✅ Saya mau...)",
-                            "Using Kamu with elders (❌ Kamu dari mana? → ✅ Anda dari mana?)",
-                            "Confusing Kami/Kita (❌ Kami pergi → ✅ Kita pergi, if including listener)"
-                        ],
-                        "practice_exercises": [
-                            "Choose correct pronoun: Talking to your boss (Saya/Aku)",
-                            "Choose correct pronoun: Talking to your friend (Anda/Kamu)",
-                            "Translate: 'We (including you) are going'"
-                        ]
-                    },
-                    {
-                        "title": "Possession & Ownership",
-                        "explanation": "Express ownership using possessive pronouns, 'punya', and possessive constructions. Essential for describing relationships and belongings.",
-                        "detailed_explanation": """
-                        **Possession Methods:**
-                        1. **Possessive after noun**: Buku saya (my book)
-                        2. **Punya construction**: Saya punya buku (I have a book)
-                        3. **Milik construction**: Buku ini milik saya (This book belongs to me)
-                        4. **Kepunyaan**: Kepunyaan saya (mine)
-                        """,
-                        "examples": [
-                            {"indonesian": "Buku saya", "english": "My book", "pronunciation": "BOO-koo SAH-yah", "method": "Possessive after noun"},
-                            {"indonesian": "Rumah dia", "english": "His/Her house", "pronunciation": "ROO-mah DEE-ah", "method": "Possessive after noun"},
-                            {"indonesian": "Saya punya mobil", "english": "I have a car", "pronunciation": "SAH-yah POO-nyah MOH-beel", "method": "Punya construction"},
-                            {"indonesian": "Mobil ini milik saya", "english": "This car belongs to me", "pronunciation": "MOH-beel EE-nee MEE-leek SAH-yah", "method": "Milik construction"}
-                        ],
-                        "key_points": [
-                            "Possessive pronouns come AFTER the noun",
-                            "Punya means 'to have' or 'to own'",
-                            "Milik means 'belongs to'",
-                            "No apostrophe needed (unlike English)",
-                            "Can combine methods for emphasis"
-                        ],
-                        "common_mistakes": [
-                            "Putting possessive before noun (❌ saya buku → ✅ buku saya)",
-                            "Using English apostrophe (❌ buku's saya → ✅ buku saya)",
-                            "Confusing punya and milik usage"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'My house is big'",
-                            "Translate: 'She has a beautiful garden'",
-                            "Make sentence: 'This book belongs to us'"
-                        ]
-                    }
-                ]
-            },
-            "🏃 Verbs & Tenses": {
-                "level": "beginner",
-                "difficulty": 2,
-                "description": "Master verb forms, tenses, and temporal expressions",
-                "estimated_time": "25 minutes",
-                "topics": [
-                    {
-                        "title": "Present Tense (No Conjugation)",
-                        "explanation": "Indonesian verbs don't change form for tense. Use time words and context to indicate when actions happen.",
-                        "detailed_explanation": """
-                        **Present Tense Rules:**
-                        - Verbs never change form
-                        - Use time words to indicate when
-                        - Context determines meaning
-                        - Can express present, present continuous, or habitual actions
-                        """,
-                        "examples": [
-                            {"indonesian": "Saya makan", "english": "I eat / I am eating", "pronunciation": "SAH-yah MAH-kan", "context": "Present"},
-                            {"indonesian": "Dia tidur", "english": "He/She sleeps / is sleeping", "pronunciation": "DEE-ah TEE-door", "context": "Present"},
-                            {"indonesian": "Kami belajar", "english": "We study / are studying", "pronunciation": "KAH-mee beh-LAH-jar", "context": "Present"}
-                        ],
-                        "key_points": [
-                            "No verb conjugation needed",
-                            "Use time words: sekarang (now), setiap hari (every day)",
-                            "Context determines exact meaning",
-                            "Same form for all subjects"
-                        ],
-                        "common_mistakes": [
-                            "Trying to conjugate verbs (❌ saya makan → ✅ saya makan)",
-                            "Adding unnecessary tense markers"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'I am reading a book'",
-                            "Translate: 'She is cooking dinner'",
-                            "Make sentence: 'We are studying Indonesian'"
-                        ]
-                    },
-                    {
-                        "title": "Past Tense with Time Words",
-                        "explanation": "Express past actions using time words like 'kemarin' (yesterday) or 'tadi' (earlier).",
-                        "detailed_explanation": """
-                        **Past Tense Indicators:**
-                        - kemarin (yesterday)
-                        - tadi (earlier today)
-                        - sudah (already)
-                        - pernah (ever, once)
-                        - dulu (before, in the past)
-                        """,
-                        "examples": [
-                            {"indonesian": "Saya makan kemarin", "english": "I ate yesterday", "pronunciation": "SAH-yah MAH-kan keh-MAH-reen", "time_word": "kemarin"},
-                            {"indonesian": "Dia sudah pergi", "english": "He/She has already gone", "pronunciation": "DEE-ah SOO-dah per-GEE", "time_word": "sudah"},
-                            {"indonesian": "Kami pernah ke Bali", "english": "We have been to Bali", "pronunciation": "KAH-mee peh-NAH keh BAH-lee", "time_word": "pernah"}
-                        ],
-                        "key_points": [
-                            "Use time words to indicate past",
-                            "Sudah = already (present perfect)",
-                            "Pernah = ever, once (experience)",
-                            "Dulu = before, in the past"
-                        ],
-                        "common_mistakes": [
-                            "Trying to conjugate verbs for past tense",
-                            "Forgetting time words"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'I went to school yesterday'",
-                            "Translate: 'She has already eaten'",
-                            "Make sentence: 'We visited Jakarta last week'"
-                        ]
-                    },
-                    {
-                        "title": "Future Tense with 'Akan'",
-                        "explanation": "Express future actions using 'akan' (will) or time words like 'besok' (tomorrow).",
-                        "detailed_explanation": """
-                        **Future Tense Markers:**
-                        - akan (will)
-                        - besok (tomorrow)
-                        - nanti (later)
-                        - minggu depan (next week)
-                        - tahun depan (next year)
-                        """,
-                        "examples": [
-                            {"indonesian": "Saya akan makan", "english": "I will eat", "pronunciation": "SAH-yah AH-kan MAH-kan", "marker": "akan"},
-                            {"indonesian": "Dia pergi besok", "english": "He/She will go tomorrow", "pronunciation": "DEE-ah per-GEE beh-SOHK", "marker": "besok"},
-                            {"indonesian": "Kami akan belajar nanti", "english": "We will study later", "pronunciation": "KAH-mee AH-kan beh-LAH-jar NAHN-tee", "marker": "nanti"}
-                        ],
-                        "key_points": [
-                            "Akan = will (definite future)",
-                            "Time words can replace akan",
-                            "Nanti = later (less definite)",
-                            "Besok = tomorrow"
-                        ],
-                        "common_mistakes": [
-                            "Using akan with time words unnecessarily",
-                            "Confusing akan and nanti"
-                        ],
-                        "practice_exercises": [
-                            "Translate: 'I will go to the market'",
-                            "Translate: 'She will call you tomorrow'",
-                            "Make sentence: 'We will meet next week'"
-                        ]
-                    }
-                ]
-            },
-            "❓ Questions & Interrogatives": {
-                "level": "beginner",
-                "difficulty": 2,
-                "description": "Master question formation and interrogative words",
-                "estimated_time": "20 minutes",
-                "topics": [
-                    {
-                        "title": "Yes/No Questions",
-                        "explanation": "Form yes/no questions by adding 'apakah' or using rising intonation.",
-                        "detailed_explanation": """
-                        **Yes/No Question Formation:**
-                        - Add 'apakah' at the beginning
-                        - Use rising intonation
-                        - Answer with 'ya' (yes) or 'tidak' (no)
-                        """,
-                        "examples": [
-                            {"indonesian": "Apakah kamu lapar?", "english": "Are you hungry?", "pronunciation": "AH-pah-kah KAH-moo LAH-par?", "answer": "ya/tidak"},
-                            {"indonesian": "Apakah dia pergi?", "english": "Did he/she go?", "pronunciation": "AH-pah-kah DEE-ah per-GEE?", "answer": "ya/tidak"},
-                            {"indonesian": "Kamu mau makan?", "english": "Do you want to eat?", "pronunciation": "KAH-moo MAH-oo MAH-kan?", "answer": "ya/tidak"}
-                        ],
-                        "key_points": [
-                            "Apakah = formal question marker",
-                            "Rising intonation for informal questions",
-                            "Ya = yes, Tidak = no",
-                            "Bukan = no (for nouns/adjectives)"
-                        ],
-                        "common_mistakes": [
-                            "Using apakah unnecessarily in informal speech",
-                            "Confusing ya/tidak and bukan"
-                        ],
-                        "practice_exercises": [
-                            "Make question: 'Are you tired?'",
-                            "Make question: 'Is the food delicious?'",
-                            "Answer: 'Apakah kamu suka musik?'"
-                        ]
-                    },
-                    {
-                        "title": "WH Questions (5W1H)",
-                        "explanation": "Master the essential question words: apa, siapa, kapan, di mana, mengapa, bagaimana.",
-                        "detailed_explanation": """
-                        **Question Words:**
-                        - Apa = What
-                        - Siapa = Who
-                        - Kapan = When
-                        - Di mana = Where
-                        - Mengapa/Kenapa = Why
-                        - Bagaimana = How
-                        """,
-                        "examples": [
-                            {"indonesian": "Apa nama kamu?", "english": "What is your name?", "pronunciation": "AH-pah NAH-mah KAH-moo?", "word": "apa"},
-                            {"indonesian": "Siapa itu?", "english": "Who is that?", "pronunciation": "SEE-ah-pah EE-too?", "word": "siapa"},
-                            {"indonesian": "Kapan kamu datang?", "english": "When did you come?", "pronunciation": "KAH-pan KAH-moo DAH-tahng?", "word": "kapan"},
-                            {"indonesian": "Di mana rumah kamu?", "english": "Where is your house?", "pronunciation": "DEE MAH-nah ROO-mah KAH-moo?", "word": "di mana"},
-                            {"indonesian": "Mengapa kamu sedih?", "english": "Why are you sad?", "pronunciation": "Meh-ngah-PAH KAH-moo seh-DEEH?", "word": "mengapa"},
-                            {"indonesian": "Bagaimana kabar kamu?", "english": "How are you?", "pronunciation": "Bah-gah-EE-mah KAH-bar KAH-moo?", "word": "bagaimana"}
-                        ],
-                        "key_points": [
-                            "Apa = what (for things)",
-                            "Siapa = who (for people)",
-                            "Kapan = when (for time)",
-                            "Di mana = where (for place)",
-                            "Mengapa/Kenapa = why (for reason)",
-                            "Bagaimana = how (for manner)"
-                        ],
-                        "common_mistakes": [
-                            "Confusing apa and siapa",
-                            "Using di mana incorrectly"
-                        ],
-                        "practice_exercises": [
-                            "Ask: 'What is this?'",
-                            "Ask: 'Where do you live?'",
-                            "Ask: 'How do you cook rice?'"
-                        ]
-                    }
-                ]
-            },
-            "🔢 Numbers & Counting": {
-                "level": "beginner",
-                "difficulty": 2,
-                "description": "Master Indonesian numbers, counting, and numerical expressions",
-                "estimated_time": "25 minutes",
-                "topics": [
-                    {
-                        "title": "Basic Numbers 1-100",
-                        "explanation": "Learn Indonesian numbers from 1 to 100 with proper pronunciation.",
-                        "detailed_explanation": """
-                        **Number System:**
-                        - 1-10: satu, dua, tiga, empat, lima, enam, tujuh, delapan, sembilan, sepuluh
-                        - 11-19: add 'belas' (except 11 = sebelas)
-                        - 20-99: puluh + unit (except 20 = dua puluh)
-                        - 100: seratus
-                        """,
-                        "examples": [
-                            {"indonesian": "satu", "english": "one", "pronunciation": "SAH-too", "number": "1"},
-                            {"indonesian": "lima", "english": "five", "pronunciation": "LEE-mah", "number": "5"},
-                            {"indonesian": "sepuluh", "english": "ten", "pronunciation": "seh-POO-looh", "number": "10"},
-                            {"indonesian": "dua puluh", "english": "twenty", "pronunciation": "DOO-ah POO-looh", "number": "20"},
-                            {"indonesian": "seratus", "english": "one hundred", "pronunciation": "seh-RAH-toos", "number": "100"}
-                        ],
-                        "key_points": [
-                            "Satu = one, Dua = two, Tiga = three",
-                            "Sepuluh = ten, Seratus = one hundred",
-                            "Belas = teen numbers (11-19)",
-                            "Puluh = tens (20-90)"
-                        ],
-                        "common_mistakes": [
-                            "Confusing puluh and belas",
-                            "Wrong pronunciation of numbers"
-                        ],
-                        "practice_exercises": [
-                            "Count from 1 to 10",
-                            "Say: 'twenty-five'",
-                            "Say: 'ninety-nine'"
-                        ]
-                    }
-                ]
-            },
-            "Questions": {
-                "icon": "❓",
-                "description": "How to ask questions in Indonesian",
-                "topics": [
-                    {
-                        "title": "Yes/No Questions",
-                        "explanation": "Add 'apakah' at the beginning or use question intonation.",
-                        "examples": [
-                            "Apakah Anda lapar? (Are you hungry?)",
-                            "Dia pergi? (Is he/she going?)",
-                            "Kamu suka kopi? (Do you like coffee?)"
-                        ],
-                        "key_points": [
-                            "Apakah is formal",
-                            "Rising intonation for informal",
-                            "Answer with 'ya' (yes) or 'tidak' (no)"
-                        ]
-                    },
-                    {
-                        "title": "Question Words",
-                        "explanation": "Use question words to ask for specific information.",
-                        "examples": [
-                            "Apa? (What?)",
-                            "Siapa? (Who?)",
-                            "Di mana? (Where?)",
-                            "Kapan? (When?)",
-                            "Mengapa? (Why?)",
-                            "Bagaimana? (How?)",
-                            "Berapa? (How much/many?)"
-                        ],
-                        "key_points": [
-                            "Question word comes first",
-                            "No auxiliary verbs needed",
-                            "Use question mark at end"
-                        ]
-                    }
-                ]
-            },
-            "Numbers": {
-                "icon": "🔢",
-                "description": "Counting and using numbers",
-                "topics": [
-                    {
-                        "title": "Cardinal Numbers",
-                        "explanation": "Basic counting from 1 to 100 and beyond.",
-                        "examples": [
-                            "1-10: satu, dua, tiga, empat, lima, enam, tujuh, delapan, sembilan, sepuluh",
-                            "11-20: sebelas, dua belas, tiga belas... dua puluh",
-                            "21-30: dua puluh satu, dua puluh dua... tiga puluh",
-                            "100: seratus, 1000: seribu"
-                        ],
-                        "key_points": [
-                            "Belas for 11-19",
-                            "Puluh for tens",
-                            "Ratus for hundreds",
-                            "Ribu for thousands"
-                        ]
-                    },
-                    {
-                        "title": "Ordinal Numbers",
-                        "explanation": "Use 'ke-' prefix to make ordinal numbers.",
-                        "examples": [
-                            "Pertama (first)",
-                            "Kedua (second)",
-                            "Ketiga (third)",
-                            "Keempat (fourth)",
-                            "Kesepuluh (tenth)"
-                        ],
-                        "key_points": [
-                            "Add 'ke-' prefix",
-                            "Pertama is irregular",
-                            "Used for ranking and order"
-                        ]
-                    }
-                ]
-            },
-            "Time Expressions": {
-                "icon": "⏰",
-                "description": "Talking about time and dates",
-                "topics": [
-                    {
-                        "title": "Days of the Week",
-                        "explanation": "Days of the week in Indonesian.",
-                        "examples": [
-                            "Senin (Monday)",
-                            "Selasa (Tuesday)",
-                            "Rabu (Wednesday)",
-                            "Kamis (Thursday)",
-                            "Jumat (Friday)",
-                            "Sabtu (Saturday)",
-                            "Minggu (Sunday)"
-                        ],
-                        "key_points": [
-                            "Capitalize first letter",
-                            "Use 'hari' for 'day'",
-                            "Hari ini (today), Besok (tomorrow)"
-                        ]
-                    },
-                    {
-                        "title": "Time of Day",
-                        "explanation": "Expressions for different times of day.",
-                        "examples": [
-                            "Pagi (morning)",
-                            "Siang (noon/afternoon)",
-                            "Sore (evening)",
-                            "Malam (night)",
-                            "Tengah malam (midnight)"
-                        ],
-                        "key_points": [
-                            "Selamat pagi (Good morning)",
-                            "Selamat siang (Good afternoon)",
-                            "Selamat malam (Good evening/night)"
-                        ]
-                    }
-                ]
-            },
-            "Prepositions": {
-                "icon": "📍",
-                "description": "Location and direction words",
-                "topics": [
-                    {
-                        "title": "Location Prepositions",
-                        "explanation": "Words to describe where things are located.",
-                        "examples": [
-                            "Di (at/in/on)",
-                            "Ke (to/towards)",
-                            "Dari (from)",
-                            "Di dalam (inside)",
-                            "Di luar (outside)",
-                            "Di atas (on top of)",
-                            "Di bawah (under/below)"
-                        ],
-                        "key_points": [
-                            "Di for static location",
-                            "Ke for movement towards",
-                            "Dari for movement from",
-                            "Combine with dalam, luar, atas, bawah"
-                        ]
-                    }
-                ]
-            },
-            "Politeness": {
-                "icon": "🙏",
-                "description": "Formal and informal language",
-                "topics": [
-                    {
-                        "title": "Formal vs Informal",
-                        "explanation": "Indonesian has different levels of formality.",
-                        "examples": [
-                            "Formal: Saya, Anda, Bapak, Ibu",
-                            "Informal: Aku, Kamu, Mas, Mbak",
-                            "Formal: Terima kasih (Thank you)",
-                            "Informal: Makasih (Thanks)"
-                        ],
-                        "key_points": [
-                            "Use formal with strangers and elders",
-                            "Informal with friends and family",
-                            "Bapak/Ibu for Mr./Mrs.",
-                            "Mas/Mbak for young people"
-                        ]
-                    },
-                    {
-                        "title": "Politeness Markers",
-                        "explanation": "Words and phrases to be polite.",
-                        "examples": [
-                            "Tolong (Please - for requests)",
-                            "Maaf (Sorry/Excuse me)",
-                            "Permisi (Excuse me - to get attention)",
-                            "Silakan (Please - offering something)"
-                        ],
-                        "key_points": [
-                            "Tolong for asking favors",
-                            "Maaf for apologies",
-                            "Permisi to get attention",
-                            "Silakan when offering"
-                        ]
-                    }
-                ]
-            }
-        }
+        # Shared grammar library (built once per process)
+        grammar_store = get_grammar_store()
+        grammar_categories = grammar_store.categories
         
         # Main content area with advanced features
         col1, col2 = st.columns([3, 1])
@@ -4614,35 +2646,25 @@ class IndonesianLearningApp:
             # Search and filter functionality
             if search_term:
                 st.markdown(f"### 🔍 Search Results for: '{search_term}'")
-                filtered_categories = {}
-                for cat_name, cat_data in grammar_categories.items():
-                    if search_term.lower() in cat_name.lower() or search_term.lower() in cat_data['description'].lower():
-                        filtered_categories[cat_name] = cat_data
-                    else:
-                        for topic in cat_data['topics']:
-                            if search_term.lower() in topic['title'].lower() or search_term.lower() in topic['explanation'].lower():
-                                if cat_name not in filtered_categories:
-                                    filtered_categories[cat_name] = cat_data
-                                break
+                search_hits = get_grammar_search_index().search(search_term)
                 
-                if not filtered_categories:
+                if not search_hits:
                     st.warning("No topics found matching your search.")
                     st.markdown("**Try searching for:** pronouns, verbs, tenses, questions, numbers, time, prepositions, politeness")
                 else:
-                    grammar_categories = filtered_categories
+                    # Best matching topics first, then their categories in rank order
+                    for hit in search_hits[:5]:
+                        found_in = ", ".join(sorted(field.replace('_', ' ') for field in hit.fields))
+                        st.caption(f"• **{hit.topic['title']}** ({hit.category}) - found in {found_in}")
+                    grammar_categories = {hit.category: grammar_categories[hit.category] for hit in search_hits}
             
             # Level-based filtering
             current_level = st.session_state.grammar_progress['current_level']
-            level_order = ['beginner', 'intermediate', 'advanced', 'expert']
-            current_level_index = level_order.index(current_level)
             
             # Filter categories by level
-            filtered_categories = {}
-            for cat_name, cat_data in grammar_categories.items():
-                if 'level' in cat_data:
-                    cat_level_index = level_order.index(cat_data['level'])
-                    if cat_level_index <= current_level_index:
-                        filtered_categories[cat_name] = cat_data
+            level_categories = grammar_store.categories_for_level(current_level)
+            filtered_categories = {cat_name: cat_data for cat_name, cat_data in grammar_categories.items()
+                                   if cat_name in level_categories}
             
             if not filtered_categories:
                 st.info(f"No topics available for {current_level} level. Try selecting a higher level.")
@@ -4704,7 +2726,7 @@ class IndonesianLearningApp:
                             # Interactive examples with pronunciation
                             st.markdown("**🎯 Examples with Pronunciation:**")
                             for example in topic['examples']:
-                                if isinstance(example, dict):
+                                if isinstance(example, Mapping):
                                     col_ex1, col_ex2, col_ex3 = st.columns([2, 2, 1])
                                     with col_ex1:
                                         st.markdown(f"**Indonesian:** {example['indonesian']}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the Indonesian Learning Platform
+Times the work done on every Streamlit rerun so regressions are easy to spot
+"""
+
+import sys
+import time
+import timeit
+
+def report(label, seconds, number):
+    """Print the mean time per call"""
+    per_call = seconds / number
+    if per_call < 1e-3:
+        print(f"   {label}: {per_call * 1e6:,.2f} µs/call ({number:,} calls)")
+    else:
+        print(f"   {label}: {per_call * 1e3:,.2f} ms/call ({number:,} calls)")
+
+def bench_shared_tables(number=1000):
+    """Time the process-wide tables (first build vs cached access)"""
+    from vocabulary_index import get_vocabulary_index
+    from translation_lookup import get_translation_lookup
+    from sentence_corpus import get_sentence_corpus
+
+    print("\n📦 Shared tables")
+    for label, getter in [("vocabulary index", get_vocabulary_index),
+                          ("translation lookup", get_translation_lookup),
+                          ("sentence corpus", get_sentence_corpus)]:
+        getter.cache_clear()
+        start = time.perf_counter()
+        getter()
+        report(f"{label} (first build)", time.perf_counter() - start, 1)
+        report(f"{label} (cached)", timeit.timeit(getter, number=number), number)
+
+def bench_translation_lookup(number=10000):
+    """Time example translation lookups (hit and word-by-word fallback)"""
+    from translation_lookup import get_translation_lookup
+
+    lookup = get_translation_lookup()
+    print("\n🔤 Translation lookup")
+    report("exact hit", timeit.timeit(lambda: lookup.translate("Saya suka kopi."), number=number), number)
+    report("normalized hit", timeit.timeit(lambda: lookup.translate("saya suka kopi"), number=number), number)
+    report("word fallback", timeit.timeit(lambda: lookup.translate("Mereka membutuhkan sepeda baru."), number=number), number)
+
+def bench_srs_simulation(learners=20, days=30):
+    """Replay synthetic learners through the scheduling engine"""
+    from srs_simulator import simulate
+
+    print("\n🧪 SRS engine")
+    result = simulate(learners=learners, days=days)
+    report(f"review ({learners} learners x {days} days)", result.seconds, result.reviews)
+    print(f"   peak daily load: {result.peak_daily_load:,} reviews")
+
+def bench_app_construction(number=200):
+    """Time IndonesianLearningApp() - it is constructed on every rerun"""
+    try:
+        import app
+    except ImportError as e:
+        print(f"\n⚠️ Skipping app construction benchmark: {e}")
+        return
+
+    print("\n🏗️ App construction (per rerun)")
+    report("IndonesianLearningApp()", timeit.timeit(app.IndonesianLearningApp, number=number), number)
+
+def main():
+    print("⏱️ Indonesian Learning Platform Benchmarks")
+    print("=" * 40)
+    bench_shared_tables()
+    bench_translation_lookup()
+    bench_srs_simulation()
+    if "--skip-app" not in sys.argv:
+        bench_app_construction()
+    print("=" * 40)
+
+if __name__ == "__main__":
+    main()
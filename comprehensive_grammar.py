@@ -42,6 +42,543 @@ def get_comprehensive_grammar():
                         "Translate: 'She reads books'",
                         "Rearrange: 'makan saya nasi' (correct order)"
                     ]
+                },
+                {
+                    "title": "Adjective Placement",
+                    "explanation": "Adjectives come AFTER the noun they describe, opposite of English. This is one of the most important differences to remember.",
+                    "detailed_explanation": """
+                    **Adjective Rules:**
+                    - Always placed AFTER the noun
+                    - No agreement with gender or number
+                    - Can be used as predicate
+                    - Can be intensified with 'sangat' (very)
+                    """,
+                    "examples": [
+                        {"indonesian": "rumah besar", "english": "big house", "pronunciation": "ROO-mah BAH-sar"},
+                        {"indonesian": "mobil merah", "english": "red car", "pronunciation": "MOH-beel meh-RAH"},
+                        {"indonesian": "buku bagus", "english": "good book", "pronunciation": "BOO-koo BAH-goos"},
+                        {"indonesian": "Rumah ini besar", "english": "This house is big", "pronunciation": "ROO-mah EE-nee BAH-sar"}
+                    ],
+                    "key_points": [
+                        "Adjective follows noun",
+                        "No agreement with gender or number",
+                        "Can be used as predicate: Rumah ini besar (This house is big)",
+                        "Can be intensified: sangat besar (very big)"
+                    ],
+                    "common_mistakes": [
+                        "Putting adjectives before nouns (❌ besar rumah → ✅ rumah besar)",
+                        "Adding gender agreement (❌ rumah besara → ✅ rumah besar)"
+                    ],
+                    "practice_exercises": [
+                        "Translate: 'small house'",
+                        "Translate: 'beautiful flower'",
+                        "Make sentence: 'This car is expensive'"
+                    ]
+                },
+                {
+                    "title": "Noun + Adjective Pattern",
+                    "explanation": "Learn the most common Indonesian sentence pattern where adjectives follow nouns.",
+                    "detailed_explanation": """
+                    **Pattern: Noun + Adjective**
+                    - This is the most basic Indonesian sentence structure
+                    - No verb 'to be' needed
+                    - Can be used as complete sentences
+                    """,
+                    "examples": [
+                        {"indonesian": "Rumah besar", "english": "The house is big", "pronunciation": "ROO-mah BAH-sar"},
+                        {"indonesian": "Mobil mahal", "english": "The car is expensive", "pronunciation": "MOH-beel mah-HAHL"},
+                        {"indonesian": "Buku tebal", "english": "The book is thick", "pronunciation": "BOO-koo teh-BAHL"}
+                    ],
+                    "key_points": [
+                        "No 'to be' verb needed",
+                        "Noun + Adjective = complete sentence",
+                        "Most common pattern in Indonesian"
+                    ],
+                    "common_mistakes": [
+                        "Adding 'adalah' unnecessarily (❌ Rumah adalah besar → ✅ Rumah besar)"
+                    ],
+                    "practice_exercises": [
+                        "Make sentence: 'The dog is small'",
+                        "Make sentence: 'The food is delicious'"
+                    ]
+                }
+            ]
+        },
+        "👥 Pronouns & Possession": {
+            "level": "beginner",
+            "difficulty": 2,
+            "description": "Master personal pronouns, possession, and social context",
+            "estimated_time": "20 minutes",
+            "topics": [
+                {
+                    "title": "Personal Pronouns System",
+                    "explanation": "Indonesian has a complex pronoun system with formal/informal distinctions and social implications. Master this for proper communication.",
+                    "detailed_explanation": """
+                    **Formal vs Informal System:**
+                    - **Saya** (I) - formal, polite, business
+                    - **Aku** (I) - informal, intimate, friends/family
+                    - **Anda** (You) - formal, respectful, strangers/elders
+                    - **Kamu** (You) - informal, friends/peers
+                    - **Dia** (He/She) - neutral, works for both genders
+                    - **Kami** (We) - excludes listener
+                    - **Kita** (We) - includes listener
+                    """,
+                    "examples": [
+                        {"indonesian": "Saya pergi ke kantor", "english": "I go to the office", "pronunciation": "SAH-yah PER-gee keh KAN-tor", "context": "Formal"},
+                        {"indonesian": "Aku suka musik", "english": "I like music", "pronunciation": "AH-koo SOO-kah MOO-seek", "context": "Informal"},
+                        {"indonesian": "Anda dari mana?", "english": "Where are you from?", "pronunciation": "Ahn-DAH DAH-ree MAH-nah?", "context": "Formal question"},
+                        {"indonesian": "Kamu mau apa?", "english": "What do you want?", "pronunciation": "KAH-moo MAH-oo AH-pah?", "context": "Informal question"}
+                    ],
+                    "key_points": [
+                        "Saya vs Aku: Saya is more polite and formal",
+                        "Anda vs Kamu: Anda shows respect and distance",
+                        "Dia works for both he and she (no gender distinction)",
+                        "Kami excludes listener, Kita includes listener",
+                        "Choose based on relationship and context"
+                    ],
+                    "common_mistakes": [
+                        "Using Aku with strangers (❌ Aku mau... → ✅ Saya mau...)",
+                        "Using Kamu with elders (❌ Kamu dari mana? → ✅ Anda dari mana?)",
+                        "Confusing Kami/Kita (❌ Kami pergi → ✅ Kita pergi, if including listener)"
+                    ],
+                    "practice_exercises": [
+                        "Choose correct pronoun: Talking to your boss (Saya/Aku)",
+                        "Choose correct pronoun: Talking to your friend (Anda/Kamu)",
+                        "Translate: 'We (including you) are going'"
+                    ]
+                },
+                {
+                    "title": "Possession & Ownership",
+                    "explanation": "Express ownership using possessive pronouns, 'punya', and possessive constructions. Essential for describing relationships and belongings.",
+                    "detailed_explanation": """
+                    **Possession Methods:**
+                    1. **Possessive after noun**: Buku saya (my book)
+                    2. **Punya construction**: Saya punya buku (I have a book)
+                    3. **Milik construction**: Buku ini milik saya (This book belongs to me)
+                    4. **Kepunyaan**: Kepunyaan saya (mine)
+                    """,
+                    "examples": [
+                        {"indonesian": "Buku saya", "english": "My book", "pronunciation": "BOO-koo SAH-yah", "method": "Possessive after noun"},
+                        {"indonesian": "Rumah dia", "english": "His/Her house", "pronunciation": "ROO-mah DEE-ah", "method": "Possessive after noun"},
+                        {"indonesian": "Saya punya mobil", "english": "I have a car", "pronunciation": "SAH-yah POO-nyah MOH-beel", "method": "Punya construction"},
+                        {"indonesian": "Mobil ini milik saya", "english": "This car belongs to me", "pronunciation": "MOH-beel EE-nee MEE-leek SAH-yah", "method": "Milik construction"}
+                    ],
+                    "key_points": [
+                        "Possessive pronouns come AFTER the noun",
+                        "Punya means 'to have' or 'to own'",
+                        "Milik means 'belongs to'",
+                        "No apostrophe needed (unlike English)",
+                        "Can combine methods for emphasis"
+                    ],
+                    "common_mistakes": [
+                        "Putting possessive before noun (❌ saya buku → ✅ buku saya)",
+                        "Using English apostrophe (❌ buku's saya → ✅ buku saya)",
+                        "Confusing punya and milik usage"
+                    ],
+                    "practice_exercises": [
+                        "Translate: 'My house is big'",
+                        "Translate: 'She has a beautiful garden'",
+                        "Make sentence: 'This book belongs to us'"
+                    ]
+                }
+            ]
+        },
+        "🏃 Verbs & Tenses": {
+            "level": "beginner",
+            "difficulty": 2,
+            "description": "Master verb forms, tenses, and temporal expressions",
+            "estimated_time": "25 minutes",
+            "topics": [
+                {
+                    "title": "Present Tense (No Conjugation)",
+                    "explanation": "Indonesian verbs don't change form for tense. Use time words and context to indicate when actions happen.",
+                    "detailed_explanation": """
+                    **Present Tense Rules:**
+                    - Verbs never change form
+                    - Use time words to indicate when
+                    - Context determines meaning
+                    - Can express present, present continuous, or habitual actions
+                    """,
+                    "examples": [
+                        {"indonesian": "Saya makan", "english": "I eat / I am eating", "pronunciation": "SAH-yah MAH-kan", "context": "Present"},
+                        {"indonesian": "Dia tidur", "english": "He/She sleeps / is sleeping", "pronunciation": "DEE-ah TEE-door", "context": "Present"},
+                        {"indonesian": "Kami belajar", "english": "We study / are studying", "pronunciation": "KAH-mee beh-LAH-jar", "context": "Present"}
+                    ],
+                    "key_points": [
+                        "No verb conjugation needed",
+                        "Use time words: sekarang (now), setiap hari (every day)",
+                        "Context determines exact meaning",
+                        "Same form for all subjects"
+                    ],
+                    "common_mistakes": [
+                        "Trying to conjugate verbs (❌ saya makan → ✅ saya makan)",
+                        "Adding unnecessary tense markers"
+                    ],
+                    "practice_exercises": [
+                        "Translate: 'I am reading a book'",
+                        "Translate: 'She is cooking dinner'",
+                        "Make sentence: 'We are studying Indonesian'"
+                    ]
+                },
+                {
+                    "title": "Past Tense with Time Words",
+                    "explanation": "Express past actions using time words like 'kemarin' (yesterday) or 'tadi' (earlier).",
+                    "detailed_explanation": """
+                    **Past Tense Indicators:**
+                    - kemarin (yesterday)
+                    - tadi (earlier today)
+                    - sudah (already)
+                    - pernah (ever, once)
+                    - dulu (before, in the past)
+                    """,
+                    "examples": [
+                        {"indonesian": "Saya makan kemarin", "english": "I ate yesterday", "pronunciation": "SAH-yah MAH-kan keh-MAH-reen", "time_word": "kemarin"},
+                        {"indonesian": "Dia sudah pergi", "english": "He/She has already gone", "pronunciation": "DEE-ah SOO-dah per-GEE", "time_word": "sudah"},
+                        {"indonesian": "Kami pernah ke Bali", "english": "We have been to Bali", "pronunciation": "KAH-mee peh-NAH keh BAH-lee", "time_word": "pernah"}
+                    ],
+                    "key_points": [
+                        "Use time words to indicate past",
+                        "Sudah = already (present perfect)",
+                        "Pernah = ever, once (experience)",
+                        "Dulu = before, in the past"
+                    ],
+                    "common_mistakes": [
+                        "Trying to conjugate verbs for past tense",
+                        "Forgetting time words"
+                    ],
+                    "practice_exercises": [
+                        "Translate: 'I went to school yesterday'",
+                        "Translate: 'She has already eaten'",
+                        "Make sentence: 'We visited Jakarta last week'"
+                    ]
+                },
+                {
+                    "title": "Future Tense with 'Akan'",
+                    "explanation": "Express future actions using 'akan' (will) or time words like 'besok' (tomorrow).",
+                    "detailed_explanation": """
+                    **Future Tense Markers:**
+                    - akan (will)
+                    - besok (tomorrow)
+                    - nanti (later)
+                    - minggu depan (next week)
+                    - tahun depan (next year)
+                    """,
+                    "examples": [
+                        {"indonesian": "Saya akan makan", "english": "I will eat", "pronunciation": "SAH-yah AH-kan MAH-kan", "marker": "akan"},
+                        {"indonesian": "Dia pergi besok", "english": "He/She will go tomorrow", "pronunciation": "DEE-ah per-GEE beh-SOHK", "marker": "besok"},
+                        {"indonesian": "Kami akan belajar nanti", "english": "We will study later", "pronunciation": "KAH-mee AH-kan beh-LAH-jar NAHN-tee", "marker": "nanti"}
+                    ],
+                    "key_points": [
+                        "Akan = will (definite future)",
+                        "Time words can replace akan",
+                        "Nanti = later (less definite)",
+                        "Besok = tomorrow"
+                    ],
+                    "common_mistakes": [
+                        "Using akan with time words unnecessarily",
+                        "Confusing akan and nanti"
+                    ],
+                    "practice_exercises": [
+                        "Translate: 'I will go to the market'",
+                        "Translate: 'She will call you tomorrow'",
+                        "Make sentence: 'We will meet next week'"
+                    ]
+                }
+            ]
+        },
+        "❓ Questions & Interrogatives": {
+            "level": "beginner",
+            "difficulty": 2,
+            "description": "Master question formation and interrogative words",
+            "estimated_time": "20 minutes",
+            "topics": [
+                {
+                    "title": "Yes/No Questions",
+                    "explanation": "Form yes/no questions by adding 'apakah' or using rising intonation.",
+                    "detailed_explanation": """
+                    **Yes/No Question Formation:**
+                    - Add 'apakah' at the beginning
+                    - Use rising intonation
+                    - Answer with 'ya' (yes) or 'tidak' (no)
+                    """,
+                    "examples": [
+                        {"indonesian": "Apakah kamu lapar?", "english": "Are you hungry?", "pronunciation": "AH-pah-kah KAH-moo LAH-par?", "answer": "ya/tidak"},
+                        {"indonesian": "Apakah dia pergi?", "english": "Did he/she go?", "pronunciation": "AH-pah-kah DEE-ah per-GEE?", "answer": "ya/tidak"},
+                        {"indonesian": "Kamu mau makan?", "english": "Do you want to eat?", "pronunciation": "KAH-moo MAH-oo MAH-kan?", "answer": "ya/tidak"}
+                    ],
+                    "key_points": [
+                        "Apakah = formal question marker",
+                        "Rising intonation for informal questions",
+                        "Ya = yes, Tidak = no",
+                        "Bukan = no (for nouns/adjectives)"
+                    ],
+                    "common_mistakes": [
+                        "Using apakah unnecessarily in informal speech",
+                        "Confusing ya/tidak and bukan"
+                    ],
+                    "practice_exercises": [
+                        "Make question: 'Are you tired?'",
+                        "Make question: 'Is the food delicious?'",
+                        "Answer: 'Apakah kamu suka musik?'"
+                    ]
+                },
+                {
+                    "title": "WH Questions (5W1H)",
+                    "explanation": "Master the essential question words: apa, siapa, kapan, di mana, mengapa, bagaimana.",
+                    "detailed_explanation": """
+                    **Question Words:**
+                    - Apa = What
+                    - Siapa = Who
+                    - Kapan = When
+                    - Di mana = Where
+                    - Mengapa/Kenapa = Why
+                    - Bagaimana = How
+                    """,
+                    "examples": [
+                        {"indonesian": "Apa nama kamu?", "english": "What is your name?", "pronunciation": "AH-pah NAH-mah KAH-moo?", "word": "apa"},
+                        {"indonesian": "Siapa itu?", "english": "Who is that?", "pronunciation": "SEE-ah-pah EE-too?", "word": "siapa"},
+                        {"indonesian": "Kapan kamu datang?", "english": "When did you come?", "pronunciation": "KAH-pan KAH-moo DAH-tahng?", "word": "kapan"},
+                        {"indonesian": "Di mana rumah kamu?", "english": "Where is your house?", "pronunciation": "DEE MAH-nah ROO-mah KAH-moo?", "word": "di mana"},
+                        {"indonesian": "Mengapa kamu sedih?", "english": "Why are you sad?", "pronunciation": "Meh-ngah-PAH KAH-moo seh-DEEH?", "word": "mengapa"},
+                        {"indonesian": "Bagaimana kabar kamu?", "english": "How are you?", "pronunciation": "Bah-gah-EE-mah KAH-bar KAH-moo?", "word": "bagaimana"}
+                    ],
+                    "key_points": [
+                        "Apa = what (for things)",
+                        "Siapa = who (for people)",
+                        "Kapan = when (for time)",
+                        "Di mana = where (for place)",
+                        "Mengapa/Kenapa = why (for reason)",
+                        "Bagaimana = how (for manner)"
+                    ],
+                    "common_mistakes": [
+                        "Confusing apa and siapa",
+                        "Using di mana incorrectly"
+                    ],
+                    "practice_exercises": [
+                        "Ask: 'What is this?'",
+                        "Ask: 'Where do you live?'",
+                        "Ask: 'How do you cook rice?'"
+                    ]
+                }
+            ]
+        },
+        "🔢 Numbers & Counting": {
+            "level": "beginner",
+            "difficulty": 2,
+            "description": "Master Indonesian numbers, counting, and numerical expressions",
+            "estimated_time": "25 minutes",
+            "topics": [
+                {
+                    "title": "Basic Numbers 1-100",
+                    "explanation": "Learn Indonesian numbers from 1 to 100 with proper pronunciation.",
+                    "detailed_explanation": """
+                    **Number System:**
+                    - 1-10: satu, dua, tiga, empat, lima, enam, tujuh, delapan, sembilan, sepuluh
+                    - 11-19: add 'belas' (except 11 = sebelas)
+                    - 20-99: puluh + unit (except 20 = dua puluh)
+                    - 100: seratus
+                    """,
+                    "examples": [
+                        {"indonesian": "satu", "english": "one", "pronunciation": "SAH-too", "number": "1"},
+                        {"indonesian": "lima", "english": "five", "pronunciation": "LEE-mah", "number": "5"},
+                        {"indonesian": "sepuluh", "english": "ten", "pronunciation": "seh-POO-looh", "number": "10"},
+                        {"indonesian": "dua puluh", "english": "twenty", "pronunciation": "DOO-ah POO-looh", "number": "20"},
+                        {"indonesian": "seratus", "english": "one hundred", "pronunciation": "seh-RAH-toos", "number": "100"}
+                    ],
+                    "key_points": [
+                        "Satu = one, Dua = two, Tiga = three",
+                        "Sepuluh = ten, Seratus = one hundred",
+                        "Belas = teen numbers (11-19)",
+                        "Puluh = tens (20-90)"
+                    ],
+                    "common_mistakes": [
+                        "Confusing puluh and belas",
+                        "Wrong pronunciation of numbers"
+                    ],
+                    "practice_exercises": [
+                        "Count from 1 to 10",
+                        "Say: 'twenty-five'",
+                        "Say: 'ninety-nine'"
+                    ]
+                }
+            ]
+        },
+        "Questions": {
+            "icon": "❓",
+            "description": "How to ask questions in Indonesian",
+            "topics": [
+                {
+                    "title": "Yes/No Questions",
+                    "explanation": "Add 'apakah' at the beginning or use question intonation.",
+                    "examples": [
+                        "Apakah Anda lapar? (Are you hungry?)",
+                        "Dia pergi? (Is he/she going?)",
+                        "Kamu suka kopi? (Do you like coffee?)"
+                    ],
+                    "key_points": [
+                        "Apakah is formal",
+                        "Rising intonation for informal",
+                        "Answer with 'ya' (yes) or 'tidak' (no)"
+                    ]
+                },
+                {
+                    "title": "Question Words",
+                    "explanation": "Use question words to ask for specific information.",
+                    "examples": [
+                        "Apa? (What?)",
+                        "Siapa? (Who?)",
+                        "Di mana? (Where?)",
+                        "Kapan? (When?)",
+                        "Mengapa? (Why?)",
+                        "Bagaimana? (How?)",
+                        "Berapa? (How much/many?)"
+                    ],
+                    "key_points": [
+                        "Question word comes first",
+                        "No auxiliary verbs needed",
+                        "Use question mark at end"
+                    ]
+                }
+            ]
+        },
+        "Numbers": {
+            "icon": "🔢",
+            "description": "Counting and using numbers",
+            "topics": [
+                {
+                    "title": "Cardinal Numbers",
+                    "explanation": "Basic counting from 1 to 100 and beyond.",
+                    "examples": [
+                        "1-10: satu, dua, tiga, empat, lima, enam, tujuh, delapan, sembilan, sepuluh",
+                        "11-20: sebelas, dua belas, tiga belas... dua puluh",
+                        "21-30: dua puluh satu, dua puluh dua... tiga puluh",
+                        "100: seratus, 1000: seribu"
+                    ],
+                    "key_points": [
+                        "Belas for 11-19",
+                        "Puluh for tens",
+                        "Ratus for hundreds",
+                        "Ribu for thousands"
+                    ]
+                },
+                {
+                    "title": "Ordinal Numbers",
+                    "explanation": "Use 'ke-' prefix to make ordinal numbers.",
+                    "examples": [
+                        "Pertama (first)",
+                        "Kedua (second)",
+                        "Ketiga (third)",
+                        "Keempat (fourth)",
+                        "Kesepuluh (tenth)"
+                    ],
+                    "key_points": [
+                        "Add 'ke-' prefix",
+                        "Pertama is irregular",
+                        "Used for ranking and order"
+                    ]
+                }
+            ]
+        },
+        "Time Expressions": {
+            "icon": "⏰",
+            "description": "Talking about time and dates",
+            "topics": [
+                {
+                    "title": "Days of the Week",
+                    "explanation": "Days of the week in Indonesian.",
+                    "examples": [
+                        "Senin (Monday)",
+                        "Selasa (Tuesday)",
+                        "Rabu (Wednesday)",
+                        "Kamis (Thursday)",
+                        "Jumat (Friday)",
+                        "Sabtu (Saturday)",
+                        "Minggu (Sunday)"
+                    ],
+                    "key_points": [
+                        "Capitalize first letter",
+                        "Use 'hari' for 'day'",
+                        "Hari ini (today), Besok (tomorrow)"
+                    ]
+                },
+                {
+                    "title": "Time of Day",
+                    "explanation": "Expressions for different times of day.",
+                    "examples": [
+                        "Pagi (morning)",
+                        "Siang (noon/afternoon)",
+                        "Sore (evening)",
+                        "Malam (night)",
+                        "Tengah malam (midnight)"
+                    ],
+                    "key_points": [
+                        "Selamat pagi (Good morning)",
+                        "Selamat siang (Good afternoon)",
+                        "Selamat malam (Good evening/night)"
+                    ]
+                }
+            ]
+        },
+        "Prepositions": {
+            "icon": "📍",
+            "description": "Location and direction words",
+            "topics": [
+                {
+                    "title": "Location Prepositions",
+                    "explanation": "Words to describe where things are located.",
+                    "examples": [
+                        "Di (at/in/on)",
+                        "Ke (to/towards)",
+                        "Dari (from)",
+                        "Di dalam (inside)",
+                        "Di luar (outside)",
+                        "Di atas (on top of)",
+                        "Di bawah (under/below)"
+                    ],
+                    "key_points": [
+                        "Di for static location",
+                        "Ke for movement towards",
+                        "Dari for movement from",
+                        "Combine with dalam, luar, atas, bawah"
+                    ]
+                }
+            ]
+        },
+        "Politeness": {
+            "icon": "🙏",
+            "description": "Formal and informal language",
+            "topics": [
+                {
+                    "title": "Formal vs Informal",
+                    "explanation": "Indonesian has different levels of formality.",
+                    "examples": [
+                        "Formal: Saya, Anda, Bapak, Ibu",
+                        "Informal: Aku, Kamu, Mas, Mbak",
+                        "Formal: Terima kasih (Thank you)",
+                        "Informal: Makasih (Thanks)"
+                    ],
+                    "key_points": [
+                        "Use formal with strangers and elders",
+                        "Informal with friends and family",
+                        "Bapak/Ibu for Mr./Mrs.",
+                        "Mas/Mbak for young people"
+                    ]
+                },
+                {
+                    "title": "Politeness Markers",
+                    "explanation": "Words and phrases to be polite.",
+                    "examples": [
+                        "Tolong (Please - for requests)",
+                        "Maaf (Sorry/Excuse me)",
+                        "Permisi (Excuse me - to get attention)",
+                        "Silakan (Please - offering something)"
+                    ],
+                    "key_points": [
+                        "Tolong for asking favors",
+                        "Maaf for apologies",
+                        "Permisi to get attention",
+                        "Silakan when offering"
+                    ]
                 }
             ]
         }
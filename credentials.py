@@ -0,0 +1,131 @@
+"""
+Credentials for Indonesian Learning
+Tiny per-profile credential records with salted PIN hashes, checked without reading progress
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from datetime import datetime
+from functools import lru_cache
+
+from safe_files import atomic_write_json
+
+CREDENTIALS_FILENAME = "credentials.json"
+
+PBKDF2_ITERATIONS = 200_000
+SALT_BYTES = 16
+
+# Fields older progress files used to keep the PIN in
+LEGACY_PIN_FIELDS = ('pin_code', 'access_code')
+
+
+def legacy_pin(progress_data):
+    """PIN stored in a progress document by older versions, or None"""
+    for field in LEGACY_PIN_FIELDS:
+        if progress_data.get(field):
+            return str(progress_data[field])
+    return None
+
+
+def _derive(pin_code, salt, iterations):
+    return hashlib.pbkdf2_hmac('sha256', pin_code.encode('utf-8'), salt, iterations)
+
+
+def make_credential(pin_code, iterations=PBKDF2_ITERATIONS):
+    """Build a credential record with a fresh salt"""
+    salt = secrets.token_bytes(SALT_BYTES)
+    return {
+        'algorithm': 'pbkdf2_sha256',
+        'iterations': iterations,
+        'salt': salt.hex(),
+        'hash': _derive(pin_code, salt, iterations).hex(),
+        'updated': datetime.now().isoformat()
+    }
+
+
+def verify_pin(credential, pin_code):
+    """True if the PIN matches the credential record (constant-time compare)"""
+    derived = _derive(pin_code, bytes.fromhex(credential['salt']), credential['iterations'])
+    return hmac.compare_digest(derived.hex(), credential['hash'])
+
+
+class CredentialStore:
+    """Per-profile credentials.json files with an in-process metadata cache.
+
+    Login reads one small record (or none, when the cache is current), so its
+    cost is the same for a new profile and one with years of history.
+    Profiles created before this store are migrated on first login by
+    reading their progress file once.
+    """
+
+    def __init__(self, profiles_dir):
+        self.profiles_dir = profiles_dir
+        self._cache = {}   # profile name -> (mtime, credential)
+        self._dummy = make_credential(secrets.token_hex(8))
+
+    def path(self, profile_name):
+        """Location of a profile's credential record"""
+        return os.path.join(self.profiles_dir, profile_name, CREDENTIALS_FILENAME)
+
+    def get(self, profile_name):
+        """Credential record for a profile, or None"""
+        path = self.path(profile_name)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            self._cache.pop(profile_name, None)
+            return None
+
+        cached = self._cache.get(profile_name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                credential = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._cache[profile_name] = (mtime, credential)
+        return credential
+
+    def set_pin(self, profile_name, pin_code):
+        """Store a new salted hash for a profile's PIN"""
+        path = self.path(profile_name)
+        credential = make_credential(pin_code)
+        atomic_write_json(path, credential)
+        self._cache[profile_name] = (os.path.getmtime(path), credential)
+
+    def _migrate(self, profile_name):
+        """Create a credential record from a PIN left in an old progress file"""
+        progress_path = os.path.join(self.profiles_dir, profile_name, "progress.json")
+        try:
+            with open(progress_path, 'r') as f:
+                pin_code = legacy_pin(json.load(f))
+        except (OSError, ValueError):
+            return None
+        if not pin_code:
+            return None
+        self.set_pin(profile_name, pin_code)
+        return self.get(profile_name)
+
+    def verify(self, profile_name, pin_code):
+        """True if the PIN is correct for the profile"""
+        credential = None
+        if profile_name and os.path.basename(profile_name) == profile_name and not profile_name.startswith('.'):
+            credential = self.get(profile_name) or self._migrate(profile_name)
+        if credential is None:
+            verify_pin(self._dummy, pin_code)  # Unknown names take as long as wrong PINs
+            return False
+        return verify_pin(credential, pin_code)
+
+    def forget(self, profile_name):
+        """Drop a deleted profile from the cache"""
+        self._cache.pop(profile_name, None)
+
+
+@lru_cache(maxsize=None)
+def get_credential_store(profiles_dir):
+    """Return the process-wide credential store for a profiles directory"""
+    return CredentialStore(profiles_dir)
@@ -0,0 +1,107 @@
+"""
+Distractors for Indonesian Learning
+Per-level and per-category pools of English glosses for multiple-choice options, built once per process
+"""
+
+import random
+from functools import lru_cache
+
+from vocabulary_index import get_vocabulary_index, gloss_variants
+
+# Random draws allowed per wanted distractor before moving on to the next pool
+SAMPLE_ATTEMPTS = 8
+
+
+class DistractorPools:
+    """Distinct English glosses grouped by level and by category.
+
+    Glosses are deduplicated on their normalized form, so 'Good' and 'good'
+    never appear as two options. Sampling draws random positions from a
+    pool and rejects the answer, its synonyms and repeats, so it costs
+    O(k) draws regardless of vocabulary size.
+    """
+
+    def __init__(self, vocabulary):
+        self._vocabulary = vocabulary
+        self._variants = {}
+        seen_by_pool = {}
+        pools = {}
+
+        for word in vocabulary.words:
+            for level, category in vocabulary.placements(word):
+                gloss = vocabulary.entry(word, level=level)['english']
+                variants = gloss_variants(gloss)
+                self._variants.setdefault(gloss, frozenset(variants))
+                key = variants[0]  # Normalized full gloss
+                for pool in (('level', level), ('category', category), ('all', None)):
+                    seen = seen_by_pool.setdefault(pool, set())
+                    if key not in seen:
+                        seen.add(key)
+                        pools.setdefault(pool, []).append(gloss)
+
+        self._pools = {pool: tuple(glosses) for pool, glosses in pools.items()}
+
+    def pool(self, level=None, category=None):
+        """Glosses for a level, a category, or (neither given) the whole vocabulary"""
+        if level is not None:
+            return self._pools.get(('level', level), ())
+        if category is not None:
+            return self._pools.get(('category', category), ())
+        return self._pools.get(('all', None), ())
+
+    def excluded_variants(self, answer):
+        """Normalized forms that would make an option a second correct answer"""
+        excluded = set(gloss_variants(answer))
+        for variant in list(excluded):
+            for word in self._vocabulary.words_for_english(variant):
+                for level in self._vocabulary.levels_of(word):
+                    excluded.update(gloss_variants(self._vocabulary.entry(word, level=level)['english']))
+        return excluded
+
+    def sample(self, answer, k=3, level=None, category=None, rng=random):
+        """Up to k distinct glosses that are not the answer or one of its synonyms.
+
+        Draws from the level pool first, then the category pool, then the
+        whole vocabulary, so small levels still get k options.
+        """
+        excluded = self.excluded_variants(answer)
+        chosen = []
+        pools = []
+        if level is not None:
+            pools.append(self.pool(level=level))
+        if category is not None:
+            pools.append(self.pool(category=category))
+        pools.append(self.pool())
+        for pool in pools:
+            if len(chosen) >= k:
+                break
+            self._draw(pool, k, excluded, chosen, rng)
+        return chosen
+
+    def _draw(self, pool, k, excluded, chosen, rng):
+        attempts = (k - len(chosen)) * SAMPLE_ATTEMPTS
+        if len(pool) <= attempts:
+            # Small pool: a shuffled pass is as cheap as rejection sampling and never misses
+            candidates = rng.sample(pool, len(pool))
+        else:
+            candidates = (pool[rng.randrange(len(pool))] for _ in range(attempts))
+        for gloss in candidates:
+            if len(chosen) >= k:
+                return
+            variants = self._variants[gloss]
+            if variants.isdisjoint(excluded):
+                chosen.append(gloss)
+                excluded.update(variants)
+
+
+@lru_cache(maxsize=None)
+def get_distractor_pools():
+    """Return the process-wide distractor pools, building them on first use"""
+    return DistractorPools(get_vocabulary_index())
+
+
+def multiple_choice_options(answer, level=None, category=None, k=3, rng=random):
+    """The answer plus k distractors, shuffled"""
+    options = [answer] + get_distractor_pools().sample(answer, k, level=level, category=category, rng=rng)
+    rng.shuffle(options)
+    return options
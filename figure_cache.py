@@ -0,0 +1,36 @@
+"""
+Figure Cache for Indonesian Learning
+Per-session chart cache keyed by chart id and the progress data version, so unchanged charts are not rebuilt
+"""
+
+
+class FigureCache:
+    """The latest figure per chart id, valid while its key is unchanged.
+
+    The key is the progress data version plus any other inputs the chart
+    reads (daily goal, today's date, ...). One entry per chart id, so the
+    cache never grows past the number of charts. Bound to one progress
+    object: loading another profile (or resetting progress) starts a new
+    cache, since versions are only comparable within one profile.
+    """
+
+    def __init__(self, user_progress):
+        self._source = user_progress
+        self._figures = {}
+        self.hits = 0
+        self.builds = 0
+
+    def tracks(self, user_progress):
+        """True if this cache was built for the given progress object"""
+        return self._source is user_progress
+
+    def figure(self, chart_id, key, build):
+        """Cached figure for chart_id if its key matches, else build(), store and return it"""
+        cached = self._figures.get(chart_id)
+        if cached is not None and cached[0] == key:
+            self.hits += 1
+            return cached[1]
+        figure = build()
+        self._figures[chart_id] = (key, figure)
+        self.builds += 1
+        return figure
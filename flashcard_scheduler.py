@@ -0,0 +1,204 @@
+"""
+Flashcard Scheduler for Indonesian Learning
+Heap-backed due-card tracking so counting due cards does not scan the whole deck
+"""
+
+import heapq
+import random
+from bisect import bisect_right, insort
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+HEAP_COMPACTION_FACTOR = 2
+
+
+def parse_review_time(value):
+    """Return next_review as a datetime (saved decks may hold ISO strings)"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now()
+    return value
+
+
+@lru_cache(maxsize=None)
+def vocabulary_pools(vocabulary):
+    """Every pool key -> headwords filed under it, for a (process-wide) vocabulary index"""
+    pools = {}
+    for word in vocabulary.words:
+        keys = {(None, None)}
+        for level, category in vocabulary.placements(word):
+            keys.update([(level, None), (None, category), (level, category)])
+        for key in keys:
+            pools.setdefault(key, []).append(word)
+    return {key: tuple(words) for key, words in pools.items()}
+
+
+@lru_cache(maxsize=None)
+def vocabulary_order(vocabulary):
+    """Headword -> position in the vocabulary (every pool lists its words in this order)"""
+    return {word: position for position, word in enumerate(vocabulary.words)}
+
+
+class DueCardScheduler:
+    """Min-heap of upcoming reviews keyed on next_review, plus due-card pools.
+
+    Cards wait in the heap until their next_review passes, then move into
+    per-level, per-category and per-(level, category) pools. Each card moves
+    once per review (O(log n)), and due counts are read straight from the
+    pools. update_flashcard_schedule calls reschedule() so the scheduler never
+    needs a rebuild while the session's deck stays the same object.
+
+    With a vocabulary, words that have no card yet count as new and always
+    due. They are never materialized: each pool keeps the sorted vocabulary
+    positions of its tracked cards, so its new-card count is a subtraction
+    and its n-th new word is found by binary search (O(log^2 n)) rather
+    than by walking the pool.
+    """
+
+    def __init__(self, flashcard_data, placements=None, now=None, vocabulary=None):
+        self._source = flashcard_data
+        self._placements = placements
+        self._vocabulary = vocabulary
+        self._pools = vocabulary_pools(vocabulary) if vocabulary is not None else {}
+        self._order = vocabulary_order(vocabulary) if vocabulary is not None else {}
+        self._scheduled = {}   # word -> live next_review
+        self._views = {}       # word -> (level, category) pairs the card is filed under
+        self._due = {}         # pool key -> {word: None} (insertion-ordered set)
+        self._tracked = {}     # pool key -> sorted vocabulary positions of the words with a card
+
+        for word, card in flashcard_data.items():
+            next_review = parse_review_time(card['next_review'])
+            self._scheduled[word] = next_review
+            self._track(word, card)
+        self._heap = [(next_review, word) for word, next_review in self._scheduled.items()]
+        heapq.heapify(self._heap)
+        self.refresh(now)
+
+    def _card_views(self, word, card):
+        """(level, category) pairs for a card, from the vocabulary when available"""
+        pairs = self._placements(word) if self._placements else ()
+        return pairs or ((card.get('level'), card.get('category', 'general')),)
+
+    def _pool_keys(self, word):
+        """Every due pool a card belongs to"""
+        keys = {(None, None)}
+        for level, category in self._views[word]:
+            keys.update([(level, None), (None, category), (level, category)])
+        return keys
+
+    def _track(self, word, card):
+        """Start tracking a card (it stops counting as new)"""
+        self._views[word] = self._card_views(word, card)
+        if self._vocabulary is not None and word in self._vocabulary:
+            for key in self._pool_keys(word):
+                insort(self._tracked.setdefault(key, []), self._order[word])
+
+    def _new_count(self, key):
+        return len(self._pools.get(key, ())) - len(self._tracked.get(key, ()))
+
+    def _new_position(self, key, n):
+        """Pool index of the pool's n-th (0-based) word without a card"""
+        pool = self._pools[key]
+        tracked = self._tracked.get(key, ())
+        order = self._order
+        # New words up to index i = i + 1 - tracked words at or before it; find the first i reaching n + 1
+        low, high = n, min(len(pool) - 1, n + len(tracked))
+        while low < high:
+            middle = (low + high) // 2
+            if middle + 1 - bisect_right(tracked, order[pool[middle]]) > n:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _new_words(self, key, start=0):
+        """Words of a pool without a card, from the start-th one on, in vocabulary order"""
+        if start >= self._new_count(key):
+            return
+        pool = self._pools[key]
+        for position in range(self._new_position(key, start), len(pool)):
+            if pool[position] not in self._views:
+                yield pool[position]
+
+    def tracks(self, flashcard_data):
+        """True if this scheduler was built for the given deck object"""
+        return self._source is flashcard_data
+
+    def refresh(self, now=None):
+        """Move every card whose review time has passed into the due pools"""
+        now = now or datetime.now()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            next_review, word = heapq.heappop(heap)
+            if self._scheduled.get(word) != next_review:
+                continue  # Stale entry from an earlier schedule
+            for key in self._pool_keys(word):
+                self._due.setdefault(key, {})[word] = None
+
+    def reschedule(self, word, next_review, card=None):
+        """Record a card's new review time - O(log n)"""
+        if word in self._views:
+            for key in self._pool_keys(word):
+                self._due.get(key, {}).pop(word, None)
+        elif card is not None:
+            self._track(word, card)
+        else:
+            return
+
+        next_review = parse_review_time(next_review)
+        self._scheduled[word] = next_review
+        heapq.heappush(self._heap, (next_review, word))
+
+        if len(self._heap) > HEAP_COMPACTION_FACTOR * len(self._scheduled):
+            self._heap = [(time, w) for time, w in self._heap if self._scheduled.get(w) == time]
+            heapq.heapify(self._heap)
+
+    def due_count(self, level=None, category=None, now=None):
+        """Number of due cards (including new ones), optionally for one level and/or category"""
+        self.refresh(now)
+        key = (level, category)
+        return len(self._due.get(key, ())) + self._new_count(key)
+
+    def due_cards(self, level=None, category=None, now=None, limit=None):
+        """Due cards (most overdue first, then new words), optionally for one level and/or category.
+
+        Pass a limit to read one page: the cost is then the page plus the
+        cards already reviewed, never the whole vocabulary pool.
+        """
+        self.refresh(now)
+        key = (level, category)
+        cards = list(islice(self._due.get(key, ()), limit))
+        remaining = None if limit is None else limit - len(cards)
+        cards.extend(islice(self._new_words(key), remaining))
+        return cards
+
+    def sample_due(self, level=None, category=None, now=None, rng=random):
+        """One due card or new word, chosen uniformly at random, or None if nothing is due"""
+        self.refresh(now)
+        key = (level, category)
+        due = self._due.get(key, {})
+        total = len(due) + self._new_count(key)
+        if not total:
+            return None
+        pick = rng.randrange(total)
+        if pick < len(due):
+            return next(islice(due, pick, None))
+        return self._pools[key][self._new_position(key, pick - len(due))]
+
+    def in_pool(self, word, level=None, category=None):
+        """True if a vocabulary word is filed under the given level and/or category"""
+        placements = self._placements(word) if self._placements else ()
+        return any((level is None or level == word_level) and (category is None or category == word_category)
+                   for word_level, word_category in placements)
+
+    def is_due(self, word, level=None, category=None, now=None):
+        """True if a card is currently due (or the word has no card yet), optionally within one pool"""
+        self.refresh(now)
+        if word in self._due.get((level, category), ()):
+            return True
+        return (self._vocabulary is not None and word in self._vocabulary and word not in self._views
+                and self.in_pool(word, level, category))
@@ -0,0 +1,188 @@
+"""
+Flashcard State for Indonesian Learning
+Compact per-word scheduling records keyed by stable vocabulary id, with word content read from the shared index
+"""
+
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+
+from vocabulary_index import get_vocabulary_index, stable_word_id
+
+# Per-profile fields - everything else about a card comes from the vocabulary
+SCHEDULE_FIELDS = ('next_review', 'interval', 'ease_factor', 'review_count', 'correct_streak')
+# Vocabulary fields a card exposes (the shape the old per-profile card dicts had)
+STATIC_FIELDS = ('level', 'english', 'pronunciation', 'category')
+
+DEFAULT_INTERVAL = 1
+DEFAULT_EASE_FACTOR = 2.5
+
+
+def _to_datetime(value):
+    """next_review from disk: epoch seconds, ISO string or datetime"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now()
+    return value or datetime.now()
+
+
+class FlashcardState(Mapping):
+    """One word's spaced-repetition state.
+
+    Reads like the old card dict (card['interval'], card['english'], ...),
+    but only the five scheduling fields are stored; level, english,
+    pronunciation and category are looked up in the process-wide
+    vocabulary index when read. Only scheduling fields can be assigned.
+    """
+
+    __slots__ = ('word_id', 'next_review', 'interval', 'ease_factor', 'review_count', 'correct_streak')
+
+    def __init__(self, word_id, next_review=None, interval=DEFAULT_INTERVAL, ease_factor=DEFAULT_EASE_FACTOR,
+                 review_count=0, correct_streak=0):
+        self.word_id = word_id
+        self.next_review = next_review or datetime.now()
+        self.interval = interval
+        self.ease_factor = ease_factor
+        self.review_count = review_count
+        self.correct_streak = correct_streak
+
+    @property
+    def word(self):
+        """Headword this card is for"""
+        return get_vocabulary_index().word_for_id(self.word_id)
+
+    def _static(self, key):
+        found = get_vocabulary_index().lookup(self.word)
+        if found is None:
+            raise KeyError(key)
+        level, entry = found
+        return level if key == 'level' else entry[key]
+
+    def __getitem__(self, key):
+        if key in SCHEDULE_FIELDS:
+            return getattr(self, key)
+        if key in STATIC_FIELDS:
+            return self._static(key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in SCHEDULE_FIELDS:
+            raise KeyError(f"'{key}' comes from the vocabulary and cannot be set on a card")
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return iter(SCHEDULE_FIELDS + STATIC_FIELDS)
+
+    def __len__(self):
+        return len(SCHEDULE_FIELDS) + len(STATIC_FIELDS)
+
+    def __repr__(self):
+        return f"FlashcardState({self.word!r}, interval={self.interval}, next_review={self.next_review})"
+
+    def update(self, values):
+        """Copy scheduling fields from a dict (static fields are ignored)"""
+        for key in SCHEDULE_FIELDS:
+            if key in values:
+                value = values[key]
+                setattr(self, key, _to_datetime(value) if key == 'next_review' else value)
+
+    def to_record(self):
+        """Compact on-disk form: [next_review epoch, interval, ease_factor, review_count, correct_streak]"""
+        return [int(_to_datetime(self.next_review).timestamp()), self.interval,
+                round(self.ease_factor, 2), self.review_count, self.correct_streak]
+
+    @classmethod
+    def from_record(cls, word_id, record):
+        """Build from to_record() output or from an old full card dict"""
+        if isinstance(record, Mapping):
+            card = cls(word_id)
+            card.update(record)
+            return card
+        next_review, interval, ease_factor, review_count, correct_streak = record
+        return cls(word_id, _to_datetime(next_review), interval, ease_factor, review_count, correct_streak)
+
+
+class FlashcardDeck(MutableMapping):
+    """A profile's cards keyed by stable word id, addressed by headword.
+
+    deck['makan'] returns the FlashcardState for 'makan'; iteration yields
+    headwords, so code written against the old {word: card dict} keeps
+    working. Assigning a plain dict stores only its scheduling fields.
+
+    The deck is sparse: a word gets a card the first time it is reviewed
+    (materialize). Until then it is an implicit new card - card() returns a
+    default state without storing it, and the scheduler counts it as due.
+    """
+
+    def __init__(self, cards=None):
+        self._cards = {}
+        for word, card in (cards or {}).items():
+            self[word] = card
+
+    def card(self, word):
+        """The stored card, or a default new-card state (not stored) for a vocabulary word"""
+        word_id = stable_word_id(word)
+        card = self._cards.get(word_id)
+        if card is None:
+            if get_vocabulary_index().word_for_id(word_id) is None:
+                raise KeyError(word)
+            card = FlashcardState(word_id)
+        return card
+
+    def materialize(self, word):
+        """The stored card for a word, creating it from the new-card defaults if needed"""
+        word_id = stable_word_id(word)
+        card = self._cards.get(word_id)
+        if card is None:
+            card = self.card(word)
+            self._cards[word_id] = card
+        return card
+
+    def is_new(self, word):
+        """True if the word has never been reviewed (no stored card)"""
+        return stable_word_id(word) not in self._cards
+
+    def __getitem__(self, word):
+        return self._cards[stable_word_id(word)]
+
+    def __setitem__(self, word, card):
+        word_id = stable_word_id(word)
+        if not isinstance(card, FlashcardState):
+            card = FlashcardState.from_record(word_id, card)
+        card.word_id = word_id
+        self._cards[word_id] = card
+
+    def __delitem__(self, word):
+        del self._cards[stable_word_id(word)]
+
+    def __contains__(self, word):
+        return isinstance(word, str) and stable_word_id(word) in self._cards
+
+    def __iter__(self):
+        word_for_id = get_vocabulary_index().word_for_id
+        for word_id in self._cards:
+            yield word_for_id(word_id)
+
+    def __len__(self):
+        return len(self._cards)
+
+    def to_json(self):
+        """{word id: compact record} for saving"""
+        return {str(word_id): card.to_record() for word_id, card in self._cards.items()}
+
+    @classmethod
+    def from_json(cls, data):
+        """Load to_json() output, or an old {word: full card dict} file"""
+        deck = cls()
+        index = get_vocabulary_index()
+        for key, record in data.items():
+            word_id = int(key) if key.isdigit() else stable_word_id(key)
+            if index.word_for_id(word_id) is None:
+                continue  # Word no longer in the vocabulary
+            card = FlashcardState.from_record(word_id, record)
+            if card.review_count:
+                deck._cards[word_id] = card  # Never-reviewed cards from full decks stay implicit
+        return deck
@@ -0,0 +1,138 @@
+"""
+Grammar Search for Indonesian Learning
+Inverted index over the grammar library with normalized tokens and ranked results
+"""
+
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+
+from grammar_store import get_grammar_store
+
+# Relative weight of a token depending on where it appears
+FIELD_WEIGHTS = {
+    'title': 5.0,
+    'category': 3.0,
+    'key_points': 2.0,
+    'explanation': 2.0,
+    'examples': 1.5,
+    'common_mistakes': 1.0,
+    'detailed_explanation': 1.0,
+}
+
+# Prefix matches ("pronoun" -> "pronouns") count for less than exact tokens
+PREFIX_MATCH_FACTOR = 0.5
+MIN_PREFIX_LENGTH = 3
+
+SearchHit = namedtuple('SearchHit', ['category', 'topic', 'score', 'fields'])
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase, strip accents, emoji and punctuation, and split into tokens"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _example_texts(example):
+    """Indonesian and English text of an example (dict or plain string)"""
+    if isinstance(example, str):
+        return [example]
+    return [example.get('indonesian', ''), example.get('english', '')]
+
+
+class GrammarSearchIndex:
+    """Token -> topic postings with field-weighted, idf-scaled scores"""
+
+    def __init__(self, categories):
+        self._docs = []        # doc id -> (category name, topic)
+        postings = {}          # token -> {doc id: weight}
+        fields_by_doc = {}     # (token, doc id) -> set of fields
+
+        def add(doc_id, field, text):
+            for token in tokenize(text):
+                weights = postings.setdefault(token, {})
+                weights[doc_id] = weights.get(doc_id, 0.0) + FIELD_WEIGHTS[field]
+                fields_by_doc.setdefault((token, doc_id), set()).add(field)
+
+        for category_name, category in categories.items():
+            for topic in category['topics']:
+                doc_id = len(self._docs)
+                self._docs.append((category_name, topic))
+
+                add(doc_id, 'category', category_name)
+                add(doc_id, 'category', category.get('description', ''))
+                add(doc_id, 'title', topic['title'])
+                add(doc_id, 'explanation', topic.get('explanation', ''))
+                add(doc_id, 'detailed_explanation', topic.get('detailed_explanation', ''))
+                for point in topic.get('key_points', ()):
+                    add(doc_id, 'key_points', point)
+                for mistake in topic.get('common_mistakes', ()):
+                    add(doc_id, 'common_mistakes', mistake)
+                for example in topic.get('examples', ()):
+                    for text in _example_texts(example):
+                        add(doc_id, 'examples', text)
+
+        # Scale by inverse document frequency so common words rank lower
+        doc_count = len(self._docs)
+        self._postings = {}
+        for token, weights in postings.items():
+            idf = math.log(1 + doc_count / len(weights))
+            self._postings[token] = {doc_id: weight * idf for doc_id, weight in weights.items()}
+        self._fields = {key: frozenset(fields) for key, fields in fields_by_doc.items()}
+        self._tokens = sorted(self._postings)
+
+    def _expand(self, term):
+        """Index tokens matching a query term: (token, factor) pairs"""
+        matches = []
+        if term in self._postings:
+            matches.append((term, 1.0))
+        if len(term) >= MIN_PREFIX_LENGTH:
+            position = bisect_left(self._tokens, term)
+            while position < len(self._tokens) and self._tokens[position].startswith(term):
+                token = self._tokens[position]
+                if token != term:
+                    matches.append((token, PREFIX_MATCH_FACTOR))
+                position += 1
+        return matches
+
+    def search(self, query, limit=None):
+        """Return SearchHits ranked by score; every query term must match"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        scores = None
+        matched_fields = {}
+        for term in terms:
+            term_scores = {}
+            for token, factor in self._expand(term):
+                for doc_id, weight in self._postings[token].items():
+                    term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), weight * factor)
+                    matched_fields.setdefault(doc_id, set()).update(self._fields[(token, doc_id)])
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: score + term_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in term_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        hits = []
+        for doc_id, score in ranked:
+            category_name, topic = self._docs[doc_id]
+            hits.append(SearchHit(category_name, topic, score, frozenset(matched_fields[doc_id])))
+        return hits
+
+
+@lru_cache(maxsize=None)
+def get_grammar_search_index():
+    """Return the process-wide grammar search index, building it on first use"""
+    return GrammarSearchIndex(get_grammar_store().categories)
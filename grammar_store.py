@@ -0,0 +1,81 @@
+"""
+Grammar Store for Indonesian Learning
+Process-level, read-only access to the grammar library by category, level and topic
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+
+from comprehensive_grammar import get_comprehensive_grammar
+
+GRAMMAR_LEVELS = ('beginner', 'intermediate', 'advanced', 'expert')
+
+
+def _freeze(value):
+    """Recursively convert dicts to mapping proxies and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class GrammarStore:
+    """Immutable grammar library with precomputed level and topic views"""
+
+    def __init__(self, grammar):
+        self._categories = _freeze(grammar)
+
+        # Categories unlocked at each study level (a level includes all easier ones)
+        by_level = {}
+        for level_index, level in enumerate(GRAMMAR_LEVELS):
+            by_level[level] = MappingProxyType({
+                name: category for name, category in self._categories.items()
+                if category.get('level') in GRAMMAR_LEVELS[:level_index + 1]
+            })
+        self._by_level = MappingProxyType(by_level)
+
+        # Topic title -> (category name, topic)
+        topics = {}
+        for name, category in self._categories.items():
+            for topic in category['topics']:
+                topics.setdefault(topic['title'], (name, topic))
+        self._topics = MappingProxyType(topics)
+
+    @property
+    def levels(self):
+        """Study levels in order of difficulty"""
+        return GRAMMAR_LEVELS
+
+    @property
+    def categories(self):
+        """All categories, keyed by display name"""
+        return self._categories
+
+    @property
+    def topic_count(self):
+        """Number of distinct topics in the library"""
+        return len(self._topics)
+
+    def category(self, name):
+        """Return one category, or None"""
+        return self._categories.get(name)
+
+    def categories_for_level(self, level):
+        """Categories available at a study level (including easier levels)"""
+        return self._by_level.get(level, MappingProxyType({}))
+
+    def topics(self, category_name):
+        """Topics for a category"""
+        category = self._categories.get(category_name)
+        return category['topics'] if category else ()
+
+    def topic(self, title):
+        """Return (category name, topic) for a topic title, or None"""
+        return self._topics.get(title)
+
+
+@lru_cache(maxsize=None)
+def get_grammar_store():
+    """Return the process-wide grammar store, building it on first use"""
+    return GrammarStore(get_comprehensive_grammar())
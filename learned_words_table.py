@@ -0,0 +1,94 @@
+"""
+Learned Words Table for Indonesian Learning
+Columnar table of a learner's words for the Word Database page, filtered with vectorized masks and served a page at a time
+"""
+
+import numpy as np
+import pandas as pd
+
+from srs_engine import MASTERED_AT, data_version
+
+PAGE_SIZE = 50
+DISPLAY_COLUMNS = ['Indonesian', 'English', 'Pronunciation', 'Category', 'Level', 'Mastery',
+                   'Reviews', 'Success Rate', 'Example', 'Last Reviewed']
+
+
+class LearnedWordsTable:
+    """Every learned word with its vocabulary entry and review stats, as one DataFrame.
+
+    Built once per progress data version (a search keystroke reuses it),
+    sorted by mastery (highest first). Filters are boolean masks over
+    pre-lowercased and categorical columns, so a search costs a few
+    vectorized string scans rather than a Python loop over the words.
+    """
+
+    def __init__(self, user_progress, vocabulary):
+        self._source = user_progress
+        self.version = data_version(user_progress)
+
+        rows = []
+        for word, details in user_progress.get('learned_words_details', {}).items():
+            found = vocabulary.lookup(word)
+            if not found:
+                continue
+            level, entry = found
+            rows.append((word, entry['english'], entry['pronunciation'], entry['category'], level,
+                         details['mastery_level'], details['total_reviews'], details['correct_reviews'],
+                         entry.get('example', 'No example available'), details['last_reviewed']))
+
+        df = pd.DataFrame(rows, columns=['Indonesian', 'English', 'Pronunciation', 'category', 'Level', 'Mastery',
+                                         'Reviews', 'correct', 'Example', 'last_reviewed'])
+        reviews = df['Reviews'].to_numpy(dtype=np.float64)
+        success = np.divide(df['correct'].to_numpy(dtype=np.float64) * 100, reviews,
+                            out=np.zeros(len(df)), where=reviews > 0)
+        df['Success Rate'] = [f"{rate:.1f}%" if count else "0%" for rate, count in zip(success, reviews)]
+        df['Last Reviewed'] = df['last_reviewed'].fillna('').str[:10].replace('', 'Never')
+        df['Category'] = df['category'].str.title()
+        df['category'] = df['category'].astype('category')
+        df['Level'] = df['Level'].astype('category')
+        df['search_indonesian'] = df['Indonesian'].str.lower()
+        df['search_english'] = df['English'].str.lower()
+
+        self.df = df.sort_values('Mastery', ascending=False, kind='stable').reset_index(drop=True)
+
+    def tracks(self, user_progress):
+        """True if the table is current for this progress object and its data version"""
+        return self._source is user_progress and self.version == data_version(user_progress)
+
+    def __len__(self):
+        return len(self.df)
+
+    def mask(self, search_term='', category=None, level=None):
+        """Boolean mask of rows matching a search term (Indonesian or English) and optional filters"""
+        df = self.df
+        mask = np.ones(len(df), dtype=bool)
+        if level is not None:
+            mask &= (df['Level'] == level).to_numpy()
+        if category is not None:
+            mask &= (df['category'] == category).to_numpy()
+        term = search_term.strip().lower()
+        if term:
+            mask &= (df['search_indonesian'].str.contains(term, regex=False)
+                     | df['search_english'].str.contains(term, regex=False)).to_numpy()
+        return mask
+
+    def stats(self, mask):
+        """(matching words, mastered words, average mastery) for a mask"""
+        mastery = self.df['Mastery'].to_numpy()[mask]
+        if not mastery.size:
+            return 0, 0, 0.0
+        return int(mastery.size), int(np.count_nonzero(mastery >= MASTERED_AT)), float(mastery.mean())
+
+    def rows(self, mask, page=0, page_size=PAGE_SIZE):
+        """Display columns for one page of the matching rows"""
+        positions = np.flatnonzero(mask)[page * page_size:(page + 1) * page_size]
+        return self.df.iloc[positions][DISPLAY_COLUMNS].reset_index(drop=True)
+
+    def export(self, mask):
+        """Display columns for every matching row (for CSV / text export)"""
+        return self.df.loc[mask, DISPLAY_COLUMNS].reset_index(drop=True)
+
+
+def page_count(matches, page_size=PAGE_SIZE):
+    """Number of pages needed for `matches` rows (at least 1)"""
+    return max(1, -(-matches // page_size))
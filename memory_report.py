@@ -0,0 +1,189 @@
+"""
+Memory Report for Indonesian Learning
+Approximate deep size of each session-state key, per active session, for capacity tuning
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import types
+from collections import namedtuple
+from functools import lru_cache
+
+# Comma-separated profile names allowed to open the memory report
+ADMIN_ENV_VAR = 'ADMIN_PROFILES'
+
+# A session is measured at most this often (seconds)
+SNAPSHOT_INTERVAL = 60
+# Sessions not seen for this long are dropped from the report
+SESSION_TTL = 30 * 60
+# The process-wide summary is logged at most this often
+LOG_INTERVAL = 5 * 60
+
+logger = logging.getLogger(__name__)
+
+SessionSnapshot = namedtuple('SessionSnapshot', ['session_id', 'profile', 'page', 'sizes', 'total', 'taken_at'])
+
+# Never descended into: code and class objects are shared by every session
+_OPAQUE_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                 types.MethodType, types.CodeType, types.FrameType)
+
+
+def admin_profiles():
+    """Profiles listed in the ADMIN_PROFILES environment variable"""
+    return frozenset(name.strip() for name in os.environ.get(ADMIN_ENV_VAR, '').split(',') if name.strip())
+
+
+def is_admin(profile_name):
+    """True if the profile may see the memory report"""
+    return bool(profile_name) and profile_name in admin_profiles()
+
+
+def format_bytes(size):
+    """Human-readable byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:,.0f} {unit}" if unit == 'B' else f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def _slot_names(cls):
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        yield from slots
+
+
+def deep_sizeof(obj, seen=None, skip_ids=frozenset()):
+    """Approximate bytes reachable from obj.
+
+    Objects already in `seen` (or listed in skip_ids, e.g. process-wide
+    tables) are not counted again, so sharing one `seen` set across a
+    session's keys counts each object once.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        current_id = id(current)
+        if current_id in seen or current_id in skip_ids or isinstance(current, _OPAQUE_TYPES):
+            continue
+        seen.add(current_id)
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, (str, bytes, bytearray, int, float, complex, bool)):
+            continue
+        else:
+            # Custom objects: their __dict__ and slots, never their mapping or iteration protocol
+            if hasattr(current, '__dict__'):
+                stack.append(vars(current))
+            for name in _slot_names(type(current)):
+                if name not in ('__dict__', '__weakref__') and hasattr(current, name):
+                    stack.append(getattr(current, name))
+    return total
+
+
+def session_key_sizes(session_state, skip_ids=frozenset()):
+    """{session-state key: approximate bytes}, largest first"""
+    seen = set()
+    sizes = {}
+    for key in list(session_state.keys()):
+        try:
+            sizes[key] = deep_sizeof(session_state[key], seen, skip_ids)
+        except (KeyError, RuntimeError):
+            continue  # Key removed or container changed while measuring
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+
+class MemoryMonitor:
+    """Process-wide registry of per-session memory snapshots.
+
+    Each session reports itself on rerun (throttled to SNAPSHOT_INTERVAL),
+    so measuring costs a few milliseconds per session per minute and no
+    Streamlit internals are needed to enumerate sessions.
+    """
+
+    def __init__(self, shared_objects=()):
+        self._lock = threading.Lock()
+        self._snapshots = {}
+        self._skip_ids = frozenset(id(obj) for obj in shared_objects)
+        self._shared_objects = tuple(shared_objects)  # Keep them alive so their ids stay valid
+        self._last_log = 0.0
+
+    def record(self, session_id, profile, session_state, force=False, now=None):
+        """Measure a session if its last snapshot is older than SNAPSHOT_INTERVAL"""
+        now = now or time.time()
+        previous = self._snapshots.get(session_id)
+        if previous and not force and now - previous.taken_at < SNAPSHOT_INTERVAL:
+            return previous
+
+        sizes = session_key_sizes(session_state, self._skip_ids)
+        snapshot = SessionSnapshot(session_id, profile, session_state.get('page'),
+                                   sizes, sum(sizes.values()), now)
+        with self._lock:
+            self._snapshots[session_id] = snapshot
+        self.maybe_log(now)
+        return snapshot
+
+    def sessions(self, now=None):
+        """Snapshots of sessions seen within SESSION_TTL, heaviest first"""
+        now = now or time.time()
+        with self._lock:
+            for session_id in [sid for sid, snap in self._snapshots.items() if now - snap.taken_at > SESSION_TTL]:
+                del self._snapshots[session_id]
+            snapshots = list(self._snapshots.values())
+        return sorted(snapshots, key=lambda snap: snap.total, reverse=True)
+
+    def key_totals(self, now=None):
+        """Bytes per session-state key summed over active sessions, largest first"""
+        totals = {}
+        for snapshot in self.sessions(now):
+            for key, size in snapshot.sizes.items():
+                totals[key] = totals.get(key, 0) + size
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def maybe_log(self, now=None):
+        """Log a one-line process summary at most every LOG_INTERVAL seconds"""
+        now = now or time.time()
+        with self._lock:
+            if now - self._last_log < LOG_INTERVAL:
+                return
+            self._last_log = now
+        sessions = self.sessions(now)
+        top_keys = ", ".join(f"{key}={format_bytes(size)}" for key, size in list(self.key_totals(now).items())[:5])
+        logger.info("session memory: sessions=%d total=%s top=[%s]",
+                    len(sessions), format_bytes(sum(snap.total for snap in sessions)), top_keys)
+
+
+@lru_cache(maxsize=None)
+def get_memory_monitor():
+    """Return the process-wide memory monitor"""
+    from distractors import get_distractor_pools
+    from flashcard_scheduler import vocabulary_pools
+    from grammar_search import get_grammar_search_index
+    from grammar_store import get_grammar_store
+    from quiz_selection import get_vocabulary_features
+    from sentence_corpus import get_sentence_corpus
+    from translation_lookup import get_translation_lookup
+    from vocabulary_index import get_vocabulary_index
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    vocabulary = get_vocabulary_index()
+    return MemoryMonitor([vocabulary, vocabulary_pools(vocabulary), get_translation_lookup(),
+                          get_sentence_corpus(), get_grammar_store(), get_grammar_search_index(),
+                          get_distractor_pools(), get_vocabulary_features()])
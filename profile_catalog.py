@@ -0,0 +1,120 @@
+"""
+Profile Catalog for Indonesian Learning
+One small index of every profile so the login screen never opens full progress files
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+from safe_files import atomic_write_json, file_lock
+
+CATALOG_FILENAME = "profile_catalog.json"
+
+
+class ProfileCatalog:
+    """Name -> {words_learned, last_activity}, kept in one JSON file.
+
+    Snapshot saves and reviews update the entry for the profile they just
+    wrote, so listing profiles is a single small read. If the catalog file
+    is missing it is rebuilt once from the storage backend. The file is
+    re-read only when its modification time changes (another session
+    saved). One instance is shared by every session thread in the process,
+    so the in-memory entries are guarded by a lock.
+    """
+
+    def __init__(self, path, storage):
+        self.path = path
+        self.storage = storage
+        self._entries = None
+        self._mtime = None
+        self._lock = threading.RLock()
+
+    def _load(self):
+        """Current entries, reloading the file only if it changed"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            if self._entries is None:
+                self.rebuild()
+            return self._entries
+
+        if self._entries is None or mtime != self._mtime:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                self._mtime = mtime
+            except (OSError, ValueError):
+                self.rebuild()
+        return self._entries
+
+    def _write(self):
+        """Write the catalog atomically so readers never see half of it"""
+        atomic_write_json(self.path, self._entries, indent=2, sort_keys=True)
+        self._mtime = os.path.getmtime(self.path)
+
+    def _locked(self):
+        """Lock the catalog and re-read it so updates from other workers are not lost"""
+        self._mtime = None
+        return file_lock(self.path + ".lock")
+
+    def rebuild(self):
+        """Recreate the catalog from the storage backend's profile summaries"""
+        entries = {}
+        for profile_name, words_learned, last_activity in self.storage.profile_summaries():
+            entries[profile_name] = {
+                'words_learned': words_learned,
+                'last_activity': last_activity.isoformat()
+            }
+        self._entries = entries
+        self._write()
+        return entries
+
+    def __contains__(self, profile_name):
+        with self._lock:
+            return profile_name in self._load()
+
+    def entry(self, profile_name):
+        """Catalog entry for a profile, or None"""
+        with self._lock:
+            return self._load().get(profile_name)
+
+    def profiles(self):
+        """Public profile summaries for the login screen"""
+        with self._lock:
+            return [{
+                'name': name,
+                'words_learned': entry.get('words_learned', 0),
+                'last_activity': entry.get('last_activity')
+            } for name, entry in sorted(self._load().items())]
+
+    def update(self, profile_name, words_learned, last_activity=None):
+        """Record a profile's latest summary (last_activity is kept to the day, so most reviews write nothing)"""
+        last_activity = (last_activity or datetime.now()).isoformat()
+        with self._lock:
+            current = self._load().get(profile_name)
+            if (current and current.get('words_learned') == words_learned
+                    and current.get('last_activity', '')[:10] == last_activity[:10]):
+                return
+            with self._locked():
+                entries = self._load()
+                entries[profile_name] = {
+                    'words_learned': words_learned,
+                    'last_activity': last_activity
+                }
+                self._write()
+
+    def remove(self, profile_name):
+        """Drop a deleted profile from the catalog"""
+        with self._lock, self._locked():
+            entries = self._load()
+            if entries.pop(profile_name, None) is not None:
+                self._write()
+
+
+@lru_cache(maxsize=None)
+def get_profile_catalog(path, storage):
+    """Return the process-wide catalog for a storage backend"""
+    return ProfileCatalog(path, storage)
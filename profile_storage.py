@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Profile Storage for Indonesian Learning
+Pluggable persistence for progress and flashcards: JSON files or an embedded SQLite database
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+
+from credentials import LEGACY_PIN_FIELDS, get_credential_store, legacy_pin
+from flashcard_state import FlashcardDeck
+from vocabulary_index import get_vocabulary_index
+from review_journal import ReviewJournal, apply_review_record, next_journal_sequence
+from safe_files import atomic_write_json, atomic_write_text, profile_lock
+
+STORAGE_BACKENDS = ('json', 'sqlite')
+DEFAULT_BACKEND = os.environ.get('PROFILE_STORAGE', 'json')
+SQLITE_FILENAME = "profiles.db"
+PROFILES_DIRNAME = "profiles"
+
+PROGRESS_SETS = ('words_learned', 'weak_words', 'mastered_words')
+SET_FLAGS = {'words_learned': 1, 'weak_words': 2, 'mastered_words': 4}
+
+# Flashcard scheduling columns (word content comes from the vocabulary)
+CARD_COLUMNS = ('next_review', 'interval', 'ease_factor', 'review_count', 'correct_streak')
+DETAIL_COLUMNS = ('first_learned', 'total_reviews', 'correct_reviews', 'mastery_level', 'last_reviewed')
+
+
+class ProfileConflictError(Exception):
+    """The profile was written by another worker since this session loaded it"""
+
+    def __init__(self, profile_name, expected_version, stored_version):
+        super().__init__(f"Profile '{profile_name}' is at version {stored_version}, "
+                         f"this session expected {expected_version}")
+        self.profile_name = profile_name
+        self.expected_version = expected_version
+        self.stored_version = stored_version
+
+
+def check_version(profile_name, expected_version, stored_version):
+    """Raise ProfileConflictError unless the stored version is the one the caller loaded"""
+    if expected_version is not None and expected_version != stored_version:
+        raise ProfileConflictError(profile_name, expected_version, stored_version)
+
+
+def progress_to_json(progress):
+    """Progress dict -> JSON-safe dict (sets to lists, dates to ISO, no PIN fields)"""
+    data = {}
+    for key, value in progress.items():
+        if key in LEGACY_PIN_FIELDS:
+            continue
+        if isinstance(value, set):
+            value = list(value)
+        elif key == 'last_study_date' and value:
+            value = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+        data[key] = value
+    return data
+
+
+def progress_from_json(data):
+    """Inverse of progress_to_json"""
+    for key, value in data.items():
+        if key in PROGRESS_SETS and isinstance(value, list):
+            data[key] = set(value)
+        elif key == 'last_study_date' and value:
+            try:
+                data[key] = datetime.fromisoformat(value).date()
+            except (TypeError, ValueError):
+                data[key] = None
+    return data
+
+
+def _review_time(value):
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now()
+    return value
+
+
+def flashcards_to_json(flashcards):
+    """Deck -> {word id: compact scheduling record}"""
+    if not isinstance(flashcards, FlashcardDeck):
+        flashcards = FlashcardDeck(flashcards)
+    return flashcards.to_json()
+
+
+def flashcards_from_json(data):
+    """Inverse of flashcards_to_json (also reads old {word: full card dict} files)"""
+    return FlashcardDeck.from_json(data)
+
+
+class ProfileStorage:
+    """What save_profile_data and load_profile_data need from a backend.
+
+    Backends take and return the in-memory shapes the app uses (sets for the
+    word sets, a date for last_study_date, datetimes for next_review).
+    Every write bumps the profile's version; passing the version a session
+    loaded as expected_version makes a write fail with ProfileConflictError
+    instead of overwriting another worker's changes (None skips the check).
+    """
+
+    name = None
+
+    def load(self, profile_name):
+        """Return (progress, flashcards, version); progress/flashcards are None if nothing is stored"""
+        raise NotImplementedError
+
+    def save(self, profile_name, progress, flashcards, expected_version=None):
+        """Store a full snapshot of a profile; returns the new version"""
+        raise NotImplementedError
+
+    def record_review(self, profile_name, record, progress, flashcards, expected_version=None):
+        """Persist one flashcard review (record comes from make_review_record); returns the new version.
+
+        Only the reviewed word is guaranteed to be written - other changes to
+        progress or flashcards (resets, profile edits) need a save().
+        """
+        raise NotImplementedError
+
+    def delete(self, profile_name):
+        """Remove everything stored for a profile"""
+        raise NotImplementedError
+
+    def profile_names(self):
+        """Names of every stored profile"""
+        raise NotImplementedError
+
+    def profile_summaries(self):
+        """(name, words learned, last activity) for every stored profile"""
+        raise NotImplementedError
+
+
+class JsonProfileStorage(ProfileStorage):
+    """progress.json and flashcards.json per profile, with a review journal between snapshots.
+
+    Snapshot files are replaced atomically, and every read-modify-write of a
+    profile holds an advisory lock on the profile directory, so several
+    worker processes can share one user_data directory.
+    """
+
+    name = 'json'
+
+    def __init__(self, profiles_dir):
+        self.profiles_dir = profiles_dir
+        self._journals = {}
+
+    def _profile_dir(self, profile_name):
+        return os.path.join(self.profiles_dir, profile_name)
+
+    def _files(self, profile_name):
+        profile_dir = self._profile_dir(profile_name)
+        return {
+            'progress': os.path.join(profile_dir, "progress.json"),
+            'flashcards': os.path.join(profile_dir, "flashcards.json"),
+            'journal': os.path.join(profile_dir, "reviews.jsonl"),
+            'version': os.path.join(profile_dir, "version")
+        }
+
+    def _read_version(self, profile_name):
+        """Current version: the version file, or the newest journaled review if that is later"""
+        return max(self._read_version_file(profile_name), self.journal(profile_name).last_version())
+
+    def _read_version_file(self, profile_name):
+        try:
+            with open(self._files(profile_name)['version'], 'r') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _write_version(self, profile_name, version):
+        atomic_write_text(self._files(profile_name)['version'], str(version))
+
+    def journal(self, profile_name):
+        """Review journal for a profile (one object per process)"""
+        if profile_name not in self._journals:
+            self._journals[profile_name] = ReviewJournal(self._files(profile_name)['journal'])
+        return self._journals[profile_name]
+
+    def load(self, profile_name):
+        files = self._files(profile_name)
+        if not os.path.isdir(self._profile_dir(profile_name)):
+            return None, None, 0
+
+        with profile_lock(self._profile_dir(profile_name)):
+            records = self.journal(profile_name).read()
+            version = self._read_version(profile_name)
+            progress = flashcards = None
+            if os.path.exists(files['progress']):
+                with open(files['progress'], 'r') as f:
+                    progress = progress_from_json(json.load(f))
+            if os.path.exists(files['flashcards']):
+                with open(files['flashcards'], 'r') as f:
+                    flashcards = flashcards_from_json(json.load(f))
+
+            # Replay reviews journaled since the last snapshot (skipping any it already has), then fold them in
+            if records and progress is not None:
+                if flashcards is None:
+                    flashcards = FlashcardDeck()
+                for record in records:
+                    apply_review_record(record, progress, flashcards)
+                # Same content as the snapshot plus journal, so sessions at this version stay valid
+                self._save_locked(profile_name, progress, flashcards, version)
+        return progress, flashcards, version
+
+    def _save_locked(self, profile_name, progress, flashcards, version):
+        """Write a snapshot stamped with `version`; the caller holds the profile lock.
+
+        progress.json is written last: it records the last journal sequence
+        folded in, so a crash before it replays the journal onto the old
+        progress (card fields in records are absolute), and a crash after
+        it skips the records the snapshot already holds.
+        """
+        files = self._files(profile_name)
+        atomic_write_json(files['flashcards'], flashcards_to_json(flashcards), separators=(',', ':'))
+        atomic_write_json(files['progress'], progress_to_json(progress), indent=2, default=str)
+        if version != self._read_version_file(profile_name):
+            self._write_version(profile_name, version)
+        # The snapshot now contains every journaled review
+        self.journal(profile_name).clear()
+        return version
+
+    def save(self, profile_name, progress, flashcards, expected_version=None):
+        with profile_lock(self._profile_dir(profile_name)):
+            stored_version = self._read_version(profile_name)
+            check_version(profile_name, expected_version, stored_version)
+            return self._save_locked(profile_name, progress, flashcards, stored_version + 1)
+
+    def record_review(self, profile_name, record, progress, flashcards, expected_version=None):
+        with profile_lock(self._profile_dir(profile_name)):
+            stored_version = self._read_version(profile_name)
+            check_version(profile_name, expected_version, stored_version)
+            journal = self.journal(profile_name)
+            record['q'] = next_journal_sequence(progress)
+            record['v'] = stored_version + 1  # The version file only changes with snapshots
+            journal.append(record)
+            if journal.needs_compaction():
+                # Fold the journal into a fresh snapshot (which also clears the journal)
+                return self._save_locked(profile_name, progress, flashcards, stored_version + 1)
+            return stored_version + 1
+
+    def delete(self, profile_name):
+        with profile_lock(self._profile_dir(profile_name)):
+            for path in self._files(profile_name).values():
+                if os.path.exists(path):
+                    os.remove(path)
+        self._journals.pop(profile_name, None)
+
+    def profile_names(self):
+        if not os.path.isdir(self.profiles_dir):
+            return []
+        return sorted(name for name in os.listdir(self.profiles_dir)
+                      if os.path.isfile(self._files(name)['progress']))
+
+    def profile_summaries(self):
+        for name in self.profile_names():
+            progress_path = self._files(name)['progress']
+            try:
+                with open(progress_path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            last_activity = datetime.fromtimestamp(os.path.getmtime(progress_path))
+            yield name, len(data.get('words_learned', [])), last_activity
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    progress TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS flashcards (
+    profile TEXT NOT NULL,
+    word TEXT NOT NULL,
+    next_review TEXT,
+    interval INTEGER,
+    ease_factor REAL,
+    review_count INTEGER,
+    correct_streak INTEGER,
+    extra TEXT,
+    PRIMARY KEY (profile, word)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS word_details (
+    profile TEXT NOT NULL,
+    word TEXT NOT NULL,
+    first_learned TEXT,
+    total_reviews INTEGER,
+    correct_reviews INTEGER,
+    mastery_level INTEGER,
+    last_reviewed TEXT,
+    difficulty_history TEXT,
+    PRIMARY KEY (profile, word)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS word_sets (
+    profile TEXT NOT NULL,
+    word TEXT NOT NULL,
+    flags INTEGER NOT NULL,
+    PRIMARY KEY (profile, word)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteProfileStorage(ProfileStorage):
+    """All profiles in one SQLite database (WAL mode), one row per card, word and review.
+
+    Flashcards, word details and word-set membership are rows keyed by
+    (profile, word), so a review touches only the rows for that word - there
+    is no journal and no compaction. Review events are not stored here: the
+    app keeps them in the profile's study history file for every backend.
+    The rest of the progress dict (streaks, settings, quiz scores) is a
+    small JSON blob on the profile row, next to the version stamp. Writes run in BEGIN
+    IMMEDIATE transactions, so the version check and the write are atomic
+    across processes sharing the database file.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        """One connection per thread (Streamlit runs sessions on worker threads)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit mode - transactions are opened explicitly by _write()
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(profiles)")]
+            if 'version' not in columns:
+                connection.execute("ALTER TABLE profiles ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            # Databases from before the study history file duplicated every review here
+            connection.execute("DROP TABLE IF EXISTS reviews")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _write(self, profile_name, expected_version):
+        """Write transaction that holds the database write lock from the version check to commit"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT version FROM profiles WHERE name = ?", (profile_name,)).fetchone()
+            stored_version = row[0] if row else 0
+            check_version(profile_name, expected_version, stored_version)
+            yield connection, stored_version + 1
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _profile_blob(progress):
+        """Progress without the parts that live in their own tables"""
+        data = progress_to_json(progress)
+        data.pop('learned_words_details', None)
+        for key in PROGRESS_SETS:
+            data.pop(key, None)
+        return json.dumps(data, default=str)
+
+    @staticmethod
+    def _card_row(profile_name, word, card):
+        next_review = card.get('next_review')
+        return (profile_name, word,
+                _review_time(next_review).isoformat() if next_review else None,
+                card.get('interval'), card.get('ease_factor'),
+                card.get('review_count'), card.get('correct_streak'),
+                None)
+
+    @staticmethod
+    def _detail_row(profile_name, word, details):
+        return (profile_name, word) + tuple(details.get(column) for column in DETAIL_COLUMNS) + (
+            json.dumps(details.get('difficulty_history', [])),)
+
+    @staticmethod
+    def _flags(progress, word):
+        return sum(flag for key, flag in SET_FLAGS.items() if word in progress.get(key, ()))
+
+    def _upsert_profile(self, connection, profile_name, progress, version):
+        connection.execute(
+            "INSERT INTO profiles (name, progress, updated_at, version) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET progress = excluded.progress, "
+            "updated_at = excluded.updated_at, version = excluded.version",
+            (profile_name, self._profile_blob(progress), datetime.now().isoformat(), version))
+
+    def load(self, profile_name):
+        connection = self._connection()
+        # One read transaction so every table is seen at the same version
+        connection.execute("BEGIN")
+        try:
+            return self._load(connection, profile_name)
+        finally:
+            connection.execute("COMMIT")
+
+    def _load(self, connection, profile_name):
+        row = connection.execute("SELECT progress, version FROM profiles WHERE name = ?", (profile_name,)).fetchone()
+        if row is None:
+            return None, None, 0
+
+        progress, version = json.loads(row[0]), row[1]
+        for key in PROGRESS_SETS:
+            progress[key] = set()
+        for word, flags in connection.execute(
+                "SELECT word, flags FROM word_sets WHERE profile = ?", (profile_name,)):
+            for key, flag in SET_FLAGS.items():
+                if flags & flag:
+                    progress[key].add(word)
+
+        details = {}
+        for row in connection.execute(
+                "SELECT word, " + ", ".join(DETAIL_COLUMNS) + ", difficulty_history "
+                "FROM word_details WHERE profile = ?", (profile_name,)):
+            entry = dict(zip(DETAIL_COLUMNS, row[1:-1]))
+            entry['difficulty_history'] = json.loads(row[-1]) if row[-1] else []
+            details[row[0]] = entry
+        progress['learned_words_details'] = details
+
+        vocabulary = get_vocabulary_index()
+        flashcards = FlashcardDeck()
+        for row in connection.execute(
+                "SELECT word, " + ", ".join(CARD_COLUMNS) + " FROM flashcards WHERE profile = ?",
+                (profile_name,)):
+            if row[0] in vocabulary:
+                flashcards[row[0]] = dict(zip(CARD_COLUMNS, row[1:]))
+        return progress_from_json(progress), flashcards, version
+
+    def save(self, profile_name, progress, flashcards, expected_version=None):
+        words = set()
+        for key in PROGRESS_SETS:
+            words.update(progress.get(key, ()))
+        with self._write(profile_name, expected_version) as (connection, version):
+            self._upsert_profile(connection, profile_name, progress, version)
+            for table in ('flashcards', 'word_details', 'word_sets'):
+                connection.execute(f"DELETE FROM {table} WHERE profile = ?", (profile_name,))
+            connection.executemany(
+                "INSERT INTO flashcards VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._card_row(profile_name, word, card) for word, card in flashcards.items()])
+            connection.executemany(
+                "INSERT INTO word_details VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._detail_row(profile_name, word, details)
+                 for word, details in progress.get('learned_words_details', {}).items()])
+            connection.executemany(
+                "INSERT INTO word_sets VALUES (?, ?, ?)",
+                [(profile_name, word, self._flags(progress, word)) for word in words])
+        return version
+
+    def record_review(self, profile_name, record, progress, flashcards, expected_version=None):
+        word = record['w']
+        with self._write(profile_name, expected_version) as (connection, version):
+            connection.execute("INSERT OR REPLACE INTO flashcards VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               self._card_row(profile_name, word, flashcards[word]))
+            connection.execute("INSERT OR REPLACE INTO word_details VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               self._detail_row(profile_name, word, progress['learned_words_details'][word]))
+            flags = self._flags(progress, word)
+            if flags:
+                connection.execute("INSERT OR REPLACE INTO word_sets VALUES (?, ?, ?)",
+                                   (profile_name, word, flags))
+            else:
+                connection.execute("DELETE FROM word_sets WHERE profile = ? AND word = ?",
+                                   (profile_name, word))
+            self._upsert_profile(connection, profile_name, progress, version)
+        return version
+
+    def delete(self, profile_name):
+        with self._write(profile_name, None) as (connection, version):
+            for table in ('flashcards', 'word_details', 'word_sets'):
+                connection.execute(f"DELETE FROM {table} WHERE profile = ?", (profile_name,))
+            connection.execute("DELETE FROM profiles WHERE name = ?", (profile_name,))
+
+    def profile_names(self):
+        return [row[0] for row in self._connection().execute("SELECT name FROM profiles ORDER BY name")]
+
+    def profile_summaries(self):
+        rows = self._connection().execute(
+            "SELECT p.name, p.updated_at, "
+            "(SELECT COUNT(*) FROM word_sets s WHERE s.profile = p.name AND s.flags & ?) "
+            "FROM profiles p ORDER BY p.name", (SET_FLAGS['words_learned'],)).fetchall()
+        for name, updated_at, words_learned in rows:
+            yield name, words_learned, datetime.fromisoformat(updated_at)
+
+
+def make_storage(backend, data_dir="user_data"):
+    """Build a storage backend by name"""
+    if backend == 'json':
+        return JsonProfileStorage(os.path.join(data_dir, PROFILES_DIRNAME))
+    if backend == 'sqlite':
+        return SqliteProfileStorage(os.path.join(data_dir, SQLITE_FILENAME))
+    raise ValueError(f"Unknown profile storage backend '{backend}' (expected one of {', '.join(STORAGE_BACKENDS)})")
+
+
+@lru_cache(maxsize=None)
+def get_profile_storage(backend=DEFAULT_BACKEND, data_dir="user_data"):
+    """Return the process-wide storage backend for a data directory"""
+    return make_storage(backend, data_dir)
+
+
+def migrate(source, target, profile_names=None, data_dir="user_data"):
+    """Copy profiles from one backend to another; returns the names copied.
+
+    Credentials and study history are not part of either backend: they stay
+    in each profile's folder under <data_dir>/profiles for every backend.
+    A PIN still kept in an old progress file is moved into its credential
+    record first, because no backend stores it and logging in would
+    otherwise depend on the old progress.json.
+    """
+    credential_store = get_credential_store(os.path.join(data_dir, PROFILES_DIRNAME))
+    copied = []
+    for name in profile_names or source.profile_names():
+        progress, flashcards, version = source.load(name)
+        if progress is None:
+            continue
+        pin_code = legacy_pin(progress)
+        if pin_code and credential_store.get(name) is None:
+            credential_store.set_pin(name, pin_code)
+        target.save(name, progress, flashcards or {})
+        copied.append(name)
+    return copied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copy learner profiles between storage backends")
+    parser.add_argument('source', choices=STORAGE_BACKENDS)
+    parser.add_argument('target', choices=STORAGE_BACKENDS)
+    parser.add_argument('--data-dir', default="user_data")
+    parser.add_argument('--profile', action='append', help="Only migrate this profile (repeatable)")
+    args = parser.parse_args(argv)
+
+    if args.source == args.target:
+        parser.error("source and target must differ")
+
+    print(f"🔄 Migrating profiles: {args.source} -> {args.target} ({args.data_dir})")
+    copied = migrate(make_storage(args.source, args.data_dir),
+                     make_storage(args.target, args.data_dir), args.profile, args.data_dir)
+    for name in copied:
+        print(f"   ✅ {name}")
+    print(f"🎯 Migrated {len(copied)} profile(s)")
+    print(f"⚠️  Keep {os.path.join(args.data_dir, PROFILES_DIRNAME)}: PINs (credentials.json) and study history "
+          f"(study_history.bin) stay there for every backend")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
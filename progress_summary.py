@@ -0,0 +1,93 @@
+"""
+Progress Summary for Indonesian Learning
+Dashboard aggregates kept up to date one review at a time instead of recomputed on every render
+"""
+
+from datetime import datetime
+
+MAX_MASTERY = 10
+# Days of per-day review counts seeded from the study history
+SUMMARY_DAYS = 30
+
+
+class ProgressSummary:
+    """Running totals over one learner's progress.
+
+    Built once from user_progress (and the study history for per-day
+    counts), then updated by record_review after each rating:
+    - learned words per level and per category
+    - reviews per calendar day
+    - words per mastery level (0-10), kept as insertion-ordered buckets,
+      so the histogram and the top-k most mastered words are read without
+      touching the other words (mastery is a small integer, so buckets
+      stand in for a heap with no stale entries to skip)
+    """
+
+    def __init__(self, user_progress, vocabulary, history=None, now=None):
+        self._source = user_progress
+        self._vocabulary = vocabulary
+        self._learned = set()
+        self.level_counts = dict.fromkeys(vocabulary.levels, 0)
+        self.category_counts = dict.fromkeys(vocabulary.categories, 0)
+        self.daily_reviews = dict(history.daily_counts(SUMMARY_DAYS, now)) if history is not None else {}
+        self._mastery = {}
+        self._buckets = [{} for _ in range(MAX_MASTERY + 1)]
+
+        for word in user_progress.get('words_learned', ()):
+            self._add_learned(word)
+        for word, details in user_progress.get('learned_words_details', {}).items():
+            self._set_mastery(word, details.get('mastery_level', 0))
+
+    def tracks(self, user_progress):
+        """True if this summary was built for the given progress object"""
+        return self._source is user_progress
+
+    def _add_learned(self, word):
+        if word in self._learned:
+            return
+        self._learned.add(word)
+        for level in self._vocabulary.levels_of(word):
+            self.level_counts[level] += 1
+        for category in {category for _, category in self._vocabulary.placements(word)}:
+            self.category_counts[category] += 1
+
+    def _set_mastery(self, word, mastery):
+        mastery = min(max(int(mastery), 0), MAX_MASTERY)
+        previous = self._mastery.get(word)
+        if previous == mastery:
+            return
+        if previous is not None:
+            del self._buckets[previous][word]
+        self._buckets[mastery][word] = None
+        self._mastery[word] = mastery
+
+    def record_review(self, word, mastery, learned, reviewed_at=None):
+        """Fold one rating in: its day, the word's new mastery level and whether it is now learned"""
+        day = (reviewed_at or datetime.now()).date()
+        self.daily_reviews[day] = self.daily_reviews.get(day, 0) + 1
+        if learned:
+            self._add_learned(word)
+        self._set_mastery(word, mastery)
+
+    @property
+    def learned_count(self):
+        """Number of learned words"""
+        return len(self._learned)
+
+    def reviews_on(self, day=None):
+        """Reviews recorded on a calendar day (default today)"""
+        return self.daily_reviews.get(day or datetime.now().date(), 0)
+
+    def mastery_histogram(self):
+        """Words per mastery level, index = level"""
+        return [len(bucket) for bucket in self._buckets]
+
+    def top_mastered(self, k=10):
+        """Up to k words with the highest mastery level, as (word, mastery level)"""
+        top = []
+        for mastery in range(MAX_MASTERY, -1, -1):
+            for word in self._buckets[mastery]:
+                if len(top) >= k:
+                    return top
+                top.append((word, mastery))
+        return top
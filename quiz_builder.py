@@ -0,0 +1,93 @@
+"""
+Quiz Builder for Indonesian Learning
+Builds a whole multiple-choice quiz in one pass at quiz start, as plain data that can be saved and replayed from its seed
+"""
+
+import random
+
+from distractors import multiple_choice_options
+from translation_lookup import get_translation_lookup
+from vocabulary_index import get_vocabulary_index
+
+# Sentence-completion questions go on even positions among the first few
+SENTENCE_QUESTION_LIMIT = 6
+DISTRACTOR_COUNT = 3
+
+# Used when a word's example sentence does not contain the word itself
+FALLBACK_SENTENCES = (
+    "Saya melihat ____ di sana.",
+    "Ini adalah ____ yang bagus.",
+    "Mereka membutuhkan ____.",
+    "Dia membeli ____ kemarin.",
+)
+
+
+def question_type(position):
+    """Question type for a position in the quiz"""
+    if position % 2 == 0 and position < SENTENCE_QUESTION_LIMIT:
+        return 'sentence_completion'
+    return 'translation'
+
+
+def _sentence_prompt(word, entry, rng, translation_lookup):
+    example = entry.get('example', f"Saya suka {word}.")
+    if word in example:
+        question_sentence = example.replace(word, "____")
+        translation = translation_lookup.translate(example)
+    else:
+        question_sentence = rng.choice(FALLBACK_SENTENCES)
+        translation = translation_lookup.translate(question_sentence.replace("____", word))
+    return f'Complete the sentence: "{question_sentence}"', f'Translation: "{translation}"'
+
+
+def build_question(word, position, rng, vocabulary=None, translation_lookup=None):
+    """One question dict for a word, or None if the word is not in the vocabulary"""
+    vocabulary = vocabulary or get_vocabulary_index()
+    translation_lookup = translation_lookup or get_translation_lookup()
+    found = vocabulary.lookup(word)
+    if found is None:
+        return None
+    level, entry = found
+    category = entry.get('category', 'general')
+    answer = entry['english']
+
+    question = {
+        'word': word,
+        'type': question_type(position),
+        'level': level,
+        'category': category,
+        'answer': answer,
+    }
+    if question['type'] == 'sentence_completion':
+        question['question'], question['translation'] = _sentence_prompt(word, entry, rng, translation_lookup)
+    else:
+        question['question'] = f'What does "{word}" mean in English?'
+    question['options'] = multiple_choice_options(answer, level=level, category=category,
+                                                  k=DISTRACTOR_COUNT, rng=rng)
+    return question
+
+
+def build_quiz(words, seed=None):
+    """A complete quiz for the given words: questions, options, answer keys and translations.
+
+    The result is plain dicts and lists (JSON-serializable). Passing the
+    same seed and words rebuilds the identical quiz; without a seed one is
+    chosen and recorded in the quiz.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = random.Random(seed)
+    vocabulary = get_vocabulary_index()
+    translation_lookup = get_translation_lookup()
+
+    questions = []
+    for word in words:
+        question = build_question(word, len(questions), rng, vocabulary, translation_lookup)
+        if question is not None:
+            questions.append(question)
+    return {'seed': seed, 'words': [q['word'] for q in questions], 'questions': questions}
+
+
+def grade(question, selected):
+    """True if the selected option is the question's answer"""
+    return selected == question['answer']
@@ -0,0 +1,162 @@
+"""
+Quiz Selection for Indonesian Learning
+Picks quiz words by weighted sampling without replacement over per-word feature vectors
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from srs_engine import data_version
+from vocabulary_index import get_vocabulary_index
+
+LEVEL_DIFFICULTY = {
+    'Absolute Beginner': 1, 'Beginner': 2, 'Intermediate': 3,
+    'Advanced': 4, 'Expert': 5
+}
+DEFAULT_DIFFICULTY = 3
+
+# Priority terms (higher priority = less likely to be picked)
+RECENCY_WEIGHT = 2.0      # per appearance in a recent quiz
+MASTERY_WEIGHT = 2.0      # fully mastered words (streak >= MASTERY_STREAK) get the whole penalty
+MASTERY_STREAK = 5
+# Larger values flatten the weights towards uniform sampling
+TEMPERATURE = 1.5
+
+# Distinct categories the first pass tries to cover before filling freely
+CATEGORY_VARIETY = 4
+# Candidates kept from the weighted draw for the category-variety pass, per question
+CANDIDATES_PER_QUESTION = 8
+
+
+class VocabularyFeatures:
+    """Read-only per-word arrays aligned with the vocabulary index's word order"""
+
+    def __init__(self, vocabulary):
+        self.words = vocabulary.words
+        self.position = {word: i for i, word in enumerate(self.words)}
+        categories = sorted({entry.get('category', 'general') for entry in
+                             (vocabulary.entry(word) for word in self.words)})
+        category_code = {category: code for code, category in enumerate(categories)}
+
+        self.difficulty = np.array(
+            [LEVEL_DIFFICULTY.get(vocabulary.level_of(word), DEFAULT_DIFFICULTY) for word in self.words],
+            dtype=np.float64)
+        self.category = np.array(
+            [category_code[vocabulary.entry(word).get('category', 'general')] for word in self.words],
+            dtype=np.int32)
+        # Shared by every session
+        self.difficulty.flags.writeable = False
+        self.category.flags.writeable = False
+
+    def positions(self, words):
+        """Array positions of the words that are in the vocabulary (unknown words are dropped)"""
+        position = self.position
+        return np.fromiter((position[word] for word in words if word in position), dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def get_vocabulary_features():
+    """Return the process-wide feature arrays, building them on first use"""
+    return VocabularyFeatures(get_vocabulary_index())
+
+
+def selection_weights(positions, recent_counts, mastery, features):
+    """Sampling weight per candidate: recently quizzed and mastered words are picked less"""
+    priority = (RECENCY_WEIGHT * recent_counts
+                + (5 - features.difficulty[positions])
+                + MASTERY_WEIGHT * mastery)
+    return np.exp(-(priority - priority.min()) / TEMPERATURE)
+
+
+class LearnerFeatures:
+    """One learner's per-word arrays, aligned with the vocabulary features.
+
+    learned marks the learned words and streak holds each word's correct
+    streak (0 for words without a card). Built once from progress and the
+    deck, then updated by record_review after each rating, so building a
+    quiz never loops over the learned words. The arrays remember the
+    progress data version they match; anything else that changes progress
+    or the deck (resets, imports) bumps it and the arrays are rebuilt.
+    """
+
+    def __init__(self, user_progress, flashcard_data, features=None):
+        self._features = features or get_vocabulary_features()
+        self._source = user_progress
+        self._deck = flashcard_data
+        self._version = data_version(user_progress)
+
+        size = len(self._features.words)
+        self.learned = np.zeros(size, dtype=bool)
+        self.learned[self._features.positions(user_progress.get('words_learned', ()))] = True
+        self.streak = np.zeros(size, dtype=np.float64)
+        reviewed = list(flashcard_data or ())
+        self.streak[self._features.positions(reviewed)] = [
+            flashcard_data[word]['correct_streak'] for word in reviewed if word in self._features.position]
+
+    def tracks(self, user_progress, flashcard_data):
+        """True if these arrays are current for the given progress and deck"""
+        return (self._source is user_progress and self._deck is flashcard_data
+                and self._version == data_version(user_progress))
+
+    def record_review(self, word, correct_streak, learned):
+        """Fold one rating in: the word's new correct streak and whether it is now learned"""
+        position = self._features.position.get(word)
+        if position is not None:
+            self.streak[position] = correct_streak
+            if learned:
+                self.learned[position] = True
+        self._version = data_version(self._source)
+
+    @property
+    def learned_count(self):
+        """Number of learned vocabulary words"""
+        return int(np.count_nonzero(self.learned))
+
+
+def select_quiz_words(learner, recent_quizzes=(), num_questions=8, rng=None):
+    """Choose quiz words from a learner's learned words (a LearnerFeatures).
+
+    Words are drawn without replacement with probability proportional to
+    their weight (Efraimidis-Spirakis keys, one vectorized pass), then the
+    best-ranked candidates are ordered so the first questions cover several
+    categories. Nothing shared is modified.
+    """
+    features = get_vocabulary_features()
+    rng = rng if rng is not None else np.random.default_rng()
+
+    positions = np.flatnonzero(learner.learned)
+    if positions.size == 0:
+        return []
+
+    # Number of recent quizzes each word appeared in, for the whole vocabulary at once
+    recent_positions = features.positions(word for quiz_words in recent_quizzes for word in set(quiz_words))
+    recent_counts = np.bincount(recent_positions, minlength=len(features.words))[positions].astype(np.float64)
+    # Correct-streak mastery in [0, 1]
+    mastery = np.minimum(learner.streak[positions], MASTERY_STREAK) / MASTERY_STREAK
+    weights = selection_weights(positions, recent_counts, mastery, features)
+
+    # Weighted sampling without replacement: the k largest log(u) / w
+    keys = np.log(rng.random(positions.size)) / weights
+    candidate_count = min(positions.size, num_questions * CANDIDATES_PER_QUESTION)
+    candidates = np.argpartition(-keys, candidate_count - 1)[:candidate_count]
+    candidates = candidates[np.argsort(-keys[candidates])]
+
+    # First pass: get diverse categories; second pass: fill remaining slots in draw order
+    selected = []
+    used_categories = set()
+    for i in candidates:
+        if len(selected) >= num_questions:
+            break
+        category = int(features.category[positions[i]])
+        if category not in used_categories or len(used_categories) >= CATEGORY_VARIETY:
+            selected.append(int(i))
+            used_categories.add(category)
+    chosen = set(selected)
+    for i in candidates:
+        if len(selected) >= num_questions:
+            break
+        if int(i) not in chosen:
+            selected.append(int(i))
+
+    return [features.words[positions[i]] for i in selected]
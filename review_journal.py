@@ -0,0 +1,218 @@
+"""
+Review Journal for Indonesian Learning
+Append-only, per-profile log of flashcard ratings that is folded into the profile snapshot
+"""
+
+import json
+import os
+from datetime import datetime, date
+
+from srs_engine import bump_data_version
+
+# Fold the journal into the snapshot once it holds this many reviews
+JOURNAL_COMPACTION_THRESHOLD = 200
+
+# Progress key holding the sequence number of the last journal record folded in
+JOURNAL_SEQUENCE_KEY = 'journal_sequence'
+
+DIFFICULTY_CODES = {'easy': 'e', 'medium': 'm', 'hard': 'h'}
+DIFFICULTY_NAMES = {code: name for name, code in DIFFICULTY_CODES.items()}
+
+# Bit flags for the word's progress sets after the review
+FLAG_LEARNED = 1
+FLAG_WEAK = 2
+FLAG_MASTERED = 4
+
+
+def _epoch(value):
+    """Datetime or ISO string -> integer epoch seconds"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp())
+
+
+def make_review_record(word, difficulty, user_progress, flashcard_data, reviewed_at=None):
+    """Build a compact record of a word's state right after it was rated"""
+    reviewed_at = reviewed_at or datetime.now()
+    card = flashcard_data[word]
+    details = user_progress['learned_words_details'][word]
+
+    flags = 0
+    if word in user_progress['words_learned']:
+        flags |= FLAG_LEARNED
+    if word in user_progress['weak_words']:
+        flags |= FLAG_WEAK
+    if word in user_progress['mastered_words']:
+        flags |= FLAG_MASTERED
+
+    record = {
+        'w': word,
+        't': _epoch(reviewed_at),
+        'd': DIFFICULTY_CODES[difficulty],
+        'n': _epoch(card['next_review']),
+        'i': card['interval'],
+        'e': round(card['ease_factor'], 2),
+        'rc': card['review_count'],
+        'cs': card['correct_streak'],
+        'fl': _epoch(details['first_learned']),
+        'tr': details['total_reviews'],
+        'cr': details['correct_reviews'],
+        'm': details['mastery_level'],
+        's': flags,
+        'k': user_progress.get('daily_streak', 0),
+    }
+    last_study_date = user_progress.get('last_study_date')
+    if isinstance(last_study_date, date):
+        record['sd'] = last_study_date.toordinal()
+    return record
+
+
+def next_journal_sequence(user_progress):
+    """Number the next record for this progress (stored in the progress, so snapshots carry it)"""
+    user_progress[JOURNAL_SEQUENCE_KEY] = user_progress.get(JOURNAL_SEQUENCE_KEY, 0) + 1
+    return user_progress[JOURNAL_SEQUENCE_KEY]
+
+
+def is_applied(record, user_progress):
+    """True if the progress snapshot already contains this record"""
+    sequence = record.get('q')
+    return sequence is not None and sequence <= user_progress.get(JOURNAL_SEQUENCE_KEY, 0)
+
+
+def apply_review_record(record, user_progress, flashcard_data):
+    """Replay one journal record onto loaded progress and flashcards; returns False if it was already applied"""
+    if is_applied(record, user_progress):
+        return False
+    word = record['w']
+    reviewed_at = datetime.fromtimestamp(record['t'])
+    difficulty = DIFFICULTY_NAMES.get(record['d'], record['d'])
+
+    try:
+        card = flashcard_data.materialize(word)  # First review of a word creates its card
+    except KeyError:
+        card = None  # Word no longer in the vocabulary
+    if card is not None:
+        card['next_review'] = datetime.fromtimestamp(record['n'])
+        card['interval'] = record['i']
+        card['ease_factor'] = record['e']
+        card['review_count'] = record['rc']
+        card['correct_streak'] = record['cs']
+
+    learned_words_details = user_progress.setdefault('learned_words_details', {})
+    if word not in learned_words_details:
+        learned_words_details[word] = {
+            'first_learned': datetime.fromtimestamp(record['fl']).isoformat(),
+            'total_reviews': 0,
+            'correct_reviews': 0,
+            'difficulty_history': [],
+            'last_reviewed': None,
+            'mastery_level': 0
+        }
+        user_progress['total_words_learned'] = user_progress.get('total_words_learned', 0) + 1
+    details = learned_words_details[word]
+    details['total_reviews'] = record['tr']
+    details['correct_reviews'] = record['cr']
+    details['mastery_level'] = record['m']
+    details['last_reviewed'] = reviewed_at.isoformat()
+    details['difficulty_history'].append(difficulty)
+
+    for key, flag in [('words_learned', FLAG_LEARNED), ('weak_words', FLAG_WEAK), ('mastered_words', FLAG_MASTERED)]:
+        words = user_progress.setdefault(key, set())
+        if record['s'] & flag:
+            words.add(word)
+        else:
+            words.discard(word)
+
+    user_progress['daily_streak'] = record['k']
+    if 'sd' in record:
+        user_progress['last_study_date'] = date.fromordinal(record['sd'])
+    if 'q' in record:
+        user_progress[JOURNAL_SEQUENCE_KEY] = record['q']
+    bump_data_version(user_progress)
+    return True
+
+
+class ReviewJournal:
+    """Write-ahead log of review records, one compact JSON object per line.
+
+    Records carry a sequence number that the progress snapshot also stores
+    (JOURNAL_SEQUENCE_KEY), so replaying a journal over a snapshot that
+    already contains some of its records skips them. They may also carry
+    the profile version the review produced ('v'), so a review does not
+    need a separate version write.
+
+    The record count and last version are kept in memory together with the
+    file's identity, size and mtime; the file is only read again when
+    another worker changed it. Callers hold the profile lock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._signature = None
+        self._count = 0
+        self._last_version = 0
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _refresh(self):
+        """Recount from disk if the file is not the one this object last wrote or read"""
+        if self._file_signature() != self._signature:
+            self.read()
+
+    def __len__(self):
+        """Records in the journal, including appends by other workers"""
+        self._refresh()
+        return self._count
+
+    def last_version(self):
+        """Profile version stored with the newest record (0 if none carries one)"""
+        self._refresh()
+        return self._last_version
+
+    def append(self, record):
+        """Append one record - the write cost does not depend on deck or journal size"""
+        self._refresh()
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n'
+        with open(self.path, 'ab') as f:
+            f.write(line.encode('utf-8'))
+            f.flush()
+            stat = os.fstat(f.fileno())
+        self._signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        self._count += 1
+        self._last_version = record.get('v', self._last_version)
+
+    def read(self):
+        """Return all records in order, skipping a torn final line"""
+        signature = self._file_signature()
+        records = []
+        if signature is not None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        self._signature = signature
+        self._count = len(records)
+        self._last_version = max((record.get('v', 0) for record in records), default=0)
+        return records
+
+    def needs_compaction(self):
+        """True once the journal is long enough to fold into the snapshot"""
+        return len(self) >= JOURNAL_COMPACTION_THRESHOLD
+
+    def clear(self):
+        """Drop all records (after they were folded into a snapshot)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._signature = None
+        self._count = 0
+        self._last_version = 0
@@ -0,0 +1,140 @@
+"""
+Review Planner for Indonesian Learning
+Forecasts daily review load from the flashcard schedule, with vectorized re-review projection
+"""
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from flashcard_scheduler import parse_review_time
+from srs_engine import apply_ratings
+
+SECONDS_PER_DAY = 86400
+FORECAST_DAYS = 14
+
+# Rating mix assumed when the learner has no recent history
+DEFAULT_OUTCOMES = {'easy': 0.5, 'medium': 0.3, 'hard': 0.2}
+# Simulated copies of the deck averaged into the expected counts
+FORECAST_SAMPLES = 16
+
+# Overdue backlogs are spread over this many days by default
+BACKLOG_DAYS = 7
+
+ReviewForecast = namedtuple('ReviewForecast', ['dates', 'scheduled', 'expected', 'overdue'])
+BacklogPlan = namedtuple('BacklogPlan', ['words', 'next_review', 'kept_today', 'daily_load'])
+
+
+class ScheduleArrays:
+    """Headwords plus next_review, interval and ease_factor for every stored card, as parallel arrays"""
+
+    def __init__(self, flashcard_data, now=None):
+        now = now or datetime.now()
+        self.today = now.date()
+        midnight = datetime.combine(self.today, datetime.min.time()).timestamp()
+        self.words = list(flashcard_data.keys())
+        cards = [flashcard_data[word] for word in self.words]
+        self.next_review = np.fromiter(
+            (parse_review_time(card['next_review']).timestamp() for card in cards),
+            dtype=np.float64, count=len(cards))
+        self.interval = np.fromiter((card['interval'] for card in cards), dtype=np.int64, count=len(cards))
+        self.ease_factor = np.fromiter((card['ease_factor'] for card in cards), dtype=np.float64, count=len(cards))
+        self.midnight = midnight
+        self.overdue_mask = self.next_review <= now.timestamp()
+        self.overdue = int(np.count_nonzero(self.overdue_mask))
+        # Whole days from today; anything already due counts as today
+        self.due_day = np.maximum(np.floor((self.next_review - midnight) / SECONDS_PER_DAY), 0).astype(np.int64)
+
+    def __len__(self):
+        return len(self.interval)
+
+
+def outcome_probabilities(difficulty_counts=None):
+    """(easy, medium, hard) probabilities from recent rating counts, or the defaults"""
+    counts = difficulty_counts or {}
+    total = sum(counts.get(name, 0) for name in DEFAULT_OUTCOMES)
+    source = counts if total else DEFAULT_OUTCOMES
+    total = total or sum(DEFAULT_OUTCOMES.values())
+    return np.array([source.get(name, 0) / total for name in DEFAULT_OUTCOMES], dtype=np.float64)
+
+
+def forecast_reviews(flashcard_data, days=FORECAST_DAYS, now=None, difficulty_counts=None,
+                     samples=FORECAST_SAMPLES, seed=0):
+    """Reviews per day for the next `days` days, starting today.
+
+    `scheduled` counts cards whose current next_review falls on each day
+    (overdue cards land on today). `expected` also includes the re-reviews
+    those reviews cause: every due card is rated with the learner's recent
+    easy/medium/hard mix and rescheduled with the app's rules. The deck is
+    replicated `samples` times and stepped a day at a time with array
+    operations, so the cost is days x cards x samples element operations.
+    New, never-reviewed words are not included.
+    """
+    schedule = ScheduleArrays(flashcard_data, now)
+    dates = [schedule.today + timedelta(days=offset) for offset in range(days)]
+    scheduled = np.bincount(schedule.due_day[schedule.due_day < days], minlength=days)[:days]
+    if not len(schedule) or days <= 0:
+        return ReviewForecast(dates, scheduled, scheduled.astype(np.float64), schedule.overdue)
+
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(outcome_probabilities(difficulty_counts))[:-1]
+    due_day = np.tile(schedule.due_day, samples)
+    interval = np.tile(schedule.interval, samples)
+    ease_factor = np.tile(schedule.ease_factor, samples)
+
+    totals = np.zeros(days, dtype=np.int64)
+    for day in range(days):
+        due = np.flatnonzero(due_day == day)
+        if not due.size:
+            continue
+        totals[day] = due.size
+        ratings = np.searchsorted(cumulative, rng.random(due.size), side='right')
+        interval[due], ease_factor[due] = apply_ratings(interval[due], ease_factor[due], ratings)
+        due_day[due] = day + interval[due]
+    return ReviewForecast(dates, scheduled, totals / samples, schedule.overdue)
+
+
+def plan_backlog(flashcard_data, daily_cap, days=BACKLOG_DAYS, now=None):
+    """Spread overdue cards over the coming days so no day exceeds daily_cap reviews.
+
+    Overdue cards are ranked by how far past due they are relative to
+    interval x ease_factor (fragile, long-overdue cards first) and poured
+    into each day's spare capacity - the cap minus reviews already
+    scheduled that day - starting today. If `days` days cannot hold the
+    backlog the plan runs on past them, still under the cap. Returns the
+    moved words with their new next_review timestamps (cards kept for
+    today are not listed) and the resulting load per day.
+    """
+    schedule = ScheduleArrays(flashcard_data, now)
+    now_ts = (now or datetime.now()).timestamp()
+    daily_cap = max(int(daily_cap), 1)
+    overdue = np.flatnonzero(schedule.overdue_mask)
+
+    # Most at risk first: days overdue per day of interval (scaled by ease)
+    overdue_days = (now_ts - schedule.next_review[overdue]) / SECONDS_PER_DAY
+    risk = overdue_days / (schedule.interval[overdue] * schedule.ease_factor[overdue])
+    ranked = overdue[np.argsort(-risk, kind='stable')]
+
+    not_overdue = schedule.due_day[~schedule.overdue_mask]
+    horizon = max(days, 1)
+    while True:
+        scheduled = np.bincount(not_overdue[not_overdue < horizon], minlength=horizon)
+        capacity = np.clip(daily_cap - scheduled, 0, None)
+        if capacity.sum() >= ranked.size:
+            break
+        horizon += -(-(ranked.size - int(capacity.sum())) // daily_cap)
+
+    slot_day = np.searchsorted(np.cumsum(capacity), np.arange(ranked.size), side='right')
+    daily_load = scheduled + np.bincount(slot_day, minlength=horizon)
+    moved = slot_day > 0
+    next_review = schedule.midnight + slot_day[moved] * SECONDS_PER_DAY
+    words = [schedule.words[i] for i in ranked[moved]]
+    return BacklogPlan(words, next_review, int(ranked.size - moved.sum()), daily_load)
+
+
+def apply_backlog_plan(flashcard_data, plan):
+    """Write a plan's new review times into the cards; returns how many moved"""
+    for word, timestamp in zip(plan.words, plan.next_review.tolist()):
+        flashcard_data[word]['next_review'] = datetime.fromtimestamp(timestamp)
+    return len(plan.words)
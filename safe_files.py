@@ -0,0 +1,69 @@
+"""
+Safe Files for Indonesian Learning
+Atomic replace-on-write and advisory file locks shared by every worker process
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single-worker deployments only
+    fcntl = None
+
+LOCK_FILENAME = ".lock"
+
+
+def atomic_write_text(path, text, encoding='utf-8'):
+    """Write a file so readers see either the old or the new contents, never a mix"""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_bytes(path, data):
+    """Write a binary file atomically"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    # A unique temp name per writer so concurrent workers never share one
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def atomic_write_json(path, data, **dump_options):
+    """Serialize to JSON and write atomically"""
+    atomic_write_text(path, json.dumps(data, **dump_options))
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on a lock file, held for the duration of the block.
+
+    flock locks are per open file, so nesting file_lock on the same path in
+    one process deadlocks - take the lock once at the outermost call.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def profile_lock(profile_dir):
+    """Lock one profile's directory against writers in other processes"""
+    return file_lock(os.path.join(profile_dir, LOCK_FILENAME))
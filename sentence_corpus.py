@@ -0,0 +1,108 @@
+"""
+Shared Sentence Corpus for Indonesian Learning
+Merges every sentence database once per process and serves read-only views of it
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+
+from massive_sentence_database import get_massive_sentence_database
+from mega_sentence_database import get_mega_sentence_database
+from ultimate_sentence_database import get_ultimate_sentence_database
+from premium_sentence_database import get_premium_sentence_database, get_extended_premium_sentences
+
+SENTENCE_LEVELS = ("Beginner", "Intermediate", "Advanced", "Conversational")
+
+SENTENCE_CATEGORIES = (
+    "Greetings & Politeness", "Daily Life", "Family & Relationships", "Food & Dining",
+    "Travel & Transportation", "Shopping & Money", "Work & Education", "Business & Professional",
+    "Culture & Society", "Technology & Innovation", "Casual & Slang", "Emotions & Feelings",
+    "Technology", "Health", "Education"
+)
+
+# Extended context sentences added to every level, per category
+EXTENDED_SENTENCES_PER_CATEGORY = 20
+
+
+def _freeze_sentence(sentence):
+    """Return a read-only copy of a sentence dict (lists become tuples)"""
+    frozen = {}
+    for key, value in sentence.items():
+        frozen[key] = tuple(value) if isinstance(value, list) else value
+    return MappingProxyType(frozen)
+
+
+class SentenceCorpus:
+    """Immutable, merged view over all sentence databases"""
+
+    def __init__(self, databases, extended_sentences):
+        grouped = {}
+        flat = {}
+        by_category = {}
+
+        for level in SENTENCE_LEVELS:
+            grouped[level] = {}
+            level_sentences = []
+            for group in SENTENCE_CATEGORIES:
+                sentences = []
+                for db in databases:
+                    if level in db and group in db[level]:
+                        sentences.extend(db[level][group])
+                if group in extended_sentences:
+                    sentences.extend(extended_sentences[group][:EXTENDED_SENTENCES_PER_CATEGORY])
+
+                frozen = tuple(_freeze_sentence(s) for s in sentences)
+                grouped[level][group] = frozen
+                level_sentences.extend(frozen)
+
+            flat[level] = tuple(level_sentences)
+
+            # Sentences keyed by their own 'category' field, in corpus order
+            level_categories = {}
+            for sentence in level_sentences:
+                level_categories.setdefault(sentence['category'], []).append(sentence)
+            by_category[level] = {cat: tuple(items) for cat, items in level_categories.items()}
+
+        self._grouped = MappingProxyType({level: MappingProxyType(groups) for level, groups in grouped.items()})
+        self._flat = MappingProxyType(flat)
+        self._by_category = MappingProxyType(by_category)
+        self._sentence_categories = MappingProxyType(
+            {level: tuple(sorted(cats)) for level, cats in by_category.items()}
+        )
+        self.total_sentences = sum(len(sentences) for sentences in flat.values())
+
+    @property
+    def levels(self):
+        """Difficulty levels in display order"""
+        return SENTENCE_LEVELS
+
+    @property
+    def categories(self):
+        """Topic groups the corpus is organized by"""
+        return SENTENCE_CATEGORIES
+
+    def sentence_categories(self, level):
+        """Sorted sentence 'category' values available at a level"""
+        return self._sentence_categories.get(level, ())
+
+    def get_grouped(self, level):
+        """Sentences for a level, grouped by topic"""
+        return self._grouped.get(level, MappingProxyType({}))
+
+    def get_sentences(self, level, category=None):
+        """Sentences for a level, optionally restricted to one sentence category"""
+        if category is None or category == "All":
+            return self._flat.get(level, ())
+        return self._by_category.get(level, {}).get(category, ())
+
+
+@lru_cache(maxsize=None)
+def get_sentence_corpus():
+    """Return the process-wide sentence corpus, building it on first use"""
+    databases = [
+        get_massive_sentence_database(),
+        get_mega_sentence_database(),
+        get_ultimate_sentence_database(),
+        get_premium_sentence_database(),
+    ]
+    return SentenceCorpus(databases, get_extended_premium_sentences())
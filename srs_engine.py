@@ -0,0 +1,118 @@
+"""
+SRS Engine for Indonesian Learning
+Pure spaced-repetition rules: how a rating changes a card and the learner's word details, with no Streamlit state
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+MAX_EASE = 2.5
+MIN_EASE = 1.3
+EASE_STEP_EASY = 0.1
+EASE_STEP_HARD = 0.2
+MEDIUM_FACTOR = 0.8
+
+MAX_MASTERY = 10
+MASTERED_AT = 8   # mastery level that moves a word to mastered_words
+WEAK_BELOW = 3    # mastery level under which a hard rating marks a word weak
+
+# Progress key counting changes, so caches can tell when progress moved on
+DATA_VERSION_KEY = 'data_version'
+
+
+def data_version(user_progress):
+    """Monotonic counter of changes to a profile's progress (0 for fresh progress)"""
+    return user_progress.get(DATA_VERSION_KEY, 0)
+
+
+def bump_data_version(user_progress):
+    """Mark the progress as changed; returns the new version"""
+    user_progress[DATA_VERSION_KEY] = data_version(user_progress) + 1
+    return user_progress[DATA_VERSION_KEY]
+
+
+def new_word_details(now=None):
+    """learned_words_details entry for a word reviewed for the first time"""
+    return {
+        'first_learned': (now or datetime.now()).isoformat(),
+        'total_reviews': 0,
+        'correct_reviews': 0,
+        'difficulty_history': [],
+        'last_reviewed': None,
+        'mastery_level': 0
+    }
+
+
+def schedule_card(card, difficulty, now=None):
+    """Apply a rating to a card's scheduling fields (card is a FlashcardState or card dict)"""
+    now = now or datetime.now()
+    card['review_count'] += 1
+    if difficulty == 'easy':
+        card['correct_streak'] += 1
+        card['interval'] = max(1, int(card['interval'] * card['ease_factor']))
+        card['ease_factor'] = min(MAX_EASE, card['ease_factor'] + EASE_STEP_EASY)
+    elif difficulty == 'medium':
+        card['correct_streak'] += 1
+        card['interval'] = max(1, int(card['interval'] * card['ease_factor'] * MEDIUM_FACTOR))
+    else:  # hard
+        card['correct_streak'] = 0
+        card['interval'] = 1
+        card['ease_factor'] = max(MIN_EASE, card['ease_factor'] - EASE_STEP_HARD)
+    card['next_review'] = now + timedelta(days=card['interval'])
+    return card
+
+
+def update_word_progress(user_progress, word, difficulty, now=None):
+    """Record a rating in the learner's word details and weak/mastered sets; returns the details"""
+    now = now or datetime.now()
+    learned_words_details = user_progress['learned_words_details']
+    if word not in learned_words_details:
+        learned_words_details[word] = new_word_details(now)
+        user_progress['total_words_learned'] += 1
+
+    word_details = learned_words_details[word]
+    word_details['total_reviews'] += 1
+    word_details['last_reviewed'] = now.isoformat()
+    word_details['difficulty_history'].append(difficulty)
+
+    if difficulty == 'easy':
+        word_details['correct_reviews'] += 1
+        word_details['mastery_level'] = min(MAX_MASTERY, word_details['mastery_level'] + 2)
+        # Move to mastered if mastery level is high enough
+        if word_details['mastery_level'] >= MASTERED_AT:
+            user_progress['mastered_words'].add(word)
+            user_progress['weak_words'].discard(word)
+    elif difficulty == 'medium':
+        word_details['correct_reviews'] += 1
+        word_details['mastery_level'] = min(MAX_MASTERY, word_details['mastery_level'] + 1)
+    else:  # hard
+        word_details['mastery_level'] = max(0, word_details['mastery_level'] - 1)
+        # Add to weak words if mastery level is low
+        if word_details['mastery_level'] < WEAK_BELOW:
+            user_progress['weak_words'].add(word)
+            user_progress['mastered_words'].discard(word)
+    bump_data_version(user_progress)
+    return word_details
+
+
+def apply_rating(user_progress, card, word, difficulty, now=None):
+    """One complete rating: reschedule the card and update the learner's progress"""
+    now = now or datetime.now()
+    schedule_card(card, difficulty, now)
+    return update_word_progress(user_progress, word, difficulty, now)
+
+
+def apply_ratings(interval, ease_factor, ratings):
+    """Vectorized schedule_card: new (interval, ease_factor) arrays for ratings 0=easy, 1=medium, 2=hard"""
+    easy = ratings == 0
+    medium = ratings == 1
+    hard = ratings == 2
+    new_interval = np.where(easy, np.maximum(1, np.floor(interval * ease_factor)), interval)
+    new_interval = np.where(medium, np.maximum(1, np.floor(interval * ease_factor * MEDIUM_FACTOR)), new_interval)
+    new_interval = np.where(hard, 1, new_interval).astype(np.int64)
+    new_ease = np.where(easy, np.minimum(MAX_EASE, ease_factor + EASE_STEP_EASY), ease_factor)
+    new_ease = np.where(hard, np.maximum(MIN_EASE, ease_factor - EASE_STEP_HARD), new_ease)
+    return new_interval, new_ease
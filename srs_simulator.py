@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+SRS Simulator for Indonesian Learning
+Replays synthetic learners through the scheduling engine over N days, headless, as a scheduler regression benchmark
+"""
+
+import argparse
+import heapq
+import json
+import random
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from flashcard_state import FlashcardDeck
+from memory_report import deep_sizeof, format_bytes
+from srs_engine import apply_rating
+from vocabulary_index import get_vocabulary_index
+
+# Learners study once a day at this hour (simulated clock)
+STUDY_HOUR = 19
+
+SimulationReport = namedtuple('SimulationReport', [
+    'learners', 'days', 'reviews', 'seconds', 'reviews_per_second',
+    'daily_reviews', 'peak_daily_load', 'peak_learner_load', 'bytes_per_learner'])
+
+
+def empty_progress():
+    """Fresh user_progress with just the keys the engine touches"""
+    return {
+        'learned_words_details': {},
+        'weak_words': set(),
+        'mastered_words': set(),
+        'total_words_learned': 0
+    }
+
+
+class SyntheticLearner:
+    """A learner with a fixed skill who adds new words daily and reviews everything due.
+
+    The chance of a hard rating falls as a card's correct streak grows;
+    non-hard ratings are easy with probability `easy_share`.
+    """
+
+    def __init__(self, words, rng, new_per_day=10, daily_limit=None):
+        self.rng = rng
+        self.words = words
+        self.new_per_day = new_per_day
+        self.daily_limit = daily_limit
+        self.hard_rate = rng.uniform(0.1, 0.4)
+        self.easy_share = rng.uniform(0.3, 0.8)
+        self.progress = empty_progress()
+        self.deck = FlashcardDeck()
+        self.queue = []  # (next_review, word) - each stored card appears once
+        self.next_new = 0
+
+    def rate(self, card):
+        """Pick a rating for a card"""
+        if self.rng.random() < self.hard_rate / (1 + card['correct_streak']):
+            return 'hard'
+        return 'easy' if self.rng.random() < self.easy_share else 'medium'
+
+    def study_day(self, now):
+        """Review due cards, then introduce new words; returns the number of reviews"""
+        reviews = 0
+        while self.queue and self.queue[0][0] <= now:
+            if self.daily_limit is not None and reviews >= self.daily_limit:
+                break
+            _, word = heapq.heappop(self.queue)
+            self.review(word, now)
+            reviews += 1
+
+        for _ in range(self.new_per_day):
+            if self.next_new >= len(self.words):
+                break
+            word = self.words[self.next_new]
+            self.next_new += 1
+            self.review(word, now)
+            reviews += 1
+        return reviews
+
+    def review(self, word, now):
+        card = self.deck.materialize(word)
+        apply_rating(self.progress, card, word, self.rate(card), now)
+        heapq.heappush(self.queue, (card['next_review'], word))
+
+
+def simulate(learners=100, days=60, new_per_day=10, daily_limit=None, seed=0, start=None):
+    """Run the simulation and return a SimulationReport"""
+    rng = random.Random(seed)
+    words = list(get_vocabulary_index().words)
+    start = (start or datetime.now()).replace(hour=STUDY_HOUR, minute=0, second=0, microsecond=0)
+
+    population = []
+    for _ in range(learners):
+        order = words[:]
+        rng.shuffle(order)
+        population.append(SyntheticLearner(order, random.Random(rng.random()), new_per_day, daily_limit))
+
+    daily_reviews = [0] * days
+    peak_learner_load = 0
+    began = time.perf_counter()
+    for day in range(days):
+        now = start + timedelta(days=day)
+        for learner in population:
+            reviews = learner.study_day(now)
+            daily_reviews[day] += reviews
+            peak_learner_load = max(peak_learner_load, reviews)
+    seconds = time.perf_counter() - began
+
+    total = sum(daily_reviews)
+    shared = [get_vocabulary_index()]
+    skip_ids = frozenset(id(obj) for obj in shared)
+    memory = [deep_sizeof((learner.progress, learner.deck), skip_ids=skip_ids) for learner in population]
+    return SimulationReport(
+        learners=learners,
+        days=days,
+        reviews=total,
+        seconds=seconds,
+        reviews_per_second=total / seconds if seconds else 0.0,
+        daily_reviews=daily_reviews,
+        peak_daily_load=max(daily_reviews, default=0),
+        peak_learner_load=peak_learner_load,
+        bytes_per_learner=sum(memory) / len(memory) if memory else 0,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay synthetic learners through the SRS engine")
+    parser.add_argument('--learners', type=int, default=100)
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--new-per-day', type=int, default=10)
+    parser.add_argument('--daily-limit', type=int, default=None, help="Max due reviews per learner per day")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON (for comparing runs)")
+    args = parser.parse_args(argv)
+
+    report = simulate(args.learners, args.days, args.new_per_day, args.daily_limit, args.seed)
+    if args.json:
+        print(json.dumps(report._asdict()))
+        return 0
+
+    print(f"🧪 SRS simulation: {report.learners} learners x {report.days} days (seed {args.seed})")
+    print(f"   Reviews: {report.reviews:,} in {report.seconds:.2f} s ({report.reviews_per_second:,.0f} reviews/s)")
+    print(f"   Peak daily load: {report.peak_daily_load:,} reviews (all learners), "
+          f"{report.peak_learner_load:,} for one learner")
+    print(f"   Mean daily load per learner: {report.reviews / max(report.learners * report.days, 1):.1f} reviews")
+    print(f"   Memory per learner: {format_bytes(report.bytes_per_learner)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
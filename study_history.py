@@ -0,0 +1,241 @@
+"""
+Study History for Indonesian Learning
+Compact, columnar study-session history with rolling aggregates and paged access
+"""
+
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, date, timedelta
+
+from flashcard_state import FlashcardDeck
+from profile_storage import ProfileConflictError
+from safe_files import atomic_write_bytes, file_lock
+
+# Fixed-width record on disk: epoch seconds, word id, difficulty code, mastery level
+RECORD = struct.Struct('<qIBB')
+
+DIFFICULTY_LEVELS = ('easy', 'medium', 'hard')
+DIFFICULTY_INDEX = {name: code for code, name in enumerate(DIFFICULTY_LEVELS)}
+
+# Only this much history is kept in memory; older records stay on disk
+RECENT_DAYS = 30
+
+
+class StudyHistory:
+    """Study sessions as parallel arrays, backed by an append-only binary file.
+
+    Appends write one 14-byte record. On load only the recent window is read
+    (found by binary search over the file), so everyday use never touches
+    old history. page() reads any slice of the full history straight from
+    disk because records are fixed width. Without a path (Demo mode) history
+    lives in memory only.
+    """
+
+    def __init__(self, path=None, recent_days=RECENT_DAYS, now=None):
+        self.path = path
+        now = now or datetime.now()
+        self._cutoff = int((now - timedelta(days=recent_days)).timestamp())
+        self._reset_columns()
+
+        if path and os.path.exists(path):
+            self._total = os.path.getsize(path) // RECORD.size
+            self._load_from(self._first_record_since(self._cutoff))
+
+    def __len__(self):
+        return self._total
+
+    def _read_timestamp(self, f, position):
+        f.seek(position * RECORD.size)
+        return RECORD.unpack(f.read(RECORD.size))[0]
+
+    def _first_record_since(self, cutoff):
+        """Binary search the file for the first record at or after cutoff"""
+        low, high = 0, self._total
+        with open(self.path, 'rb') as f:
+            while low < high:
+                middle = (low + high) // 2
+                if self._read_timestamp(f, middle) < cutoff:
+                    low = middle + 1
+                else:
+                    high = middle
+        return low
+
+    def _load_from(self, position):
+        with open(self.path, 'rb') as f:
+            f.seek(position * RECORD.size)
+            data = f.read((self._total - position) * RECORD.size)
+        for timestamp, word_id, difficulty, mastery in RECORD.iter_unpack(data):
+            self._append_columns(timestamp, word_id, difficulty, mastery)
+
+    def _reset_columns(self):
+        self.timestamps = array('q')
+        self.word_ids = array('I')
+        self.difficulties = array('B')
+        self.mastery = array('B')
+        self._total = 0
+
+    def _append_columns(self, timestamp, word_id, difficulty, mastery):
+        self.timestamps.append(timestamp)
+        self.word_ids.append(word_id)
+        self.difficulties.append(difficulty)
+        self.mastery.append(mastery)
+
+    def append(self, word_id, difficulty, mastery, reviewed_at=None):
+        """Record one study session"""
+        timestamp = int((reviewed_at or datetime.now()).timestamp())
+        code = DIFFICULTY_INDEX[difficulty]
+        if self.path:
+            with open(self.path, 'ab') as f:
+                f.write(RECORD.pack(timestamp, word_id, code, mastery))
+        self._append_columns(timestamp, word_id, code, mastery)
+        self._total += 1
+
+    def locked(self):
+        """Lock the history file against other workers (for multi-step changes such as imports)"""
+        return file_lock(self.path + ".lock")
+
+    def clear(self):
+        """Delete every recorded session (progress reset)"""
+        if self.path:
+            with self.locked():
+                if os.path.exists(self.path):
+                    open(self.path, 'wb').close()
+        self._reset_columns()
+
+    def _all_records(self):
+        if not self.path:
+            return list(zip(self.timestamps, self.word_ids, self.difficulties, self.mastery))
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'rb') as f:
+            return list(RECORD.iter_unpack(f.read()))
+
+    def import_sessions(self, sessions, word_id_for):
+        """Merge legacy study_sessions dicts (ISO timestamps) into the history.
+
+        Records already in the history are skipped, so importing the same
+        sessions again adds nothing. Sessions newer than the history are
+        appended in one write; older ones are merged in time order and the
+        file is replaced, because loading and the daily counts rely on the
+        file being sorted. Returns the number of sessions added. Call under
+        locked() when other workers may write the same file.
+        """
+        records = []
+        for session in sessions:
+            try:
+                timestamp = int(datetime.fromisoformat(session['timestamp']).timestamp())
+                code = DIFFICULTY_INDEX[session['difficulty']]
+            except (KeyError, TypeError, ValueError):
+                continue
+            records.append((timestamp, word_id_for(session['word']), code, session.get('mastery_level', 0)))
+        records.sort()
+
+        existing = self._all_records()
+        already_stored = Counter(existing)
+        new_records = []
+        for record in records:
+            if already_stored[record]:
+                already_stored[record] -= 1
+            else:
+                new_records.append(record)
+        if not new_records:
+            return 0
+
+        if not existing or new_records[0][0] >= existing[-1][0]:
+            if self.path:
+                with open(self.path, 'ab') as f:
+                    f.write(b''.join(RECORD.pack(*record) for record in new_records))
+            for record in new_records:
+                self._append_columns(*record)
+            self._total += len(new_records)
+            return len(new_records)
+
+        merged = sorted(existing + new_records)
+        self._reset_columns()
+        if self.path:
+            atomic_write_bytes(self.path, b''.join(RECORD.pack(*record) for record in merged))
+            self._total = len(merged)
+            self._load_from(self._first_record_since(self._cutoff))
+        else:
+            for record in merged:
+                self._append_columns(*record)
+            self._total = len(merged)
+        return len(new_records)
+
+    def _recent_start(self, days, now=None):
+        """Index into the in-memory columns of the first session within the window"""
+        now = now or datetime.now()
+        start_of_window = datetime.combine(now.date() - timedelta(days=days - 1), datetime.min.time())
+        return bisect_left(self.timestamps, int(start_of_window.timestamp()))
+
+    def daily_counts(self, days=7, now=None):
+        """Sessions per calendar day for the last `days` days (oldest first)"""
+        now = now or datetime.now()
+        today = now.date()
+        counts = {today - timedelta(days=offset): 0 for offset in range(days - 1, -1, -1)}
+        for position in range(self._recent_start(days, now), len(self.timestamps)):
+            day = date.fromtimestamp(self.timestamps[position])
+            if day in counts:
+                counts[day] += 1
+        return counts
+
+    def difficulty_counts(self, days=7, now=None):
+        """Sessions per difficulty for the last `days` days"""
+        counts = dict.fromkeys(DIFFICULTY_LEVELS, 0)
+        for position in range(self._recent_start(days, now), len(self.difficulties)):
+            counts[DIFFICULTY_LEVELS[self.difficulties[position]]] += 1
+        return counts
+
+    def page(self, offset=0, limit=50, newest_first=True):
+        """A page of raw sessions as dicts, read directly from the file"""
+        if offset < 0 or limit <= 0 or offset >= self._total:
+            return []
+        count = min(limit, self._total - offset)
+        start = self._total - offset - count if newest_first else offset
+
+        if self.path:
+            with open(self.path, 'rb') as f:
+                f.seek(start * RECORD.size)
+                rows = list(RECORD.iter_unpack(f.read(count * RECORD.size)))
+        else:
+            rows = [(self.timestamps[i], self.word_ids[i], self.difficulties[i], self.mastery[i])
+                    for i in range(start, start + count)]
+        if newest_first:
+            rows.reverse()
+
+        return [{
+            'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+            'word_id': word_id,
+            'difficulty': DIFFICULTY_LEVELS[difficulty],
+            'mastery_level': mastery
+        } for timestamp, word_id, difficulty, mastery in rows]
+
+
+def migrate_legacy_sessions(history, storage, profile_name, word_id_for):
+    """Move a profile's legacy study_sessions list into its history file, exactly once.
+
+    Runs under the history file's lock and re-reads the stored profile, so
+    a second worker (or a second load) finds nothing left to import. The
+    records are written before the progress without study_sessions is
+    saved; if that save never happens the next load imports again, and
+    import_sessions skips the records that are already there. Returns the
+    stored (progress, flashcards, version) and whether this call imported
+    anything.
+    """
+    with history.locked():
+        while True:
+            progress, flashcards, version = storage.load(profile_name)
+            sessions = progress.get('study_sessions') if progress else None
+            if not sessions:
+                return progress, flashcards, version, False
+            imported = history.import_sessions(sessions, word_id_for)
+            del progress['study_sessions']
+            try:
+                version = storage.save(profile_name, progress, flashcards or FlashcardDeck(),
+                                       expected_version=version)
+            except ProfileConflictError:
+                continue  # A review was saved in between - read it and try again
+            return progress, flashcards, version, imported > 0
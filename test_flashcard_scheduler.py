@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for the due-card scheduler
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+from flashcard_scheduler import DueCardScheduler
+from flashcard_state import FlashcardDeck
+from srs_engine import schedule_card
+from vocabulary_index import get_vocabulary_index
+
+
+def test_flashcard_scheduler():
+    """Due cards come most overdue first, then new words in vocabulary order, across reschedules"""
+    print("🧪 Testing Due-Card Scheduler")
+    print("=" * 40)
+
+    vocabulary = get_vocabulary_index()
+    level = vocabulary.levels[0]
+    pool = [word for word in vocabulary.words if level in vocabulary.levels_of(word)]
+    now = datetime(2026, 10, 18, 12, 0)
+
+    deck = FlashcardDeck()
+    scheduler = DueCardScheduler(deck, vocabulary.placements, now=now, vocabulary=vocabulary)
+
+    # Test 1: An empty deck - every word is new and due, in vocabulary order
+    assert scheduler.due_cards(level=level, now=now) == pool
+    assert scheduler.due_count(level=level, now=now) == len(pool)
+    print(f"✅ {len(pool)} new words due in '{level}'")
+
+    # Test 2: Rated words leave the due list until their review time
+    rated = pool[:5]
+    for word in rated:
+        card = deck.materialize(word)
+        schedule_card(card, 'easy', now)
+        scheduler.reschedule(word, card['next_review'], card)
+    assert scheduler.due_cards(level=level, now=now) == pool[5:]
+    assert not any(scheduler.is_due(word, level=level, now=now) for word in rated)
+    assert scheduler.due_count(level=level, now=now) == len(pool) - 5
+    print("✅ Rated words are no longer due or new")
+
+    # Test 3: Overdue cards come first, most overdue first, ahead of new words
+    for days_overdue, word in zip([1, 3, 2], rated):
+        deck[word]['next_review'] = now - timedelta(days=days_overdue)
+        scheduler.reschedule(word, deck[word]['next_review'])
+    due = scheduler.due_cards(level=level, now=now)
+    assert due[:3] == [rated[1], rated[2], rated[0]]
+    assert due[3:] == pool[5:]
+    print("✅ Overdue cards are ordered by how late they are")
+
+    # Test 4: Their review time passing moves the remaining rated cards back in
+    later = now + timedelta(days=30)
+    due = scheduler.due_cards(level=level, now=later)
+    assert due[:3] == [rated[1], rated[2], rated[0]] and set(due[3:5]) == set(rated[3:])
+    print("✅ Cards return when their review time passes")
+
+    # Test 5: Pages and samples agree with the full list
+    full = scheduler.due_cards(level=level, now=later)
+    for limit in (1, 4, 10, len(full) + 5):
+        assert scheduler.due_cards(level=level, now=later, limit=limit) == full[:limit]
+    rng = random.Random(7)
+    samples = {scheduler.sample_due(level=level, now=later, rng=rng) for _ in range(500)}
+    assert samples <= set(full) and len(samples) > 1
+    print("✅ Paged and sampled due cards match the full list")
+
+    # Test 6: A scheduler rebuilt from the deck sees the same state
+    rebuilt = DueCardScheduler(deck, vocabulary.placements, now=later, vocabulary=vocabulary)
+    assert set(rebuilt.due_cards(level=level, now=later)) == set(full)
+    assert rebuilt.due_count(level=level, now=later) == len(full)
+    print("✅ Rebuilt scheduler agrees")
+
+    print("\n🎉 Due-card scheduler test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_flashcard_scheduler()
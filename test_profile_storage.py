@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script for the JSON and SQLite profile storage backends
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import date
+sys.path.append('.')
+
+from credentials import CredentialStore
+from flashcard_state import FlashcardDeck
+from profile_storage import STORAGE_BACKENDS, ProfileConflictError, make_storage, migrate
+from review_journal import make_review_record
+from srs_engine import apply_rating
+from vocabulary_index import get_vocabulary_index
+
+PROFILE = 'Tester'
+
+
+def sample_profile(words):
+    """Progress and deck with a few rated words, a streak and a study date"""
+    progress = {
+        'words_learned': set(), 'weak_words': set(), 'mastered_words': set(),
+        'learned_words_details': {}, 'total_words_learned': 0,
+        'daily_streak': 3, 'last_study_date': date(2026, 10, 17),
+        'quiz_scores': [80, 95], 'profile_name': PROFILE
+    }
+    deck = FlashcardDeck()
+    for word, difficulty in zip(words, ['easy', 'medium', 'hard', 'easy']):
+        if difficulty != 'hard':
+            progress['words_learned'].add(word)
+        apply_rating(progress, deck.materialize(word), word, difficulty)
+    return progress, deck
+
+
+def assert_round_trip(loaded, loaded_deck, progress, deck):
+    for key in ('words_learned', 'weak_words', 'mastered_words', 'daily_streak',
+                'last_study_date', 'quiz_scores', 'total_words_learned'):
+        assert loaded[key] == progress[key], key
+    assert loaded['learned_words_details'].keys() == progress['learned_words_details'].keys()
+    for word, details in progress['learned_words_details'].items():
+        stored = loaded['learned_words_details'][word]
+        for field in ('total_reviews', 'correct_reviews', 'mastery_level', 'difficulty_history'):
+            assert stored[field] == details[field], (word, field)
+        for field in ('first_learned', 'last_reviewed'):
+            assert stored[field][:19] == details[field][:19], (word, field)
+    assert set(loaded_deck) == set(deck)
+    for word in deck:
+        loaded_card, card = loaded_deck.card(word), deck.card(word)
+        # Review times are stored to the second
+        assert int(loaded_card['next_review'].timestamp()) == int(card['next_review'].timestamp()), word
+        for field in ('interval', 'ease_factor', 'review_count', 'correct_streak'):
+            assert loaded_card[field] == card[field], (word, field)
+
+
+def test_profile_storage():
+    """Both backends must load back exactly what was saved and reviewed"""
+    print("🧪 Testing Profile Storage")
+    print("=" * 40)
+
+    words = get_vocabulary_index().words[:6]
+    for backend in STORAGE_BACKENDS:
+        with tempfile.TemporaryDirectory() as data_dir:
+            storage = make_storage(backend, data_dir)
+            assert storage.load(PROFILE) == (None, None, 0)
+
+            # Test 1: Snapshot round trip
+            progress, deck = sample_profile(words[:4])
+            version = storage.save(PROFILE, progress, deck)
+            assert_round_trip(*make_storage(backend, data_dir).load(PROFILE)[:2], progress, deck)
+            print(f"✅ {backend}: snapshot round trip")
+
+            # Test 2: Single reviews on top of the snapshot
+            for word, difficulty in [(words[4], 'easy'), (words[0], 'hard')]:
+                if difficulty != 'hard':
+                    progress['words_learned'].add(word)
+                apply_rating(progress, deck.materialize(word), word, difficulty)
+                record = make_review_record(word, difficulty, progress, deck)
+                version = storage.record_review(PROFILE, record, progress, deck, expected_version=version)
+            loaded, loaded_deck, loaded_version = make_storage(backend, data_dir).load(PROFILE)
+            assert loaded_version == version
+            assert_round_trip(loaded, loaded_deck, progress, deck)
+            print(f"✅ {backend}: reviews round trip at version {version}")
+
+            # Test 3: Profile listing and deletion
+            assert storage.profile_names() == [PROFILE]
+            (name, words_learned, _), = storage.profile_summaries()
+            assert (name, words_learned) == (PROFILE, len(progress['words_learned']))
+            storage.delete(PROFILE)
+            assert storage.profile_names() == []
+            print(f"✅ {backend}: listing and deletion")
+
+    # Test 4: Migration between backends keeps the data, including a PIN left in an old progress file
+    with tempfile.TemporaryDirectory() as data_dir:
+        progress, deck = sample_profile(words[:4])
+        make_storage('json', data_dir).save(PROFILE, progress, deck)
+        profile_dir = os.path.join(data_dir, 'profiles', PROFILE)
+        with open(os.path.join(profile_dir, 'progress.json')) as f:
+            legacy = json.load(f)
+        with open(os.path.join(profile_dir, 'progress.json'), 'w') as f:
+            json.dump(dict(legacy, pin_code='4321'), f)
+
+        assert migrate(make_storage('json', data_dir), make_storage('sqlite', data_dir), data_dir=data_dir) == [PROFILE]
+        assert os.path.exists(os.path.join(data_dir, 'profiles.db'))
+        assert_round_trip(*make_storage('sqlite', data_dir).load(PROFILE)[:2], progress, deck)
+
+        # The JSON snapshot is no longer needed to log in
+        for filename in ('progress.json', 'flashcards.json'):
+            os.remove(os.path.join(profile_dir, filename))
+        credentials = CredentialStore(os.path.join(data_dir, 'profiles'))
+        assert credentials.verify(PROFILE, '4321') and not credentials.verify(PROFILE, '1234')
+        print("✅ json -> sqlite migration (PIN moved into the credential record)")
+
+    print("\n🎉 Profile storage test completed!")
+    print("=" * 40)
+
+
+def test_version_conflicts():
+    """A write based on an old version must fail instead of overwriting another worker"""
+    print("🧪 Testing Profile Version Conflicts")
+    print("=" * 40)
+
+    words = get_vocabulary_index().words[:6]
+    for backend in STORAGE_BACKENDS:
+        with tempfile.TemporaryDirectory() as data_dir:
+            first, second = make_storage(backend, data_dir), make_storage(backend, data_dir)
+            progress, deck = sample_profile(words[:4])
+            assert first.save(PROFILE, progress, deck, expected_version=0) == 1
+
+            # Test 1: Creating a profile that already exists conflicts
+            try:
+                second.save(PROFILE, progress, deck, expected_version=0)
+                raise AssertionError("second create should conflict")
+            except ProfileConflictError as e:
+                assert (e.expected_version, e.stored_version) == (0, 1)
+
+            # Test 2: Two sessions at the same version - the slower writer conflicts
+            mine, my_deck, my_version = first.load(PROFILE)
+            theirs, their_deck, their_version = second.load(PROFILE)
+            apply_rating(theirs, their_deck.materialize(words[5]), words[5], 'easy')
+            record = make_review_record(words[5], 'easy', theirs, their_deck)
+            second.record_review(PROFILE, record, theirs, their_deck, expected_version=their_version)
+            for write in (lambda: first.save(PROFILE, mine, my_deck, expected_version=my_version),
+                          lambda: first.record_review(PROFILE, make_review_record(words[0], 'easy', mine, my_deck),
+                                                      mine, my_deck, expected_version=my_version)):
+                try:
+                    write()
+                    raise AssertionError("stale write should conflict")
+                except ProfileConflictError as e:
+                    assert e.stored_version == my_version + 1
+
+            # Test 3: The other worker's review survived, and reloading gives a version that writes again
+            mine, my_deck, my_version = first.load(PROFILE)
+            assert words[5] in mine['learned_words_details']
+            assert first.save(PROFILE, mine, my_deck, expected_version=my_version) == my_version + 1
+            print(f"✅ {backend}: stale writes raise ProfileConflictError and nothing is overwritten")
+
+    print("\n🎉 Profile version conflict test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_profile_storage()
+    test_version_conflicts()
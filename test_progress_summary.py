@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the incrementally maintained dashboard aggregates
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+from progress_summary import ProgressSummary
+from srs_engine import apply_rating
+from study_history import StudyHistory
+from vocabulary_index import get_vocabulary_index
+
+
+def test_progress_summary():
+    """A summary updated review by review must match one rebuilt from scratch"""
+    print("🧪 Testing Progress Summary")
+    print("=" * 40)
+
+    vocabulary = get_vocabulary_index()
+    rng = random.Random(11)
+    now = datetime(2026, 10, 18, 20, 0)
+    words = rng.sample(vocabulary.words, 60)
+
+    progress = {'words_learned': set(), 'weak_words': set(), 'mastered_words': set(),
+                'learned_words_details': {}, 'total_words_learned': 0}
+    history = StudyHistory()  # In memory, as in Demo mode
+    cards = {}
+    summary = ProgressSummary(progress, vocabulary, history, now=now)
+    assert summary.tracks(progress) and summary.learned_count == 0
+
+    # Test 1: 600 reviews over the last five days, folded in one at a time
+    for n in range(600):
+        word = rng.choice(words)
+        difficulty = rng.choice(['easy', 'easy', 'medium', 'hard'])
+        reviewed_at = now - timedelta(days=4 - n // 120, minutes=n % 120)
+        if difficulty != 'hard':
+            progress['words_learned'].add(word)
+        card = cards.setdefault(word, {'next_review': None, 'interval': 1, 'ease_factor': 2.5,
+                                       'review_count': 0, 'correct_streak': 0})
+        details = apply_rating(progress, card, word, difficulty, reviewed_at)
+        history.append(vocabulary.word_id(word), difficulty, details['mastery_level'], reviewed_at)
+        summary.record_review(word, details['mastery_level'], word in progress['words_learned'], reviewed_at)
+
+    rebuilt = ProgressSummary(progress, vocabulary, history, now=now)
+    assert summary.learned_count == rebuilt.learned_count == len(progress['words_learned'])
+    assert summary.level_counts == rebuilt.level_counts == vocabulary.level_counts(progress['words_learned'])
+    assert summary.category_counts == rebuilt.category_counts
+    print(f"✅ {summary.learned_count} learned words counted per level and category")
+
+    # Test 2: Mastery histogram and top words
+    mastery = {word: details['mastery_level'] for word, details in progress['learned_words_details'].items()}
+    expected_histogram = [sum(1 for level in mastery.values() if level == m) for m in range(11)]
+    assert summary.mastery_histogram() == rebuilt.mastery_histogram() == expected_histogram
+    top = summary.top_mastered(10)
+    assert [m for _, m in top] == sorted(mastery.values(), reverse=True)[:10]
+    assert all(mastery[word] == m for word, m in top)
+    print(f"✅ Mastery histogram {summary.mastery_histogram()} matches a full recount")
+
+    # Test 3: Reviews per day
+    for days_ago in range(5):
+        day = (now - timedelta(days=days_ago)).date()
+        assert summary.reviews_on(day) == rebuilt.reviews_on(day) == 120, day
+    print("✅ Reviews per day match the study history")
+
+    print("\n🎉 Progress summary test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_progress_summary()
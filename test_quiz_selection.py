@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for quiz word selection over per-learner feature arrays
+"""
+
+import random
+import sys
+sys.path.append('.')
+
+import numpy as np
+
+from flashcard_state import FlashcardDeck
+from quiz_selection import LearnerFeatures, select_quiz_words
+from srs_engine import apply_rating, bump_data_version
+from vocabulary_index import get_vocabulary_index
+
+
+def test_quiz_selection():
+    """Arrays updated review by review must match a rebuild, and quizzes only use learned words"""
+    print("🧪 Testing Quiz Selection")
+    print("=" * 40)
+
+    vocabulary = get_vocabulary_index()
+    rng = random.Random(5)
+    words = rng.sample(vocabulary.words, 80)
+
+    progress = {'words_learned': set(), 'weak_words': set(), 'mastered_words': set(),
+                'learned_words_details': {}, 'total_words_learned': 0}
+    deck = FlashcardDeck()
+    learner = LearnerFeatures(progress, deck)
+    assert learner.learned_count == 0 and select_quiz_words(learner) == []
+
+    # Test 1: 400 ratings folded in one at a time
+    for _ in range(400):
+        word = rng.choice(words)
+        difficulty = rng.choice(['easy', 'easy', 'medium', 'hard'])
+        if difficulty != 'hard':
+            progress['words_learned'].add(word)
+        card = deck.materialize(word)
+        apply_rating(progress, card, word, difficulty)
+        learner.record_review(word, card['correct_streak'], word in progress['words_learned'])
+    assert learner.tracks(progress, deck)
+
+    rebuilt = LearnerFeatures(progress, deck)
+    assert np.array_equal(learner.learned, rebuilt.learned)
+    assert np.array_equal(learner.streak, rebuilt.streak)
+    assert learner.learned_count == len(progress['words_learned'])
+    print(f"✅ {learner.learned_count} learned words and their streaks match a rebuild")
+
+    # Test 2: Quizzes draw distinct learned words, avoiding the recent quiz when they can
+    for seed in range(20):
+        quiz = select_quiz_words(learner, num_questions=8, rng=np.random.default_rng(seed))
+        assert len(quiz) == min(8, learner.learned_count) and len(set(quiz)) == len(quiz)
+        assert set(quiz) <= progress['words_learned']
+    recent = [quiz] * 5
+    repeats = [len(set(quiz) & set(select_quiz_words(learner, recent, rng=np.random.default_rng(seed))))
+               for seed in range(20)]
+    assert np.mean(repeats) < 4
+    print(f"✅ Quizzes use learned words only (on average {np.mean(repeats):.1f} of 8 repeat a recent quiz)")
+
+    # Test 3: Changes outside a rating make the arrays stale
+    bump_data_version(progress)
+    assert not learner.tracks(progress, deck)
+    assert not LearnerFeatures(progress, deck).tracks(progress, FlashcardDeck())
+    print("✅ Resets and imports invalidate the arrays")
+
+    print("\n🎉 Quiz selection test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_quiz_selection()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the review journal and its replay into JSON profile snapshots
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append('.')
+
+from flashcard_state import FlashcardDeck
+from profile_storage import JsonProfileStorage
+from review_journal import JOURNAL_COMPACTION_THRESHOLD, ReviewJournal, make_review_record
+from srs_engine import apply_rating
+from vocabulary_index import get_vocabulary_index
+
+PROFILE = 'Tester'
+
+
+def new_progress():
+    return {
+        'words_learned': set(), 'weak_words': set(), 'mastered_words': set(),
+        'learned_words_details': {}, 'total_words_learned': 0,
+        'daily_streak': 0, 'last_study_date': None, 'profile_name': PROFILE
+    }
+
+
+def review(storage, progress, deck, version, word, difficulty='easy'):
+    """Rate a word the way the app does and journal it; returns the new version"""
+    if difficulty != 'hard':
+        progress['words_learned'].add(word)
+    apply_rating(progress, deck.materialize(word), word, difficulty)
+    record = make_review_record(word, difficulty, progress, deck)
+    return storage.record_review(PROFILE, record, progress, deck, expected_version=version)
+
+
+def assert_same_progress(loaded, expected):
+    assert loaded['total_words_learned'] == expected['total_words_learned']
+    assert loaded['words_learned'] == expected['words_learned']
+    for word, details in expected['learned_words_details'].items():
+        stored = loaded['learned_words_details'][word]
+        assert stored['difficulty_history'] == details['difficulty_history'], word
+        assert stored['mastery_level'] == details['mastery_level'], word
+
+
+def test_review_journal():
+    """Journaled reviews must load back exactly once, whatever point a snapshot stopped at"""
+    print("🧪 Testing Review Journal")
+    print("=" * 40)
+
+    words = get_vocabulary_index().words[:5]
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = JsonProfileStorage(data_dir)
+        progress, deck = new_progress(), FlashcardDeck()
+        version = storage.save(PROFILE, progress, deck)
+
+        # Test 1: Reviews are appended to the journal, not written to the snapshot
+        for word in words:
+            version = review(storage, progress, deck, version, word)
+        version = review(storage, progress, deck, version, words[0], 'hard')
+        assert len(storage.journal(PROFILE)) == len(words) + 1
+        print(f"✅ {len(storage.journal(PROFILE))} reviews journaled")
+
+        # Test 1b: A review is one append - no journal re-read and no version file rewrite
+        journal = storage.journal(PROFILE)
+        version_path = os.path.join(data_dir, PROFILE, 'version')
+        with open(version_path) as f:
+            snapshot_version = f.read()
+        reads = []
+        original_read = journal.read
+        journal.read = lambda: reads.append(1) or original_read()
+        version = review(storage, progress, deck, version, words[3], 'medium')
+        del journal.read
+        assert reads == [] and len(journal) == len(words) + 2
+        with open(version_path) as f:
+            assert f.read() == snapshot_version
+        assert JsonProfileStorage(data_dir)._read_version(PROFILE) == version
+        print("✅ Reviews append one line and carry the version themselves")
+
+        # Test 2: A fresh process replays the journal onto the snapshot
+        loaded, loaded_deck, loaded_version = JsonProfileStorage(data_dir).load(PROFILE)
+        assert loaded_version == version
+        assert_same_progress(loaded, progress)
+        assert loaded_deck.card(words[0])['interval'] == deck.card(words[0])['interval']
+        assert len(storage.journal(PROFILE)) == 0
+        print("✅ Replay restores progress and cards, and folds the journal in")
+
+        # Test 3: A crash after the snapshot was written but before the journal was cleared
+        version = review(storage, progress, deck, version, words[1], 'medium')
+        journal_path = storage.journal(PROFILE).path
+        with open(journal_path, 'rb') as f:
+            journal_bytes = f.read()
+        storage.load(PROFILE)
+        with open(journal_path, 'wb') as f:
+            f.write(journal_bytes)  # The journal survives next to a snapshot that already holds it
+        loaded, _, _ = JsonProfileStorage(data_dir).load(PROFILE)
+        assert_same_progress(loaded, progress)
+        print("✅ Records already in the snapshot are not applied twice")
+
+        # Test 4: A missing flashcards.json does not drop the journal
+        version = review(storage, progress, deck, version, words[2], 'easy')
+        os.remove(os.path.join(data_dir, PROFILE, 'flashcards.json'))
+        loaded, loaded_deck, _ = JsonProfileStorage(data_dir).load(PROFILE)
+        assert words[2] in loaded_deck
+        assert loaded['learned_words_details'][words[2]]['difficulty_history'] == ['easy', 'easy']
+        print("✅ Journal is replayed onto an empty deck when flashcards.json is missing")
+
+    # Test 5: Compaction counts records written by other workers
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = JsonProfileStorage(data_dir)
+        other_worker = JsonProfileStorage(data_dir)
+        progress, deck = new_progress(), FlashcardDeck()
+        version = storage.save(PROFILE, progress, deck)
+        other_worker.journal(PROFILE)  # Opened before the appends below
+        for word in words:
+            version = review(storage, progress, deck, version, word)
+        assert len(other_worker.journal(PROFILE)) == len(words)
+
+        journal = ReviewJournal(storage.journal(PROFILE).path)
+        for _ in range(JOURNAL_COMPACTION_THRESHOLD - len(words) - 1):
+            journal.append({'w': words[0]})
+        version = review(storage, progress, deck, version, words[0], 'medium')
+        assert len(journal) == 0
+        print(f"✅ Journal compacts at {JOURNAL_COMPACTION_THRESHOLD} records across workers")
+
+    print("\n🎉 Review journal test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_review_journal()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the review forecast and the overdue backlog planner
+"""
+
+import sys
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+import numpy as np
+
+from review_planner import apply_backlog_plan, forecast_reviews, plan_backlog
+
+
+def make_deck(now, overdue, scheduled_per_day, rng):
+    """Cards overdue by 1-60 days plus cards already scheduled on each upcoming day"""
+    deck = {}
+    for n in range(overdue):
+        interval = int(rng.integers(1, 30))
+        deck[f'overdue{n}'] = {'next_review': now - timedelta(days=int(rng.integers(1, 60)), hours=1),
+                               'interval': interval, 'ease_factor': float(rng.uniform(1.3, 2.5)),
+                               'review_count': 3, 'correct_streak': 1}
+    for day, count in enumerate(scheduled_per_day):
+        for n in range(count):
+            deck[f'day{day}-{n}'] = {'next_review': now + timedelta(days=day, hours=2),
+                                     'interval': 5, 'ease_factor': 2.5, 'review_count': 2, 'correct_streak': 2}
+    return deck
+
+
+def test_review_planner():
+    """Backlog plans stay under the cap and keep every card; forecasts count every review"""
+    print("🧪 Testing Review Planner")
+    print("=" * 40)
+
+    now = datetime(2026, 10, 18, 8, 0)
+    rng = np.random.default_rng(3)
+
+    # Test 1: Plans respect the cap and place every overdue card exactly once
+    for overdue, cap, scheduled in [(120, 20, [2, 5, 0, 19, 25, 3, 1]), (15, 20, [4]), (300, 10, [12] * 10)]:
+        deck = make_deck(now, overdue, scheduled, rng)
+        plan = plan_backlog(deck, cap, days=7, now=now)
+        assert len(set(plan.words)) == len(plan.words)
+        assert plan.kept_today + len(plan.words) == overdue
+        assert all(word.startswith('overdue') for word in plan.words)
+
+        moved = apply_backlog_plan(deck, plan)
+        assert moved == len(plan.words) and len(deck) == overdue + sum(scheduled)
+        still_overdue = [w for w, card in deck.items() if card['next_review'] <= now]
+        assert len(still_overdue) == plan.kept_today
+
+        # Per-day load after the move, counted from the cards themselves
+        load = {}
+        for card in deck.values():
+            day = max((card['next_review'].date() - now.date()).days, 0)
+            load[day] = load.get(day, 0) + 1
+        assert [load.get(day, 0) for day in range(len(plan.daily_load))] == plan.daily_load.tolist()
+        for day, count in enumerate(plan.daily_load):
+            # Days that were already over the cap only keep what was scheduled there
+            assert count <= max(cap, scheduled[day] if day < len(scheduled) else 0), (day, count)
+        print(f"✅ {overdue} overdue, cap {cap}: {plan.kept_today} today, {moved} moved over "
+              f"{len(plan.daily_load)} days, peak {plan.daily_load.max()}")
+
+    # Test 2: Nothing overdue - nothing moves
+    deck = make_deck(now, 0, [3, 3], rng)
+    plan = plan_backlog(deck, 20, now=now)
+    assert plan.words == [] and plan.kept_today == 0
+    print("✅ A deck without a backlog is left alone")
+
+    # Test 3: The forecast counts scheduled cards per day and at least as many expected reviews
+    deck = make_deck(now, 30, [4, 0, 7], rng)
+    forecast = forecast_reviews(deck, days=14, now=now)
+    assert forecast.overdue == 30
+    assert forecast.scheduled[:3].tolist() == [34, 0, 7] and forecast.scheduled[3:].sum() == 0
+    assert forecast.expected[0] == 34 and forecast.expected.sum() >= forecast.scheduled.sum()
+    assert forecast_reviews(deck, days=14, now=now).expected.tolist() == forecast.expected.tolist()
+    print(f"✅ Forecast: {forecast.scheduled.sum()} scheduled, {forecast.expected.sum():.1f} expected in 14 days")
+
+    print("\n🎉 Review planner test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_review_planner()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the pure SRS engine
+"""
+
+import sys
+from datetime import datetime
+sys.path.append('.')
+
+import numpy as np
+
+from srs_engine import (DIFFICULTIES, MAX_EASE, MIN_EASE, apply_rating, apply_ratings, data_version,
+                        schedule_card)
+
+
+def new_card():
+    return {'next_review': None, 'interval': 1, 'ease_factor': 2.5, 'review_count': 0, 'correct_streak': 0}
+
+
+def test_srs_engine():
+    """The vectorized rules must match schedule_card card by card"""
+    print("🧪 Testing SRS Engine")
+    print("=" * 40)
+
+    now = datetime(2026, 10, 18, 12, 0)
+    rng = np.random.default_rng(0)
+
+    # Test 1: Random rating sequences, scalar vs vectorized, step by step
+    cards = [new_card() for _ in range(500)]
+    interval = np.ones(len(cards), dtype=np.int64)
+    ease_factor = np.full(len(cards), 2.5)
+    for step in range(12):
+        ratings = rng.integers(0, len(DIFFICULTIES), len(cards))
+        for card, rating in zip(cards, ratings):
+            schedule_card(card, DIFFICULTIES[rating], now)
+        interval, ease_factor = apply_ratings(interval, ease_factor, ratings)
+        assert interval.tolist() == [card['interval'] for card in cards], step
+        assert np.allclose(ease_factor, [card['ease_factor'] for card in cards]), step
+    assert ease_factor.min() >= MIN_EASE and ease_factor.max() <= MAX_EASE
+    print(f"✅ {len(cards)} cards x 12 ratings agree (intervals up to {interval.max()} days)")
+
+    # Test 2: Every rating from the extremes of the ease range
+    for ease in (MIN_EASE, 2.0, MAX_EASE):
+        for start in (1, 7, 40):
+            for rating, difficulty in enumerate(DIFFICULTIES):
+                card = dict(new_card(), interval=start, ease_factor=ease)
+                schedule_card(card, difficulty, now)
+                new_interval, new_ease = apply_ratings(np.array([start]), np.array([ease]), np.array([rating]))
+                assert (new_interval[0], round(new_ease[0], 6)) == (card['interval'], round(card['ease_factor'], 6))
+    print("✅ Edge cases at the ease bounds agree")
+
+    # Test 3: A full rating updates the learner's progress and its data version
+    progress = {'learned_words_details': {}, 'total_words_learned': 0, 'weak_words': set(), 'mastered_words': set()}
+    card = new_card()
+    for difficulty in ['easy'] * 4 + ['hard']:
+        details = apply_rating(progress, card, 'halo', difficulty, now)
+    assert details['difficulty_history'] == ['easy'] * 4 + ['hard']
+    assert details['mastery_level'] == 7 and progress['total_words_learned'] == 1
+    assert 'halo' in progress['mastered_words'] and data_version(progress) == 5
+    assert card['review_count'] == 5 and card['interval'] == 1
+    print("✅ apply_rating updates word details, word sets and the data version")
+
+    print("\n🎉 SRS engine test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_srs_engine()
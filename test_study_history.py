@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the compact study history
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append('.')
+
+from flashcard_state import FlashcardDeck
+from profile_storage import JsonProfileStorage
+from study_history import RECORD, StudyHistory, migrate_legacy_sessions
+from vocabulary_index import get_vocabulary_index
+
+PROFILE = 'Tester'
+
+
+def test_study_history():
+    """Appends, pages and daily counts must agree whether read from memory or disk"""
+    print("🧪 Testing Study History")
+    print("=" * 40)
+
+    vocabulary = get_vocabulary_index()
+    words = vocabulary.words[:3]
+    now = datetime(2026, 10, 18, 12, 0)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "study_history.bin")
+        history = StudyHistory(path, now=now)
+
+        # Test 1: One fixed-width record per review, sessions spread over ten days
+        sessions = []
+        for days_ago in range(9, -1, -1):
+            for n in range(days_ago % 3 + 1):
+                sessions.append((words[n], ['easy', 'medium', 'hard'][n], n, now - timedelta(days=days_ago, minutes=n)))
+        for word, difficulty, mastery, reviewed_at in sessions:
+            history.append(vocabulary.word_id(word), difficulty, mastery, reviewed_at)
+        assert len(history) == len(sessions)
+        assert os.path.getsize(path) == len(sessions) * RECORD.size
+        print(f"✅ {len(sessions)} sessions stored in {os.path.getsize(path)} bytes")
+
+        # Test 2: Pages come newest first, straight from the file
+        reopened = StudyHistory(path, recent_days=3, now=now)
+        assert len(reopened) == len(sessions)
+        assert len(reopened.timestamps) < len(sessions)  # Only the recent window is in memory
+        page = reopened.page(offset=0, limit=4)
+        assert [entry['word_id'] for entry in page] == [vocabulary.word_id(s[0]) for s in reversed(sessions[-4:])]
+        oldest = reopened.page(offset=0, limit=2, newest_first=False)
+        assert oldest[0]['timestamp'] == sessions[0][3].isoformat()
+        assert reopened.page(offset=len(sessions)) == []
+        print("✅ Paging reads any slice of the file")
+
+        # Test 3: Daily counts for the last week match the sessions
+        counts = history.daily_counts(7, now=now)
+        assert list(counts) == [now.date() - timedelta(days=d) for d in range(6, -1, -1)]
+        for day, count in counts.items():
+            assert count == sum(1 for s in sessions if s[3].date() == day), day
+        assert sum(reopened.daily_counts(3, now=now).values()) == sum(list(counts.values())[-3:])
+        print("✅ Daily counts match a scan of the sessions")
+
+        # Test 4: Older sessions imported into a non-empty history are merged in time order
+        older = [{'word': words[0], 'timestamp': (now - timedelta(days=days_ago, hours=1)).isoformat(),
+                  'difficulty': 'medium', 'mastery_level': 1} for days_ago in (12, 5, 1)]
+        assert history.import_sessions(older, vocabulary.word_id) == len(older)
+        assert history.import_sessions(older, vocabulary.word_id) == 0  # Already there
+        merged = StudyHistory(path, now=now)
+        stamps = [entry['timestamp'] for entry in merged.page(limit=len(merged), newest_first=False)]
+        assert len(merged) == len(sessions) + len(older) and stamps == sorted(stamps)
+        all_days = [s[3].date() for s in sessions] + [datetime.fromisoformat(s['timestamp']).date() for s in older]
+        for days in (3, 7):
+            for day, count in merged.daily_counts(days, now=now).items():
+                assert count == all_days.count(day), (days, day)
+            assert history.daily_counts(days, now=now) == merged.daily_counts(days, now=now)
+        print("✅ Older sessions are merged in order and never imported twice")
+
+        # Test 5: Clearing empties the file and the in-memory window
+        history.clear()
+        assert len(history) == 0 and len(StudyHistory(path, now=now)) == 0
+        assert sum(history.daily_counts(7, now=now).values()) == 0
+        print("✅ Clearing removes every session")
+
+    # Test 6: Legacy study_sessions are imported once, however often the profile is loaded
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = JsonProfileStorage(data_dir)
+        legacy = [{'word': word, 'timestamp': (now - timedelta(hours=n)).isoformat(),
+                   'difficulty': 'easy', 'mastery_level': 2} for n, word in enumerate(words)]
+        storage.save(PROFILE, {'profile_name': PROFILE, 'words_learned': set(), 'study_sessions': legacy},
+                     FlashcardDeck())
+
+        path = os.path.join(data_dir, PROFILE, "study_history.bin")
+        for attempt in range(3):
+            progress, _, _, imported = migrate_legacy_sessions(StudyHistory(path, now=now), storage, PROFILE,
+                                                                vocabulary.word_id)
+            assert imported == (attempt == 0)
+            assert 'study_sessions' not in progress
+        assert len(StudyHistory(path, now=now)) == len(legacy)
+        assert 'study_sessions' not in storage.load(PROFILE)[0]
+        print("✅ Legacy sessions are imported exactly once")
+
+    # Test 7: A failed save after the import keeps the sessions, and the retry adds no duplicates
+    with tempfile.TemporaryDirectory() as data_dir:
+        storage = JsonProfileStorage(data_dir)
+        storage.save(PROFILE, {'profile_name': PROFILE, 'words_learned': set(), 'study_sessions': legacy},
+                     FlashcardDeck())
+        path = os.path.join(data_dir, PROFILE, "study_history.bin")
+
+        class FailingSave(JsonProfileStorage):
+            def save(self, *args, **kwargs):
+                raise OSError("disk full")
+
+        try:
+            migrate_legacy_sessions(StudyHistory(path, now=now), FailingSave(data_dir), PROFILE, vocabulary.word_id)
+            raise AssertionError("the save should fail")
+        except OSError:
+            pass
+        assert storage.load(PROFILE)[0]['study_sessions'] == legacy  # Nothing lost
+        assert len(StudyHistory(path, now=now)) == len(legacy)
+
+        progress, _, _, _ = migrate_legacy_sessions(StudyHistory(path, now=now), storage, PROFILE, vocabulary.word_id)
+        assert 'study_sessions' not in progress and 'study_sessions' not in storage.load(PROFILE)[0]
+        assert len(StudyHistory(path, now=now)) == len(legacy)
+        print("✅ An interrupted import loses nothing and is not repeated")
+
+    print("\n🎉 Study history test completed!")
+    print("=" * 40)
+
+
+if __name__ == "__main__":
+    test_study_history()
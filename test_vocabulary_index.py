@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test script for the precomputed vocabulary index
+"""
+
+import sys
+sys.path.append('.')
+
+from vocabulary_data import VOCABULARY_DATA
+from vocabulary_index import get_vocabulary_index
+
+def test_vocabulary_index():
+    """Index lookups must agree with a scan of VOCABULARY_DATA"""
+    print("🧪 Testing Vocabulary Index")
+    print("=" * 40)
+
+    index = get_vocabulary_index()
+    assert get_vocabulary_index() is index
+
+    # Test 1: Headword lookups match the old "first level wins" scan
+    for word in index.words:
+        for level, words in VOCABULARY_DATA.items():
+            if word in words:
+                assert index.lookup(word) == (level, words[word])
+                break
+    print(f"✅ {len(index)} headwords resolve to the same level and entry")
+
+    # Test 2: Level and category views
+    for level, words in VOCABULARY_DATA.items():
+        assert set(index.words_in_level(level)) == set(words)
+        for word, data in words.items():
+            assert word in index.words_in_category(data['category'], level=level)
+    print(f"✅ {len(index.levels)} levels and {len(index.categories)} categories indexed")
+
+    # Test 3: English gloss lookups, including slash alternatives
+    level, entry = index.lookup('halo')
+    assert 'halo' in index.words_for_english(entry['english'].upper())
+    print("✅ English gloss lookups work")
+
+    # Test 4: Per-level counting covers words filed under several levels
+    counts = index.level_counts(['kaki'])
+    assert sum(counts.values()) == len(index.levels_of('kaki'))
+    print("✅ Level counts work")
+
+    print("\n🎉 Vocabulary index test completed!")
+    print("=" * 40)
+
+if __name__ == "__main__":
+    test_vocabulary_index()
@@ -0,0 +1,238 @@
+# Example Sentence Translations for Indonesian Learning
+# Loaded once per process and shared read-only by every session
+
+# Comprehensive example sentence translations database
+EXAMPLE_TRANSLATIONS = {
+    "Halo, apa kabar?": "Hello, how are you?",
+    "Terima kasih banyak!": "Thank you very much!",
+    "Sama-sama!": "You're welcome!",
+    "Maaf, saya terlambat.": "Sorry, I'm late.",
+    "Permisi, boleh lewat?": "Excuse me, may I pass?",
+    "Ya, saya mengerti.": "Yes, I understand.",
+    "Tidak, terima kasih.": "No, thank you.",
+    "Saya baik-baik saja.": "I'm fine.",
+    "Satu orang": "One person",
+    "Dua buku": "Two books",
+    "Tiga apel": "Three apples",
+    "Empat kursi": "Four chairs",
+    "Lima menit": "Five minutes",
+    "Enam jam": "Six hours",
+    "Tujuh hari": "Seven days",
+    "Delapan bulan": "Eight months",
+    "Sembilan tahun": "Nine years",
+    "Sepuluh rupiah": "Ten rupiah",
+    "Saya suka kopi.": "I like coffee.",
+    "Dia makan nasi.": "He/she eats rice.",
+    "Kami belajar bahasa Indonesia.": "We learn Indonesian.",
+    "Mereka bermain sepak bola.": "They play soccer.",
+    "Ibu memasak di dapur.": "Mother cooks in the kitchen.",
+    "Ayah bekerja di kantor.": "Father works in the office.",
+    "Adik menonton TV.": "Little sibling watches TV.",
+    "Kakak membaca buku.": "Older sibling reads a book.",
+    "Nenek istirahat.": "Grandmother rests.",
+    "Kakek berjalan-jalan.": "Grandfather takes a walk.",
+    "Mata saya sakit.": "My eyes hurt.",
+    "Kepala saya pusing.": "My head is dizzy.",
+    "Tangan saya dingin.": "My hands are cold.",
+    "Kaki saya lelah.": "My feet are tired.",
+    "Perut saya lapar.": "My stomach is hungry.",
+    "Punggung saya sakit.": "My back hurts.",
+    "Saya makan nasi.": "I eat rice.",
+    "Dia minum air.": "He/she drinks water.",
+    "Kami makan bersama.": "We eat together.",
+    "Saya lapar sekali.": "I'm very hungry.",
+    "Makanan ini enak.": "This food is delicious.",
+    "Saya suka buah.": "I like fruit.",
+    "Rumah saya besar.": "My house is big.",
+    "Kamar tidur saya kecil.": "My bedroom is small.",
+    "Dapur ini bersih.": "This kitchen is clean.",
+    "Kamar mandi kotor.": "The bathroom is dirty.",
+    "Ruang tamu nyaman.": "The living room is comfortable.",
+    "Saya pergi ke sekolah.": "I go to school.",
+    "Mobil ini cepat.": "This car is fast.",
+    "Bus itu lambat.": "That bus is slow.",
+    "Pesawat terbang tinggi.": "The plane flies high.",
+    "Kereta api panjang.": "The train is long.",
+    "Sepeda motor kecil.": "The motorcycle is small.",
+    "Cuaca hari ini panas.": "Today's weather is hot.",
+    "Kemarin hujan deras.": "Yesterday it rained heavily.",
+    "Besok akan cerah.": "Tomorrow will be sunny.",
+    "Angin bertiup kencang.": "The wind blows strongly.",
+    "Langit biru cerah.": "The sky is bright blue.",
+    "Saya bekerja di kantor.": "I work at the office.",
+    "Dia seorang dokter.": "He/she is a doctor.",
+    "Guru mengajar di kelas.": "The teacher teaches in class.",
+    "Petani menanam padi.": "The farmer plants rice.",
+    "Polisi menjaga keamanan.": "The police maintain security.",
+    "Baju ini bagus.": "This shirt is nice.",
+    "Celana itu mahal.": "Those pants are expensive.",
+    "Sepatu saya baru.": "My shoes are new.",
+    "Topi ini kecil.": "This hat is small.",
+    "Tas itu berat.": "That bag is heavy.",
+    "Merah, biru, hijau": "Red, blue, green",
+    "Hitam dan putih": "Black and white",
+    "Kuning seperti matahari": "Yellow like the sun",
+    "Ungu adalah warna favorit saya": "Purple is my favorite color",
+    "Coklat seperti tanah": "Brown like soil",
+    "Saya suka musik.": "I like music.",
+    "Film ini menarik.": "This movie is interesting.",
+    "Buku itu tebal.": "That book is thick.",
+    "Permainan ini seru.": "This game is exciting.",
+    "Olahraga itu sehat.": "Sports are healthy.",
+    "Hari ini saya senang.": "Today I am happy.",
+    "Kemarin saya sedih.": "Yesterday I was sad.",
+    "Dia terlihat marah.": "He/she looks angry.",
+    "Kami merasa takut.": "We feel scared.",
+    "Mereka sangat gembira.": "They are very joyful.",
+    "Saya bangun pagi.": "I wake up early.",
+    "Dia tidur malam.": "He/she sleeps at night.",
+    "Kami makan siang.": "We have lunch.",
+    "Mereka bekerja sore.": "They work in the afternoon.",
+    "Keluarga berkumpul malam.": "The family gathers at night.",
+    "Jakarta adalah ibu kota.": "Jakarta is the capital city.",
+    "Bali pulau yang indah.": "Bali is a beautiful island.",
+    "Surabaya kota besar.": "Surabaya is a big city.",
+    "Bandung sejuk dan nyaman.": "Bandung is cool and comfortable.",
+    "Yogyakarta kota budaya.": "Yogyakarta is a cultural city.",
+    "Saya belajar dengan rajin.": "I study diligently.",
+    "Dia bekerja dengan keras.": "He/she works hard.",
+    "Kami bermain dengan gembira.": "We play joyfully.",
+    "Mereka bernyanyi dengan indah.": "They sing beautifully.",
+    "Guru menjelaskan dengan sabar.": "The teacher explains patiently.",
+    # Additional comprehensive translations for better coverage
+    "Anak-anak bermain.": "The children are playing.",
+    "Kucing tidur.": "The cat is sleeping.",
+    "Anjing berlari.": "The dog is running.",
+    "Burung terbang.": "The bird is flying.",
+    "Ikan berenang.": "The fish is swimming.",
+    "Bunga mekar.": "The flower is blooming.",
+    "Pohon tinggi.": "The tree is tall.",
+    "Air mengalir.": "The water is flowing.",
+    "Matahari bersinar.": "The sun is shining.",
+    "Bulan terang.": "The moon is bright.",
+    "Bintang berkilau.": "The stars are sparkling.",
+    "Hujan turun.": "Rain is falling.",
+    "Salju putih.": "Snow is white.",
+    "Api panas.": "Fire is hot.",
+    "Es dingin.": "Ice is cold.",
+    "Pintu terbuka.": "The door is open.",
+    "Jendela tertutup.": "The window is closed.",
+    "Lampu menyala.": "The light is on.",
+    "Komputer mati.": "The computer is off.",
+    "Telepon berdering.": "The phone is ringing.",
+    "Musik keras.": "The music is loud.",
+    "Suara pelan.": "The voice is soft.",
+    "Warna cerah.": "Bright colors.",
+    "Gambar indah.": "Beautiful picture.",
+    "Cerita menarik.": "Interesting story.",
+    "Lagu sedih.": "Sad song.",
+    "Tarian bagus.": "Good dance.",
+    "Makanan lezat.": "Delicious food.",
+    "Minuman segar.": "Fresh drink.",
+    "Udara bersih.": "Clean air.",
+    "Jalan ramai.": "Busy road.",
+    "Kota besar.": "Big city.",
+    "Desa kecil.": "Small village.",
+    "Gunung tinggi.": "High mountain.",
+    "Laut dalam.": "Deep sea.",
+    "Pantai indah.": "Beautiful beach.",
+    "Hutan lebat.": "Dense forest.",
+    "Padang luas.": "Wide field.",
+    "Sungai panjang.": "Long river.",
+    "Danau tenang.": "Calm lake.",
+    "Jembatan kuat.": "Strong bridge.",
+    "Gedung modern.": "Modern building.",
+    "Rumah nyaman.": "Comfortable house.",
+    "Kamar bersih.": "Clean room.",
+    "Tempat tidur empuk.": "Soft bed.",
+    "Meja kayu.": "Wooden table.",
+    "Kursi plastik.": "Plastic chair.",
+    "Lemari besar.": "Big wardrobe.",
+    "Rak buku.": "Bookshelf.",
+    "Jam dinding.": "Wall clock.",
+    "Kaca bening.": "Clear glass.",
+    "Piring putih.": "White plate.",
+    "Gelas kosong.": "Empty glass.",
+    "Sendok kecil.": "Small spoon.",
+    "Garpu tajam.": "Sharp fork.",
+    "Pisau besar.": "Big knife.",
+    "Panci hitam.": "Black pot.",
+    "Wajan bulat.": "Round pan.",
+    "Kompor gas.": "Gas stove.",
+    "Kulkas dingin.": "Cold refrigerator.",
+    "Mesin cuci.": "Washing machine.",
+    "Setrika panas.": "Hot iron.",
+    "Sapu bersih.": "Clean broom.",
+    "Kain lap.": "Cleaning cloth.",
+    "Sabun wangi.": "Fragrant soap.",
+    "Shampo rambut.": "Hair shampoo.",
+    "Pasta gigi.": "Toothpaste.",
+    "Sikat gigi.": "Toothbrush.",
+    "Handuk kering.": "Dry towel.",
+    "Baju baru.": "New clothes.",
+    "Celana panjang.": "Long pants.",
+    "Kaos putih.": "White t-shirt.",
+    "Rok pendek.": "Short skirt.",
+    "Sepatu hitam.": "Black shoes.",
+    "Sandal jepit.": "Flip-flops.",
+    "Topi merah.": "Red hat.",
+    "Tas sekolah.": "School bag.",
+    "Buku tebal.": "Thick book.",
+    "Pensil tajam.": "Sharp pencil.",
+    "Penghapus kecil.": "Small eraser.",
+    "Penggaris panjang.": "Long ruler.",
+    "Kertas putih.": "White paper.",
+    "Pulpen biru.": "Blue pen.",
+    "Spidol hitam.": "Black marker.",
+    "Gunting tajam.": "Sharp scissors.",
+    "Lem kuat.": "Strong glue.",
+    "Stapler berat.": "Heavy stapler.",
+    "Kalkulator kecil.": "Small calculator.",
+    "Komputer baru.": "New computer.",
+    "Laptop ringan.": "Light laptop.",
+    "Tablet tipis.": "Thin tablet.",
+    "Handphone pintar.": "Smart phone.",
+    "Kamera bagus.": "Good camera.",
+    "Televisi besar.": "Big television.",
+    "Radio lama.": "Old radio.",
+    "Jam tangan.": "Wristwatch.",
+    "Kacamata bening.": "Clear glasses.",
+    "Cincin emas.": "Gold ring.",
+    "Kalung perak.": "Silver necklace.",
+    "Gelang cantik.": "Beautiful bracelet.",
+    "Anting kecil.": "Small earrings.",
+}
+
+# Word-based translation patterns for intelligent fallback
+TRANSLATION_PATTERNS = {
+    # Common sentence structures
+    "saya": "I",
+    "dia": "he/she",
+    "kami": "we", 
+    "mereka": "they",
+    "ini": "this",
+    "itu": "that",
+    "adalah": "is/are",
+    "makan": "eat/eating",
+    "minum": "drink/drinking",
+    "tidur": "sleep/sleeping",
+    "belajar": "learn/learning",
+    "bekerja": "work/working",
+    "bermain": "play/playing",
+    "besar": "big",
+    "kecil": "small",
+    "bagus": "good/nice",
+    "jelek": "bad/ugly",
+    "baru": "new",
+    "lama": "old",
+    "panas": "hot",
+    "dingin": "cold",
+    "tinggi": "tall/high",
+    "rendah": "short/low",
+    "cepat": "fast",
+    "lambat": "slow",
+    "senang": "happy",
+    "sedih": "sad",
+    "marah": "angry",
+    "takut": "afraid",
+}
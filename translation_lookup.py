@@ -0,0 +1,71 @@
+"""
+Translation Lookup for Indonesian Learning
+Precompiled example-sentence translations with a word-by-word fallback
+"""
+
+from functools import lru_cache
+
+from translation_data import EXAMPLE_TRANSLATIONS, TRANSLATION_PATTERNS
+from vocabulary_index import get_vocabulary_index
+
+PUNCTUATION = '.,!?'
+
+
+def clean_text(text):
+    """Normalize text the way example lookups compare it"""
+    return text.strip(PUNCTUATION).lower()
+
+
+class TranslationLookup:
+    """Translate example sentences in O(tokens) using precomputed keys"""
+
+    def __init__(self, example_translations, translation_patterns, vocab_index):
+        self._exact = example_translations
+
+        # Normalized keys - first entry wins, like the old linear passes
+        self._by_lower = {}
+        self._by_clean = {}
+        for indonesian_text, english_translation in example_translations.items():
+            self._by_lower.setdefault(indonesian_text.lower(), english_translation)
+            self._by_clean.setdefault(clean_text(indonesian_text), english_translation)
+
+        # Token -> gloss for the fallback; translation patterns take priority
+        self._token_glosses = {}
+        for word in vocab_index.words:
+            self._token_glosses[word] = vocab_index.entry(word)['english']
+        self._token_glosses.update(translation_patterns)
+
+    def translate(self, example_text):
+        """Return an English translation for an Indonesian example sentence"""
+        # Try exact match first - highest priority
+        translation = self._exact.get(example_text)
+        if translation is not None:
+            return translation
+
+        # Case-insensitive match, then match ignoring surrounding punctuation
+        translation = self._by_lower.get(example_text.lower())
+        if translation is not None:
+            return translation
+        translation = self._by_clean.get(clean_text(example_text))
+        if translation is not None:
+            return translation
+
+        # Intelligent word-by-word translation as fallback
+        translated_words = []
+        for indonesian_word in example_text.lower().split():
+            clean_word = indonesian_word.strip(PUNCTUATION)
+            # Keep original word if no translation found
+            translated_words.append(self._token_glosses.get(clean_word, f"[{clean_word}]"))
+
+        if translated_words:
+            # Join translated words and capitalize first letter
+            return " ".join(translated_words).capitalize() + "."
+
+        # Last resort - return a helpful message
+        return f"Translation for '{example_text}' not available yet."
+
+
+@lru_cache(maxsize=None)
+def get_translation_lookup():
+    """Return the process-wide translation lookup, building it on first use"""
+    return TranslationLookup(EXAMPLE_TRANSLATIONS, TRANSLATION_PATTERNS, get_vocabulary_index())
@@ -0,0 +1,168 @@
+"""
+Vocabulary Index for Indonesian Learning
+Precomputed lookups over VOCABULARY_DATA so callers never scan every level
+"""
+
+import zlib
+from functools import lru_cache
+
+from vocabulary_data import VOCABULARY_DATA
+
+
+def normalize_gloss(text):
+    """Normalize an English gloss for lookups"""
+    return " ".join(text.lower().split())
+
+
+def stable_word_id(word):
+    """Stable 32-bit id for a headword (independent of vocabulary order)"""
+    return zlib.crc32(word.encode('utf-8'))
+
+
+def gloss_variants(gloss):
+    """Full gloss plus each slash-separated alternative ('good/fine' -> good, fine)"""
+    variants = [normalize_gloss(gloss)]
+    for part in gloss.split('/'):
+        part = normalize_gloss(part)
+        if part and part not in variants:
+            variants.append(part)
+    return variants
+
+
+class VocabularyIndex:
+    """Hash-based lookups by headword, level, category and English gloss.
+
+    Entries are the dicts held in VOCABULARY_DATA and are shared by every
+    session - treat them as read-only.
+    """
+
+    def __init__(self, vocabulary):
+        self._vocabulary = vocabulary
+        self._levels = tuple(vocabulary.keys())
+        self._by_word = {}
+        self._levels_by_word = {}
+        self._categories_by_word = {}
+        self._placements = {}
+        self._by_level = {}
+        self._by_category = {}
+        self._by_level_category = {}
+        self._by_english = {}
+        self.entry_count = 0
+
+        for level, words in vocabulary.items():
+            self._by_level[level] = tuple(words.keys())
+            for word, entry in words.items():
+                self.entry_count += 1
+                category = entry.get('category', 'general')
+
+                # First level wins, matching the old "scan levels in order" lookups
+                if word not in self._by_word:
+                    self._by_word[word] = (level, entry)
+                    self._by_category.setdefault(category, []).append(word)
+                    for variant in gloss_variants(entry['english']):
+                        self._by_english.setdefault(variant, []).append(word)
+
+                self._levels_by_word.setdefault(word, []).append(level)
+                self._categories_by_word.setdefault(word, set()).add(category)
+                self._placements.setdefault(word, []).append((level, category))
+                self._by_level_category.setdefault((level, category), []).append(word)
+
+        self._words = tuple(self._by_word.keys())
+        self._by_id = {}
+        for word in self._words:
+            word_id = stable_word_id(word)
+            if word_id in self._by_id:
+                raise ValueError(f"Word id collision between '{self._by_id[word_id]}' and '{word}'")
+            self._by_id[word_id] = word
+        self._levels_by_word = {w: tuple(levels) for w, levels in self._levels_by_word.items()}
+        self._categories_by_word = {w: frozenset(cats) for w, cats in self._categories_by_word.items()}
+        self._placements = {w: tuple(pairs) for w, pairs in self._placements.items()}
+        self._by_category = {cat: tuple(words) for cat, words in self._by_category.items()}
+        self._by_level_category = {key: tuple(words) for key, words in self._by_level_category.items()}
+        self._by_english = {gloss: tuple(words) for gloss, words in self._by_english.items()}
+        self._categories = tuple(sorted(self._by_category.keys()))
+
+    def __contains__(self, word):
+        return word in self._by_word
+
+    def __len__(self):
+        return len(self._by_word)
+
+    @property
+    def levels(self):
+        """Level names in curriculum order"""
+        return self._levels
+
+    @property
+    def categories(self):
+        """Sorted category names"""
+        return self._categories
+
+    @property
+    def words(self):
+        """Every distinct headword"""
+        return self._words
+
+    def lookup(self, word):
+        """Return (level, entry) for a headword, or None"""
+        return self._by_word.get(word)
+
+    def entry(self, word, level=None):
+        """Return the entry for a headword (optionally from a specific level), or None"""
+        if level is not None:
+            return self._vocabulary.get(level, {}).get(word)
+        found = self._by_word.get(word)
+        return found[1] if found else None
+
+    def word_id(self, word):
+        """Stable integer id for a headword"""
+        return stable_word_id(word)
+
+    def word_for_id(self, word_id):
+        """Headword for a stable id, or None"""
+        return self._by_id.get(word_id)
+
+    def level_of(self, word):
+        """Return the first level a headword appears in, or None"""
+        found = self._by_word.get(word)
+        return found[0] if found else None
+
+    def levels_of(self, word):
+        """Return every level a headword appears in"""
+        return self._levels_by_word.get(word, ())
+
+    def placements(self, word):
+        """Every (level, category) pair a headword is filed under"""
+        return self._placements.get(word, ())
+
+    def in_category(self, word, category):
+        """True if the headword is filed under the category at any level"""
+        return category in self._categories_by_word.get(word, ())
+
+    def words_in_level(self, level):
+        """Headwords for a level, in source order"""
+        return self._by_level.get(level, ())
+
+    def words_in_category(self, category, level=None):
+        """Headwords in a category, optionally restricted to one level"""
+        if level is not None:
+            return self._by_level_category.get((level, category), ())
+        return self._by_category.get(category, ())
+
+    def words_for_english(self, gloss):
+        """Headwords whose English gloss (or one of its alternatives) matches"""
+        return self._by_english.get(normalize_gloss(gloss), ())
+
+    def level_counts(self, words):
+        """Count how many of the given words belong to each level"""
+        counts = dict.fromkeys(self._levels, 0)
+        for word in words:
+            for level in self._levels_by_word.get(word, ()):
+                counts[level] += 1
+        return counts
+
+
+@lru_cache(maxsize=None)
+def get_vocabulary_index():
+    """Return the process-wide vocabulary index, building it on first use"""
+    return VocabularyIndex(VOCABULARY_DATA)